@@ -6,12 +6,15 @@ Each station has a corresponding YAML file in the configs/ directory with:
 - model: The OpenRouter model to use
 - temperature: Temperature setting for the model
 - max_tokens: Maximum tokens for generation
+- fallback_models: Failover order when the model errors or its circuit is
+  open (paid models are only used with LLM_ALLOW_PAID_FALLBACK=true)
 - prompts: Dictionary of prompts used by the station
 """
 
 import yaml
 import os
-from typing import Dict, Any
+from functools import lru_cache
+from typing import Dict, Any, List, Optional
 from pathlib import Path
 
 class StationConfig:
@@ -105,3 +108,39 @@ def reload_station_config(station_number: int, station_suffix: str = None) -> St
     return load_station_config(station_number, station_suffix)
 
 
+@lru_cache(maxsize=None)
+def get_fallback_models(station_id: str) -> Optional[List[str]]:
+    """
+    Get the failover chain declared as `fallback_models` in a station config
+
+    Args:
+        station_id: Station identifier as used in usage scopes (e.g. '21', '4.5')
+
+    Returns:
+        List of model names/ids to try after the primary model, or None if the
+        station config does not declare a chain (or cannot be loaded)
+    """
+    try:
+        config = load_station_config(0, station_suffix=station_id.replace('.', ''))
+    except Exception:
+        return None
+    models = config.get('fallback_models')
+    return list(models) if models is not None else None
+
+
+@lru_cache(maxsize=None)
+def station_uses_llm_cache(station_id: str) -> bool:
+    """
+    Whether a station's LLM calls may use the response cache
+
+    Args:
+        station_id: Station identifier as used in usage scopes (e.g. '1', '4.5')
+
+    Returns:
+        False when the station config sets `llm_cache: false`, True otherwise
+    """
+    try:
+        config = load_station_config(0, station_suffix=station_id.replace('.', ''))
+    except Exception:
+        return True
+    return bool(config.get('llm_cache', True))
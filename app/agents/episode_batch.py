@@ -0,0 +1,141 @@
+"""
+Batch Episode Processing
+
+Shared by the script stations (21-27) for batch mode: instead of the
+interactive pick-an-episode loop, every available episode is processed
+concurrently, bounded by a semaphore. The audit stations (28-30) use it to
+fan out across episodes the same way. Each station's per-episode method
+already persists its outputs (files + Redis) when it finishes, so results
+land as soon as each episode completes rather than at the end of the batch.
+
+A failed episode does not stop the others; the per-episode outcome is
+printed and written to a batch report JSON. Once every episode has finished,
+EpisodeBatchError is raised if any of them failed, so the station (and the
+pipeline runner) records the station as failed rather than completed.
+"""
+
+import asyncio
+import json
+import logging
+import time
+from dataclasses import dataclass, asdict
+from datetime import datetime
+from pathlib import Path
+from typing import Awaitable, Callable, Iterable, List, Optional, Union
+
+from app.config import settings
+
+logger = logging.getLogger(__name__)
+
+
+class EpisodeBatchError(RuntimeError):
+    """One or more episodes of a batch failed; the rest completed and were saved"""
+
+    def __init__(self, label: str, results: List["EpisodeResult"]):
+        self.results = results
+        self.failed = [r for r in results if r.status == "failed"]
+        episodes = ", ".join(str(r.episode_number) for r in self.failed)
+        super().__init__(f"{label}: {len(self.failed)} of {len(results)} episode(s) failed ({episodes})")
+
+
+@dataclass
+class EpisodeResult:
+    """Outcome of one episode in a batch"""
+    episode_number: Union[int, str]
+    status: str = "pending"  # pending | completed | failed
+    duration_seconds: float = 0.0
+    error: Optional[str] = None
+
+
+async def run_episode_batch(episode_numbers: Iterable[Union[int, str]],
+                            process_episode: Callable[..., Awaitable[object]],
+                            label: str,
+                            max_concurrency: Optional[int] = None,
+                            report_path: Optional[Path] = None,
+                            raise_on_failure: bool = True) -> List[EpisodeResult]:
+    """
+    Run process_episode for every episode concurrently
+
+    Args:
+        episode_numbers: Episodes to process (numbers, or episode keys such as "episode_01")
+        process_episode: Station method that processes and saves one episode
+        label: Name used in progress output (e.g. "Station 21 drafting")
+        max_concurrency: Episodes in flight at once (default EPISODE_BATCH_CONCURRENCY)
+        report_path: Where to write the per-episode report JSON (optional)
+        raise_on_failure: Raise EpisodeBatchError after the batch if any episode failed
+
+    Returns:
+        One EpisodeResult per episode, in episode order
+
+    Raises:
+        EpisodeBatchError: An episode failed (unless raise_on_failure is False)
+    """
+    episodes = sorted(set(episode_numbers))
+    limit = max(1, max_concurrency or settings.episode_batch_concurrency)
+    semaphore = asyncio.Semaphore(limit)
+    results = {ep: EpisodeResult(ep) for ep in episodes}
+
+    print(f"🚀 {label}: {len(episodes)} episode(s), up to {limit} at once")
+    print()
+
+    async def run_one(episode_number: int):
+        result = results[episode_number]
+        async with semaphore:
+            started = time.monotonic()
+            try:
+                await process_episode(episode_number)
+                result.status = "completed"
+                print(f"✅ Episode {episode_number} completed ({time.monotonic() - started:.1f}s)")
+            except Exception as e:
+                result.status = "failed"
+                result.error = str(e)
+                logger.error(f"{label}: episode {episode_number} failed: {e}", exc_info=True)
+                print(f"❌ Episode {episode_number} failed: {e}")
+            finally:
+                result.duration_seconds = round(time.monotonic() - started, 2)
+
+    wall_start = time.monotonic()
+    await asyncio.gather(*(run_one(ep) for ep in episodes))
+    wall_seconds = time.monotonic() - wall_start
+
+    ordered = [results[ep] for ep in episodes]
+    display_batch_summary(label, ordered, wall_seconds)
+
+    if report_path is not None:
+        report = {
+            "label": label,
+            "timestamp": datetime.now().isoformat(),
+            "max_concurrency": limit,
+            "wall_clock_seconds": round(wall_seconds, 2),
+            "completed": [r.episode_number for r in ordered if r.status == "completed"],
+            "failed": [r.episode_number for r in ordered if r.status == "failed"],
+            "episodes": [asdict(r) for r in ordered],
+        }
+        report_path.parent.mkdir(parents=True, exist_ok=True)
+        with open(report_path, "w", encoding="utf-8") as f:
+            json.dump(report, f, indent=2)
+        print(f"📄 Batch report: {report_path}")
+
+    if raise_on_failure and any(r.status == "failed" for r in ordered):
+        raise EpisodeBatchError(label, ordered)
+    return ordered
+
+
+def display_batch_summary(label: str, results: List[EpisodeResult], wall_seconds: float):
+    """Print the per-episode outcome table"""
+    completed = sum(1 for r in results if r.status == "completed")
+    print()
+    print("=" * 70)
+    print(f"📊 BATCH SUMMARY: {label}")
+    print("=" * 70)
+    for r in results:
+        icon = "✅" if r.status == "completed" else "❌"
+        line = f"  {icon} Episode {r.episode_number}: {r.status} ({r.duration_seconds:.1f}s)"
+        if r.error:
+            line += f" - {r.error[:80]}"
+        print(line)
+    print()
+    print(f"Completed: {completed}/{len(results)} in {wall_seconds:.1f}s "
+          f"(episodes took {sum(r.duration_seconds for r in results):.1f}s in total)")
+    print("=" * 70)
+    print()
@@ -15,6 +15,8 @@ from typing import Dict, Any, Callable, List, Optional, Set
 from dataclasses import dataclass
 from functools import wraps
 
+from app.llm_cache import reject_llm_response
+
 logger = logging.getLogger(__name__)
 
 
@@ -280,7 +282,8 @@ async def retry_with_validation(
     1. LLM is called repeatedly until it produces valid output
     2. No fallback content is ever used
     3. Clear error messages when validation fails
-    4. Exponential backoff to handle rate limits
+    4. Exponential backoff between attempts (HTTP 429s are paced
+       separately by the shared per-model rate limiter)
 
     Args:
         func: Async function to call (should return the content to validate)
@@ -316,7 +319,8 @@ async def retry_with_validation(
                     logger.info(f"{context_name}: Validation passed on attempt {attempt}")
                 return result
 
-            # Validation failed
+            # Validation failed; the retry must not get the same answer from the LLM cache
+            await reject_llm_response()
             last_errors = validation.errors
             if config.log_attempts:
                 logger.warning(
@@ -333,6 +337,7 @@ async def retry_with_validation(
                     delay = min(delay * config.backoff_multiplier, config.max_delay)
 
         except json.JSONDecodeError as e:
+            await reject_llm_response()
             last_errors = [f"JSON parse error: {str(e)}"]
             if config.log_attempts:
                 logger.warning(f"{context_name}: JSON parse error on attempt {attempt}, retrying...")
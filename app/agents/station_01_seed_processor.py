@@ -15,11 +15,12 @@ This agent:
 import asyncio
 import json
 import logging
-from typing import Dict, List
+from typing import Dict, List, Optional
 from datetime import datetime
 from pathlib import Path
 
-from app.openrouter_agent import OpenRouterAgent
+from app.openrouter_agent import get_openrouter_agent
+from app.llm_usage import track_usage, set_usage_session
 from app.redis_client import RedisClient
 from app.agents.config_loader import load_station_config
 from app.agents.json_extractor import extract_json
@@ -32,8 +33,15 @@ logger = logging.getLogger(__name__)
 class Station01SeedProcessor:
     """Simplified Station 1: Seed Processor & Scale Evaluator"""
 
-    def __init__(self):
-        self.openrouter = OpenRouterAgent()
+    def __init__(self, seed: Optional[Dict] = None):
+        """
+        Args:
+            seed: Preset answers for a headless run instead of console prompts:
+                  {"seed": ..., "seed_type": ..., "scale": "A"-"C", "title": 1-3 or a title}.
+                  Scale defaults to the recommended option and title to the first.
+        """
+        self.seed = seed
+        self.openrouter = get_openrouter_agent()
         self.redis = RedisClient()
         self.config = load_station_config(station_number=1)
         self.output_dir = Path("output/station_01")
@@ -46,6 +54,16 @@ class Station01SeedProcessor:
 
     def get_user_seed_input(self) -> tuple[str, str]:
         """Get seed input from user with type selection"""
+        if self.seed is not None:
+            seed_content = str(self.seed.get('seed', '')).strip()
+            seed_type = self.seed.get('seed_type', 'one-liner')
+            if seed_type not in ('one-liner', 'synopsis', 'script', 'idea'):
+                raise ValueError(f"❌ Unknown seed type: {seed_type}")
+            if len(seed_content) < 10:
+                raise ValueError("❌ Seed content must be at least 10 characters")
+            print(f"\n✅ Seed preset: {seed_type}, {len(seed_content)} characters")
+            return seed_content, seed_type
+
         print("\n" + "="*60)
         print("🎬 STATION 1: SEED PROCESSOR & SCALE EVALUATOR")
         print("="*60)
@@ -161,7 +179,11 @@ class Station01SeedProcessor:
         print("-"*60)
 
         # Get user choice
-        while True:
+        if self.seed is not None:
+            choice = str(self.seed.get('scale') or options['recommended_option']).strip().upper()
+            if choice not in ['A', 'B', 'C']:
+                raise ValueError(f"❌ Scale choice must be A, B, or C, got {choice!r}")
+        while self.seed is None:
             choice = input("\n👉 Which option do you choose? (A/B/C): ").strip().upper()
             if choice in ['A', 'B', 'C']:
                 break
@@ -185,6 +207,15 @@ class Station01SeedProcessor:
 
         print("\n" + "-"*60)
 
+        if self.seed is not None:
+            preset = str(self.seed.get('title') or 1).strip()
+            if preset.isdigit() and 1 <= int(preset) <= len(titles):
+                chosen_title = titles[int(preset) - 1]
+            else:
+                chosen_title = preset
+            print(f"\n✅ Title preset: {chosen_title}")
+            return chosen_title
+
         while True:
             choice = input("\n👉 Which title do you prefer? (1/2/3): ").strip()
             if choice in ['1', '2', '3']:
@@ -257,11 +288,13 @@ class Station01SeedProcessor:
         print(f"   📄 {json_path}")
         print(f"   📄 {txt_path}")
 
+    @track_usage(station="1")
     async def process(self, session_id: str = None) -> Dict:
         """Main processing method"""
         try:
             if not session_id:
                 session_id = f"session_{datetime.now().strftime('%Y%m%d_%H%M%S')}"
+            set_usage_session(session_id)
 
             # Step 1: Get user input
             seed_content, seed_type = self.get_user_seed_input()
@@ -19,7 +19,9 @@ from dataclasses import dataclass
 from datetime import datetime
 from pathlib import Path
 
-from app.openrouter_agent import OpenRouterAgent
+from app.openrouter_agent import get_openrouter_agent
+from app.llm_usage import track_usage
+from app.checkpoint_store import checkpoint_unit
 from app.redis_client import RedisClient
 from app.agents.config_loader import load_station_config
 from app.agents.json_extractor import extract_json
@@ -56,7 +58,7 @@ class Station02ProjectDNABuilder:
     """Simplified Station 2: Project DNA Builder"""
 
     def __init__(self):
-        self.openrouter = OpenRouterAgent()
+        self.openrouter = get_openrouter_agent()
         self.redis = RedisClient()
         self.config = load_station_config(station_number=2)
         self.output_dir = Path("output/station_02")
@@ -111,6 +113,7 @@ EPISODE RATIONALE: {station1_data['episode_rationale']}
 MAIN CHARACTERS: {', '.join(station1_data['main_characters'])}
 """
 
+    @checkpoint_unit("world_setting")
     async def generate_world_setting(self, station1_data: Dict) -> Dict:
         """Generate world & setting section"""
         print("\n🌍 Generating World & Setting...")
@@ -128,6 +131,7 @@ MAIN CHARACTERS: {', '.join(station1_data['main_characters'])}
         print("   ✅ World & Setting complete")
         return result
 
+    @checkpoint_unit("format_specifications")
     async def generate_format_specifications(self, station1_data: Dict) -> Dict:
         """Generate format specifications section"""
         print("📐 Generating Format Specifications...")
@@ -145,6 +149,7 @@ MAIN CHARACTERS: {', '.join(station1_data['main_characters'])}
         print("   ✅ Format Specifications complete")
         return result
 
+    @checkpoint_unit("genre_tone")
     async def generate_genre_tone(self, station1_data: Dict) -> Dict:
         """Generate genre & tone section"""
         print("🎭 Generating Genre & Tone...")
@@ -162,6 +167,7 @@ MAIN CHARACTERS: {', '.join(station1_data['main_characters'])}
         print("   ✅ Genre & Tone complete")
         return result
 
+    @checkpoint_unit("creative_promises")
     async def generate_creative_promises(self, station1_data: Dict) -> Dict:
         """Generate creative promises section"""
         print("✨ Generating Creative Promises...")
@@ -204,6 +210,7 @@ Return ONLY valid JSON:
         print("   ✅ Creative Promises complete")
         return result
 
+    @checkpoint_unit("audience_profile")
     async def generate_audience_profile(self, station1_data: Dict) -> Dict:
         """Generate audience profile section"""
         print("👥 Generating Audience Profile...")
@@ -221,6 +228,7 @@ Return ONLY valid JSON:
         print("   ✅ Audience Profile complete")
         return result
 
+    @checkpoint_unit("production_constraints")
     async def generate_production_constraints(self, station1_data: Dict) -> Dict:
         """Generate production constraints section"""
         print("🎬 Generating Production Constraints...")
@@ -238,6 +246,7 @@ Return ONLY valid JSON:
         print("   ✅ Production Constraints complete")
         return result
 
+    @checkpoint_unit("creative_team")
     async def generate_creative_team(self, station1_data: Dict) -> Dict:
         """Generate creative team section"""
         print("🎯 Generating Creative Team Structure...")
@@ -420,6 +429,7 @@ Return ONLY valid JSON:
         print(f"   📄 {json_path}")
         print(f"   📄 {txt_path}")
 
+    @track_usage(station="2")
     async def process(self, session_id: str) -> ProjectBible:
         """Main processing method"""
         try:
@@ -18,7 +18,10 @@ from dataclasses import dataclass
 from datetime import datetime
 from pathlib import Path
 
-from app.openrouter_agent import OpenRouterAgent
+from app.openrouter_agent import get_openrouter_agent
+from app.llm_cache import reject_llm_response
+from app.llm_usage import track_usage
+from app.checkpoint_store import checkpoint_unit
 from app.redis_client import RedisClient
 from app.agents.config_loader import load_station_config
 from app.agents.json_extractor import extract_json
@@ -56,8 +59,9 @@ class StyleGuide:
 class Station03AgeGenreOptimizer:
     """Simplified Station 3: Age & Genre Optimizer"""
 
-    def __init__(self):
-        self.openrouter = OpenRouterAgent()
+    def __init__(self, skip_review: bool = False):
+        self.skip_review = skip_review
+        self.openrouter = get_openrouter_agent()
         self.redis = RedisClient()
         self.config = load_station_config(station_number=3)
         self.output_dir = Path("output/station_03")
@@ -141,6 +145,7 @@ class Station03AgeGenreOptimizer:
 
         print("-"*60)
 
+    @checkpoint_unit("age_guidelines")
     async def generate_age_guidelines(self, station2_data: Dict) -> Dict:
         """Generate age-appropriate content guidelines"""
         print("\n🤖 Analyzing age-appropriate content guidelines...")
@@ -190,6 +195,7 @@ class Station03AgeGenreOptimizer:
             except Exception as e:
                 if attempt < 2:
                     logger.warning(f"⚠️ Attempt {attempt + 1} failed: {e}. Retrying...")
+                    await reject_llm_response()  # Don't get the same bad answer from the cache
                     await asyncio.sleep(2)
                 else:
                     logger.error(f"❌ Failed after 3 attempts: {e}")
@@ -239,6 +245,7 @@ class Station03AgeGenreOptimizer:
 
         print("-"*60)
 
+    @checkpoint_unit("genre_blends")
     async def generate_genre_blends(self, station2_data: Dict) -> Dict:
         """Generate 3 genre blend options"""
         print("\n🤖 Generating genre blend options...")
@@ -285,6 +292,7 @@ class Station03AgeGenreOptimizer:
             except Exception as e:
                 if attempt < 2:
                     logger.warning(f"⚠️ Attempt {attempt + 1} failed: {e}. Retrying...")
+                    await reject_llm_response()  # Don't get the same bad answer from the cache
                     await asyncio.sleep(2)
                 else:
                     logger.error(f"❌ Failed after 3 attempts: {e}")
@@ -336,8 +344,8 @@ class Station03AgeGenreOptimizer:
 
         print("\n" + "="*60)
 
-        # Get user choice
-        while True:
+        # Get user choice (headless runs take the default)
+        while not self.skip_review:
             choice = input("\n🎯 Which genre blend best fits your vision?\n   Enter A, B, or C (or press Enter for Option A): ").strip().upper()
 
             if choice == "":
@@ -348,6 +356,9 @@ class Station03AgeGenreOptimizer:
                 break
             else:
                 print("❌ Please enter A, B, or C (or press Enter for default)")
+        else:
+            choice = "A"
+            print("✅ Review skipped, using default: Option A")
 
         # Map choice to option key
         choice_to_key = {'A': 'option_a', 'B': 'option_b', 'C': 'option_c'}
@@ -403,6 +414,7 @@ class Station03AgeGenreOptimizer:
             except Exception as e:
                 if attempt < 2:
                     logger.warning(f"⚠️ Attempt {attempt + 1} failed: {e}. Retrying...")
+                    await reject_llm_response()  # Don't get the same bad answer from the cache
                     await asyncio.sleep(2)
                 else:
                     logger.error(f"❌ Failed after 3 attempts: {e}")
@@ -565,6 +577,7 @@ class Station03AgeGenreOptimizer:
         print(f"   📄 {txt_path}")
         print(f"\n✅ Stored in Redis for Station 4")
 
+    @track_usage(station="3")
     async def process(self, session_id: str) -> StyleGuide:
         """Main processing method"""
         try:
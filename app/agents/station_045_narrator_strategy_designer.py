@@ -25,7 +25,9 @@ from pathlib import Path
 from datetime import datetime
 from typing import Dict, List, Any, Optional
 
-from app.openrouter_agent import OpenRouterAgent
+from app.openrouter_agent import get_openrouter_agent
+from app.llm_usage import track_usage
+from app.checkpoint_store import checkpoint_unit
 from app.redis_client import RedisClient
 from app.agents.config_loader import load_station_config
 from app.agents.json_extractor import extract_json
@@ -37,7 +39,7 @@ class Station045NarratorStrategyDesigner:
 
     def __init__(self, session_id: str):
         self.session_id = session_id
-        self.openrouter = OpenRouterAgent()
+        self.openrouter = get_openrouter_agent()
         self.redis = RedisClient()
         self.config = load_station_config(station_number=4, station_suffix="45")
         self.output_dir = Path("output/station_045")
@@ -47,6 +49,7 @@ class Station045NarratorStrategyDesigner:
         """Initialize connections"""
         await self.redis.initialize()
 
+    @track_usage(station="4.5")
     async def run(self):
         """Main execution method"""
         print("=" * 60)
@@ -211,6 +214,7 @@ class Station045NarratorStrategyDesigner:
         except Exception as e:
             raise ValueError(f"❌ Error extracting required inputs: {str(e)}")
 
+    @checkpoint_unit("task_1_quantitative_analysis")
     async def execute_task1_quantitative_analysis(self, inputs: Dict) -> Dict:
         """Task 1: Quantitative Analysis of Narrator Necessity"""
         try:
@@ -228,6 +232,7 @@ class Station045NarratorStrategyDesigner:
         except Exception as e:
             raise ValueError(f"❌ Task 1 failed: {str(e)}")
 
+    @checkpoint_unit("task_2_sample_scenes")
     async def execute_task2_sample_scenes(self, inputs: Dict) -> Dict:
         """Task 2: Generate Comparative Sample Scenes"""
         try:
@@ -245,6 +250,7 @@ class Station045NarratorStrategyDesigner:
         except Exception as e:
             raise ValueError(f"❌ Task 2 failed: {str(e)}")
 
+    @checkpoint_unit("task_3_strategy_options")
     async def execute_task3_strategy_options(self, inputs: Dict, analysis: Dict) -> Dict:
         """Task 3: Define Narrator Strategy Options"""
         try:
@@ -275,6 +281,7 @@ class Station045NarratorStrategyDesigner:
         except Exception as e:
             raise ValueError(f"❌ Task 3 failed: {str(e)}")
 
+    @checkpoint_unit("task_4_definitive_recommendation")
     async def execute_task4_definitive_recommendation(self, inputs: Dict, analysis: Dict, 
                                                      scenes: Dict, options: Dict) -> Dict:
         """Task 4: Formulate Definitive Recommendation"""
@@ -301,6 +308,7 @@ class Station045NarratorStrategyDesigner:
         except Exception as e:
             raise ValueError(f"❌ Task 4 failed: {str(e)}")
 
+    @checkpoint_unit("task_5_pipeline_impact")
     async def execute_task5_pipeline_impact(self, inputs: Dict, recommendation: Dict) -> Dict:
         """Task 5: Assess Pipeline Impact"""
         try:
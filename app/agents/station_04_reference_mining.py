@@ -24,7 +24,10 @@ from pathlib import Path
 from datetime import datetime
 from typing import Dict, List, Any, Optional
 
-from app.openrouter_agent import OpenRouterAgent
+from app.openrouter_agent import get_openrouter_agent, StreamProgress
+from app.llm_usage import track_usage
+from app.checkpoint_store import checkpoint_unit, unit_digest
+from app.llm_cache import refresh_llm_cache
 from app.redis_client import RedisClient
 from app.agents.config_loader import load_station_config
 from app.agents.json_extractor import extract_json
@@ -34,8 +37,9 @@ from app.agents.title_validator import TitleValidator
 class Station04ReferenceMining:
     """Station 4: Reference Mining & Seed Extraction - SIMPLIFIED & CLEAN"""
 
-    def __init__(self):
-        self.openrouter = OpenRouterAgent()
+    def __init__(self, skip_review: bool = False):
+        self.skip_review = skip_review
+        self.openrouter = get_openrouter_agent()
         self.redis = RedisClient()
         self.config = load_station_config(station_number=4)
         self.output_dir = Path("output/station_04")
@@ -45,7 +49,8 @@ class Station04ReferenceMining:
         """Initialize connections"""
         await self.redis.initialize()
 
-    async def run(self):
+    @track_usage(station="4")
+    async def run(self, session_id: str = None):
         """Main interactive flow"""
         print("=" * 70)
         print("🎬 STATION 4: REFERENCE MINING & SEED EXTRACTION")
@@ -53,7 +58,8 @@ class Station04ReferenceMining:
         print()
 
         # Step 1: Get session ID
-        session_id = input("📋 Enter session ID from previous stations: ").strip()
+        if not session_id:
+            session_id = input("📋 Enter session ID from previous stations: ").strip()
         if not session_id:
             print("❌ Session ID is required")
             return
@@ -106,7 +112,8 @@ class Station04ReferenceMining:
         if approval == "R":
             print("\n🔄 Regenerating references...")
             print("⏳ This may take 30-60 seconds...")
-            references = await self.generate_references(station1_data, station2_data, station3_data)
+            with refresh_llm_cache():
+                references = await self.generate_references(station1_data, station2_data, station3_data)
             if not references:
                 print("❌ Failed to regenerate references")
                 return
@@ -374,7 +381,7 @@ class Station04ReferenceMining:
         print("  [Type 'V'] View all references in detail")
         print("-" * 70)
 
-        choice = input("\nYour choice: ").strip().upper()
+        choice = "" if self.skip_review else input("\nYour choice: ").strip().upper()
         if choice == "":
             choice = "ENTER"
             print("✅ References approved. Proceeding to tactical extraction...")
@@ -398,6 +405,7 @@ class Station04ReferenceMining:
             print(f"   Why Selected: {ref.get('why_selected', 'N/A')}")
             print()
 
+    @checkpoint_unit("tactics", key=lambda args: unit_digest(args["references"]))
     async def extract_tactics_with_progress(self, references: List[Dict],
                                            station1_data: Dict,
                                            station2_data: Dict,
@@ -633,6 +641,7 @@ class Station04ReferenceMining:
 
         return "\n".join(summary[:20])  # Reduced to max 20 tactics for better performance
 
+    @checkpoint_unit("seed_batch", key=lambda args: f"{args['prompt_name']}_{unit_digest(args['context'])}")
     async def generate_seed_batch(self, prompt_name: str, context: Dict) -> Dict:
         """Generate a batch of seeds using specified prompt with retry logic"""
         # Set appropriate token limits based on complexity - increased to prevent truncation
@@ -656,7 +665,9 @@ class Station04ReferenceMining:
                 response = await self.openrouter.process_message(
                     prompt,
                     model_name=self.config.model,
-                    max_tokens=max_tokens
+                    max_tokens=max_tokens,
+                    stream=self.config.get('stream', False),
+                    on_delta=StreamProgress(prompt_name)
                 )
 
                 # Validate response before JSON extraction
@@ -770,7 +781,7 @@ class Station04ReferenceMining:
         print("  [Type 'A'] View ALL seeds")
         print("-" * 70)
 
-        choice = input("\nYour choice: ").strip().upper()
+        choice = "" if self.skip_review else input("\nYour choice: ").strip().upper()
         if choice == "":
             choice = "ENTER"
             print("✅ Seed bank accepted. Proceeding to save...")
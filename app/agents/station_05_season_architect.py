@@ -24,7 +24,8 @@ from pathlib import Path
 from datetime import datetime
 from typing import Dict, List, Any, Optional
 
-from app.openrouter_agent import OpenRouterAgent
+from app.openrouter_agent import get_openrouter_agent
+from app.llm_usage import track_usage
 from app.redis_client import RedisClient
 from app.agents.config_loader import load_station_config
 from app.agents.json_extractor import extract_json
@@ -36,7 +37,7 @@ class Station05SeasonArchitect:
 
     def __init__(self, session_id: str):
         self.session_id = session_id
-        self.agent = OpenRouterAgent()
+        self.agent = get_openrouter_agent()
         self.redis_client = RedisClient()
         self.config = load_station_config(station_number=5)
         self.output_dir = Path("output/station_05")
@@ -46,6 +47,7 @@ class Station05SeasonArchitect:
         """Initialize connections"""
         await self.redis_client.initialize()
 
+    @track_usage(station="5")
     async def run(self):
         """Main execution method"""
         print("=" * 60)
@@ -25,7 +25,8 @@ from pathlib import Path
 from datetime import datetime
 from typing import Dict, List, Any, Optional
 
-from app.openrouter_agent import OpenRouterAgent
+from app.openrouter_agent import get_openrouter_agent
+from app.llm_usage import track_usage
 from app.redis_client import RedisClient
 from app.agents.config_loader import load_station_config
 from app.agents.json_extractor import extract_json
@@ -37,7 +38,7 @@ class Station07CharacterArchitect:
 
     def __init__(self, session_id: str):
         self.session_id = session_id
-        self.agent = OpenRouterAgent()
+        self.agent = get_openrouter_agent()
         self.redis_client = RedisClient()
         self.config = load_station_config(station_number=7)
         # Load additional config from YAML directly
@@ -60,6 +61,7 @@ class Station07CharacterArchitect:
         """Initialize connections"""
         await self.redis_client.initialize()
 
+    @track_usage(station="7")
     async def run(self):
         """Main execution method"""
         print("=" * 60)
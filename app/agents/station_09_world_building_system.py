@@ -26,11 +26,14 @@ from pathlib import Path
 from datetime import datetime
 from typing import Dict, List, Any, Optional
 
-from app.openrouter_agent import OpenRouterAgent
+from app.openrouter_agent import get_openrouter_agent
+from app.llm_usage import track_usage
+from app.checkpoint_store import checkpoint_unit
 from app.redis_client import RedisClient
 from app.agents.config_loader import load_station_config
 from app.agents.json_extractor import extract_json
 from app.agents.title_validator import TitleValidator
+from app.review_queue import request_review
 
 
 class Station09WorldBuildingSystem:
@@ -39,7 +42,7 @@ class Station09WorldBuildingSystem:
     def __init__(self, session_id: str, skip_review: bool = False):
         self.session_id = session_id
         self.skip_review = skip_review  # For testing/automation
-        self.agent = OpenRouterAgent()
+        self.agent = get_openrouter_agent()
         self.redis_client = RedisClient()
         self.config = load_station_config(station_number=9)
 
@@ -68,6 +71,7 @@ class Station09WorldBuildingSystem:
         """Initialize connections"""
         await self.redis_client.initialize()
 
+    @track_usage(station="9")
     async def run(self):
         """Main execution method"""
         print("=" * 70)
@@ -284,6 +288,7 @@ class Station09WorldBuildingSystem:
         print("🎯 Building audio-optimized world architecture...")
         print()
 
+    @checkpoint_unit("task_1_geography", state=["task_results"])
     async def execute_task_1_geography(self):
         """Task 1: Generate Geography & Spaces"""
         print("=" * 70)
@@ -344,6 +349,7 @@ class Station09WorldBuildingSystem:
             print(f"❌ Task 1 failed: {str(e)}")
             raise
 
+    @checkpoint_unit("task_2_social_systems", state=["task_results"])
     async def execute_task_2_social_systems(self):
         """Task 2: Generate Social Systems"""
         print("=" * 70)
@@ -401,6 +407,7 @@ class Station09WorldBuildingSystem:
             print(f"❌ Task 2 failed: {str(e)}")
             raise
 
+    @checkpoint_unit("task_3_technology", state=["task_results"])
     async def execute_task_3_technology(self):
         """Task 3: Generate Technology/Magic Systems"""
         print("=" * 70)
@@ -460,6 +467,7 @@ class Station09WorldBuildingSystem:
             print(f"❌ Task 3 failed: {str(e)}")
             raise
 
+    @checkpoint_unit("task_4_history", state=["task_results"])
     async def execute_task_4_history(self):
         """Task 4: Generate History & Lore"""
         print("=" * 70)
@@ -521,6 +529,7 @@ class Station09WorldBuildingSystem:
             print(f"❌ Task 4 failed: {str(e)}")
             raise
 
+    @checkpoint_unit("task_5_sensory_palette", state=["task_results"])
     async def execute_task_5_sensory_palette(self):
         """Task 5: Generate Sensory Palette (Complete Audio Cue Library)"""
         print("=" * 70)
@@ -611,70 +620,64 @@ class Station09WorldBuildingSystem:
 
     async def optional_human_review(self):
         """Optional human review of generated world bible"""
-        print("=" * 70)
-        print("🎯 WORLD BIBLE REVIEW")
-        print("=" * 70)
-        print()
-        print("The World Bible is complete with 5 major sections:")
-        print(f"  ✓ Geography & Spaces ({len(self.task_results.get('task_1_geography', {}).get('key_locations', []))} locations)")
-        print("  ✓ Social Systems (authority, economy, culture)")
-        print(f"  ✓ Technology Systems ({len(self.task_results.get('task_3_technology', {}).get('available_systems', []))} systems)")
-        print(f"  ✓ History & Lore ({len(self.task_results.get('task_4_history', {}).get('timeline', []))} events)")
         sfx_count = len(self.task_results.get('task_5_sensory', {}).get('complete_sound_effects_library', []))
-        print(f"  ✓ Sensory Palette ({sfx_count}+ audio cues)")
-        print()
+        summary = [
+            "The World Bible is complete with 5 major sections:",
+            f"  ✓ Geography & Spaces ({len(self.task_results.get('task_1_geography', {}).get('key_locations', []))} locations)",
+            "  ✓ Social Systems (authority, economy, culture)",
+            f"  ✓ Technology Systems ({len(self.task_results.get('task_3_technology', {}).get('available_systems', []))} systems)",
+            f"  ✓ History & Lore ({len(self.task_results.get('task_4_history', {}).get('timeline', []))} events)",
+            f"  ✓ Sensory Palette ({sfx_count}+ audio cues)",
+        ]
 
         # Skip review if requested (for automation/testing)
         if self.skip_review:
+            print("=" * 70)
+            print("🎯 WORLD BIBLE REVIEW")
+            print("=" * 70)
+            print()
+            for line in summary:
+                print(line)
+            print()
             print("✅ Auto-accepting World Bible (skip_review=True)")
             print()
             return
 
-        print("Options:")
-        print("  [Press Enter] Accept World Bible and save")
-        print("  [Type 'V'] View different section in detail")
-        print("  [Type 'R'] Regenerate specific section (which?)")
-        print("  [Type 'L'] View full audio cue list")
+        sections = [
+            ("1", "Geography & Spaces", 'task_1_geography'),
+            ("2", "Social Systems", 'task_2_social_systems'),
+            ("3", "Technology/Magic", 'task_3_technology'),
+            ("4", "History & Lore", 'task_4_history'),
+            ("5", "Sensory Palette", 'task_5_sensory'),
+        ]
+        views = {
+            key: (f"View section: {label}", lambda task=task: self.display_section(task))
+            for key, label, task in sections
+        }
+        views["L"] = ("View full audio cue list", self.display_audio_cue_list)
+
+        await request_review(
+            self.session_id, "9", "World Bible", "WORLD BIBLE REVIEW",
+            summary=summary,
+            options={"": "Accept World Bible and save"},
+            views=views
+        )
+        print("✅ World Bible accepted. Saving files...")
         print()
 
-        choice = input("Your choice: ").strip().upper()
+    def display_section(self, task: str):
+        """Print one World Bible section as JSON"""
+        print(json.dumps(self.task_results.get(task, {}), indent=2))
 
-        if choice == '':
-            print("✅ World Bible accepted. Saving files...")
-            print()
-        elif choice == 'V':
-            # View section detail
-            print("\nAvailable sections:")
-            print("  1. Geography & Spaces")
-            print("  2. Social Systems")
-            print("  3. Technology/Magic")
-            print("  4. History & Lore")
-            print("  5. Sensory Palette")
-            section = input("Enter section number (1-5): ").strip()
-
-            if section == '1':
-                print(json.dumps(self.task_results.get('task_1_geography', {}), indent=2))
-            elif section == '2':
-                print(json.dumps(self.task_results.get('task_2_social_systems', {}), indent=2))
-            elif section == '3':
-                print(json.dumps(self.task_results.get('task_3_technology', {}), indent=2))
-            elif section == '4':
-                print(json.dumps(self.task_results.get('task_4_history', {}), indent=2))
-            elif section == '5':
-                print(json.dumps(self.task_results.get('task_5_sensory', {}), indent=2))
-
-            input("\nPress Enter to continue...")
-
-        elif choice == 'L':
-            # View audio cue list
-            sfx_library = self.task_results.get('task_5_sensory', {}).get('complete_sound_effects_library', [])
-            print(f"\n🎵 COMPLETE AUDIO CUE LIBRARY ({len(sfx_library)} sounds)")
-            print("=" * 70)
-            for i, sfx in enumerate(sfx_library[:20], 1):  # Show first 20
-                print(f"{i}. {sfx.get('sound_name', 'Unnamed')} - {sfx.get('category', 'N/A')}")
-            if len(sfx_library) > 20:
-                print(f"... and {len(sfx_library) - 20} more sounds")
-            input("\nPress Enter to continue...")
+    def display_audio_cue_list(self):
+        """Print the start of the audio cue library"""
+        sfx_library = self.task_results.get('task_5_sensory', {}).get('complete_sound_effects_library', [])
+        print(f"\n🎵 COMPLETE AUDIO CUE LIBRARY ({len(sfx_library)} sounds)")
+        print("=" * 70)
+        for i, sfx in enumerate(sfx_library[:20], 1):  # Show first 20
+            print(f"{i}. {sfx.get('sound_name', 'Unnamed')} - {sfx.get('category', 'N/A')}")
+        if len(sfx_library) > 20:
+            print(f"... and {len(sfx_library) - 20} more sounds")
 
     async def generate_outputs(self):
         """Generate all output files"""
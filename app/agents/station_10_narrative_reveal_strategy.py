@@ -36,11 +36,15 @@ from pathlib import Path
 from datetime import datetime
 from typing import Dict, List, Any, Optional
 
-from app.openrouter_agent import OpenRouterAgent
+from app.openrouter_agent import get_openrouter_agent
+from app.llm_usage import track_usage
+from app.checkpoint_store import checkpoint_unit
 from app.redis_client import RedisClient
+from app.state_store import StateStore
 from app.agents.config_loader import load_station_config
 from app.agents.json_extractor import extract_json
 from app.agents.title_validator import TitleValidator
+from app.review_queue import request_review
 
 
 class Station10NarrativeRevealStrategy:
@@ -49,8 +53,9 @@ class Station10NarrativeRevealStrategy:
     def __init__(self, session_id: str, skip_review: bool = False):
         self.session_id = session_id
         self.skip_review = skip_review
-        self.agent = OpenRouterAgent()
+        self.agent = get_openrouter_agent()
         self.redis_client = RedisClient()
+        self.state = StateStore(self.redis_client)
         self.config = load_station_config(station_number=10)
         self.output_dir = Path("output/station_10")
         self.output_dir.mkdir(parents=True, exist_ok=True)
@@ -64,6 +69,7 @@ class Station10NarrativeRevealStrategy:
         """Initialize connections"""
         await self.redis_client.initialize()
 
+    @track_usage(station="10")
     async def run(self):
         """Main execution method"""
         print("=" * 70)
@@ -137,12 +143,14 @@ class Station10NarrativeRevealStrategy:
                 '09': 'World Building System'
             }
 
+            # One round trip for every station
+            loaded = await self.state.load_stations(self.session_id, stations_to_load)
+
             for station_num in stations_to_load:
-                key = f"audiobook:{self.session_id}:station_{station_num}"
-                data = await self.redis_client.get(key)
+                data = loaded.get(station_num)
 
                 if data:
-                    self.all_station_data[station_num] = json.loads(data)
+                    self.all_station_data[station_num] = data
                     print(f"   ✓ Station {station_num}: {station_names.get(station_num, 'loaded')}")
                 else:
                     if station_num in ['06', '07']:  # Optional stations
@@ -200,6 +208,7 @@ class Station10NarrativeRevealStrategy:
         print("🎯 Designing narrative reveal architecture...")
         print()
 
+    @checkpoint_unit("task_1_reveal_taxonomy", state=["task_results"])
     async def execute_task_1_reveal_taxonomy(self):
         """Task 1: Generate Reveal Taxonomy"""
         print("=" * 70)
@@ -308,6 +317,7 @@ class Station10NarrativeRevealStrategy:
         print("=" * 70)
         print()
 
+    @checkpoint_unit("task_2_reveal_methods", state=["task_results"])
     async def execute_task_2_reveal_methods(self):
         """Task 2: Select Reveal Methods"""
         print("=" * 70)
@@ -396,31 +406,23 @@ class Station10NarrativeRevealStrategy:
 
     async def human_review_reveal_methods(self):
         """Optional human review of reveal methods"""
-        print("=" * 70)
-        print("⭐ HUMAN DECISION REQUIRED")
-        print("=" * 70)
-        print()
-
         reveal_count = len(self.task_results.get('task_2_methods', {}).get('reveal_methods', []))
-        print(f"The reveal strategy has been generated with {reveal_count} major revelations")
-        print("using methods from the 45-method catalog.")
-        print()
-        print("OPTIONS:")
-        print("  [Enter] - Approve and continue to Plant/Proof/Payoff Grid")
-        print("  [V]     - View complete list of all revelations")
-        print("  [R]     - Regenerate with different method emphasis")
-        print()
-        print("💡 TIP: Press V to see all revelations before approving")
-        print()
 
-        choice = input("Your choice: ").strip().upper()
-
-        if choice == 'V':
-            self._view_all_revelations()
-            input("\nPress Enter when ready to continue: ")
-        elif choice == 'R':
+        choice = await request_review(
+            self.session_id, "10", "Reveal methods", "HUMAN DECISION REQUIRED",
+            summary=[
+                f"The reveal strategy has been generated with {reveal_count} major revelations",
+                "using methods from the 45-method catalog.",
+            ],
+            options={
+                "": "Approve and continue to Plant/Proof/Payoff Grid",
+                "R": "Regenerate with different method emphasis",
+            },
+            views={"V": ("View complete list of all revelations", self._view_all_revelations)}
+        )
+
+        if choice == 'R':
             print("\nRegeneration not yet implemented. Continuing with current methods...")
-            await asyncio.sleep(1)
 
     def _view_all_revelations(self):
         """View all revelations in detail"""
@@ -437,6 +439,7 @@ class Station10NarrativeRevealStrategy:
             print(f"\nTimeline: Clued from E{method.get('episode_first_clue')}, Revealed E{method.get('episode_revealed')}")
             print(f"\nRelisten Impact: {method.get('relisten_impact')}")
 
+    @checkpoint_unit("task_3_plant_proof_payoff", state=["task_results"])
     async def execute_task_3_plant_proof_payoff(self):
         """Task 3: Create Plant/Proof/Payoff Grid"""
         print("=" * 70)
@@ -556,6 +559,7 @@ class Station10NarrativeRevealStrategy:
         print("=" * 70)
         print()
 
+    @checkpoint_unit("task_4_red_herrings", state=["task_results"])
     async def execute_task_4_red_herrings(self):
         """Task 4: Design Red Herring Strategy"""
         print("=" * 70)
@@ -662,6 +666,7 @@ class Station10NarrativeRevealStrategy:
         print("=" * 70)
         print()
 
+    @checkpoint_unit("task_5_fairness_check", state=["task_results"])
     async def execute_task_5_fairness_check(self):
         """Task 5: Fairness Check Analysis"""
         print("=" * 70)
@@ -769,42 +774,37 @@ class Station10NarrativeRevealStrategy:
 
     async def human_review_complete_strategy(self):
         """Final human review of complete strategy"""
-        print("=" * 70)
-        print("⭐ FINAL HUMAN DECISION REQUIRED")
-        print("=" * 70)
-        print()
-
-        print("The complete narrative reveal strategy has been generated:")
         elements = self.task_results.get('task_1_taxonomy', {}).get('total_information_units', 0)
         methods = len(self.task_results.get('task_2_methods', {}).get('reveal_methods', []))
         plants = self.task_results.get('task_3_p3_grid', {}).get('grid_statistics', {}).get('total_plants', 0)
         rh_count = len(self.task_results.get('task_4_red_herrings', {}).get('red_herrings', []))
         rating = self.task_results.get('task_5_fairness', {}).get('overall_fairness_rating', 0)
 
-        print(f"  ✓ {elements} story elements classified")
-        print(f"  ✓ {methods} reveal methods from 45-method catalog")
-        print(f"  ✓ Complete Plant/Proof/Payoff grid ({plants} plants)")
-        print(f"  ✓ {rh_count} major red herrings designed")
-        print(f"  ✓ Fairness check passed ({rating}/5 rating)")
-        print()
-        print("This is the information architecture for your entire series.")
-        print()
-        print("OPTIONS:")
-        print("  [Enter] - Approve and save complete reveal matrix")
-        print("  [R]     - Regenerate entire strategy")
-        print("  [V]     - View complete reveal matrix document")
-        print()
-        print("💡 NOTE: This is a critical story infrastructure decision")
-        print()
-
-        choice = input("Your choice: ").strip().upper()
-
-        if choice == 'V':
-            print("\n[View complete matrix functionality would display full JSON here]")
-            input("\nPress Enter when ready to save: ")
-        elif choice == 'R':
+        choice = await request_review(
+            self.session_id, "10", "Complete strategy", "FINAL HUMAN DECISION REQUIRED",
+            summary=[
+                "The complete narrative reveal strategy has been generated:",
+                f"  ✓ {elements} story elements classified",
+                f"  ✓ {methods} reveal methods from 45-method catalog",
+                f"  ✓ Complete Plant/Proof/Payoff grid ({plants} plants)",
+                f"  ✓ {rh_count} major red herrings designed",
+                f"  ✓ Fairness check passed ({rating}/5 rating)",
+                "",
+                "This is the information architecture for your entire series.",
+            ],
+            options={
+                "": "Approve and save complete reveal matrix",
+                "R": "Regenerate entire strategy",
+            },
+            views={"V": ("View complete reveal matrix document", self._view_complete_matrix)}
+        )
+
+        if choice == 'R':
             print("\nRegeneration not yet implemented. Continuing with current strategy...")
-            await asyncio.sleep(1)
+
+    def _view_complete_matrix(self):
+        """View the complete reveal matrix (all task results)"""
+        print(json.dumps(self.task_results, indent=2, ensure_ascii=False))
 
     async def generate_outputs(self):
         """Generate all output files"""
@@ -25,8 +25,10 @@ from pathlib import Path
 from datetime import datetime
 from typing import Dict, List, Any, Optional
 
-from app.openrouter_agent import OpenRouterAgent
+from app.openrouter_agent import get_openrouter_agent
+from app.llm_usage import track_usage
 from app.redis_client import RedisClient
+from app.state_store import StateStore
 from app.agents.config_loader import load_station_config
 from app.agents.json_extractor import extract_json
 from app.agents.title_validator import TitleValidator
@@ -37,8 +39,9 @@ class Station11RuntimePlanner:
 
     def __init__(self, session_id: str):
         self.session_id = session_id
-        self.agent = OpenRouterAgent()
+        self.agent = get_openrouter_agent()
         self.redis_client = RedisClient()
+        self.state = StateStore(self.redis_client)
         self.config = load_station_config(station_number=11)
         self.output_dir = Path("output/station_11")
         self.output_dir.mkdir(parents=True, exist_ok=True)
@@ -47,6 +50,7 @@ class Station11RuntimePlanner:
         """Initialize connections"""
         await self.redis_client.initialize()
 
+    @track_usage(station="11")
     async def run(self):
         """Main execution method"""
         print("=" * 60)
@@ -139,88 +143,33 @@ class Station11RuntimePlanner:
     async def load_previous_stations_data(self) -> Dict[str, Any]:
         """Load data from all required previous stations"""
         print("📥 Loading data from previous stations...")
-        
-        station_data = {}
-        
-        # Load Station 1 (Seed Processor)
-        station1_key = f"session:{self.session_id}:station:01:output"
-        station1_data = await self.redis_client.get(station1_key)
-        if station1_data:
-            station_data['station_01'] = json.loads(station1_data)
-            print("✅ Station 1 data loaded from Redis")
-        else:
+
+        # (station, label, fallback file) for each required station
+        required = {
+            'station_01': ('1', "Station 1", f"output/station_01/{self.session_id}_output.json"),
+            'station_02': ('2', "Station 2", f"output/station_02/{self.session_id}_bible.json"),
+            'station_03': ('3', "Station 3", f"output/station_03/{self.session_id}_style_guide.json"),
+            'station_04': ('4', "Station 4", f"output/station_04/{self.session_id}_output.json"),
+            'station_045': ('4.5', "Station 4.5", f"output/station_045/{self.session_id}_output.json"),
+            'station_05': ('5', "Station 5", f"output/station_05/{self.session_id}_output.json"),
+        }
+
+        # One round trip for every station
+        station_data = await self.state.load_stations(
+            self.session_id, {name: station for name, (station, _, _) in required.items()}
+        )
+
+        for name, (_, label, fallback) in required.items():
+            if name in station_data:
+                print(f"✅ {label} data loaded from Redis")
+                continue
             # Fallback to file system if not in Redis
-            station1_file = Path(f"output/station_01/{self.session_id}_output.json")
-            if station1_file.exists():
-                with open(station1_file, 'r', encoding='utf-8') as f:
-                    station_data['station_01'] = json.load(f)
-                print("✅ Station 1 data loaded from file")
-        
-        # Load Station 2 (Project DNA Builder)
-        station2_key = f"session:{self.session_id}:station:02:output"
-        station2_data = await self.redis_client.get(station2_key)
-        if station2_data:
-            station_data['station_02'] = json.loads(station2_data)
-            print("✅ Station 2 data loaded from Redis")
-        else:
-            station2_file = Path(f"output/station_02/{self.session_id}_bible.json")
-            if station2_file.exists():
-                with open(station2_file, 'r', encoding='utf-8') as f:
-                    station_data['station_02'] = json.load(f)
-                print("✅ Station 2 data loaded from file")
-        
-        # Load Station 3 (Age Genre Optimizer)
-        station3_key = f"session:{self.session_id}:station:03:style_guide"
-        station3_data = await self.redis_client.get(station3_key)
-        if station3_data:
-            station_data['station_03'] = json.loads(station3_data)
-            print("✅ Station 3 data loaded from Redis")
-        else:
-            station3_file = Path(f"output/station_03/{self.session_id}_style_guide.json")
-            if station3_file.exists():
-                with open(station3_file, 'r', encoding='utf-8') as f:
-                    station_data['station_03'] = json.load(f)
-                print("✅ Station 3 data loaded from file")
-        
-        # Load Station 4 (Reference Mining)
-        station4_key = f"session:{self.session_id}:station:04:output"
-        station4_data = await self.redis_client.get(station4_key)
-        if station4_data:
-            station_data['station_04'] = json.loads(station4_data)
-            print("✅ Station 4 data loaded from Redis")
-        else:
-            station4_file = Path(f"output/station_04/{self.session_id}_output.json")
-            if station4_file.exists():
-                with open(station4_file, 'r', encoding='utf-8') as f:
-                    station_data['station_04'] = json.load(f)
-                print("✅ Station 4 data loaded from file")
-        
-        # Load Station 4.5 (Narrator Strategy)
-        station45_key = f"session:{self.session_id}:station:045:output"
-        station45_data = await self.redis_client.get(station45_key)
-        if station45_data:
-            station_data['station_045'] = json.loads(station45_data)
-            print("✅ Station 4.5 data loaded from Redis")
-        else:
-            station45_file = Path(f"output/station_045/{self.session_id}_output.json")
-            if station45_file.exists():
-                with open(station45_file, 'r', encoding='utf-8') as f:
-                    station_data['station_045'] = json.load(f)
-                print("✅ Station 4.5 data loaded from file")
-        
-        # Load Station 5 (Season Architect)
-        station5_key = f"session:{self.session_id}:station:05:output"
-        station5_data = await self.redis_client.get(station5_key)
-        if station5_data:
-            station_data['station_05'] = json.loads(station5_data)
-            print("✅ Station 5 data loaded from Redis")
-        else:
-            station5_file = Path(f"output/station_05/{self.session_id}_output.json")
-            if station5_file.exists():
-                with open(station5_file, 'r', encoding='utf-8') as f:
-                    station_data['station_05'] = json.load(f)
-                print("✅ Station 5 data loaded from file")
-        
+            station_file = Path(fallback)
+            if station_file.exists():
+                with open(station_file, 'r', encoding='utf-8') as f:
+                    station_data[name] = json.load(f)
+                print(f"✅ {label} data loaded from file")
+
         return station_data
 
     async def extract_required_inputs(self, station_data: Dict[str, Any]) -> Dict[str, Any]:
@@ -376,8 +325,7 @@ class Station11RuntimePlanner:
         """Store the runtime planning data in Redis"""
         print("💾 Storing in Redis...")
         
-        redis_key = f"session:{self.session_id}:station:11:output"
-        await self.redis_client.set(redis_key, json.dumps(runtime_data))
+        await self.state.save_station(self.session_id, 11, runtime_data)
         
         print("✅ Data stored in Redis")
 
@@ -27,8 +27,10 @@ from pathlib import Path
 from datetime import datetime
 from typing import Dict, List, Any, Optional
 
-from app.openrouter_agent import OpenRouterAgent
+from app.openrouter_agent import get_openrouter_agent
+from app.llm_usage import track_usage
 from app.redis_client import RedisClient
+from app.state_store import StateStore
 from app.agents.config_loader import load_station_config
 from app.agents.json_extractor import extract_json
 from app.agents.title_validator import TitleValidator
@@ -39,8 +41,9 @@ class Station14SimpleEpisodeBlueprint:
 
     def __init__(self, session_id: str):
         self.session_id = session_id
-        self.agent = OpenRouterAgent()
+        self.agent = get_openrouter_agent()
         self.redis_client = RedisClient()
+        self.state = StateStore(self.redis_client)
         self.config = load_station_config(station_number=14)
         self.output_dir = Path("output/station_14")
         self.output_dir.mkdir(parents=True, exist_ok=True)
@@ -49,6 +52,7 @@ class Station14SimpleEpisodeBlueprint:
         """Initialize connections"""
         await self.redis_client.initialize()
 
+    @track_usage(station="14")
     async def run(self):
         """Main execution method"""
         print("=" * 60)
@@ -162,71 +166,24 @@ class Station14SimpleEpisodeBlueprint:
         
         # Load from Redis first
         try:
-            # Station 1: Seed Processor
-            station1_data = await self.redis_client.get(f"station_1:{self.session_id}")
-            if station1_data:
-                station_data['station_1'] = json.loads(station1_data)
-            
-            # Station 2: Project DNA Builder
-            station2_data = await self.redis_client.get(f"station_2:{self.session_id}")
-            if station2_data:
-                station_data['station_2'] = json.loads(station2_data)
-            
-            # Station 3: Age & Genre Optimizer
-            station3_data = await self.redis_client.get(f"station_3:{self.session_id}")
-            if station3_data:
-                station_data['station_3'] = json.loads(station3_data)
-            
-            # Station 4: Reference Mining
-            station4_data = await self.redis_client.get(f"station_4:{self.session_id}")
-            if station4_data:
-                station_data['station_4'] = json.loads(station4_data)
-            
-            # Station 4.5: Narrator Strategy
-            station45_data = await self.redis_client.get(f"station_45:{self.session_id}")
-            if station45_data:
-                station_data['station_45'] = json.loads(station45_data)
-            
-            # Station 5: Season Architecture
-            station5_data = await self.redis_client.get(f"station_5:{self.session_id}")
-            if station5_data:
-                station_data['station_5'] = json.loads(station5_data)
-            
-            # Station 6: Master Style Guide
-            station6_data = await self.redis_client.get(f"station_6:{self.session_id}")
-            if station6_data:
-                station_data['station_6'] = json.loads(station6_data)
-            
-            # Station 7: Character Architecture
-            station7_data = await self.redis_client.get(f"station_7:{self.session_id}")
-            if station7_data:
-                station_data['station_7'] = json.loads(station7_data)
-            
-            # Station 8: World Builder
-            station8_data = await self.redis_client.get(f"station_8:{self.session_id}")
-            if station8_data:
-                station_data['station_8'] = json.loads(station8_data)
-            
-            # Station 9: World Building System
-            station9_data = await self.redis_client.get(f"station_9:{self.session_id}")
-            if station9_data:
-                station_data['station_9'] = json.loads(station9_data)
-            
-            # Station 10: Narrative Reveal Strategy
-            station10_data = await self.redis_client.get(f"station_10:{self.session_id}")
-            if station10_data:
-                station_data['station_10'] = json.loads(station10_data)
-            
-            # Station 11: Runtime Planning
-            station11_data = await self.redis_client.get(f"station_11:{self.session_id}")
-            if station11_data:
-                station_data['station_11'] = json.loads(station11_data)
-            
-            # Station 12: Hook & Cliffhanger Designer
-            station12_data = await self.redis_client.get(f"station_12:{self.session_id}")
-            if station12_data:
-                station_data['station_12'] = json.loads(station12_data)
-                
+            required = {
+                'station_1': '1',  # Seed Processor
+                'station_2': '2',  # Project DNA Builder
+                'station_3': '3',  # Age & Genre Optimizer
+                'station_4': '4',  # Reference Mining
+                'station_45': '4.5',  # Narrator Strategy
+                'station_5': '5',  # Season Architecture
+                'station_6': '6',  # Master Style Guide
+                'station_7': '7',  # Character Architecture
+                'station_8': '8',  # World Builder
+                'station_9': '9',  # World Building System
+                'station_10': '10',  # Narrative Reveal Strategy
+                'station_11': '11',  # Runtime Planning
+                'station_12': '12',  # Hook & Cliffhanger Designer
+            }
+            # One round trip for every station
+            station_data = await self.state.load_stations(self.session_id, required)
+
         except Exception as e:
             print(f"⚠️ Warning: Could not load some station data from Redis: {str(e)}")
         
@@ -430,10 +387,7 @@ class Station14SimpleEpisodeBlueprint:
                 f.write(f"Episode {episode.get('episode_number', 'N/A')},{episode.get('episode_title', 'Untitled')},{episode.get('emotional_tone', 'Unknown')},{main_goal},{main_obstacle}\n")
         
         # Save to Redis
-        await self.redis_client.set(
-            f"station_14:{self.session_id}",
-            json.dumps(blueprint_data, ensure_ascii=False)
-        )
+        await self.state.save_station(self.session_id, 14, blueprint_data)
 
 
 async def main():
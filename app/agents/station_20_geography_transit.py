@@ -31,8 +31,10 @@ import sys
 from pathlib import Path
 sys.path.append(str(Path(__file__).parent.parent.parent))
 
-from app.openrouter_agent import OpenRouterAgent
+from app.openrouter_agent import get_openrouter_agent
+from app.llm_usage import track_usage
 from app.redis_client import RedisClient
+from app.state_store import StateStore
 from app.agents.config_loader import load_station_config
 from app.agents.json_extractor import extract_json
 from app.agents.title_validator import TitleValidator
@@ -43,8 +45,9 @@ class Station20GeographyTransit:
 
     def __init__(self, session_id: str):
         self.session_id = session_id
-        self.agent = OpenRouterAgent()
+        self.agent = get_openrouter_agent()
         self.redis_client = RedisClient()
+        self.state = StateStore(self.redis_client)
         self.config = load_station_config(station_number=20)
         self.output_dir = Path("output/station_20")
         self.output_dir.mkdir(parents=True, exist_ok=True)
@@ -53,6 +56,7 @@ class Station20GeographyTransit:
         """Initialize connections"""
         await self.redis_client.initialize()
 
+    @track_usage(station="20")
     async def run(self):
         """Main execution method"""
         print("=" * 60)
@@ -127,35 +131,18 @@ class Station20GeographyTransit:
 
         # Load from Redis first
         try:
-            # Station 1: Seed Processor
-            station1_data = await self.redis_client.get(f"session:{self.session_id}:station:01:output")
-            if station1_data:
-                station_data['station_1'] = json.loads(station1_data)
-                print("✅ Station 1 data loaded")
-
-            # Station 2: Project DNA Builder
-            station2_data = await self.redis_client.get(f"session:{self.session_id}:station:02:bible")
-            if station2_data:
-                station_data['station_2'] = json.loads(station2_data)
-                print("✅ Station 2 data loaded")
-
-            # Station 3: Age & Genre Optimizer
-            station3_data = await self.redis_client.get(f"session:{self.session_id}:station:03:style_guide")
-            if station3_data:
-                station_data['station_3'] = json.loads(station3_data)
-                print("✅ Station 3 data loaded")
-
-            # Station 8: World Builder
-            station8_data = await self.redis_client.get(f"session:{self.session_id}:station:08:world_bible")
-            if station8_data:
-                station_data['station_8'] = json.loads(station8_data)
-                print("✅ Station 8 data loaded")
-
-            # Station 15: Detailed Episode Outlining
-            station15_data = await self.redis_client.get(f"session:{self.session_id}:station:15:detailed_episode_outlines")
-            if station15_data:
-                station_data['station_15'] = json.loads(station15_data)
-                print("✅ Station 15 data loaded")
+            required = {
+                'station_1': '1',  # Seed Processor
+                'station_2': '2',  # Project DNA Builder
+                'station_3': '3',  # Age & Genre Optimizer
+                'station_8': '8',  # World Builder
+                'station_15': '15',  # Detailed Episode Outlining
+            }
+            # One round trip for every station
+            station_data = await self.state.load_stations(self.session_id, required)
+            for name, station in required.items():
+                if name in station_data:
+                    print(f"✅ Station {station} data loaded")
 
         except Exception as e:
             print(f"⚠️  Redis data loading error: {e}")
@@ -346,10 +333,7 @@ class Station20GeographyTransit:
         print(f"✅ CSV summary saved: {csv_file}")
 
         # Store in Redis for future stations
-        await self.redis_client.set(
-            f"session:{self.session_id}:station:20:geography_transit_results",
-            json.dumps(geography_transit_results)
-        )
+        await self.state.save_station(self.session_id, 20, geography_transit_results)
         print("✅ Results stored in Redis")
 
     def generate_readable_report(self, results: Dict[str, Any]) -> str:
@@ -28,23 +28,33 @@ import os
 import logging
 from pathlib import Path
 from datetime import datetime
-from typing import Dict, List, Any, Optional
+from typing import Callable, Dict, List, Any, Optional
 
-from app.openrouter_agent import OpenRouterAgent
+from app.config import settings
+from app.openrouter_agent import get_openrouter_agent, StreamProgress
+from app.llm_usage import track_usage, usage_scope
+from app.checkpoint_store import checkpoint_unit
+from app.llm_cache import refresh_llm_cache, is_cache_refresh
 from app.redis_client import RedisClient
-from app.agents.config_loader import load_station_config
+from app.state_store import StateStore
+from app.agents.config_loader import load_station_config, station_uses_llm_cache
 from app.agents.json_extractor import extract_json
+from app.agents.episode_batch import run_episode_batch
+from app.review_queue import request_review
+from app.speculation import SpeculativeTasks
 from app.agents.title_validator import TitleValidator
 
 
 class Station21FirstDraft:
     """Station 21: First Draft (Scene-by-Scene)"""
 
-    def __init__(self, session_id: str, skip_review: bool = False):
+    def __init__(self, session_id: str, skip_review: bool = False, batch_mode: bool = False):
         self.session_id = session_id
         self.skip_review = skip_review
-        self.agent = OpenRouterAgent()
+        self.batch_mode = batch_mode
+        self.agent = get_openrouter_agent()
         self.redis_client = RedisClient()
+        self.state = StateStore(self.redis_client)
         self.config = load_station_config(station_number=21)
 
         # Load additional config from YAML
@@ -58,6 +68,10 @@ class Station21FirstDraft:
         self.episode_data = {}
         self.drafted_episodes = set()
 
+        # Work started while reviews are pending (see app/speculation.py)
+        self.speculation = SpeculativeTasks("Station 21")
+        self._momentum_check = None
+
     def _load_additional_config(self):
         """Load additional configuration from YAML file"""
         import yaml
@@ -73,6 +87,7 @@ class Station21FirstDraft:
         """Initialize connections"""
         await self.redis_client.initialize()
 
+    @track_usage(station="21")
     async def run(self):
         """Main execution method with episode loop"""
         print("=" * 70)
@@ -87,13 +102,20 @@ class Station21FirstDraft:
             print("✅ Full production context loaded (20 stations)")
             print()
 
+            if self.batch_mode:
+                # Batch mode: every episode concurrently, no selection menu
+                await self.run_batch()
+                self.display_session_summary()
+                return
+
             # Main drafting loop
             while True:
                 # Step 2: Display episode selection
                 self.display_episode_selection()
 
-                # Step 3: Human selects episode
-                episode_number = self.get_episode_selection()
+                # Step 3: Human selects episode (from a thread, so speculative
+                # drafting keeps going while the prompt waits)
+                episode_number = await asyncio.to_thread(self.get_episode_selection)
 
                 if episode_number is None:
                     # User chose to exit
@@ -103,7 +125,7 @@ class Station21FirstDraft:
                 await self.draft_episode(episode_number)
 
                 # Step 11: Ask to continue
-                if not self.ask_continue_drafting():
+                if not await asyncio.to_thread(self.ask_continue_drafting):
                     break
 
             # Display final summary
@@ -113,6 +135,8 @@ class Station21FirstDraft:
             print(f"❌ Station 21 failed: {str(e)}")
             logging.error(f"Station 21 error: {str(e)}", exc_info=True)
             raise
+        finally:
+            await self.speculation.close()
 
     async def load_all_station_data(self):
         """Load data from all previous stations (1-20)"""
@@ -127,19 +151,16 @@ class Station21FirstDraft:
                 "Procedure Check", "Geography Transit"
             ]
 
-            for i, name in enumerate(station_names, 1):
-                try:
-                    key = f"audiobook:{self.session_id}:station_{i:02d}" if i < 10 else f"audiobook:{self.session_id}:station_{i}"
-                    data_raw = await self.redis_client.get(key)
-
-                    if data_raw:
-                        self.all_station_data[i] = json.loads(data_raw)
-                        print(f"   ✓ Station {i}: {name} loaded")
-                    else:
-                        print(f"   ⚠️  Station {i}: {name} not found (optional)")
+            # One round trip for all 20 stations
+            self.all_station_data = await self.state.load_stations(
+                self.session_id, range(1, len(station_names) + 1)
+            )
 
-                except Exception as e:
-                    logging.warning(f"Could not load Station {i}: {str(e)}")
+            for i, name in enumerate(station_names, 1):
+                if i in self.all_station_data:
+                    print(f"   ✓ Station {i}: {name} loaded")
+                else:
+                    print(f"   ⚠️  Station {i}: {name} not found (optional)")
 
             # Extract key project info
             self.project_info = self.extract_project_info()
@@ -261,6 +282,20 @@ class Station21FirstDraft:
         print("=" * 70)
         print()
 
+    async def run_batch(self):
+        """Draft every episode concurrently (batch mode)"""
+        import re
+        match = re.search(r'(\d+)', str(self.project_info.get('episode_count', '0')))
+        total_episodes = int(match.group(1)) if match else 0
+
+        await run_episode_batch(
+            range(1, total_episodes + 1),
+            self.draft_episode,
+            label="Station 21 first drafts",
+            max_concurrency=self.config_data.get('batch_concurrency'),
+            report_path=self.output_dir / f"{self.session_id}_batch_report.json"
+        )
+
     def get_episode_selection(self) -> Optional[int]:
         """Get episode selection from user"""
         print("=" * 70)
@@ -300,6 +335,10 @@ class Station21FirstDraft:
             except ValueError:
                 print("❌ Invalid input. Please enter a number or 'Q'")
 
+    @track_usage(episode_arg="episode_number")
+    @checkpoint_unit("episode", key_arg="episode_number",
+                     output_ref="audiobook:{session_id}:station_21:episode_{key:02d}",
+                     restore=lambda self, output, args: self.drafted_episodes.add(args["episode_number"]))
     async def draft_episode(self, episode_number: int):
         """Draft a complete episode"""
         print()
@@ -328,18 +367,29 @@ class Station21FirstDraft:
         print("   Planting P3 elements...")
         print()
 
-        draft_data = await self.generate_first_draft(episode_number, episode_context)
+        # A draft written while the previous episode's review was pending
+        draft_data = None if is_cache_refresh() else await self.speculation.result(f"draft:{episode_number}")
+        if draft_data is None:
+            draft_data = await self.generate_first_draft(episode_number, episode_context)
+        else:
+            print("✅ First draft generated (drafted during the previous review)")
+            print()
 
         # Display draft
         self.display_draft(episode_number, draft_data)
 
         # Human review
         if not self.skip_review:
+            self.speculate_during_review(episode_number, draft_data)
             review_result = await self.human_review(episode_number, draft_data, episode_context)
 
             if review_result == "regenerate":
+                # Analyses of the rejected draft are no longer needed
+                self.speculation.discard(f"momentum:{episode_number}")
+
                 # Regenerate the entire draft
-                draft_data = await self.generate_first_draft(episode_number, episode_context)
+                with refresh_llm_cache():
+                    draft_data = await self.generate_first_draft(episode_number, episode_context)
             elif review_result == "edit_scene":
                 # Edit specific scene (simplified for now)
                 pass
@@ -453,27 +503,10 @@ class Station21FirstDraft:
     async def generate_first_draft(self, episode_number: int, context: Dict) -> Dict:
         """Generate first draft via LLM"""
         try:
-            # Build comprehensive prompt
-            prompt = self.build_draft_prompt(episode_number, context)
-
-            # Execute LLM call
-            start_time = datetime.now()
-
-            response = await self.agent.process_message(
-                prompt,
-                model_name=self.config.model,
-                max_tokens=self.config.max_tokens
+            draft_data = await self._request_draft(
+                episode_number, context, on_delta=StreamProgress(f"Episode {episode_number} draft")
             )
-
-            end_time = datetime.now()
-            duration = (end_time - start_time).total_seconds()
-
-            # Extract JSON
-            draft_data = extract_json(response)
-
-            # Add metadata
-            draft_data['generation_time'] = duration
-            draft_data['generated_at'] = datetime.now().isoformat()
+            duration = draft_data['generation_time']
 
             print(f"✅ First draft generated")
             print(f"⏱️  Time: {int(duration // 60)} minutes {int(duration % 60)} seconds")
@@ -485,6 +518,68 @@ class Station21FirstDraft:
             print(f"❌ Draft generation failed: {str(e)}")
             raise
 
+    async def _request_draft(self, episode_number: int, context: Dict,
+                             on_delta: Optional[Callable[[str], None]] = None) -> Dict:
+        """Call the LLM for a draft and parse it (no console output)"""
+        # Build comprehensive prompt
+        prompt = self.build_draft_prompt(episode_number, context)
+
+        # Execute LLM call
+        start_time = datetime.now()
+
+        response = await self.agent.process_message(
+            prompt,
+            model_name=self.config.model,
+            max_tokens=self.config.max_tokens,
+            stream=self.config.get('stream', False) and on_delta is not None,
+            on_delta=on_delta
+        )
+
+        end_time = datetime.now()
+
+        # Extract JSON
+        draft_data = extract_json(response)
+
+        # Add metadata
+        draft_data['generation_time'] = (end_time - start_time).total_seconds()
+        draft_data['generated_at'] = datetime.now().isoformat()
+        return draft_data
+
+    async def _speculative_draft(self, episode_number: int) -> Dict:
+        """Draft an episode in the background while a review is pending"""
+        with usage_scope(episode=episode_number):
+            context = await self.load_episode_context(episode_number)
+            return await self._request_draft(episode_number, context)
+
+    def _momentum_checker(self):
+        """Station 22 instance used to precompute its analyses"""
+        if self._momentum_check is None:
+            from app.agents.station_22_momentum_check import Station22MomentumCheck
+            self._momentum_check = Station22MomentumCheck(self.session_id, skip_review=True)
+        return self._momentum_check
+
+    def speculate_during_review(self, episode_number: int, draft_data: Dict):
+        """Start the work most likely needed once the review of this draft is answered
+
+        Station 22's analyses of the draft land in the LLM cache for its
+        check_episode, so they are only prefetched when that cache is on; the
+        next episode's draft is picked up by draft_episode.
+        """
+        if settings.llm_cache_enabled and station_uses_llm_cache("22"):
+            first_draft = draft_data.get('first_draft_script', {})
+            self.speculation.start(
+                f"momentum:{episode_number}",
+                lambda: self._momentum_checker().prefetch_analyses(episode_number, first_draft)
+            )
+
+        import re
+        match = re.search(r'(\d+)', str(self.project_info.get('episode_count', '0')))
+        total_episodes = int(match.group(1)) if match else 0
+        next_episode = episode_number + 1
+        # Batch mode drafts every episode at once anyway
+        if not self.batch_mode and next_episode <= total_episodes and next_episode not in self.drafted_episodes:
+            self.speculation.start(f"draft:{next_episode}", lambda: self._speculative_draft(next_episode))
+
     def build_draft_prompt(self, episode_number: int, context: Dict) -> str:
         """Build comprehensive prompt for draft generation"""
         # Get base prompt from config
@@ -658,34 +753,28 @@ class Station21FirstDraft:
 
     async def human_review(self, episode_number: int, draft_data: Dict, context: Dict) -> str:
         """Human review interface"""
-        print("=" * 70)
-        print("⭐ FIRST DRAFT REVIEW")
-        print("=" * 70)
-        print()
-
         first_draft = draft_data.get('first_draft_script', {})
         total_words = first_draft.get('total_word_count', 0)
         target_words = context.get('word_budget', 2000)
 
-        print(f"Episode {episode_number} first draft complete: {total_words} words")
-        print(f"Target: {target_words} words ({int((total_words/target_words)*100)}% of final target)")
-        print()
-        print("OPTIONS:")
-        print("  [Enter] - Approve and save (recommended)")
-        print("  [R]     - Regenerate entire draft")
-        print("  [E]     - Edit specific scene")
-        print("  [V]     - View complete script")
-        print()
-
-        choice = input("Your choice: ").strip().upper()
+        choice = await request_review(
+            self.session_id, "21", f"Episode {episode_number}", "FIRST DRAFT REVIEW",
+            summary=[
+                f"Episode {episode_number} first draft complete: {total_words} words",
+                f"Target: {target_words} words ({int((total_words/target_words)*100)}% of final target)",
+            ],
+            options={
+                "": "Approve and save (recommended)",
+                "R": "Regenerate entire draft",
+                "E": "Edit specific scene",
+            },
+            views={"V": ("View complete script", lambda: self.display_full_script(draft_data))}
+        )
 
         if choice == 'R':
             return "regenerate"
         elif choice == 'E':
             return "edit_scene"
-        elif choice == 'V':
-            self.display_full_script(draft_data)
-            return await self.human_review(episode_number, draft_data, context)
         else:
             print("✅ Draft approved. Saving files...")
             print()
@@ -705,8 +794,6 @@ class Station21FirstDraft:
             print(scene.get('script_content', ''))
             print("\n" + "-" * 70 + "\n")
 
-        input("\nPress Enter to return to review menu...")
-
     async def save_episode_outputs(self, episode_number: int, draft_data: Dict, context: Dict):
         """Save episode in multiple formats"""
         print()
@@ -767,8 +854,8 @@ class Station21FirstDraft:
         print(f"✅ Saved Stats: {stats_path}")
 
         # 5. Save to Redis for Station 22
-        redis_key = f"audiobook:{self.session_id}:station_21:episode_{episode_number:02d}"
-        await self.redis_client.set(redis_key, json.dumps(full_data), expire=604800)  # 7 days
+        redis_key = await self.state.save_station(self.session_id, 21, full_data,
+                                                   episode=episode_number, expire=604800)  # 7 days
         print(f"✅ Saved to Redis: {redis_key}")
 
         print()
@@ -911,7 +998,11 @@ async def main():
         print("❌ Session ID is required")
         return
 
-    station = Station21FirstDraft(session_id, skip_review=False)
+    # --batch processes every episode concurrently instead of the selection menu
+    import sys
+    batch_mode = '--batch' in sys.argv
+
+    station = Station21FirstDraft(session_id, skip_review=False, batch_mode=batch_mode)
     await station.initialize()
     await station.run()
 
@@ -33,20 +33,29 @@ from pathlib import Path
 from datetime import datetime
 from typing import Dict, List, Any, Optional
 
-from app.openrouter_agent import OpenRouterAgent
+from app.openrouter_agent import get_openrouter_agent
+from app.llm_usage import track_usage, usage_scope
+from app.checkpoint_store import checkpoint_unit
+from app.llm_cache import refresh_llm_cache
 from app.redis_client import RedisClient
+from app.state_store import StateStore
 from app.agents.config_loader import load_station_config
 from app.agents.json_extractor import extract_json
+from app.agents.episode_batch import run_episode_batch
+from app.review_queue import request_review
+from app.agents.task_graph import TaskGraph
 
 
 class Station22MomentumCheck:
     """Station 22: Momentum Check"""
 
-    def __init__(self, session_id: str, skip_review: bool = False):
+    def __init__(self, session_id: str, skip_review: bool = False, batch_mode: bool = False):
         self.session_id = session_id
         self.skip_review = skip_review
-        self.agent = OpenRouterAgent()
+        self.batch_mode = batch_mode
+        self.agent = get_openrouter_agent()
         self.redis_client = RedisClient()
+        self.state = StateStore(self.redis_client)
         self.config = load_station_config(station_number=22)
 
         # Load additional config from YAML
@@ -74,6 +83,7 @@ class Station22MomentumCheck:
         """Initialize connections"""
         await self.redis_client.initialize()
 
+    @track_usage(station="22")
     async def run(self):
         """Main execution method with episode loop"""
         print("=" * 70)
@@ -92,6 +102,12 @@ class Station22MomentumCheck:
                 print("❌ No first drafts found. Please run Station 21 first.")
                 return
 
+            if self.batch_mode:
+                # Batch mode: every episode concurrently, no selection menu
+                await self.run_batch()
+                self.display_session_summary()
+                return
+
             # Main checking loop
             while True:
                 # Step 2: Display episode selection
@@ -122,23 +138,11 @@ class Station22MomentumCheck:
     async def load_first_drafts(self):
         """Load all first drafts from Station 21"""
         try:
-            # Get all Station 21 keys from Redis
-            pattern = f"audiobook:{self.session_id}:station_21:episode_*"
-
-            # For now, try loading episodes 1-24 (typical max)
-            for episode_num in range(1, 25):
-                try:
-                    key = f"audiobook:{self.session_id}:station_21:episode_{episode_num:02d}"
-                    data_raw = await self.redis_client.get(key)
-
-                    if data_raw:
-                        episode_data = json.loads(data_raw)
-                        self.drafted_episodes[episode_num] = episode_data
-                        print(f"   ✓ Episode {episode_num} first draft loaded")
-
-                except Exception as e:
-                    # Episode doesn't exist, skip silently
-                    continue
+            # Every stored episode through the session's episode index (one MGET)
+            drafts = await self.state.load_all_episodes(self.session_id, 21)
+            for episode_num, episode_data in drafts.items():
+                self.drafted_episodes[episode_num] = episode_data
+                print(f"   ✓ Episode {episode_num} first draft loaded")
 
         except Exception as e:
             raise ValueError(f"❌ Error loading first drafts: {str(e)}")
@@ -195,6 +199,16 @@ class Station22MomentumCheck:
         print("=" * 70)
         print()
 
+    async def run_batch(self):
+        """Momentum-check every episode concurrently (batch mode)"""
+        await run_episode_batch(
+            self.drafted_episodes.keys(),
+            self.check_episode,
+            label="Station 22 momentum checks",
+            max_concurrency=self.config_data.get('batch_concurrency'),
+            report_path=self.output_dir / f"{self.session_id}_batch_report.json"
+        )
+
     def get_episode_selection(self) -> Optional[int]:
         """Get episode selection from user"""
         print("=" * 70)
@@ -230,6 +244,10 @@ class Station22MomentumCheck:
             except ValueError:
                 print("❌ Invalid input. Please enter a number or 'Q'")
 
+    @track_usage(episode_arg="episode_number")
+    @checkpoint_unit("episode", key_arg="episode_number",
+                     output_ref="audiobook:{session_id}:station_22:episode_{key:02d}",
+                     restore=lambda self, output, args: self.checked_episodes.add(args["episode_number"]))
     async def check_episode(self, episode_number: int):
         """Analyze and fix momentum for a complete episode"""
         print()
@@ -246,49 +264,55 @@ class Station22MomentumCheck:
         # Display draft summary
         self.display_draft_summary(episode_number, episode_data)
 
-        # Step 4: Execute 4 sequential LLM analysis tasks
+        # Step 4: Execute the LLM analysis tasks; tasks 1-3 are independent
+        # and run concurrently, task 4 needs all three
         print()
         print("=" * 70)
         print("🔍 EXECUTING MOMENTUM ANALYSIS")
         print("=" * 70)
         print()
 
-        # Task 1: Pacing Analysis
         print("⏱️  Task 1/4: Pacing Analysis...")
-        pacing_analysis = await self.execute_pacing_analysis(episode_number, first_draft)
-        print("✅ Pacing analysis complete")
-        print()
-
-        # Task 2: Repetition Detection
         print("🔁 Task 2/4: Repetition Detection...")
-        repetition_analysis = await self.execute_repetition_detection(episode_number, first_draft)
-        print("✅ Repetition detection complete")
-        print()
-
-        # Task 3: Energy Flow Analysis
         print("⚡ Task 3/4: Energy Flow Analysis...")
-        energy_analysis = await self.execute_energy_flow_analysis(episode_number, first_draft)
-        print("✅ Energy flow analysis complete")
         print()
 
-        # Display all detected issues
-        self.display_detected_issues(pacing_analysis, repetition_analysis, energy_analysis)
+        async def auto_fix(pacing_analysis, repetition_analysis, energy_analysis):
+            print("✅ Pacing, repetition and energy flow analyses complete")
+            print()
 
-        # Task 4: Auto-fix Momentum
-        print()
-        print("🔧 Task 4/4: Auto-Fix Momentum Issues...")
-        momentum_fixes = await self.execute_auto_fix_momentum(
-            episode_number,
-            first_draft,
-            pacing_analysis,
-            repetition_analysis,
-            energy_analysis
-        )
+            # Display all detected issues
+            self.display_detected_issues(pacing_analysis, repetition_analysis, energy_analysis)
+
+            # Task 4: Auto-fix Momentum
+            print()
+            print("🔧 Task 4/4: Auto-Fix Momentum Issues...")
+            return await self.execute_auto_fix_momentum(
+                episode_number,
+                first_draft,
+                pacing_analysis,
+                repetition_analysis,
+                energy_analysis
+            )
+
+        graph = TaskGraph(f"Episode {episode_number} momentum analysis")
+        graph.add("pacing", lambda: self.execute_pacing_analysis(episode_number, first_draft))
+        graph.add("repetition", lambda: self.execute_repetition_detection(episode_number, first_draft))
+        graph.add("energy_flow", lambda: self.execute_energy_flow_analysis(episode_number, first_draft))
+        graph.add("auto_fix", auto_fix, depends_on=["pacing", "repetition", "energy_flow"])
+        results = await graph.run()
+
+        pacing_analysis = results["pacing"]
+        repetition_analysis = results["repetition"]
+        energy_analysis = results["energy_flow"]
+        momentum_fixes = results["auto_fix"]
 
         # Convert momentum_fixes to corrected_draft structure with scenes
         corrected_draft = self._convert_momentum_fixes_to_script(momentum_fixes, first_draft)
         print("✅ Corrected draft generated")
         print()
+        graph.display_timings()
+        print()
 
         # Display corrected draft with changes
         self.display_corrected_draft(episode_number, first_draft, corrected_draft)
@@ -299,13 +323,14 @@ class Station22MomentumCheck:
 
             if review_result == "regenerate":
                 # Regenerate the corrections
-                corrected_draft = await self.execute_auto_fix_momentum(
-                    episode_number,
-                    first_draft,
-                    pacing_analysis,
-                    repetition_analysis,
-                    energy_analysis
-                )
+                with refresh_llm_cache():
+                    corrected_draft = await self.execute_auto_fix_momentum(
+                        episode_number,
+                        first_draft,
+                        pacing_analysis,
+                        repetition_analysis,
+                        energy_analysis
+                    )
         else:
             print("✅ Auto-accepting corrected draft (skip_review=True)")
             print()
@@ -355,6 +380,20 @@ class Station22MomentumCheck:
         print("=" * 70)
         print()
 
+    async def prefetch_analyses(self, episode_number: int, first_draft: Dict):
+        """Run tasks 1-3 ahead of time (while Station 21's review is pending)
+
+        Their responses land in the LLM cache, so check_episode on the same
+        draft gets them without waiting.
+        """
+        with usage_scope(session_id=self.session_id, station="22", episode=episode_number):
+            await asyncio.gather(
+                self.execute_pacing_analysis(episode_number, first_draft),
+                self.execute_repetition_detection(episode_number, first_draft),
+                self.execute_energy_flow_analysis(episode_number, first_draft),
+                return_exceptions=True
+            )
+
     async def execute_pacing_analysis(self, episode_number: int, first_draft: Dict) -> Dict:
         """Task 1: Analyze pacing issues"""
         try:
@@ -703,32 +742,23 @@ class Station22MomentumCheck:
 
     async def human_review(self, episode_number: int, corrected: Dict, original: Dict) -> str:
         """Human review interface"""
-        print("=" * 70)
-        print("⭐ CORRECTED DRAFT REVIEW")
-        print("=" * 70)
-        print()
-
         total_changes = corrected.get('total_changes', 0)
 
-        print(f"Episode {episode_number} momentum check complete: {total_changes} changes made")
-        print()
-        print("OPTIONS:")
-        print("  [Enter] - Approve and save (recommended)")
-        print("  [R]     - Regenerate corrections")
-        print("  [V]     - View complete corrected script")
-        print("  [C]     - View detailed change report")
-        print()
-
-        choice = input("Your choice: ").strip().upper()
+        choice = await request_review(
+            self.session_id, "22", f"Episode {episode_number}", "CORRECTED DRAFT REVIEW",
+            summary=[f"Episode {episode_number} momentum check complete: {total_changes} changes made"],
+            options={
+                "": "Approve and save (recommended)",
+                "R": "Regenerate corrections",
+            },
+            views={
+                "V": ("View complete corrected script", lambda: self.display_full_script(corrected)),
+                "C": ("View detailed change report", lambda: self.display_change_report(original, corrected)),
+            }
+        )
 
         if choice == 'R':
             return "regenerate"
-        elif choice == 'V':
-            self.display_full_script(corrected)
-            return await self.human_review(episode_number, corrected, original)
-        elif choice == 'C':
-            self.display_change_report(original, corrected)
-            return await self.human_review(episode_number, corrected, original)
         else:
             print("✅ Corrected draft approved. Saving files...")
             print()
@@ -747,8 +777,6 @@ class Station22MomentumCheck:
             print(scene.get('script_content', ''))
             print("\n" + "-" * 70 + "\n")
 
-        input("\nPress Enter to return to review menu...")
-
     def display_change_report(self, original: Dict, corrected: Dict):
         """Display detailed change report"""
         changes = corrected.get('changes_made', [])
@@ -773,8 +801,6 @@ class Station22MomentumCheck:
 
             print("-" * 70)
 
-        input("\nPress Enter to return to review menu...")
-
     async def save_episode_outputs(self, episode_number: int, corrected: Dict,
                                    pacing: Dict, repetition: Dict, energy: Dict):
         """Save episode in multiple formats"""
@@ -825,8 +851,8 @@ class Station22MomentumCheck:
         print(f"✅ Saved Change Report: {report_path}")
 
         # 4. Save to Redis for Station 23
-        redis_key = f"audiobook:{self.session_id}:station_22:episode_{episode_number:02d}"
-        await self.redis_client.set(redis_key, json.dumps(full_data), expire=604800)  # 7 days
+        redis_key = await self.state.save_station(self.session_id, 22, full_data,
+                                                   episode=episode_number, expire=604800)  # 7 days
         print(f"✅ Saved to Redis: {redis_key}")
 
         print()
@@ -963,7 +989,11 @@ async def main():
         print("❌ Session ID is required")
         return
 
-    station = Station22MomentumCheck(session_id, skip_review=False)
+    # --batch processes every episode concurrently instead of the selection menu
+    import sys
+    batch_mode = '--batch' in sys.argv
+
+    station = Station22MomentumCheck(session_id, skip_review=False, batch_mode=batch_mode)
     await station.initialize()
     await station.run()
 
@@ -34,20 +34,28 @@ from pathlib import Path
 from datetime import datetime
 from typing import Dict, List, Any, Optional
 
-from app.openrouter_agent import OpenRouterAgent
+from app.openrouter_agent import get_openrouter_agent
+from app.llm_usage import track_usage
+from app.checkpoint_store import checkpoint_unit
+from app.llm_cache import refresh_llm_cache
 from app.redis_client import RedisClient
+from app.state_store import StateStore
 from app.agents.config_loader import load_station_config
 from app.agents.json_extractor import extract_json
+from app.agents.episode_batch import run_episode_batch
+from app.review_queue import request_review
 
 
 class Station23TwistIntegration:
     """Station 23: Twist Integration"""
 
-    def __init__(self, session_id: str, skip_review: bool = False):
+    def __init__(self, session_id: str, skip_review: bool = False, batch_mode: bool = False):
         self.session_id = session_id
         self.skip_review = skip_review
-        self.agent = OpenRouterAgent()
+        self.batch_mode = batch_mode
+        self.agent = get_openrouter_agent()
         self.redis_client = RedisClient()
+        self.state = StateStore(self.redis_client)
         self.config = load_station_config(station_number=23)
 
         # Load additional config from YAML
@@ -76,6 +84,7 @@ class Station23TwistIntegration:
         """Initialize connections"""
         await self.redis_client.initialize()
 
+    @track_usage(station="23")
     async def run(self):
         """Main execution method with episode loop"""
         print("=" * 70)
@@ -100,6 +109,12 @@ class Station23TwistIntegration:
             print("✅ P3 Grid loaded")
             print()
 
+            if self.batch_mode:
+                # Batch mode: every episode concurrently, no selection menu
+                await self.run_batch()
+                self.display_session_summary()
+                return
+
             # Main validation loop
             while True:
                 # Step 3: Display episode selection
@@ -130,47 +145,33 @@ class Station23TwistIntegration:
     async def load_scripts(self):
         """Load scripts from Station 22 (preferred) or Station 21"""
         try:
-            # Try loading from Station 22 first (momentum-corrected scripts)
-            for episode_num in range(1, 25):
-                try:
-                    key_22 = f"audiobook:{self.session_id}:station_22:episode_{episode_num:02d}"
-                    data_raw = await self.redis_client.get(key_22)
-
-                    if data_raw:
-                        episode_data = json.loads(data_raw)
-                        # Extract corrected script from Station 22
-                        corrected_script = episode_data.get('corrected_script', {})
-                        self.script_episodes[episode_num] = {
-                            'source': 'station_22',
-                            'script': corrected_script,
-                            'episode_number': episode_num
-                        }
-                        print(f"   ✓ Episode {episode_num} (from Station 22 - momentum corrected)")
-                        continue
-
-                except Exception:
-                    pass
-
-                # Try Station 21 if Station 22 not available
-                try:
-                    key_21 = f"audiobook:{self.session_id}:station_21:episode_{episode_num:02d}"
-                    data_raw = await self.redis_client.get(key_21)
-
-                    if data_raw:
-                        episode_data = json.loads(data_raw)
-                        # Extract first draft from Station 21
-                        draft_data = episode_data.get('draft_data', {})
-                        first_draft = draft_data.get('first_draft_script', {})
-                        self.script_episodes[episode_num] = {
-                            'source': 'station_21',
-                            'script': first_draft,
-                            'episode_number': episode_num
-                        }
-                        print(f"   ✓ Episode {episode_num} (from Station 21 - first draft)")
-
-                except Exception:
+            station_22 = await self.state.load_all_episodes(self.session_id, 22)
+            station_21 = await self.state.load_all_episodes(self.session_id, 21)
+
+            for episode_num in sorted(set(station_22) | set(station_21)):
+                # Try Station 22 first (momentum-corrected scripts)
+                if episode_num in station_22:
+                    # Extract corrected script from Station 22
+                    corrected_script = station_22[episode_num].get('corrected_script', {})
+                    self.script_episodes[episode_num] = {
+                        'source': 'station_22',
+                        'script': corrected_script,
+                        'episode_number': episode_num
+                    }
+                    print(f"   ✓ Episode {episode_num} (from Station 22 - momentum corrected)")
                     continue
 
+                # Station 21 if Station 22 not available
+                # Extract first draft from Station 21
+                draft_data = station_21[episode_num].get('draft_data', {})
+                first_draft = draft_data.get('first_draft_script', {})
+                self.script_episodes[episode_num] = {
+                    'source': 'station_21',
+                    'script': first_draft,
+                    'episode_number': episode_num
+                }
+                print(f"   ✓ Episode {episode_num} (from Station 21 - first draft)")
+
         except Exception as e:
             raise ValueError(f"❌ Error loading scripts: {str(e)}")
 
@@ -246,6 +247,16 @@ class Station23TwistIntegration:
         print("=" * 70)
         print()
 
+    async def run_batch(self):
+        """Validate every episode concurrently (batch mode)"""
+        await run_episode_batch(
+            self.script_episodes.keys(),
+            self.validate_episode,
+            label="Station 23 twist integration",
+            max_concurrency=self.config_data.get('batch_concurrency'),
+            report_path=self.output_dir / f"{self.session_id}_batch_report.json"
+        )
+
     def get_episode_selection(self) -> Optional[int]:
         """Get episode selection from user"""
         print("=" * 70)
@@ -281,6 +292,10 @@ class Station23TwistIntegration:
             except ValueError:
                 print("❌ Invalid input. Please enter a number or 'Q'")
 
+    @track_usage(episode_arg="episode_number")
+    @checkpoint_unit("episode", key_arg="episode_number",
+                     output_ref="audiobook:{session_id}:station_23:episode_{key:02d}",
+                     restore=lambda self, output, args: self.validated_episodes.add(args["episode_number"]))
     async def validate_episode(self, episode_number: int):
         """Validate and integrate P3 elements for an episode"""
         print()
@@ -333,11 +348,12 @@ class Station23TwistIntegration:
 
             if review_result == "regenerate":
                 # Regenerate the enhancements
-                enhanced_script = await self.execute_minimal_enhancement(
-                    episode_number,
-                    script,
-                    coherence_check
-                )
+                with refresh_llm_cache():
+                    enhanced_script = await self.execute_minimal_enhancement(
+                        episode_number,
+                        script,
+                        coherence_check
+                    )
         else:
             print("✅ Auto-accepting enhanced script (skip_review=True)")
             print()
@@ -846,35 +862,28 @@ class Station23TwistIntegration:
 
     async def human_review(self, episode_number: int, enhanced: Dict, original: Dict) -> str:
         """Human review interface"""
-        print("=" * 70)
-        print("⭐ COHERENCE-ENHANCED SCRIPT REVIEW")
-        print("=" * 70)
-        print()
-
         total_changes = enhanced.get('total_changes', 0)
         enhancement_type = enhanced.get('enhancement_type', 'Unknown')
 
-        print(f"Episode {episode_number} coherence enhancement complete:")
-        print(f"  • {total_changes} coherence improvements made")
-        print(f"  • Enhancement Type: {enhancement_type}")
-        print()
-        print("OPTIONS:")
-        print("  [Enter] - Approve and save (recommended)")
-        print("  [R]     - Regenerate coherence enhancements")
-        print("  [V]     - View complete enhanced script")
-        print("  [D]     - View detailed enhancement report")
-        print()
-
-        choice = input("Your choice: ").strip().upper()
+        choice = await request_review(
+            self.session_id, "23", f"Episode {episode_number}", "COHERENCE-ENHANCED SCRIPT REVIEW",
+            summary=[
+                f"Episode {episode_number} coherence enhancement complete:",
+                f"  • {total_changes} coherence improvements made",
+                f"  • Enhancement Type: {enhancement_type}",
+            ],
+            options={
+                "": "Approve and save (recommended)",
+                "R": "Regenerate coherence enhancements",
+            },
+            views={
+                "V": ("View complete enhanced script", lambda: self.display_full_script(enhanced)),
+                "D": ("View detailed enhancement report", lambda: self.display_detailed_integration_report(enhanced)),
+            }
+        )
 
         if choice == 'R':
             return "regenerate"
-        elif choice == 'V':
-            self.display_full_script(enhanced)
-            return await self.human_review(episode_number, enhanced, original)
-        elif choice == 'D':
-            self.display_detailed_integration_report(enhanced)
-            return await self.human_review(episode_number, enhanced, original)
         else:
             print("✅ Coherence-enhanced script approved. Saving files...")
             print()
@@ -895,8 +904,6 @@ class Station23TwistIntegration:
         else:
             print(full_script)
 
-        input("\nPress Enter to return to review menu...")
-
     def display_detailed_integration_report(self, enhanced: Dict):
         """Display detailed coherence enhancement report"""
         enhancements = enhanced.get('enhancements', [])
@@ -922,8 +929,6 @@ class Station23TwistIntegration:
 
             print("-" * 70)
 
-        input("\nPress Enter to return to review menu...")
-
     async def save_episode_outputs(self, episode_number: int, enhanced: Dict,
                                    coherence_check: Dict):
         """Save episode in multiple formats"""
@@ -972,8 +977,8 @@ class Station23TwistIntegration:
         print(f"✅ Saved Coherence Report: {report_path}")
 
         # 4. Save to Redis for Station 24+
-        redis_key = f"audiobook:{self.session_id}:station_23:episode_{episode_number:02d}"
-        await self.redis_client.set(redis_key, json.dumps(full_data), expire=604800)  # 7 days
+        redis_key = await self.state.save_station(self.session_id, 23, full_data,
+                                                   episode=episode_number, expire=604800)  # 7 days
         print(f"✅ Saved to Redis: {redis_key}")
 
         print()
@@ -1117,7 +1122,11 @@ async def main():
         print("❌ Session ID is required")
         return
 
-    station = Station23TwistIntegration(session_id, skip_review=False)
+    # --batch processes every episode concurrently instead of the selection menu
+    import sys
+    batch_mode = '--batch' in sys.argv
+
+    station = Station23TwistIntegration(session_id, skip_review=False, batch_mode=batch_mode)
     await station.initialize()
     await station.run()
 
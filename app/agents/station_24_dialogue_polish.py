@@ -36,20 +36,29 @@ from pathlib import Path
 from datetime import datetime
 from typing import Dict, List, Any, Optional
 
-from app.openrouter_agent import OpenRouterAgent
+from app.openrouter_agent import get_openrouter_agent
+from app.llm_usage import track_usage
+from app.checkpoint_store import checkpoint_unit
+from app.llm_cache import refresh_llm_cache
 from app.redis_client import RedisClient
+from app.state_store import StateStore
 from app.agents.config_loader import load_station_config
 from app.agents.json_extractor import extract_json
+from app.agents.episode_batch import run_episode_batch
+from app.review_queue import request_review
+from app.agents.task_graph import TaskGraph
 
 
 class Station24DialoguePolish:
     """Station 24: Dialogue Polish"""
 
-    def __init__(self, session_id: str, skip_review: bool = False):
+    def __init__(self, session_id: str, skip_review: bool = False, batch_mode: bool = False):
         self.session_id = session_id
         self.skip_review = skip_review
-        self.agent = OpenRouterAgent()
+        self.batch_mode = batch_mode
+        self.agent = get_openrouter_agent()
         self.redis_client = RedisClient()
+        self.state = StateStore(self.redis_client)
         self.config = load_station_config(station_number=24)
 
         # Load additional config from YAML
@@ -78,6 +87,7 @@ class Station24DialoguePolish:
         """Initialize connections"""
         await self.redis_client.initialize()
 
+    @track_usage(station="24")
     async def run(self):
         """Main execution method with episode loop"""
         print("=" * 70)
@@ -102,6 +112,12 @@ class Station24DialoguePolish:
             print("✅ Character profiles loaded")
             print()
 
+            if self.batch_mode:
+                # Batch mode: every episode concurrently, no selection menu
+                await self.run_batch()
+                self.display_session_summary()
+                return
+
             # Main polishing loop
             while True:
                 # Step 3: Display episode selection
@@ -170,27 +186,18 @@ class Station24DialoguePolish:
             # If no files found, try Redis as fallback
             if not file_loaded:
                 print("   📁 No files found, trying Redis...")
-                for episode_num in range(1, 25):
-                    try:
-                        key = f"audiobook:{self.session_id}:station_23:episode_{episode_num:02d}"
-                        data_raw = await self.redis_client.get(key)
-
-                        if data_raw:
-                            episode_data = json.loads(data_raw)
-                            # Extract enhanced script from Station 23
-                            twist_integration = episode_data.get('twist_integration', {})
-                            full_script = twist_integration.get('full_enhanced_script', '')
-
-                            self.script_episodes[episode_num] = {
-                                'source': 'station_23_redis',
-                                'script': full_script,
-                                'twist_data': twist_integration,
-                                'episode_number': episode_num
-                            }
-                            print(f"   ✓ Episode {episode_num} (from Station 23 Redis - P3 enhanced)")
-
-                    except Exception:
-                        continue
+                for episode_num, episode_data in (await self.state.load_all_episodes(self.session_id, 23)).items():
+                    # Extract enhanced script from Station 23
+                    twist_integration = episode_data.get('twist_integration', {})
+                    full_script = twist_integration.get('full_enhanced_script', '')
+
+                    self.script_episodes[episode_num] = {
+                        'source': 'station_23_redis',
+                        'script': full_script,
+                        'twist_data': twist_integration,
+                        'episode_number': episode_num
+                    }
+                    print(f"   ✓ Episode {episode_num} (from Station 23 Redis - P3 enhanced)")
 
         except Exception as e:
             raise ValueError(f"❌ Error loading scripts: {str(e)}")
@@ -199,11 +206,9 @@ class Station24DialoguePolish:
         """Load character voice profiles from Station 7"""
         try:
             # Try Redis first
-            key = f"audiobook:{self.session_id}:station_7"
-            data_raw = await self.redis_client.get(key)
+            station7_data = await self.state.load_station(self.session_id, 7)
 
-            if data_raw:
-                station7_data = json.loads(data_raw)
+            if station7_data:
                 self.character_profiles = station7_data.get('Character Architect Document', {})
                 print("   ✓ Character profiles loaded from Redis")
             else:
@@ -280,6 +285,16 @@ class Station24DialoguePolish:
         print("=" * 70)
         print()
 
+    async def run_batch(self):
+        """Polish every episode concurrently (batch mode)"""
+        await run_episode_batch(
+            self.script_episodes.keys(),
+            self.polish_episode,
+            label="Station 24 dialogue polish",
+            max_concurrency=self.config_data.get('batch_concurrency'),
+            report_path=self.output_dir / f"{self.session_id}_batch_report.json"
+        )
+
     def get_episode_selection(self) -> Optional[int]:
         """Get episode selection from user"""
         print("=" * 70)
@@ -315,6 +330,10 @@ class Station24DialoguePolish:
             except ValueError:
                 print("❌ Invalid input. Please enter a number or 'Q'")
 
+    @track_usage(episode_arg="episode_number")
+    @checkpoint_unit("episode", key_arg="episode_number",
+                     output_ref="audiobook:{session_id}:station_24:episode_{key:02d}",
+                     restore=lambda self, output, args: self.polished_episodes.add(args["episode_number"]))
     async def polish_episode(self, episode_number: int):
         """Polish dialogue for a complete episode"""
         print()
@@ -327,54 +346,57 @@ class Station24DialoguePolish:
         episode_data = self.script_episodes[episode_number]
         script = episode_data['script']
 
-        # Step 5: Execute 4 sequential LLM analysis tasks
+        # Step 5: Execute the LLM analysis tasks; tasks 1-3 are independent
+        # and run concurrently, task 4 needs all three
         print()
         print("=" * 70)
         print("🔍 EXECUTING DIALOGUE ANALYSIS")
         print("=" * 70)
         print()
 
-        # Task 1: Natural Speech Analysis
         print("🗣️  Task 1/4: Natural Speech Analysis...")
-        natural_speech = await self.execute_natural_speech_analysis(episode_number, script)
-        print("✅ Natural speech analysis complete")
-        print()
-
-        # Display unnatural dialogue issues
-        self.display_unnatural_dialogue(natural_speech)
-
-        # Task 2: Character Voice Validation
-        print()
         print("🎭 Task 2/4: Character Voice Validation...")
-        voice_validation = await self.execute_voice_validation(episode_number, script)
-        print("✅ Voice validation complete")
+        print("📖 Task 3/4: Subtext Enhancement Analysis...")
         print()
 
-        # Display voice distinction problems
-        self.display_voice_problems(voice_validation)
+        async def auto_polish(natural_speech, voice_validation, subtext_analysis):
+            print("✅ Natural speech, voice and subtext analyses complete")
+            print()
 
-        # Task 3: Subtext Enhancement
-        print()
-        print("📖 Task 3/4: Subtext Enhancement Analysis...")
-        subtext_analysis = await self.execute_subtext_analysis(episode_number, script)
-        print("✅ Subtext analysis complete")
-        print()
+            # Display unnatural dialogue issues, voice distinction problems
+            # and subtext opportunities
+            self.display_unnatural_dialogue(natural_speech)
+            print()
+            self.display_voice_problems(voice_validation)
+            print()
+            self.display_subtext_opportunities(subtext_analysis)
 
-        # Display subtext opportunities
-        self.display_subtext_opportunities(subtext_analysis)
+            # Task 4: Auto-polish dialogue
+            print()
+            print("✨ Task 4/4: Auto-Polish Dialogue...")
+            return await self.execute_auto_polish(
+                episode_number,
+                script,
+                natural_speech,
+                voice_validation,
+                subtext_analysis
+            )
 
-        # Task 4: Auto-polish dialogue
-        print()
-        print("✨ Task 4/4: Auto-Polish Dialogue...")
-        polished_script = await self.execute_auto_polish(
-            episode_number,
-            script,
-            natural_speech,
-            voice_validation,
-            subtext_analysis
-        )
+        graph = TaskGraph(f"Episode {episode_number} dialogue analysis")
+        graph.add("natural_speech", lambda: self.execute_natural_speech_analysis(episode_number, script))
+        graph.add("voice_validation", lambda: self.execute_voice_validation(episode_number, script))
+        graph.add("subtext", lambda: self.execute_subtext_analysis(episode_number, script))
+        graph.add("auto_polish", auto_polish, depends_on=["natural_speech", "voice_validation", "subtext"])
+        results = await graph.run()
+
+        natural_speech = results["natural_speech"]
+        voice_validation = results["voice_validation"]
+        subtext_analysis = results["subtext"]
+        polished_script = results["auto_polish"]
         print("✅ Polished script generated")
         print()
+        graph.display_timings()
+        print()
 
         # Display polished script with comparisons
         self.display_polished_script(episode_number, script, polished_script)
@@ -385,13 +407,14 @@ class Station24DialoguePolish:
 
             if review_result == "regenerate":
                 # Regenerate the polish
-                polished_script = await self.execute_auto_polish(
-                    episode_number,
-                    script,
-                    natural_speech,
-                    voice_validation,
-                    subtext_analysis
-                )
+                with refresh_llm_cache():
+                    polished_script = await self.execute_auto_polish(
+                        episode_number,
+                        script,
+                        natural_speech,
+                        voice_validation,
+                        subtext_analysis
+                    )
         else:
             print("✅ Auto-accepting polished script (skip_review=True)")
             print()
@@ -763,29 +786,23 @@ class Station24DialoguePolish:
 
     async def human_review(self, episode_number: int, polished: Dict, original: str) -> str:
         """Human review interface"""
-        print("=" * 70)
-        print("⭐ DIALOGUE-POLISHED SCRIPT REVIEW")
-        print("=" * 70)
-        print()
-
         total_changes = polished.get('total_changes', 0)
 
-        print(f"Episode {episode_number} dialogue polish complete:")
-        print(f"  • {total_changes} dialogue improvements made")
-        print()
-        print("OPTIONS:")
-        print("  [Enter] - Approve and save (recommended)")
-        print("  [R]     - Regenerate dialogue polish")
-        print("  [V]     - View complete polished script")
-        print()
-
-        choice = input("Your choice: ").strip().upper()
+        choice = await request_review(
+            self.session_id, "24", f"Episode {episode_number}", "DIALOGUE-POLISHED SCRIPT REVIEW",
+            summary=[
+                f"Episode {episode_number} dialogue polish complete:",
+                f"  • {total_changes} dialogue improvements made",
+            ],
+            options={
+                "": "Approve and save (recommended)",
+                "R": "Regenerate dialogue polish",
+            },
+            views={"V": ("View complete polished script", lambda: self.display_full_script(polished))}
+        )
 
         if choice == 'R':
             return "regenerate"
-        elif choice == 'V':
-            self.display_full_script(polished)
-            return await self.human_review(episode_number, polished, original)
         else:
             print("✅ Polished script approved. Saving files...")
             print()
@@ -806,8 +823,6 @@ class Station24DialoguePolish:
         else:
             print(complete_script)
 
-        input("\nPress Enter to return to review menu...")
-
     async def save_episode_outputs(self, episode_number: int, polished: Dict,
                                    natural_speech: Dict, voice_validation: Dict,
                                    subtext_analysis: Dict):
@@ -860,8 +875,8 @@ class Station24DialoguePolish:
         print(f"✅ Saved Comparison Report: {report_path}")
 
         # 4. Save to Redis for Station 25
-        redis_key = f"audiobook:{self.session_id}:station_24:episode_{episode_number:02d}"
-        await self.redis_client.set(redis_key, json.dumps(full_data), expire=604800)  # 7 days
+        redis_key = await self.state.save_station(self.session_id, 24, full_data,
+                                                   episode=episode_number, expire=604800)  # 7 days
         print(f"✅ Saved to Redis: {redis_key}")
 
         print()
@@ -965,7 +980,11 @@ async def main():
         print("❌ Session ID is required")
         return
 
-    station = Station24DialoguePolish(session_id, skip_review=False)
+    # --batch processes every episode concurrently instead of the selection menu
+    import sys
+    batch_mode = '--batch' in sys.argv
+
+    station = Station24DialoguePolish(session_id, skip_review=False, batch_mode=batch_mode)
     await station.initialize()
     await station.run()
 
@@ -36,20 +36,29 @@ from pathlib import Path
 from datetime import datetime
 from typing import Dict, List, Any, Optional
 
-from app.openrouter_agent import OpenRouterAgent
+from app.openrouter_agent import get_openrouter_agent
+from app.llm_usage import track_usage
+from app.checkpoint_store import checkpoint_unit
+from app.llm_cache import refresh_llm_cache
 from app.redis_client import RedisClient
+from app.state_store import StateStore
 from app.agents.config_loader import load_station_config
 from app.agents.json_extractor import extract_json
+from app.agents.episode_batch import run_episode_batch
+from app.review_queue import request_review
+from app.agents.task_graph import TaskGraph
 
 
 class Station25AudioOptimization:
     """Station 25: Audio Optimization"""
 
-    def __init__(self, session_id: str, skip_review: bool = False):
+    def __init__(self, session_id: str, skip_review: bool = False, batch_mode: bool = False):
         self.session_id = session_id
         self.skip_review = skip_review
-        self.agent = OpenRouterAgent()
+        self.batch_mode = batch_mode
+        self.agent = get_openrouter_agent()
         self.redis_client = RedisClient()
+        self.state = StateStore(self.redis_client)
         self.config = load_station_config(station_number=25)
 
         # Load additional config from YAML
@@ -78,6 +87,7 @@ class Station25AudioOptimization:
         """Initialize connections"""
         await self.redis_client.initialize()
 
+    @track_usage(station="25")
     async def run(self):
         """Main execution method with episode loop"""
         print("=" * 70)
@@ -102,6 +112,12 @@ class Station25AudioOptimization:
             print("✅ Audio cue library loaded")
             print()
 
+            if self.batch_mode:
+                # Batch mode: every episode concurrently, no selection menu
+                await self.run_batch()
+                self.display_session_summary()
+                return
+
             # Main optimization loop
             while True:
                 # Step 3: Display episode selection
@@ -132,27 +148,18 @@ class Station25AudioOptimization:
     async def load_scripts(self):
         """Load scripts from Station 24 (dialogue-polished)"""
         try:
-            for episode_num in range(1, 25):
-                try:
-                    key = f"audiobook:{self.session_id}:station_24:episode_{episode_num:02d}"
-                    data_raw = await self.redis_client.get(key)
-
-                    if data_raw:
-                        episode_data = json.loads(data_raw)
-                        # Extract polished script from Station 24
-                        polished_script = episode_data.get('dialogue_polished_script', {})
-                        complete_script = polished_script.get('complete_polished_script', '')
-
-                        self.script_episodes[episode_num] = {
-                            'source': 'station_24',
-                            'script': complete_script,
-                            'polished_data': polished_script,
-                            'episode_number': episode_num
-                        }
-                        print(f"   ✓ Episode {episode_num} (from Station 24 - dialogue polished)")
-
-                except Exception:
-                    continue
+            for episode_num, episode_data in (await self.state.load_all_episodes(self.session_id, 24)).items():
+                # Extract polished script from Station 24
+                polished_script = episode_data.get('dialogue_polished_script', {})
+                complete_script = polished_script.get('complete_polished_script', '')
+
+                self.script_episodes[episode_num] = {
+                    'source': 'station_24',
+                    'script': complete_script,
+                    'polished_data': polished_script,
+                    'episode_number': episode_num
+                }
+                print(f"   ✓ Episode {episode_num} (from Station 24 - dialogue polished)")
 
         except Exception as e:
             raise ValueError(f"❌ Error loading scripts: {str(e)}")
@@ -160,11 +167,9 @@ class Station25AudioOptimization:
     async def load_audio_library(self):
         """Load audio cue library from Station 9"""
         try:
-            key = f"audiobook:{self.session_id}:station_9"
-            data_raw = await self.redis_client.get(key)
+            station9_data = await self.state.load_station(self.session_id, 9)
 
-            if data_raw:
-                station9_data = json.loads(data_raw)
+            if station9_data:
                 self.audio_cue_library = station9_data.get('World Building System', {})
             else:
                 print("⚠️  Warning: Station 9 (World Building System) not found")
@@ -219,6 +224,16 @@ class Station25AudioOptimization:
         print("=" * 70)
         print()
 
+    async def run_batch(self):
+        """Optimize every episode concurrently (batch mode)"""
+        await run_episode_batch(
+            self.script_episodes.keys(),
+            self.optimize_episode,
+            label="Station 25 audio optimization",
+            max_concurrency=self.config_data.get('batch_concurrency'),
+            report_path=self.output_dir / f"{self.session_id}_batch_report.json"
+        )
+
     def get_episode_selection(self) -> Optional[int]:
         """Get episode selection from user"""
         print("=" * 70)
@@ -254,6 +269,10 @@ class Station25AudioOptimization:
             except ValueError:
                 print("❌ Invalid input. Please enter a number or 'Q'")
 
+    @track_usage(episode_arg="episode_number")
+    @checkpoint_unit("episode", key_arg="episode_number",
+                     output_ref="audiobook:{session_id}:station_25:episode_{key:02d}",
+                     restore=lambda self, output, args: self.optimized_episodes.add(args["episode_number"]))
     async def optimize_episode(self, episode_number: int):
         """Optimize audio for a complete episode"""
         print()
@@ -266,54 +285,57 @@ class Station25AudioOptimization:
         episode_data = self.script_episodes[episode_number]
         script = episode_data['script']
 
-        # Step 5: Execute 4 sequential LLM optimization tasks
+        # Step 5: Execute the LLM optimization tasks; tasks 1-3 are independent
+        # and run concurrently, task 4 needs all three
         print()
         print("=" * 70)
         print("🔍 EXECUTING AUDIO OPTIMIZATION")
         print("=" * 70)
         print()
 
-        # Task 1: Speaker Identification Check
         print("🎙️  Task 1/4: Speaker Identification Check...")
-        speaker_check = await self.execute_speaker_check(episode_number, script)
-        print("✅ Speaker identification check complete")
-        print()
-
-        # Display clarity issues
-        self.display_speaker_issues(speaker_check)
-
-        # Task 2: Sound Cue Integration
-        print()
         print("🔊 Task 2/4: Sound Cue Integration Analysis...")
-        sound_cue_analysis = await self.execute_sound_cue_analysis(episode_number, script)
-        print("✅ Sound cue analysis complete")
+        print("🤫 Task 3/4: Strategic Silence Marking...")
         print()
 
-        # Display sound cue analysis
-        self.display_sound_cue_analysis(sound_cue_analysis)
+        async def audio_optimization(speaker_check, sound_cue_analysis, silence_analysis):
+            print("✅ Speaker, sound cue and silence analyses complete")
+            print()
 
-        # Task 3: Silence Marking
-        print()
-        print("🤫 Task 3/4: Strategic Silence Marking...")
-        silence_analysis = await self.execute_silence_analysis(episode_number, script)
-        print("✅ Silence analysis complete")
-        print()
+            # Display clarity issues, sound cue analysis and silence placements
+            self.display_speaker_issues(speaker_check)
+            print()
+            self.display_sound_cue_analysis(sound_cue_analysis)
+            print()
+            self.display_silence_placements(silence_analysis)
 
-        # Display silence placements
-        self.display_silence_placements(silence_analysis)
+            # Task 4: Audio Optimization
+            print()
+            print("✨ Task 4/4: Audio Optimization (Production Script)...")
+            return await self.execute_audio_optimization(
+                episode_number,
+                script,
+                speaker_check,
+                sound_cue_analysis,
+                silence_analysis
+            )
 
-        # Task 4: Audio Optimization
-        print()
-        print("✨ Task 4/4: Audio Optimization (Production Script)...")
-        optimized_script = await self.execute_audio_optimization(
-            episode_number,
-            script,
-            speaker_check,
-            sound_cue_analysis,
-            silence_analysis
-        )
+        graph = TaskGraph(f"Episode {episode_number} audio optimization")
+        graph.add("speaker_check", lambda: self.execute_speaker_check(episode_number, script))
+        graph.add("sound_cues", lambda: self.execute_sound_cue_analysis(episode_number, script))
+        graph.add("silence", lambda: self.execute_silence_analysis(episode_number, script))
+        graph.add("audio_optimization", audio_optimization,
+                  depends_on=["speaker_check", "sound_cues", "silence"])
+        results = await graph.run()
+
+        speaker_check = results["speaker_check"]
+        sound_cue_analysis = results["sound_cues"]
+        silence_analysis = results["silence"]
+        optimized_script = results["audio_optimization"]
         print("✅ Audio-optimized script generated")
         print()
+        graph.display_timings()
+        print()
 
         # Display final audio-ready script
         self.display_optimized_script(episode_number, optimized_script)
@@ -324,13 +346,14 @@ class Station25AudioOptimization:
 
             if review_result == "regenerate":
                 # Regenerate the optimization
-                optimized_script = await self.execute_audio_optimization(
-                    episode_number,
-                    script,
-                    speaker_check,
-                    sound_cue_analysis,
-                    silence_analysis
-                )
+                with refresh_llm_cache():
+                    optimized_script = await self.execute_audio_optimization(
+                        episode_number,
+                        script,
+                        speaker_check,
+                        sound_cue_analysis,
+                        silence_analysis
+                    )
         else:
             print("✅ Auto-accepting optimized script (skip_review=True)")
             print()
@@ -635,26 +658,18 @@ class Station25AudioOptimization:
 
     async def human_review(self, episode_number: int, optimized: Dict, original: str) -> str:
         """Human review interface"""
-        print("=" * 70)
-        print("⭐ AUDIO OPTIMIZATION COMPLETE - FINAL REVIEW")
-        print("=" * 70)
-        print()
-
-        print(f"Episode {episode_number} is now production-ready for audio recording")
-        print()
-        print("OPTIONS:")
-        print("  [Enter] - Approve and export final script")
-        print("  [R]     - Regenerate audio optimization")
-        print("  [V]     - View complete audio script")
-        print()
-
-        choice = input("Your choice: ").strip().upper()
+        choice = await request_review(
+            self.session_id, "25", f"Episode {episode_number}", "AUDIO OPTIMIZATION COMPLETE - FINAL REVIEW",
+            summary=[f"Episode {episode_number} is now production-ready for audio recording"],
+            options={
+                "": "Approve and export final script",
+                "R": "Regenerate audio optimization",
+            },
+            views={"V": ("View complete audio script", lambda: self.display_full_script(optimized))}
+        )
 
         if choice == 'R':
             return "regenerate"
-        elif choice == 'V':
-            self.display_full_script(optimized)
-            return await self.human_review(episode_number, optimized, original)
         else:
             print("✅ Audio-optimized script approved. Exporting files...")
             print()
@@ -675,8 +690,6 @@ class Station25AudioOptimization:
         else:
             print(complete_script)
 
-        input("\nPress Enter to return to review menu...")
-
     async def save_episode_outputs(self, episode_number: int, optimized: Dict,
                                    speaker_check: Dict, sound_cues: Dict, silences: Dict):
         """Save episode in multiple production formats"""
@@ -722,8 +735,8 @@ class Station25AudioOptimization:
         print(f"✓ AUDIO SCRIPT: {txt_path.name}")
 
         # 3. Save to Redis for Station 26+
-        redis_key = f"audiobook:{self.session_id}:station_25:episode_{episode_number:02d}"
-        await self.redis_client.set(redis_key, json.dumps(full_data), expire=604800)
+        redis_key = await self.state.save_station(self.session_id, 25, full_data,
+                                                   episode=episode_number, expire=604800)
 
         print()
         print(f"📁 Files saved to: {episode_dir}")
@@ -773,7 +786,11 @@ async def main():
         print("❌ Session ID is required")
         return
 
-    station = Station25AudioOptimization(session_id, skip_review=False)
+    # --batch processes every episode concurrently instead of the selection menu
+    import sys
+    batch_mode = '--batch' in sys.argv
+
+    station = Station25AudioOptimization(session_id, skip_review=False, batch_mode=batch_mode)
     await station.initialize()
     await station.run()
 
@@ -37,20 +37,28 @@ from pathlib import Path
 from datetime import datetime
 from typing import Dict, List, Any, Optional
 
-from app.openrouter_agent import OpenRouterAgent
+from app.openrouter_agent import get_openrouter_agent, StreamProgress
+from app.llm_usage import track_usage
+from app.checkpoint_store import checkpoint_unit
+from app.llm_cache import refresh_llm_cache, reject_llm_response
 from app.redis_client import RedisClient
+from app.state_store import StateStore
 from app.agents.config_loader import load_station_config
 from app.agents.json_extractor import extract_json
+from app.agents.episode_batch import run_episode_batch
+from app.review_queue import request_review
 
 
 class Station26FinalScriptLock:
     """Station 26: Final Episode Script Lock"""
 
-    def __init__(self, session_id: str, skip_review: bool = False):
+    def __init__(self, session_id: str, skip_review: bool = False, batch_mode: bool = False):
         self.session_id = session_id
         self.skip_review = skip_review
-        self.agent = OpenRouterAgent()
+        self.batch_mode = batch_mode
+        self.agent = get_openrouter_agent()
         self.redis_client = RedisClient()
+        self.state = StateStore(self.redis_client)
         self.config = load_station_config(station_number=26)
 
         # Load additional config from YAML
@@ -79,6 +87,7 @@ class Station26FinalScriptLock:
         """Initialize connections"""
         await self.redis_client.initialize()
 
+    @track_usage(station="26")
     async def run(self):
         """Main execution method with episode loop"""
         print("=" * 70)
@@ -103,6 +112,12 @@ class Station26FinalScriptLock:
             print("✅ Runtime targets loaded")
             print()
 
+            if self.batch_mode:
+                # Batch mode: every episode concurrently, no selection menu
+                await self.run_batch()
+                self.display_session_summary()
+                return
+
             # Main finalization loop
             while True:
                 # Step 3: Display episode selection
@@ -132,17 +147,17 @@ class Station26FinalScriptLock:
     async def load_scripts(self):
         """Load scripts from Station 25, with fallback to Station 24"""
         try:
-            for episode_num in range(1, 25):
+            station_25 = await self.state.load_all_episodes(self.session_id, 25)
+            station_24 = await self.state.load_all_episodes(self.session_id, 24)
+
+            for episode_num in sorted(set(station_25) | set(station_24)):
                 try:
                     # Try Station 25 first
-                    key = f"audiobook:{self.session_id}:station_25:episode_{episode_num:02d}"
-                    data_raw = await self.redis_client.get(key)
+                    episode_data = station_25.get(episode_num)
                     complete_script = ""
                     source_station = "station_25"
 
-                    if data_raw:
-                        episode_data = json.loads(data_raw)
-
+                    if episode_data:
                         # Get the expanded script from word count expansion section
                         word_expansion = episode_data.get('word_count_expansion', {})
                         complete_script = word_expansion.get('expanded_full_script', '')
@@ -159,11 +174,9 @@ class Station26FinalScriptLock:
 
                     # If Station 25 doesn't have script content, try Station 24
                     if not complete_script:
-                        key_24 = f"audiobook:{self.session_id}:station_24:episode_{episode_num:02d}"
-                        data_raw_24 = await self.redis_client.get(key_24)
-                        
-                        if data_raw_24:
-                            episode_data_24 = json.loads(data_raw_24)
+                        episode_data_24 = station_24.get(episode_num)
+
+                        if episode_data_24:
                             dialogue_data = episode_data_24.get('dialogue_polished_script', {})
                             if isinstance(dialogue_data, dict):
                                 complete_script = dialogue_data.get('complete_polished_script', '')
@@ -331,6 +344,16 @@ class Station26FinalScriptLock:
         print("=" * 70)
         print()
 
+    async def run_batch(self):
+        """Finalize every episode concurrently (batch mode)"""
+        await run_episode_batch(
+            self.script_episodes.keys(),
+            self.finalize_episode,
+            label="Station 26 script lock",
+            max_concurrency=self.config_data.get('batch_concurrency'),
+            report_path=self.output_dir / f"{self.session_id}_batch_report.json"
+        )
+
     def get_episode_selection(self) -> Optional[int]:
         """Get episode selection from user"""
         print("=" * 70)
@@ -361,6 +384,10 @@ class Station26FinalScriptLock:
             except ValueError:
                 print("❌ Invalid input. Please enter a number or 'Q'")
 
+    @track_usage(episode_arg="episode_number")
+    @checkpoint_unit("episode", key_arg="episode_number",
+                     output_ref="audiobook:{session_id}:station_26:episode_{key:02d}",
+                     restore=lambda self, output, args: self.locked_episodes.add(args["episode_number"]))
     async def finalize_episode(self, episode_number: int):
         """Finalize episode to production-ready state"""
         print()
@@ -482,21 +509,22 @@ class Station26FinalScriptLock:
 
             if review_result == "regenerate":
                 # Regenerate finalization
-                expanded_script = await self.execute_word_count_expansion(
-                    episode_number, script, current_word_count, target_word_count, word_gap
-                )
-                audio_finalized = await self.execute_audio_finalization(
-                    episode_number,
-                    expanded_script.get('expanded_full_script', script)
-                )
-                performance_added = await self.execute_performance_notes(
-                    episode_number,
-                    audio_finalized.get('complete_audio_script', script)
-                )
-                validation = await self.execute_production_validation(
-                    episode_number,
-                    performance_added.get('script_with_performance_notes', script)
-                )
+                with refresh_llm_cache():
+                    expanded_script = await self.execute_word_count_expansion(
+                        episode_number, script, current_word_count, target_word_count, word_gap
+                    )
+                    audio_finalized = await self.execute_audio_finalization(
+                        episode_number,
+                        expanded_script.get('expanded_full_script', script)
+                    )
+                    performance_added = await self.execute_performance_notes(
+                        episode_number,
+                        audio_finalized.get('complete_audio_script', script)
+                    )
+                    validation = await self.execute_production_validation(
+                        episode_number,
+                        performance_added.get('script_with_performance_notes', script)
+                    )
         else:
             print("✅ Auto-accepting finalized script (skip_review=True)")
             print()
@@ -558,7 +586,9 @@ Return ONLY valid JSON:
                     response = await self.agent.process_message(
                         formatted_prompt,
                         model_name=self.config.model,
-                        max_tokens=16384
+                        max_tokens=16384,
+                        stream=self.config.get('stream', False),
+                        on_delta=StreamProgress("Script expansion")
                     )
                     
                     if not response or not response.strip():
@@ -575,6 +605,7 @@ Return ONLY valid JSON:
                 except Exception as e:
                     if attempt < max_retries - 1:
                         print(f"⚠️ Attempt {attempt + 1} failed: {str(e)}, retrying...")
+                        await reject_llm_response()  # Don't get the same bad answer from the cache
                         continue
                     else:
                         raise
@@ -693,40 +724,32 @@ Return ONLY valid JSON:
 
     async def human_review(self, episode_number: int, validation: Dict) -> str:
         """Human review interface"""
-        print("=" * 70)
-        print("⭐ FINAL REVIEW - SCRIPT LOCK DECISION")
-        print("=" * 70)
-        print()
-
         ready = validation.get('ready_for_production', False)
         status_msg = "✅ Production Ready" if ready else "⚠️  Needs Review"
 
-        print(f"Episode {episode_number}: {status_msg}")
-        print()
-        print("⚠️  WARNING: Locking the script means:")
-        print("  • No further changes without formal revision")
-        print("  • Goes to full production team")
-        print("  • Becomes authoritative version")
-        print()
-        print("OPTIONS:")
-        print("  [Enter] - LOCK SCRIPT for production")
-        print("  [R]     - Regenerate finalization")
-        print("  [V]     - View validation report")
-        print()
-
-        choice = input("Your choice: ").strip().upper()
+        choice = await request_review(
+            self.session_id, "26", f"Episode {episode_number}", "FINAL REVIEW - SCRIPT LOCK DECISION",
+            summary=[
+                f"Episode {episode_number}: {status_msg}",
+                "",
+                "⚠️  WARNING: Locking the script means:",
+                "  • No further changes without formal revision",
+                "  • Goes to full production team",
+                "  • Becomes authoritative version",
+            ],
+            options={
+                "": "LOCK SCRIPT for production",
+                "R": "Regenerate finalization",
+            },
+            views={"V": ("View validation report", lambda: print(json.dumps(validation, indent=2)))}
+        )
 
         if choice == 'R':
             return "regenerate"
-        elif choice == 'V':
-            print("\nValidation Details:")
-            print(json.dumps(validation, indent=2))
-            return await self.human_review(episode_number, validation)
         else:
             print("✅ Script locked for production")
             print()
             return "approved"
-
     async def save_episode_outputs(self, episode_number: int, expansion: Dict,
                                    audio: Dict, performance: Dict, validation: Dict):
         """Save final locked script and production package"""
@@ -780,8 +803,8 @@ Return ONLY valid JSON:
         print(f"✅ Saved Report: {report_path.name}")
 
         # 4. Save to Redis
-        redis_key = f"audiobook:{self.session_id}:station_26:episode_{episode_number:02d}"
-        await self.redis_client.set(redis_key, json.dumps(full_data), expire=604800)
+        redis_key = await self.state.save_station(self.session_id, 26, full_data,
+                                                   episode=episode_number, expire=604800)
 
         print()
 
@@ -875,7 +898,11 @@ async def main():
         print("❌ Session ID is required")
         return
 
-    station = Station26FinalScriptLock(session_id, skip_review=False)
+    # --batch processes every episode concurrently instead of the selection menu
+    import sys
+    batch_mode = '--batch' in sys.argv
+
+    station = Station26FinalScriptLock(session_id, skip_review=False, batch_mode=batch_mode)
     await station.initialize()
     await station.run()
 
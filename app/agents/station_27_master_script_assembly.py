@@ -30,20 +30,26 @@ from pathlib import Path
 from datetime import datetime
 from typing import Dict, List, Any, Optional
 
-from app.openrouter_agent import OpenRouterAgent
+from app.openrouter_agent import get_openrouter_agent
+from app.llm_usage import track_usage
+from app.checkpoint_store import checkpoint_unit
 from app.redis_client import RedisClient
+from app.state_store import StateStore
 from app.agents.config_loader import load_station_config
 from app.agents.json_extractor import extract_json
+from app.agents.episode_batch import run_episode_batch
 
 
 class Station27MasterScriptAssembly:
     """Station 27: Master Script Assembly"""
 
-    def __init__(self, session_id: str, skip_review: bool = False):
+    def __init__(self, session_id: str, skip_review: bool = False, batch_mode: bool = False):
         self.session_id = session_id
         self.skip_review = skip_review
-        self.agent = OpenRouterAgent()
+        self.batch_mode = batch_mode
+        self.agent = get_openrouter_agent()
         self.redis_client = RedisClient()
+        self.state = StateStore(self.redis_client)
         self.config = load_station_config(station_number=27)
 
         # Load additional config from YAML
@@ -71,6 +77,7 @@ class Station27MasterScriptAssembly:
         """Initialize connections"""
         await self.redis_client.initialize()
 
+    @track_usage(station="27")
     async def run(self):
         """Main execution method with episode loop"""
         print("=" * 70)
@@ -89,6 +96,12 @@ class Station27MasterScriptAssembly:
                 print("❌ No scripts found. Please run Station 26 first.")
                 return
 
+            if self.batch_mode:
+                # Batch mode: every episode concurrently, no selection menu
+                await self.run_batch()
+                self.display_session_summary()
+                return
+
             # Main assembly loop
             while True:
                 # Step 2: Display episode selection
@@ -118,22 +131,13 @@ class Station27MasterScriptAssembly:
     async def load_scripts(self):
         """Load scripts from Station 26"""
         try:
-            for episode_num in range(1, 25):
-                try:
-                    key = f"audiobook:{self.session_id}:station_26:episode_{episode_num:02d}"
-                    data_raw = await self.redis_client.get(key)
-
-                    if data_raw:
-                        episode_data = json.loads(data_raw)
-                        self.locked_episodes[episode_num] = {
-                            'source': 'station_26',
-                            'data': episode_data,
-                            'episode_number': episode_num
-                        }
-                        print(f"   ✓ Episode {episode_num} (from Station 26 - locked and finalized)")
-
-                except Exception:
-                    continue
+            for episode_num, episode_data in (await self.state.load_all_episodes(self.session_id, 26)).items():
+                self.locked_episodes[episode_num] = {
+                    'source': 'station_26',
+                    'data': episode_data,
+                    'episode_number': episode_num
+                }
+                print(f"   ✓ Episode {episode_num} (from Station 26 - locked and finalized)")
 
         except Exception as e:
             raise ValueError(f"❌ Error loading scripts: {str(e)}")
@@ -161,6 +165,16 @@ class Station27MasterScriptAssembly:
         print(f"Episodes Assembled: {len(self.assembled_episodes)}/{len(self.locked_episodes)}")
         print()
 
+    async def run_batch(self):
+        """Assemble every episode concurrently (batch mode)"""
+        await run_episode_batch(
+            self.locked_episodes.keys(),
+            self.assemble_episode,
+            label="Station 27 master assembly",
+            max_concurrency=self.config_data.get('batch_concurrency'),
+            report_path=self.output_dir / f"{self.session_id}_batch_report.json"
+        )
+
     def get_episode_selection(self) -> Optional[int]:
         """Get episode selection from user"""
         print("=" * 70)
@@ -189,6 +203,10 @@ class Station27MasterScriptAssembly:
             except ValueError:
                 print("❌ Please enter a valid episode number or 'Q' to quit")
 
+    @track_usage(episode_arg="episode_number")
+    @checkpoint_unit("episode", key_arg="episode_number",
+                     output_ref="audiobook:{session_id}:station_27:episode_{key:02d}",
+                     restore=lambda self, output, args: self.assembled_episodes.add(args["episode_number"]))
     async def assemble_episode(self, episode_number: int):
         """Assemble complete master script for episode"""
         print()
@@ -468,8 +486,8 @@ class Station27MasterScriptAssembly:
         print(f"✅ Saved Delivery Manifest: {manifest_path.name}")
 
         # 7. Save to Redis
-        redis_key = f"audiobook:{self.session_id}:station_27:episode_{episode_number:02d}"
-        await self.redis_client.set(redis_key, json.dumps(full_data), expire=604800)
+        redis_key = await self.state.save_station(self.session_id, 27, full_data,
+                                                   episode=episode_number, expire=604800)
 
         print()
         print(f"📁 Files saved to: {episode_dir}")
@@ -571,7 +589,11 @@ async def main():
     """Main execution"""
     session_id = input("📋 Enter session ID: ").strip()
 
-    station = Station27MasterScriptAssembly(session_id, skip_review=True)
+    # --batch processes every episode concurrently instead of the selection menu
+    import sys
+    batch_mode = '--batch' in sys.argv
+
+    station = Station27MasterScriptAssembly(session_id, skip_review=True, batch_mode=batch_mode)
     await station.initialize()
     await station.run()
 
@@ -9,7 +9,8 @@ Flow:
 1. Load Station 27 complete scripts
 2. Load Station 8 character bibles  
 3. Load Station 5 emotional journey maps
-4. Execute 4-task analysis sequence:
+4. Execute 4-task analysis sequence (episodes in parallel; tasks 1-3 run
+   concurrently, then task 4):
    - Task 1: Emotional Arc Verification
    - Task 2: Relationship Dynamics Check
    - Task 3: Universal Emotional Resonance
@@ -34,10 +35,15 @@ from pathlib import Path
 from datetime import datetime
 from typing import Dict, List, Any, Optional
 
-from app.openrouter_agent import OpenRouterAgent
+from app.openrouter_agent import get_openrouter_agent
+from app.llm_usage import track_usage
+from app.checkpoint_store import checkpoint_unit
 from app.redis_client import RedisClient
+from app.state_store import StateStore
 from app.agents.config_loader import load_station_config
 from app.agents.json_extractor import extract_json
+from app.agents.episode_batch import run_episode_batch
+from app.agents.task_graph import TaskGraph
 
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
@@ -48,8 +54,9 @@ class Station28EmotionalTruthValidator:
 
     def __init__(self, session_id: str):
         self.session_id = session_id
-        self.openrouter = OpenRouterAgent()
+        self.openrouter = get_openrouter_agent()
         self.redis = RedisClient()
+        self.state = StateStore(self.redis)
         self.config = load_station_config(station_number=28)
         self.output_dir = Path("output/station_28")
         self.output_dir.mkdir(parents=True, exist_ok=True)
@@ -59,6 +66,7 @@ class Station28EmotionalTruthValidator:
         await self.redis.initialize()
         logger.info("✅ Station 28 initialized")
 
+    @track_usage(station="28")
     async def run(self):
         """Main execution method"""
         print("=" * 70)
@@ -87,55 +95,22 @@ class Station28EmotionalTruthValidator:
             if not episodes:
                 raise ValueError("❌ No episodes found in Station 27 data. Cannot proceed.")
 
-            all_episode_results = []
-            
-            for episode_key, episode_data in episodes.items():
-                episode_id = episode_data.get('episode_number', episode_key)
-                print(f"\n🎬 Processing Episode: {episode_id}")
-                print("-" * 70)
-
-                # Execute 4-task analysis sequence
-                print("📊 Task 1/4: Emotional Arc Verification...")
-                emotional_arcs = await self.execute_task1_emotional_arc_verification(
-                    episode_data, station7_data, station5_data
-                )
-                print("✅ Emotional arc verification complete")
-
-                print("🤝 Task 2/4: Relationship Dynamics Check...")
-                relationship_dynamics = await self.execute_task2_relationship_dynamics_check(
-                    episode_data, station7_data
-                )
-                print("✅ Relationship dynamics check complete")
-
-                print("🌟 Task 3/4: Universal Emotional Resonance...")
-                universal_resonance = await self.execute_task3_universal_emotional_resonance(
-                    episode_data, station5_data
-                )
-                print("✅ Universal emotional resonance complete")
+            # Episodes are audited concurrently; each result is saved as it finishes
+            episode_results: Dict[str, Dict] = {}
 
-                print("🔍 Task 4/4: Emotional Problem Detection...")
-                problem_detection = await self.execute_task4_emotional_problem_detection(
-                    episode_data, emotional_arcs, relationship_dynamics, universal_resonance
+            async def audit(episode_key):
+                episode_results[episode_key] = await self.audit_episode(
+                    episode_key, episodes[episode_key], station7_data, station5_data
                 )
-                print("✅ Emotional problem detection complete")
-
-                # Compile episode results
-                episode_result = {
-                    "episode_id": episode_id,
-                    "emotional_scorecard": emotional_arcs,
-                    "relationship_chart": relationship_dynamics,
-                    "universal_resonance": universal_resonance,
-                    "problem_flags": problem_detection.get("problem_flags", []),
-                    "line_adjustments": problem_detection.get("line_adjustments", []),
-                    "timestamp": datetime.now().isoformat()
-                }
 
-                all_episode_results.append(episode_result)
-
-                # Save individual episode results
-                await self.save_episode_output(episode_result)
+            await run_episode_batch(
+                episodes.keys(), audit,
+                label="Station 28 emotional truth validation",
+                max_concurrency=self.config.get('batch_concurrency'),
+                report_path=self.output_dir / f"{self.session_id}_batch_report.json"
+            )
 
-                print(f"✅ Episode {episode_id} analysis complete")
+            all_episode_results = [episode_results[key] for key in sorted(episode_results)]
 
             # Step 4: Generate summary report
             print("\n" + "=" * 70)
@@ -164,26 +139,15 @@ class Station28EmotionalTruthValidator:
     async def load_station27_data(self) -> Dict:
         """Load Station 27 complete scripts from Redis"""
         try:
-            # Station 27 saves data with episode-specific keys
-            # Look for all episode keys for this session
-            pattern = f"audiobook:{self.session_id}:station_27:episode_*"
-            episode_keys = await self.redis.keys(pattern)
+            # Station 27 saves data with episode-specific keys; the session's
+            # episode index lists them, and they load in one round trip
+            stored = await self.state.load_all_episodes(self.session_id, 27)
             
-            if not episode_keys:
+            if not stored:
                 raise ValueError(f"❌ No Station 27 data found for session {self.session_id}\n   Please run Station 27 first")
             
-            # Load all episodes and combine them
-            episodes = {}
-            for key in episode_keys:
-                episode_raw = await self.redis.get(key)
-                if episode_raw:
-                    episode_data = json.loads(episode_raw)
-                    # Extract episode number from key (e.g., episode_01)
-                    episode_num = key.split(':')[-1]  # Gets "episode_01"
-                    episodes[episode_num] = episode_data
-            
-            if not episodes:
-                raise ValueError(f"❌ No valid Station 27 episode data found for session {self.session_id}")
+            # Keyed like "episode_01"
+            episodes = {f"episode_{number:02d}": episode_data for number, episode_data in stored.items()}
             
             # Return in expected format
             station27_data = {
@@ -516,6 +480,43 @@ class Station28EmotionalTruthValidator:
         except Exception as e:
             raise ValueError(f"❌ Summary report generation failed: {str(e)}")
 
+    @checkpoint_unit("audit", key_arg="episode_key")
+    async def audit_episode(self, episode_key: str, episode_data: Dict,
+                            station7_data: Dict, station5_data: Dict) -> Dict:
+        """Run the 4-task analysis for one episode and save the result"""
+        episode_id = episode_data.get('episode_number', episode_key)
+        print(f"🎬 Episode {episode_id}: running tasks 1-3 in parallel...")
+
+        # Tasks 1-3 are independent; task 4 needs all three
+        graph = TaskGraph(f"Episode {episode_id} emotional truth validation")
+        graph.add("emotional_arcs", lambda: self.execute_task1_emotional_arc_verification(
+            episode_data, station7_data, station5_data))
+        graph.add("relationship_dynamics", lambda: self.execute_task2_relationship_dynamics_check(
+            episode_data, station7_data))
+        graph.add("universal_resonance", lambda: self.execute_task3_universal_emotional_resonance(
+            episode_data, station5_data))
+        graph.add("problem_detection", lambda arcs, dynamics, resonance: self.execute_task4_emotional_problem_detection(
+            episode_data, arcs, dynamics, resonance),
+            depends_on=["emotional_arcs", "relationship_dynamics", "universal_resonance"])
+        results = await graph.run()
+        problem_detection = results["problem_detection"]
+
+        # Compile episode results
+        episode_result = {
+            "episode_id": episode_id,
+            "emotional_scorecard": results["emotional_arcs"],
+            "relationship_chart": results["relationship_dynamics"],
+            "universal_resonance": results["universal_resonance"],
+            "problem_flags": problem_detection.get("problem_flags", []),
+            "line_adjustments": problem_detection.get("line_adjustments", []),
+            "task_timings": graph.get_timings(),
+            "timestamp": datetime.now().isoformat()
+        }
+
+        # Save individual episode results
+        await self.save_episode_output(episode_result)
+        return episode_result
+
     async def save_episode_output(self, episode_result: Dict):
         """Save individual episode results to JSON and TXT"""
         episode_id = episode_result['episode_id']
@@ -529,6 +530,10 @@ class Station28EmotionalTruthValidator:
         txt_path = self.output_dir / f"{self.session_id}_{episode_id}_analysis.txt"
         self.save_episode_readable_txt(txt_path, episode_result)
 
+        # Stream to Redis so finished episodes are visible before the summary
+        redis_key = f"audiobook:{self.session_id}:station_28:audits"
+        await self.redis.hset(redis_key, str(episode_id), json.dumps(episode_result), expire=86400)
+
     def save_episode_readable_txt(self, path: Path, data: Dict):
         """Save human-readable TXT file for episode analysis"""
         with open(path, 'w', encoding='utf-8') as f:
@@ -9,7 +9,8 @@ Flow:
 1. Load Station 27 complete scripts
 2. Load Station 7 character bibles  
 3. Load Station 5 emotional journey maps
-4. Execute 4-task analysis sequence:
+4. Execute 4-task analysis sequence (episodes in parallel; tasks 1-3 run
+   concurrently, then task 4):
    - Task 1: Heroic Acts Inventory (Per Episode)
    - Task 2: Agency Scoring (1-5 Scale Per Episode)
    - Task 3: Heroic Arc Tracking (Cross-Episode)
@@ -34,10 +35,15 @@ from pathlib import Path
 from datetime import datetime
 from typing import Dict, List, Any, Optional
 
-from app.openrouter_agent import OpenRouterAgent
+from app.openrouter_agent import get_openrouter_agent
+from app.llm_usage import track_usage
+from app.checkpoint_store import checkpoint_unit
 from app.redis_client import RedisClient
+from app.state_store import StateStore
 from app.agents.config_loader import load_station_config
 from app.agents.json_extractor import extract_json
+from app.agents.episode_batch import run_episode_batch
+from app.agents.task_graph import TaskGraph
 
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
@@ -48,8 +54,9 @@ class Station29HeroicJourneyAuditor:
 
     def __init__(self, session_id: str):
         self.session_id = session_id
-        self.openrouter = OpenRouterAgent()
+        self.openrouter = get_openrouter_agent()
         self.redis = RedisClient()
+        self.state = StateStore(self.redis)
         self.config = load_station_config(station_number=29)
         self.output_dir = Path("output/station_29")
         self.output_dir.mkdir(parents=True, exist_ok=True)
@@ -59,6 +66,7 @@ class Station29HeroicJourneyAuditor:
         await self.redis.initialize()
         logger.info("✅ Station 29 initialized")
 
+    @track_usage(station="29")
     async def run(self):
         """Main execution method"""
         print("=" * 70)
@@ -87,56 +95,22 @@ class Station29HeroicJourneyAuditor:
             if not episodes:
                 raise ValueError("❌ No episodes found in Station 27 data. Cannot proceed.")
 
-            all_episode_results = []
-            
-            for episode_key, episode_data in episodes.items():
-                episode_id = episode_data.get('episode_number', episode_key)
-                print(f"\n🎬 Processing Episode: {episode_id}")
-                print("-" * 70)
-
-                # Execute 4-task analysis sequence
-                print("📊 Task 1/4: Heroic Acts Inventory...")
-                heroic_acts = await self.execute_task1_heroic_acts_inventory(
-                    episode_data, station7_data, station5_data
-                )
-                print("✅ Heroic acts inventory complete")
-
-                print("🎯 Task 2/4: Agency Scoring...")
-                agency_scores = await self.execute_task2_agency_scoring(
-                    episode_data, station7_data
-                )
-                print("✅ Agency scoring complete")
-
-                print("📈 Task 3/4: Heroic Arc Tracking...")
-                arc_tracking = await self.execute_task3_heroic_arc_tracking(
-                    episode_data, station5_data
-                )
-                print("✅ Heroic arc tracking complete")
+            # Episodes are audited concurrently; each result is saved as it finishes
+            episode_results: Dict[str, Dict] = {}
 
-                print("🔍 Task 4/4: Problem Identification & Fixes...")
-                problem_detection = await self.execute_task4_problem_identification_fixes(
-                    episode_data, heroic_acts, agency_scores, arc_tracking
+            async def audit(episode_key):
+                episode_results[episode_key] = await self.audit_episode(
+                    episode_key, episodes[episode_key], station7_data, station5_data
                 )
-                print("✅ Problem identification complete")
 
-                # Compile episode results
-                episode_result = {
-                    "episode_id": episode_id,
-                    "heroic_acts": heroic_acts,
-                    "agency_scorecard": agency_scores,
-                    "heroic_arc": arc_tracking,
-                    "problem_flags": problem_detection.get("problem_flags", []),
-                    "adjustments": problem_detection.get("adjustments", []),
-                    "audio_notes": problem_detection.get("audio_notes", []),
-                    "timestamp": datetime.now().isoformat()
-                }
-
-                all_episode_results.append(episode_result)
-
-                # Save individual episode results
-                await self.save_episode_output(episode_result)
+            await run_episode_batch(
+                episodes.keys(), audit,
+                label="Station 29 heroic journey audit",
+                max_concurrency=self.config.get('batch_concurrency'),
+                report_path=self.output_dir / f"{self.session_id}_batch_report.json"
+            )
 
-                print(f"✅ Episode {episode_id} analysis complete")
+            all_episode_results = [episode_results[key] for key in sorted(episode_results)]
 
             # Step 4: Generate summary report
             print("\n" + "=" * 70)
@@ -165,21 +139,13 @@ class Station29HeroicJourneyAuditor:
     async def load_station27_data(self) -> Dict:
         """Load Station 27 complete scripts from Redis, fallback to Station 21 if needed"""
         try:
-            # First try Station 27
-            pattern = f"audiobook:{self.session_id}:station_27:episode_*"
-            episode_keys = await self.redis.keys(pattern)
-            
-            episodes = {}
-            
-            if episode_keys:
-                # Load from Station 27
-                for key in episode_keys:
-                    episode_raw = await self.redis.get(key)
-                    if episode_raw:
-                        episode_data = json.loads(episode_raw)
-                        episode_num = key.split(':')[-1]  # Gets "episode_01"
-                        episodes[episode_num] = episode_data
-                
+            # First try Station 27 (episode index lookup, then one MGET)
+            episodes = {
+                f"episode_{number:02d}": episode_data  # Keyed like "episode_01"
+                for number, episode_data in (await self.state.load_all_episodes(self.session_id, 27)).items()
+            }
+            
+            if episodes:
                 # Check if Station 27 has actual content
                 has_content = False
                 for episode_data in episodes.values():
@@ -194,41 +160,37 @@ class Station29HeroicJourneyAuditor:
             
             # If Station 27 failed or has no content, try Station 21
             if not episodes:
-                pattern = f"audiobook:{self.session_id}:station_21:episode_*"
-                episode_keys = await self.redis.keys(pattern)
+                station21_episodes = await self.state.load_all_episodes(self.session_id, 21)
                 
-                if not episode_keys:
+                if not station21_episodes:
                     raise ValueError(f"❌ No Station 21 or Station 27 data found for session {self.session_id}\n   Please run Station 21 or Station 27 first")
                 
-                for key in episode_keys:
-                    episode_raw = await self.redis.get(key)
-                    if episode_raw:
-                        episode_data = json.loads(episode_raw)
-                        episode_num = key.split(':')[-1]  # Gets "episode_01"
-                        
-                        # Extract script content from Station 21 format
-                        draft_data = episode_data.get('draft_data', {})
-                        script_content = draft_data.get('first_draft_script', '')
-                        
-                        # If script_content is a dict (Station 21 format), extract the actual script text
-                        if isinstance(script_content, dict):
-                            scenes = script_content.get('scenes', [])
-                            extracted_script = ''
-                            for scene in scenes:
-                                scene_content = scene.get('script_content', '')
-                                extracted_script += scene_content + '\n\n'
-                            script_content = extracted_script
-                        
-                        # Convert Station 21 format to Station 27 format for compatibility
-                        converted_episode = {
-                            'episode_number': episode_data.get('episode_number', episode_num),
-                            'master_script_assembly': {
-                                'master_script_text': script_content,
-                                'assembly_status': 'complete'
-                            }
+                for number, episode_data in station21_episodes.items():
+                    episode_num = f"episode_{number:02d}"
+                    
+                    # Extract script content from Station 21 format
+                    draft_data = episode_data.get('draft_data', {})
+                    script_content = draft_data.get('first_draft_script', '')
+                    
+                    # If script_content is a dict (Station 21 format), extract the actual script text
+                    if isinstance(script_content, dict):
+                        scenes = script_content.get('scenes', [])
+                        extracted_script = ''
+                        for scene in scenes:
+                            scene_content = scene.get('script_content', '')
+                            extracted_script += scene_content + '\n\n'
+                        script_content = extracted_script
+                    
+                    # Convert Station 21 format to Station 27 format for compatibility
+                    converted_episode = {
+                        'episode_number': episode_data.get('episode_number', episode_num),
+                        'master_script_assembly': {
+                            'master_script_text': script_content,
+                            'assembly_status': 'complete'
                         }
-                        
-                        episodes[episode_num] = converted_episode
+                    }
+                    
+                    episodes[episode_num] = converted_episode
             
             if not episodes:
                 raise ValueError(f"❌ No valid episode data found for session {self.session_id}")
@@ -715,6 +677,44 @@ class Station29HeroicJourneyAuditor:
         except Exception as e:
             raise ValueError(f"❌ Summary report generation failed: {str(e)}")
 
+    @checkpoint_unit("audit", key_arg="episode_key")
+    async def audit_episode(self, episode_key: str, episode_data: Dict,
+                            station7_data: Dict, station5_data: Dict) -> Dict:
+        """Run the 4-task analysis for one episode and save the result"""
+        episode_id = episode_data.get('episode_number', episode_key)
+        print(f"🎬 Episode {episode_id}: running tasks 1-3 in parallel...")
+
+        # Tasks 1-3 are independent; task 4 needs all three
+        graph = TaskGraph(f"Episode {episode_id} heroic journey audit")
+        graph.add("heroic_acts", lambda: self.execute_task1_heroic_acts_inventory(
+            episode_data, station7_data, station5_data))
+        graph.add("agency_scores", lambda: self.execute_task2_agency_scoring(
+            episode_data, station7_data))
+        graph.add("arc_tracking", lambda: self.execute_task3_heroic_arc_tracking(
+            episode_data, station5_data))
+        graph.add("problem_detection", lambda acts, scores, arc: self.execute_task4_problem_identification_fixes(
+            episode_data, acts, scores, arc),
+            depends_on=["heroic_acts", "agency_scores", "arc_tracking"])
+        results = await graph.run()
+        problem_detection = results["problem_detection"]
+
+        # Compile episode results
+        episode_result = {
+            "episode_id": episode_id,
+            "heroic_acts": results["heroic_acts"],
+            "agency_scorecard": results["agency_scores"],
+            "heroic_arc": results["arc_tracking"],
+            "problem_flags": problem_detection.get("problem_flags", []),
+            "adjustments": problem_detection.get("adjustments", []),
+            "audio_notes": problem_detection.get("audio_notes", []),
+            "task_timings": graph.get_timings(),
+            "timestamp": datetime.now().isoformat()
+        }
+
+        # Save individual episode results
+        await self.save_episode_output(episode_result)
+        return episode_result
+
     async def save_episode_output(self, episode_result: Dict):
         """Save individual episode results to JSON and TXT"""
         episode_id = episode_result['episode_id']
@@ -728,6 +728,10 @@ class Station29HeroicJourneyAuditor:
         txt_path = self.output_dir / f"{self.session_id}_{episode_id}_analysis.txt"
         self.save_episode_readable_txt(txt_path, episode_result)
 
+        # Stream to Redis so finished episodes are visible before the summary
+        redis_key = f"audiobook:{self.session_id}:station_29:audits"
+        await self.redis.hset(redis_key, str(episode_id), json.dumps(episode_result), expire=86400)
+
     def save_episode_readable_txt(self, path: Path, data: Dict):
         """Save human-readable TXT file for episode analysis"""
         with open(path, 'w', encoding='utf-8') as f:
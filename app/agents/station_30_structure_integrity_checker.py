@@ -7,7 +7,8 @@ It analyzes structure adherence, reveal mechanism execution, subplot integration
 Flow:
 1. Load Station 5 structure choice and Station 10 reveal mechanism data
 2. Load all generated scripts across episodes from previous stations
-3. Execute 4-task validation sequence:
+3. Execute 4-task validation sequence (episodes in parallel, the four tasks
+   concurrently within each episode):
    - Task 1: Structure Adherence Validation
    - Task 2: Reveal Mechanism Check
    - Task 3: Subplot Integration Analysis
@@ -34,10 +35,16 @@ from datetime import datetime
 from typing import Dict, List, Any, Optional
 from dataclasses import dataclass
 
-from app.openrouter_agent import OpenRouterAgent
+from app.openrouter_agent import get_openrouter_agent
+from app.llm_usage import track_usage
+from app.checkpoint_store import checkpoint_unit
 from app.redis_client import RedisClient
+from app.state_store import StateStore
 from app.agents.config_loader import load_station_config
 from app.agents.json_extractor import extract_json
+from app.agents.episode_batch import run_episode_batch
+from app.agents.task_graph import TaskGraph
+from app.review_queue import request_review
 
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
@@ -106,10 +113,12 @@ class OutputValidationError(Exception):
 class Station30StructureIntegrityChecker:
     """Station 30: Narrative Structure Integrity Checker"""
 
-    def __init__(self, session_id: str):
+    def __init__(self, session_id: str, skip_review: bool = False):
         self.session_id = session_id
-        self.openrouter = OpenRouterAgent()
+        self.skip_review = skip_review
+        self.openrouter = get_openrouter_agent()
         self.redis = RedisClient()
+        self.state = StateStore(self.redis)
         self.config = load_station_config(station_number=30)
         self.output_dir = Path("output/station_30")
         self.output_dir.mkdir(parents=True, exist_ok=True)
@@ -210,6 +219,19 @@ class Station30StructureIntegrityChecker:
                 return True
         return False
     
+    def restore_flagged_issues(self, episode_result: Dict) -> None:
+        """Re-register an episode's issues when its validation is reused from a checkpoint"""
+        for issue in episode_result.get('flagged_issues', []):
+            if "issue_id" not in issue:
+                continue  # Only structure violations are tracked for approval
+            # Renumber so ids stay unique alongside issues flagged in this run
+            self.issue_counter += 1
+            issue["issue_id"] = self.issue_counter
+            if issue.get("approval_status") == "pending":
+                self.user_validation.total_issues_requiring_approval += 1
+                self.user_validation.pending_issues.append(self.issue_counter)
+            self.flagged_issues.append(issue)
+
     def get_pending_issues(self) -> List[Dict]:
         """Get all issues requiring user approval"""
         return [issue for issue in self.flagged_issues if issue["approval_status"] == "pending"]
@@ -503,9 +525,7 @@ class Station30StructureIntegrityChecker:
                 })
         
         # Check episode scripts exist
-        pattern = f"audiobook:{self.session_id}:station_*:episode_*"
-        episode_keys = await self.redis.keys(pattern)
-        if not episode_keys:
+        if not await self.script_stations():
             errors.append({
                 "type": "missing_scripts",
                 "message": "No episode scripts found to validate."
@@ -523,6 +543,7 @@ class Station30StructureIntegrityChecker:
         
         logger.info("✅ All input dependencies validated successfully")
 
+    @track_usage(station="30")
     async def run(self):
         """Main execution method"""
         print("=" * 70)
@@ -563,57 +584,22 @@ class Station30StructureIntegrityChecker:
             if not episodes:
                 raise ValueError("❌ No episodes found in episode scripts data. Cannot proceed.")
 
-            all_episode_results = []
-            
-            for episode_key, episode_data in episodes.items():
-                episode_id = episode_data.get('episode_number', episode_key)
-                print(f"\n🎬 Processing Episode: {episode_id}")
-                print("-" * 70)
-
-                # Execute 4-task validation sequence
-                print("📊 Task 1/4: Structure Adherence Validation...")
-                structure_compliance = await self.execute_task1_structure_adherence(
-                    episode_data, station5_data
-                )
-                print("✅ Structure adherence validation complete")
-
-                print("🔍 Task 2/4: Reveal Mechanism Check...")
-                reveal_mechanism = await self.execute_task2_reveal_mechanism_check(
-                    episode_data, station10_data
-                )
-                print("✅ Reveal mechanism check complete")
-
-                print("📈 Task 3/4: Subplot Integration Analysis...")
-                subplot_analysis = await self.execute_task3_subplot_integration(
-                    episode_data, station5_data
-                )
-                print("✅ Subplot integration analysis complete")
+            # Episodes are validated concurrently; each result is saved as it finishes
+            episode_results: Dict[str, Dict] = {}
 
-                print("🔗 Task 4/4: Cross-Episode Continuity...")
-                continuity_check = await self.execute_task4_cross_episode_continuity(
-                    episode_data, episode_scripts
+            async def validate(episode_key):
+                episode_results[episode_key] = await self.validate_episode(
+                    episode_key, episodes[episode_key], station5_data, station10_data, episode_scripts
                 )
-                print("✅ Cross-episode continuity check complete")
-
-                # Compile episode results
-                episode_result = {
-                    "episode_id": episode_id,
-                    "structure_compliance": structure_compliance,
-                    "reveal_mechanism": reveal_mechanism,
-                    "subplot_analysis": subplot_analysis,
-                    "continuity_check": continuity_check,
-                    "flagged_issues": self.extract_flagged_issues(
-                        structure_compliance, reveal_mechanism, subplot_analysis, continuity_check
-                    ),
-                    "timestamp": datetime.now().isoformat()
-                }
-
-                all_episode_results.append(episode_result)
 
-                # Save individual episode results
-                await self.save_episode_output(episode_result)
+            await run_episode_batch(
+                episodes.keys(), validate,
+                label="Station 30 structure integrity check",
+                max_concurrency=self.config.get('batch_concurrency'),
+                report_path=self.output_dir / f"{self.session_id}_batch_report.json"
+            )
 
-                print(f"✅ Episode {episode_id} validation complete")
+            all_episode_results = [episode_results[key] for key in sorted(episode_results)]
 
             # Step 5: Generate summary report
             print("\n" + "=" * 70)
@@ -707,25 +693,26 @@ class Station30StructureIntegrityChecker:
         except Exception as e:
             raise ValueError(f"❌ Error loading Station 10 data: {str(e)}")
 
+    async def script_stations(self) -> List[str]:
+        """Upstream stations with stored episodes, from the session's episode index"""
+        return [code for code in await self.state.episode_stations(self.session_id)
+                if code != "045" and int(code) < 30]
+
     async def load_episode_scripts(self) -> Dict:
         """Load all generated episode scripts from previous stations"""
         try:
-            # Look for episode scripts from various stations (27, 28, etc.)
-            pattern = f"audiobook:{self.session_id}:station_*:episode_*"
-            episode_keys = await self.redis.keys(pattern)
+            # Look for episode scripts from the script stations (21-27)
+            stations = await self.script_stations()
             
-            if not episode_keys:
+            if not stations:
                 raise ValueError(f"❌ No episode scripts found for session {self.session_id}\n   Please run script generation stations first")
             
-            # Load all episodes and combine them
+            # Load all episodes and combine them; the latest station's version
+            # of an episode wins
             episodes = {}
-            for key in episode_keys:
-                episode_raw = await self.redis.get(key)
-                if episode_raw:
-                    episode_data = json.loads(episode_raw)
-                    # Extract episode number from key (e.g., episode_01)
-                    episode_num = key.split(':')[-1]  # Gets "episode_01"
-                    episodes[episode_num] = episode_data
+            for station in stations:
+                for number, episode_data in (await self.state.load_all_episodes(self.session_id, station)).items():
+                    episodes[f"episode_{number:02d}"] = episode_data  # Keyed like "episode_01"
             
             if not episodes:
                 raise ValueError(f"❌ No valid episode scripts found for session {self.session_id}")
@@ -1225,18 +1212,20 @@ class Station30StructureIntegrityChecker:
                 print("-" * 70)
         
         # Ask for approval
-        print("\nOPTIONS:")
-        print("  [Enter] - Approve all fixes and continue")
-        print("  [R]      - Review all issues in detail")
-        print("  [S]      - Skip fixes and continue without changes")
-        print()
-        
-        choice = input("Your choice: ").strip().upper()
+        choice = "" if self.skip_review else await request_review(
+            self.session_id, "30", "All episodes", "FLAGGED ISSUES APPROVAL",
+            summary=[
+                f"Total Issues Found: {len(all_issues)} ({len(critical_issues)} critical, "
+                f"{len(high_issues)} high, {len(medium_issues)} medium, {len(low_issues)} low)",
+            ],
+            options={
+                "": "Approve all fixes and continue",
+                "S": "Skip fixes and continue without changes",
+            },
+            views={"R": ("Review all issues in detail", lambda: self._review_all_issues(all_issues))}
+        )
         
-        if choice == 'R':
-            self._review_all_issues(all_issues)
-            input("\nPress Enter when ready to continue: ")
-        elif choice == 'S':
+        if choice == 'S':
             print("⚠️ Continuing without applying fixes...")
         else:
             print("✅ Approved - fixes will be applied in future implementation")
@@ -1253,6 +1242,45 @@ class Station30StructureIntegrityChecker:
             print(f"Location: {issue.get('location', 'Unknown')}")
             print(f"Recommended Fix: {issue.get('recommended_fix', 'No fix provided')}")
 
+    @checkpoint_unit("validation", key_arg="episode_key",
+                     restore=lambda self, output, args: self.restore_flagged_issues(output))
+    async def validate_episode(self, episode_key: str, episode_data: Dict, station5_data: Dict,
+                               station10_data: Dict, episode_scripts: Dict) -> Dict:
+        """Run the 4-task validation for one episode and save the result"""
+        episode_id = episode_data.get('episode_number', episode_key)
+        print(f"🎬 Episode {episode_id}: running 4 validation tasks in parallel...")
+
+        # The four tasks only read their inputs, so they all run at once
+        graph = TaskGraph(f"Episode {episode_id} structure validation")
+        graph.add("structure_compliance", lambda: self.execute_task1_structure_adherence(
+            episode_data, station5_data))
+        graph.add("reveal_mechanism", lambda: self.execute_task2_reveal_mechanism_check(
+            episode_data, station10_data))
+        graph.add("subplot_analysis", lambda: self.execute_task3_subplot_integration(
+            episode_data, station5_data))
+        graph.add("continuity_check", lambda: self.execute_task4_cross_episode_continuity(
+            episode_data, episode_scripts))
+        results = await graph.run()
+
+        # Compile episode results
+        episode_result = {
+            "episode_id": episode_id,
+            "structure_compliance": results["structure_compliance"],
+            "reveal_mechanism": results["reveal_mechanism"],
+            "subplot_analysis": results["subplot_analysis"],
+            "continuity_check": results["continuity_check"],
+            "flagged_issues": self.extract_flagged_issues(
+                results["structure_compliance"], results["reveal_mechanism"],
+                results["subplot_analysis"], results["continuity_check"]
+            ),
+            "task_timings": graph.get_timings(),
+            "timestamp": datetime.now().isoformat()
+        }
+
+        # Save individual episode results
+        await self.save_episode_output(episode_result)
+        return episode_result
+
     async def save_episode_output(self, episode_result: Dict):
         """Save individual episode results to JSON and TXT"""
         episode_id = episode_result['episode_id']
@@ -1267,9 +1295,6 @@ class Station30StructureIntegrityChecker:
             "pending_issues": self.user_validation.pending_issues
         }
         
-        # Add flagged issues with approval tracking
-        episode_result['flagged_issues'] = self.flagged_issues
-        
         # Save JSON
         json_path = self.output_dir / f"{self.session_id}_{episode_id}_validation.json"
         with open(json_path, 'w', encoding='utf-8') as f:
@@ -1279,6 +1304,11 @@ class Station30StructureIntegrityChecker:
         txt_path = self.output_dir / f"{self.session_id}_{episode_id}_validation.txt"
         self.save_episode_readable_txt(txt_path, episode_result)
 
+        # Stream to Redis so finished episodes are visible before the summary
+        # (the key avoids "episode_" so load_episode_scripts' scan never picks it up)
+        redis_key = f"audiobook:{self.session_id}:station_30:audits"
+        await self.redis.hset(redis_key, str(episode_id), json.dumps(episode_result), expire=86400)
+
     def save_episode_readable_txt(self, path: Path, data: Dict):
         """Save human-readable TXT file for episode validation"""
         with open(path, 'w', encoding='utf-8') as f:
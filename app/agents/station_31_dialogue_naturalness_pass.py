@@ -26,8 +26,12 @@ from pathlib import Path
 from datetime import datetime
 from typing import Dict, List, Any, Optional
 
-from app.openrouter_agent import OpenRouterAgent
+from app.openrouter_agent import get_openrouter_agent
+from app.llm_usage import track_usage
+from app.checkpoint_store import checkpoint_unit
 from app.redis_client import RedisClient
+from app.state_store import StateStore
+from app.review_queue import request_review
 from app.agents.config_loader import load_station_config
 from app.agents.json_extractor import extract_json
 
@@ -41,8 +45,9 @@ class Station31DialogueNaturalnessPass:
     def __init__(self, session_id: str, skip_review: bool = False):
         self.session_id = session_id
         self.skip_review = skip_review
-        self.agent = OpenRouterAgent()
+        self.agent = get_openrouter_agent()
         self.redis_client = RedisClient()
+        self.state = StateStore(self.redis_client)
         self.config = load_station_config(station_number=31)
 
         # Load YAML config
@@ -67,6 +72,7 @@ class Station31DialogueNaturalnessPass:
         """Initialize Redis connection"""
         await self.redis_client.initialize()
 
+    @track_usage(station="31")
     async def run(self):
         """Main execution loop"""
         print("\n" + "=" * 70)
@@ -102,16 +108,14 @@ class Station31DialogueNaturalnessPass:
 
     async def load_scripts_from_station_26(self):
         """Load scripts from Station 26 Redis"""
-        for episode_num in range(1, 4):  # Episodes 1-3
-            try:
-                key = f"audiobook:{self.session_id}:station_26:episode_{episode_num:02d}"
-                data = await self.redis_client.get(key)
-                if data:
-                    episode_data = json.loads(data)
-                    self.episode_scripts[episode_num] = episode_data
-                    logger.info(f"✓ Loaded Episode {episode_num}")
-            except Exception as e:
-                logger.warning(f"Episode {episode_num} load failed: {e}")
+        try:
+            episodes = await self.state.load_all_episodes(self.session_id, 26)
+        except Exception as e:
+            logger.warning(f"Station 26 episodes load failed: {e}")
+            return
+        for episode_num, episode_data in episodes.items():
+            self.episode_scripts[episode_num] = episode_data
+            logger.info(f"✓ Loaded Episode {episode_num}")
 
     def select_episode(self) -> Optional[int]:
         """Interactive episode selection"""
@@ -121,7 +125,10 @@ class Station31DialogueNaturalnessPass:
 
         available = list(self.episode_scripts.keys())
         print(f"\nAvailable episodes: {available}")
-        print("Options: 1-3, 'all', 'q' to quit")
+        if self.skip_review:
+            print("Review skipped: processing all episodes")
+            return "all"
+        print("Options: an episode number, 'all', 'q' to quit")
 
         choice = input("\nEnter choice: ").strip().lower()
 
@@ -129,7 +136,7 @@ class Station31DialogueNaturalnessPass:
             return None
         elif choice == "all":
             return "all"
-        elif choice.isdigit() and 1 <= int(choice) <= 3:
+        elif choice.isdigit() and int(choice) in self.episode_scripts:
             return int(choice)
         else:
             print("❌ Invalid choice")
@@ -187,11 +194,12 @@ class Station31DialogueNaturalnessPass:
         self._display_subtext(results["subtext"])
 
         # Human Review
-        self._human_review(episode_num, results)
+        await self._human_review(episode_num, results)
 
         # Save Results
         await self._save_analysis_results(episode_num, results)
 
+    @checkpoint_unit("speakability", key_arg="episode_num")
     async def _check_speakability(self, episode_num: int, content: str) -> Dict:
         """Task 1: Check speakability"""
         prompt = self.yaml_config["prompts"]["speakability_check"].format(
@@ -204,6 +212,7 @@ class Station31DialogueNaturalnessPass:
         result = extract_json(response)
         return result if isinstance(result, dict) else {}
 
+    @checkpoint_unit("naturalness", key_arg="episode_num")
     async def _check_naturalness(self, episode_num: int, content: str) -> Dict:
         """Task 2: Check naturalness"""
         prompt = self.yaml_config["prompts"]["naturalness_scoring"].format(
@@ -216,6 +225,7 @@ class Station31DialogueNaturalnessPass:
         result = extract_json(response)
         return result if isinstance(result, dict) else {}
 
+    @checkpoint_unit("identity_clarity", key_arg="episode_num")
     async def _check_identity_clarity(self, episode_num: int, content: str) -> Dict:
         """Task 3: Check identity clarity"""
         prompt = self.yaml_config["prompts"]["identity_clarity_check"].format(
@@ -228,6 +238,7 @@ class Station31DialogueNaturalnessPass:
         result = extract_json(response)
         return result if isinstance(result, dict) else {}
 
+    @checkpoint_unit("subtext", key_arg="episode_num")
     async def _check_subtext(self, episode_num: int, content: str) -> Dict:
         """Task 4: Check subtext"""
         prompt = self.yaml_config["prompts"]["subtext_verification"].format(
@@ -323,26 +334,20 @@ class Station31DialogueNaturalnessPass:
                 print(f"  • Scene: {ex.get('scene')}")
                 print(f"    Problem: {ex.get('problem')}")
 
-    def _human_review(self, episode_num: int, results: Dict):
+    async def _human_review(self, episode_num: int, results: Dict):
         """Get human approval"""
-        print("\n" + "=" * 70)
-        print("⭐ HUMAN REVIEW REQUIRED")
-        print("=" * 70)
-
-        print("\nAnalysis complete. Options:")
-        print("  [Enter] - Approve and save")
-        print("  [F]     - View fixes")
-        print("  [R]     - Regenerate analysis")
-        print("  [V]     - View detailed report")
-
-        choice = input("\nYour choice: ").strip().lower()
+        choice = "" if self.skip_review else await request_review(
+            self.session_id, "31", f"Episode {episode_num}", "HUMAN REVIEW REQUIRED",
+            summary=["Analysis complete."],
+            options={"": "Approve and save", "R": "Regenerate analysis"},
+            views={
+                "F": ("View fixes", lambda: self._show_fixes(results)),
+                "V": ("View detailed report", lambda: self._show_detailed_report(results)),
+            }
+        )
 
-        if choice == "f":
-            self._show_fixes(results)
-        elif choice == "r":
+        if choice == "R":
             print("Regeneration requested (manual follow-up needed)")
-        elif choice == "v":
-            self._show_detailed_report(results)
         else:
             print("✅ Analysis approved")
 
@@ -388,22 +393,23 @@ class Station31DialogueNaturalnessPass:
             )
 
         # Save to Redis
-        key = f"audiobook:{self.session_id}:station_31:episode_{episode_num:02d}"
-        await self.redis_client.set(
-            key,
-            json.dumps(
-                {
-                    "episode": episode_num,
-                    "timestamp": timestamp,
-                    "dialogue_analysis": results,
-                }
-            ),
+        await self.state.save_station(
+            self.session_id,
+            31,
+            {
+                "episode": episode_num,
+                "timestamp": timestamp,
+                "dialogue_analysis": results,
+            },
+            episode=episode_num,
         )
 
         print(f"\n✅ Saved: {json_file.name}")
 
     def ask_continue(self) -> bool:
         """Ask to continue analysis"""
+        if self.skip_review:
+            return False
         choice = input("\n\nAnalyze another episode? (y/n): ").strip().lower()
         return choice == "y"
 
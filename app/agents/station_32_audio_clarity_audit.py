@@ -27,8 +27,12 @@ from pathlib import Path
 from datetime import datetime
 from typing import Dict, List, Any, Optional
 
-from app.openrouter_agent import OpenRouterAgent
+from app.openrouter_agent import get_openrouter_agent
+from app.llm_usage import track_usage
+from app.checkpoint_store import checkpoint_unit
 from app.redis_client import RedisClient
+from app.state_store import StateStore
+from app.review_queue import request_review
 from app.agents.config_loader import load_station_config
 from app.agents.json_extractor import extract_json
 
@@ -42,8 +46,9 @@ class Station32AudioClarityAudit:
     def __init__(self, session_id: str, skip_review: bool = False):
         self.session_id = session_id
         self.skip_review = skip_review
-        self.agent = OpenRouterAgent()
+        self.agent = get_openrouter_agent()
         self.redis_client = RedisClient()
+        self.state = StateStore(self.redis_client)
         self.config = load_station_config(station_number=32)
 
         # Load YAML config
@@ -68,6 +73,7 @@ class Station32AudioClarityAudit:
         """Initialize Redis connection"""
         await self.redis_client.initialize()
 
+    @track_usage(station="32")
     async def run(self):
         """Main execution loop"""
         print("\n" + "=" * 70)
@@ -107,29 +113,25 @@ class Station32AudioClarityAudit:
 
     async def load_scripts_from_station_26(self):
         """Load scripts from Station 26 Redis"""
-        for episode_num in range(1, 4):  # Episodes 1-3
-            try:
-                key = f"audiobook:{self.session_id}:station_26:episode_{episode_num:02d}"
-                data = await self.redis_client.get(key)
-                if data:
-                    episode_data = json.loads(data)
-                    self.episode_scripts[episode_num] = episode_data
-                    logger.info(f"✓ Loaded Episode {episode_num}")
-            except Exception as e:
-                logger.warning(f"Episode {episode_num} load failed: {e}")
+        try:
+            episodes = await self.state.load_all_episodes(self.session_id, 26)
+        except Exception as e:
+            logger.warning(f"Station 26 episodes load failed: {e}")
+            return
+        for episode_num, episode_data in episodes.items():
+            self.episode_scripts[episode_num] = episode_data
+            logger.info(f"✓ Loaded Episode {episode_num}")
 
     async def load_station_31_analysis(self):
         """Load Station 31 dialogue analysis results"""
         self.station_31_data = {}
-        for episode_num in range(1, 4):
-            try:
-                key = f"audiobook:{self.session_id}:station_31:episode_{episode_num:02d}"
-                data = await self.redis_client.get(key)
-                if data:
-                    self.station_31_data[episode_num] = json.loads(data)
-                    logger.info(f"✓ Loaded Station 31 data for Episode {episode_num}")
-            except Exception as e:
-                logger.warning(f"Station 31 data load failed for Episode {episode_num}: {e}")
+        try:
+            self.station_31_data = await self.state.load_all_episodes(self.session_id, 31)
+        except Exception as e:
+            logger.warning(f"Station 31 data load failed: {e}")
+            return
+        for episode_num in self.station_31_data:
+            logger.info(f"✓ Loaded Station 31 data for Episode {episode_num}")
 
     def select_episode(self) -> Optional[int]:
         """Interactive episode selection"""
@@ -139,7 +141,10 @@ class Station32AudioClarityAudit:
 
         available = list(self.episode_scripts.keys())
         print(f"\nAvailable episodes: {available}")
-        print("Options: 1-3, 'all', 'q' to quit")
+        if self.skip_review:
+            print("Review skipped: processing all episodes")
+            return "all"
+        print("Options: an episode number, 'all', 'q' to quit")
 
         choice = input("\nEnter choice: ").strip().lower()
 
@@ -147,12 +152,13 @@ class Station32AudioClarityAudit:
             return None
         elif choice == "all":
             return "all"
-        elif choice.isdigit() and 1 <= int(choice) <= 3:
+        elif choice.isdigit() and int(choice) in self.episode_scripts:
             return int(choice)
         else:
             print("❌ Invalid choice")
             return self.select_episode()
 
+    @track_usage(episode_arg="episode_num")
     async def audit_episode(self, episode_num):
         """Run all 4 clarity audits on episode"""
         if episode_num == "all":
@@ -205,11 +211,12 @@ class Station32AudioClarityAudit:
         self._display_information(results["information"])
 
         # Human Review
-        self._human_review(episode_num, results)
+        await self._human_review(episode_num, results)
 
         # Save Results
         await self._save_audit_results(episode_num, results)
 
+    @checkpoint_unit("scene_setting", key_arg="episode_num")
     async def _audit_scene_setting(self, episode_num: int, content: str) -> Dict:
         """Task 1: Audit scene setting clarity"""
         prompt = self.yaml_config["prompts"]["scene_setting_clarity"].format(
@@ -221,6 +228,7 @@ class Station32AudioClarityAudit:
         result = extract_json(response)
         return result if isinstance(result, dict) else {}
 
+    @checkpoint_unit("actions", key_arg="episode_num")
     async def _audit_actions(self, episode_num: int, content: str) -> Dict:
         """Task 2: Audit action comprehension"""
         prompt = self.yaml_config["prompts"]["action_comprehension"].format(
@@ -232,6 +240,7 @@ class Station32AudioClarityAudit:
         result = extract_json(response)
         return result if isinstance(result, dict) else {}
 
+    @checkpoint_unit("transitions", key_arg="episode_num")
     async def _audit_transitions(self, episode_num: int, content: str) -> Dict:
         """Task 3: Audit transition clarity"""
         prompt = self.yaml_config["prompts"]["transition_clarity"].format(
@@ -243,6 +252,7 @@ class Station32AudioClarityAudit:
         result = extract_json(response)
         return result if isinstance(result, dict) else {}
 
+    @checkpoint_unit("information", key_arg="episode_num")
     async def _audit_information(self, episode_num: int, content: str) -> Dict:
         """Task 4: Audit information delivery"""
         prompt = self.yaml_config["prompts"]["information_delivery"].format(
@@ -330,26 +340,20 @@ class Station32AudioClarityAudit:
         if overload:
             print(f"⚠️  Information overload moments: {len(overload)}")
 
-    def _human_review(self, episode_num: int, results: Dict):
+    async def _human_review(self, episode_num: int, results: Dict):
         """Get human approval"""
-        print("\n" + "=" * 70)
-        print("⭐ AUDIO CLARITY AUDIT COMPLETE - REVIEW REQUIRED")
-        print("=" * 70)
-
-        print("\nOptions:")
-        print("  [Enter] - Approve and save")
-        print("  [F]     - View audio fix specs")
-        print("  [R]     - Regenerate audit")
-        print("  [S]     - Show summary")
-
-        choice = input("\nYour choice: ").strip().lower()
+        choice = "" if self.skip_review else await request_review(
+            self.session_id, "32", f"Episode {episode_num}", "AUDIO CLARITY AUDIT COMPLETE - REVIEW REQUIRED",
+            summary=[],
+            options={"": "Approve and save", "R": "Regenerate audit"},
+            views={
+                "F": ("View audio fix specs", lambda: self._show_audio_specs(results)),
+                "S": ("Show summary", lambda: self._show_summary(results)),
+            }
+        )
 
-        if choice == "f":
-            self._show_audio_specs(results)
-        elif choice == "r":
+        if choice == "R":
             print("Regeneration requested (manual follow-up needed)")
-        elif choice == "s":
-            self._show_summary(results)
         else:
             print("✅ Audit approved")
 
@@ -397,22 +401,23 @@ class Station32AudioClarityAudit:
             )
 
         # Save to Redis
-        key = f"audiobook:{self.session_id}:station_32:episode_{episode_num:02d}"
-        await self.redis_client.set(
-            key,
-            json.dumps(
-                {
-                    "episode": episode_num,
-                    "timestamp": timestamp,
-                    "audio_clarity_audit": results,
-                }
-            ),
+        await self.state.save_station(
+            self.session_id,
+            32,
+            {
+                "episode": episode_num,
+                "timestamp": timestamp,
+                "audio_clarity_audit": results,
+            },
+            episode=episode_num,
         )
 
         print(f"\n✅ Saved: {json_file.name}")
 
     def ask_continue(self) -> bool:
         """Ask to continue audits"""
+        if self.skip_review:
+            return False
         choice = input("\n\nAudit another episode? (y/n): ").strip().lower()
         return choice == "y"
 
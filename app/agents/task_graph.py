@@ -0,0 +1,127 @@
+"""
+Task Graph for Per-Episode Analyses
+
+Several script stations run independent LLM analyses (e.g. pacing,
+repetition and energy flow in Station 22) that only feed a final fix step.
+TaskGraph runs every task as soon as the tasks it depends on have finished,
+so independent analyses overlap and the fix step starts right after the
+slowest of them:
+
+    graph = TaskGraph("Episode 3 momentum analysis")
+    graph.add("pacing", lambda: self.execute_pacing_analysis(3, draft))
+    graph.add("repetition", lambda: self.execute_repetition_detection(3, draft))
+    graph.add("auto_fix", lambda pacing, repetition: self.execute_fix(pacing, repetition),
+              depends_on=["pacing", "repetition"])
+    results = await graph.run()
+
+A dependent task receives its dependencies' results as positional arguments,
+in depends_on order. If any task fails, the tasks still running are
+cancelled and the error is raised, as it would be in a sequential run.
+"""
+
+import asyncio
+import logging
+import time
+from dataclasses import dataclass, field
+from typing import Any, Awaitable, Callable, Dict, List, Optional
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class TaskTiming:
+    """When a task ran, relative to the start of the graph"""
+    name: str
+    started_at: float = 0.0
+    seconds: float = 0.0
+    status: str = "pending"  # pending | completed | failed | cancelled
+
+
+@dataclass
+class _TaskNode:
+    name: str
+    func: Callable[..., Awaitable[Any]]
+    depends_on: List[str] = field(default_factory=list)
+
+
+class TaskGraph:
+    """A small DAG of async tasks run with maximum overlap"""
+
+    def __init__(self, label: str = ""):
+        self.label = label
+        self._nodes: Dict[str, _TaskNode] = {}
+        self.results: Dict[str, Any] = {}
+        self.timings: Dict[str, TaskTiming] = {}
+        self.wall_seconds = 0.0
+
+    def add(self, name: str, func: Callable[..., Awaitable[Any]],
+            depends_on: Optional[List[str]] = None) -> "TaskGraph":
+        """Add a task; dependencies must already be in the graph (so it stays acyclic)"""
+        if name in self._nodes:
+            raise ValueError(f"Task '{name}' is already in the graph")
+        depends_on = list(depends_on or [])
+        missing = [dep for dep in depends_on if dep not in self._nodes]
+        if missing:
+            raise ValueError(f"Task '{name}' depends on unknown task(s): {', '.join(missing)}")
+        self._nodes[name] = _TaskNode(name, func, depends_on)
+        return self
+
+    async def run(self) -> Dict[str, Any]:
+        """Run every task; returns {task name: result}"""
+        graph_start = time.monotonic()
+        tasks: Dict[str, asyncio.Task] = {}
+
+        async def run_node(node: _TaskNode):
+            args = [await tasks[dep] for dep in node.depends_on]
+            timing = self.timings[node.name]
+            started = time.monotonic()
+            timing.started_at = round(started - graph_start, 2)
+            try:
+                result = await node.func(*args)
+                timing.status = "completed"
+            except asyncio.CancelledError:
+                timing.status = "cancelled"
+                raise
+            except Exception:
+                timing.status = "failed"
+                raise
+            finally:
+                timing.seconds = round(time.monotonic() - started, 2)
+            self.results[node.name] = result
+            return result
+
+        for node in self._nodes.values():
+            self.timings[node.name] = TaskTiming(node.name)
+            tasks[node.name] = asyncio.ensure_future(run_node(node))
+
+        try:
+            await asyncio.gather(*tasks.values())
+        finally:
+            for task in tasks.values():
+                if not task.done():
+                    task.cancel()
+            self.wall_seconds = round(time.monotonic() - graph_start, 2)
+
+        logger.info(f"{self.label or 'Task graph'}: " + ", ".join(
+            f"{t.name} {t.seconds:.1f}s" for t in self.timings.values()
+        ) + f" (wall {self.wall_seconds:.1f}s)")
+        return self.results
+
+    def get_timings(self) -> Dict[str, Any]:
+        """Per-task timing report, e.g. for saving alongside episode outputs"""
+        return {
+            "wall_seconds": self.wall_seconds,
+            "sequential_seconds": round(sum(t.seconds for t in self.timings.values()), 2),
+            "tasks": {
+                t.name: {"started_at": t.started_at, "seconds": t.seconds, "status": t.status}
+                for t in self.timings.values()
+            },
+        }
+
+    def display_timings(self):
+        """Print per-task timing"""
+        report = self.get_timings()
+        print(f"⏱️  {self.label or 'Task timing'}:")
+        for name, timing in report["tasks"].items():
+            print(f"   • {name}: {timing['seconds']:.1f}s (started +{timing['started_at']:.1f}s)")
+        print(f"   Wall clock {report['wall_seconds']:.1f}s vs {report['sequential_seconds']:.1f}s sequential")
@@ -0,0 +1,276 @@
+"""
+Headless Batch Runner (many sessions at once)
+
+Runs the full pipeline for every story seed in a JSONL file, one session per
+seed, across a pool of worker processes. Each worker runs a PipelineRunner
+in its own asyncio loop with reviews auto-accepted and Station 1's prompts
+answered from the seed record, so no console is needed.
+
+Seeds file, one JSON object per line (blank lines and # comments ignored):
+
+    {"seed": "A lighthouse keeper hears her drowned brother on the radio",
+     "seed_type": "one-liner", "scale": "B", "title": 2}
+
+- seed_type: one-liner | synopsis | script | idea (default one-liner)
+- scale: A, B or C (default: the option Station 1 recommends)
+- title: 1-3 to pick a generated working title, or a title of your own (default 1)
+- session_id: optional; by default it is derived from the file name, the
+  line's position and a hash of the record, so rerunning the same file
+  picks up each session where it stopped (up-to-date stations are skipped,
+  see app/station_fingerprints.py) and an edited seed gets a fresh session
+
+Every worker talks to OpenRouter on its own, so LLM_GLOBAL_CONCURRENCY (or
+--llm-concurrency) caps the requests in flight across all of them through
+Redis (see app/llm_budget.py).
+
+Each session's console output goes to output/batch_<timestamp>/<session_id>.log
+and the outcome of every session to batch_summary_batch_<timestamp>.json.
+
+Usage:
+    python -m app.batch_runner seeds.jsonl --workers 4
+    python -m app.batch_runner seeds.jsonl --workers 8 --llm-concurrency 16 --stations 1-15
+"""
+
+import argparse
+import asyncio
+import contextlib
+import json
+import logging
+import os
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+from app.config import settings
+from app.checkpoint_store import unit_digest
+
+logger = logging.getLogger(__name__)
+
+SEED_TYPES = ("one-liner", "synopsis", "script", "idea")
+
+
+def load_seeds(path: Path) -> List[Dict[str, Any]]:
+    """Read and validate the seed records of a JSONL file
+
+    Raises:
+        ValueError: If a line is not a JSON object with usable seed fields
+    """
+    seeds = []
+    with open(path, "r", encoding="utf-8") as f:
+        for line_number, line in enumerate(f, 1):
+            line = line.strip()
+            if not line or line.startswith("#"):
+                continue
+            try:
+                record = json.loads(line)
+            except json.JSONDecodeError as e:
+                raise ValueError(f"{path}:{line_number}: invalid JSON ({e})")
+            if not isinstance(record, dict) or len(str(record.get("seed", "")).strip()) < 10:
+                raise ValueError(f"{path}:{line_number}: needs a \"seed\" of at least 10 characters")
+            if record.get("seed_type", "one-liner") not in SEED_TYPES:
+                raise ValueError(f"{path}:{line_number}: seed_type must be one of {', '.join(SEED_TYPES)}")
+            if record.get("scale") and str(record["scale"]).strip().upper() not in ("A", "B", "C"):
+                raise ValueError(f"{path}:{line_number}: scale must be A, B or C")
+            seeds.append(record)
+    return seeds
+
+
+def session_id_for(record: Dict[str, Any], index: int, stem: str) -> str:
+    """Stable session id for a seed record"""
+    if record.get("session_id"):
+        return str(record["session_id"])
+    return f"session_{stem}_{index:03d}_{unit_digest(record)[:8]}"
+
+
+def _init_worker(llm_concurrency: Optional[int]):
+    """Per-process setup: no console input, shared LLM budget size"""
+    sys.stdin = open(os.devnull, "r")
+    if llm_concurrency is not None:
+        settings.llm_global_concurrency = llm_concurrency
+
+
+def run_session(job: Dict[str, Any]) -> Dict[str, Any]:
+    """Run one session's pipeline in a worker process; never raises"""
+    from app.pipeline_runner import PipelineRunner
+
+    session_id = job["session_id"]
+    log_path = Path(job["log_path"])
+    result = {
+        "index": job["index"],
+        "session_id": session_id,
+        "log": str(log_path),
+        "status": "failed",
+        "completed_stations": [],
+        "failed_stations": [],
+        "skipped_stations": [],
+    }
+    started = time.monotonic()
+
+    with open(log_path, "a", encoding="utf-8") as log_file, \
+            contextlib.redirect_stdout(log_file), contextlib.redirect_stderr(log_file):
+        logging.basicConfig(
+            stream=log_file, level=logging.INFO, force=True,
+            format="%(asctime)s %(name)s %(levelname)s %(message)s"
+        )
+        try:
+            runner = PipelineRunner(
+                session_id,
+                stations=job["stations"],
+                max_concurrency=job["max_concurrency"],
+                skip_review=True,
+                force=job["force"],
+                station_kwargs={"1": {"seed": job["seed"]}},
+                run_id=f"auto_{job['batch_id']}_{job['index']:03d}"
+            )
+            summary = asyncio.run(runner.run())
+            for field in ("completed_stations", "failed_stations", "skipped_stations"):
+                result[field] = summary[field]
+            result["run_id"] = summary["run_id"]
+            result["status"] = "failed" if summary["failed_stations"] else "completed"
+        except BaseException as e:
+            # A worker must report back rather than take the pool down
+            logger.error(f"Session {session_id} failed: {e}", exc_info=True)
+            result["error"] = str(e) or type(e).__name__
+
+    result["wall_clock_seconds"] = round(time.monotonic() - started, 2)
+    return result
+
+
+def run_batch(seeds_path: Path, workers: int, stations: Optional[List[str]] = None,
+              max_concurrency: Optional[int] = None, llm_concurrency: Optional[int] = None,
+              force: bool = False) -> Dict[str, Any]:
+    """Run a pipeline for every seed in the file; returns the batch summary"""
+    seeds = load_seeds(seeds_path)
+    batch_id = f"batch_{datetime.now().strftime('%Y%m%d_%H%M%S')}"
+    batch_dir = Path(settings.output_dir) / batch_id
+    batch_dir.mkdir(parents=True, exist_ok=True)
+    budget = settings.llm_global_concurrency if llm_concurrency is None else llm_concurrency
+
+    jobs = []
+    for index, record in enumerate(seeds, 1):
+        session_id = session_id_for(record, index, seeds_path.stem)
+        jobs.append({
+            "index": index,
+            "session_id": session_id,
+            "seed": record,
+            "stations": stations,
+            "max_concurrency": max_concurrency,
+            "force": force,
+            "batch_id": batch_id,
+            "log_path": str(batch_dir / f"{session_id}.log"),
+        })
+
+    print("=" * 70)
+    print(f"🚀 BATCH RUN {batch_id}")
+    print("=" * 70)
+    print(f"Seeds: {len(jobs)} from {seeds_path}")
+    print(f"Workers: {workers}, LLM requests in flight: {budget or 'per-process limits only'}")
+    print(f"Logs: {batch_dir}/")
+    print()
+
+    wall_start = time.monotonic()
+    results = []
+    with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker,
+                             initargs=(llm_concurrency,)) as pool:
+        futures = {pool.submit(run_session, job): job for job in jobs}
+        for future in as_completed(futures):
+            job = futures[future]
+            try:
+                result = future.result()
+            except Exception as e:
+                # The worker process itself died
+                result = {"index": job["index"], "session_id": job["session_id"],
+                          "log": job["log_path"], "status": "failed", "error": str(e)}
+            results.append(result)
+            icon = "✅" if result["status"] == "completed" else "❌"
+            print(f"{icon} [{len(results)}/{len(jobs)}] {result['session_id']}: {result['status']}"
+                  + (f" ({result['wall_clock_seconds']:.1f}s)" if "wall_clock_seconds" in result else "")
+                  + (f" - {result['error'][:80]}" if result.get("error") else ""))
+    wall_seconds = time.monotonic() - wall_start
+
+    results.sort(key=lambda r: r["index"])
+    summary = {
+        "batch_id": batch_id,
+        "seeds_file": str(seeds_path),
+        "timestamp": datetime.now().isoformat(),
+        "workers": workers,
+        "llm_global_concurrency": budget,
+        "wall_clock_seconds": round(wall_seconds, 2),
+        "completed": [r["session_id"] for r in results if r["status"] == "completed"],
+        "failed": [r["session_id"] for r in results if r["status"] != "completed"],
+        "sessions": results,
+    }
+    summary_path = batch_dir / f"batch_summary_{batch_id}.json"
+    with open(summary_path, "w", encoding="utf-8") as f:
+        json.dump(summary, f, indent=2)
+
+    display_batch_summary(summary)
+    print(f"📄 Batch summary: {summary_path}")
+    return summary
+
+
+def display_batch_summary(summary: Dict[str, Any]):
+    """Print the per-session outcome table"""
+    print()
+    print("=" * 70)
+    print(f"📊 BATCH SUMMARY: {summary['batch_id']}")
+    print("=" * 70)
+    for r in summary["sessions"]:
+        icon = "✅" if r["status"] == "completed" else "❌"
+        line = f"  {icon} {r['session_id']}: {len(r.get('completed_stations', []))} station(s) completed"
+        if r.get("failed_stations"):
+            line += f", failed: {', '.join(map(str, r['failed_stations']))}"
+        if r.get("error"):
+            line += f" - {r['error'][:60]}"
+        print(line)
+    print()
+    session_seconds = sum(r.get("wall_clock_seconds", 0.0) for r in summary["sessions"])
+    print(f"Completed: {len(summary['completed'])}/{len(summary['sessions'])} in "
+          f"{summary['wall_clock_seconds']:.1f}s (sessions took {session_seconds:.1f}s in total)")
+    print("=" * 70)
+
+
+def main():
+    """Run a batch from the command line"""
+    from app.pipeline_runner import STATION_REGISTRY, expand_station_spec
+
+    parser = argparse.ArgumentParser(description="Run the pipeline for every seed in a JSONL file")
+    parser.add_argument("seeds", help="JSONL file with one seed record per line")
+    parser.add_argument("--workers", type=int, default=os.cpu_count() or 2,
+                        help="Sessions run at once, one process each (default: CPU count)")
+    parser.add_argument("--stations", help="Stations to run per session, e.g. '1-15' (default: all)")
+    parser.add_argument("--max-concurrency", type=int, default=None,
+                        help=f"Stations run at once within a session (default: {settings.pipeline_max_concurrency})")
+    parser.add_argument("--llm-concurrency", type=int, default=None,
+                        help="LLM requests in flight across all workers "
+                             f"(default: LLM_GLOBAL_CONCURRENCY={settings.llm_global_concurrency}, 0 = no shared cap)")
+    parser.add_argument("--force", action="store_true",
+                        help="Rerun stations even when their config and inputs are unchanged")
+    args = parser.parse_args()
+
+    stations = expand_station_spec(args.stations) if args.stations else None
+    unknown = [sid for sid in stations or [] if sid not in STATION_REGISTRY]
+    if unknown:
+        parser.error(f"Unknown station(s): {', '.join(unknown)}")
+
+    try:
+        summary = run_batch(
+            Path(args.seeds),
+            workers=max(1, args.workers),
+            stations=stations,
+            max_concurrency=args.max_concurrency,
+            llm_concurrency=args.llm_concurrency,
+            force=args.force
+        )
+    except (OSError, ValueError) as e:
+        parser.error(str(e))
+    if summary["failed"]:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO)
+    main()
@@ -0,0 +1,310 @@
+"""
+Task-Granular Checkpoints
+
+The pipeline checkpoint (output/auto_*/checkpoint_auto_*.json) records whole
+stations, so a crash in station 9 task 5 or station 26 episode 7 meant
+rerunning the station from the start. This store records every completed
+unit inside a station - a task, an episode, a seed batch - with its output,
+and a resumed station skips the units that already finished:
+
+    @checkpoint_unit("task_5_sensory_palette", state=["task_results"])
+    async def execute_task_5_sensory_palette(self): ...
+
+    @checkpoint_unit("episode", key_arg="episode_number",
+                     output_ref="audiobook:{session_id}:station_26:episode_{key:02d}")
+    async def finalize_episode(self, episode_number: int): ...
+
+A skipped unit returns its recorded output and restores the listed `state`
+attributes; `output_ref` names where the unit's output lives (Redis key or
+file) and the unit is rerun if that output has since disappeared.
+
+The session and station come from the usage scope (@track_usage on the
+station's entry point). Units are always recorded but only skipped when
+resuming - `python -m app.pipeline_runner --resume ...`, or STATION_RESUME=true
+for a station run on its own. A fresh run of a station drops that station's
+old units when it records its first one, and regenerate flows
+(`with refresh_llm_cache():`) never reuse a unit.
+
+Records are appended, one JSON line per completed unit, to
+output/{session_id}/units_{session_id}.jsonl, so recording a unit costs the
+same however many came before it. The journal is compacted when a session is
+loaded and mostly holds superseded lines. A unit whose record cannot be
+written still counts as completed; it is only logged and rerun on resume.
+"""
+
+import asyncio
+import hashlib
+import inspect
+import json
+import logging
+import os
+import tempfile
+import threading
+from contextlib import contextmanager
+from contextvars import ContextVar
+from datetime import datetime
+from functools import wraps
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Sequence
+
+from app.config import settings
+from app.llm_cache import is_cache_refresh
+from app.llm_usage import get_usage_scope
+from app.redis_client import RedisClient
+
+logger = logging.getLogger(__name__)
+
+# Set by the pipeline runner for --resume; None falls back to STATION_RESUME
+_resume_units: ContextVar[Optional[bool]] = ContextVar("checkpoint_resume_units", default=None)
+
+
+@contextmanager
+def resume_units(enabled: bool = True):
+    """Skip units recorded by an earlier run inside the block"""
+    token = _resume_units.set(enabled)
+    try:
+        yield
+    finally:
+        _resume_units.reset(token)
+
+
+def is_resuming() -> bool:
+    enabled = _resume_units.get()
+    return settings.station_resume if enabled is None else enabled
+
+
+def unit_digest(value: Any) -> str:
+    """Short stable hash of a JSON-able value, for unit keys that depend on inputs"""
+    payload = json.dumps(value, sort_keys=True, default=str)
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()[:12]
+
+
+def make_unit_id(unit: str, key: Any = None) -> str:
+    """'episode' + 7 -> 'episode_07'; 'seed_batch' + 'micro' -> 'seed_batch_micro'"""
+    if key is None:
+        return unit
+    if isinstance(key, int):
+        return f"{unit}_{key:02d}"
+    return f"{unit}_{key}"
+
+
+class CheckpointStore:
+    """Completed units per session and station, persisted as JSON"""
+
+    def __init__(self, output_dir: str = "output"):
+        self.output_dir = Path(output_dir)
+        self._lock = threading.Lock()
+        self._sessions: Dict[str, Dict[str, Dict[str, Dict[str, Any]]]] = {}
+        self._fresh_stations: set = set()
+
+    def _units_path(self, session_id: str) -> Path:
+        return self.output_dir / session_id / f"units_{session_id}.jsonl"
+
+    def _legacy_path(self, session_id: str) -> Path:
+        return self.output_dir / session_id / f"units_{session_id}.json"
+
+    def _load_session(self, session_id: str) -> Dict[str, Dict[str, Dict[str, Any]]]:
+        with self._lock:
+            if session_id in self._sessions:
+                return self._sessions[session_id]
+            stations: Dict[str, Dict[str, Dict[str, Any]]] = {}
+            legacy = self._legacy_path(session_id)
+            if legacy.exists():
+                try:
+                    with open(legacy, "r", encoding="utf-8") as f:
+                        stations = json.load(f).get("stations", {})
+                except (OSError, json.JSONDecodeError) as e:
+                    logger.warning(f"Could not load unit checkpoints for {session_id}: {e}")
+            path = self._units_path(session_id)
+            lines = 0
+            if path.exists():
+                try:
+                    with open(path, "r", encoding="utf-8") as f:
+                        for line in f:
+                            try:
+                                self._apply(stations, json.loads(line))
+                            except (json.JSONDecodeError, KeyError, TypeError):
+                                continue  # A line cut short by a crash
+                            lines += 1
+                except OSError as e:
+                    logger.warning(f"Could not load unit checkpoints for {session_id}: {e}")
+            self._sessions[session_id] = stations
+            live = sum(len(units) for units in stations.values())
+            if legacy.exists() or lines > 2 * live + 50:
+                self._compact(session_id, stations, legacy)
+            return stations
+
+    @staticmethod
+    def _apply(stations: Dict[str, Dict[str, Dict[str, Any]]], event: Dict[str, Any]):
+        """Replay one journal line"""
+        if event["op"] == "unit":
+            stations.setdefault(event["station"], {})[event["unit_id"]] = event["entry"]
+        elif event["op"] == "clear":
+            if event.get("station") is None:
+                stations.clear()
+            else:
+                stations.pop(event["station"], None)
+
+    def _compact(self, session_id: str, stations: Dict[str, Dict[str, Dict[str, Any]]], legacy: Path):
+        """Rewrite the journal with one line per live unit (caller holds the lock)"""
+        path = self._units_path(session_id)
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            with tempfile.NamedTemporaryFile("w", encoding="utf-8", dir=path.parent,
+                                             prefix=f"{path.name}.", suffix=".tmp",
+                                             delete=False) as f:
+                tmp_path = f.name
+                for station, units in stations.items():
+                    for unit_id, entry in units.items():
+                        f.write(self._line({"op": "unit", "station": station,
+                                            "unit_id": unit_id, "entry": entry}))
+            os.replace(tmp_path, path)
+            if legacy.exists():
+                legacy.unlink()
+        except OSError as e:
+            logger.warning(f"Could not compact unit checkpoints for {session_id}: {e}")
+
+    @staticmethod
+    def _line(event: Dict[str, Any]) -> str:
+        return json.dumps(event, ensure_ascii=False) + "\n"
+
+    def _append(self, session_id: str, *events: Dict[str, Any]):
+        """Append events to the session journal in one write (caller holds the lock)"""
+        path = self._units_path(session_id)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        with open(path, "a", encoding="utf-8") as f:
+            f.write("".join(self._line(event) for event in events))
+
+    def _add_unit(self, session_id: str, station: str, unit_id: str, entry: Dict[str, Any]):
+        """Apply and journal one completed unit; the lock keeps file and memory in the same order"""
+        stations = self._load_session(session_id)
+        events: List[Dict[str, Any]] = []
+        with self._lock:
+            if not is_resuming() and (session_id, station) not in self._fresh_stations:
+                # Fresh run: units from an earlier run of this station no longer apply
+                if stations.pop(station, None) is not None:
+                    events.append({"op": "clear", "station": station})
+            self._fresh_stations.add((session_id, station))
+            stations.setdefault(station, {})[unit_id] = entry
+            events.append({"op": "unit", "station": station, "unit_id": unit_id, "entry": entry})
+            self._append(session_id, *events)
+
+    def get(self, session_id: str, station: str, unit_id: str) -> Optional[Dict[str, Any]]:
+        """The record of a completed unit, or None"""
+        return self._load_session(session_id).get(station, {}).get(unit_id)
+
+    def completed_units(self, session_id: str, station: str) -> List[str]:
+        return sorted(self._load_session(session_id).get(station, {}))
+
+    async def record(self, session_id: str, station: str, unit_id: str, output: Any = None,
+                     state: Optional[Dict[str, Any]] = None, output_ref: Optional[str] = None):
+        """Mark a unit completed and append it to the journal off the event loop"""
+        entry = {
+            "completed_at": datetime.now().isoformat(),
+            "output": output,
+            "state": state or {},
+            "output_ref": output_ref,
+        }
+        try:
+            json.dumps(entry)
+        except (TypeError, ValueError) as e:
+            logger.warning(f"Station {station} unit {unit_id} is not JSON-serializable, not checkpointed: {e}")
+            return
+
+        try:
+            await asyncio.to_thread(self._add_unit, session_id, station, unit_id, entry)
+        except Exception as e:
+            # The unit itself finished; at worst it is rerun on resume
+            logger.warning(f"Could not checkpoint station {station} unit {unit_id}: {e}")
+
+    def clear(self, session_id: str, station: Optional[str] = None):
+        """Forget one station's units (or the whole session's)"""
+        stations = self._load_session(session_id)
+        with self._lock:
+            if station is None:
+                stations.clear()
+            else:
+                stations.pop(station, None)
+            try:
+                self._append(session_id, {"op": "clear", "station": station})
+            except OSError as e:
+                logger.warning(f"Could not clear unit checkpoints for {session_id}: {e}")
+
+
+# Global store instance (lazy initialization)
+checkpoint_store = None
+
+
+def get_checkpoint_store() -> CheckpointStore:
+    """Get the global checkpoint store, creating it if needed"""
+    global checkpoint_store
+    if checkpoint_store is None:
+        checkpoint_store = CheckpointStore(settings.output_dir)
+    return checkpoint_store
+
+
+async def _output_available(station_obj: Any, output_ref: Optional[str]) -> bool:
+    """Whether a unit's recorded output still exists (unknown counts as yes)"""
+    if not output_ref:
+        return True
+    if "/" in output_ref:
+        return Path(output_ref).exists()
+    for value in vars(station_obj).values():
+        if isinstance(value, RedisClient) and value.redis:
+            return bool(await value.exists(output_ref))
+    return True
+
+
+def checkpoint_unit(unit: str, key_arg: Optional[str] = None,
+                    key: Optional[Callable[[Dict[str, Any]], Any]] = None,
+                    state: Sequence[str] = (), output_ref: Optional[str] = None,
+                    restore: Optional[Callable[[Any, Any, Dict[str, Any]], None]] = None):
+    """Decorator that records an async station method as a resumable unit
+
+    key_arg names the parameter that tells units apart (e.g. the episode
+    number); key computes it from the bound arguments instead. state lists
+    attributes the method fills in, restored when the unit is skipped;
+    restore(self, output, arguments) re-applies any other side effect.
+    output_ref is formatted with session_id, station and key.
+    """
+    def decorator(func: Callable):
+        signature = inspect.signature(func)
+
+        @wraps(func)
+        async def wrapper(self, *args, **kwargs):
+            scope = get_usage_scope()
+            session_id = getattr(self, "session_id", None) or scope.session_id
+            station = scope.station
+            if not session_id or not station:
+                return await func(self, *args, **kwargs)
+
+            bound = signature.bind(self, *args, **kwargs)
+            bound.apply_defaults()
+            arguments = dict(bound.arguments)
+            key_value = key(arguments) if key else (arguments.get(key_arg) if key_arg else None)
+            unit_id = make_unit_id(unit, key_value)
+            ref = output_ref.format(session_id=session_id, station=station, key=key_value) if output_ref else None
+            store = get_checkpoint_store()
+
+            if is_resuming() and not is_cache_refresh():
+                record = store.get(session_id, station, unit_id)
+                if record and await _output_available(self, record.get("output_ref")):
+                    for attr, value in record.get("state", {}).items():
+                        setattr(self, attr, value)
+                    if restore:
+                        restore(self, record.get("output"), arguments)
+                    logger.info(f"Station {station}: {unit_id} completed at {record.get('completed_at')}, skipped")
+                    print(f"⏭️  {unit_id}: already completed in an earlier run, skipped")
+                    return record.get("output")
+
+            result = await func(self, *args, **kwargs)
+            await store.record(
+                session_id, station, unit_id,
+                output=result,
+                state={attr: getattr(self, attr) for attr in state},
+                output_ref=ref
+            )
+            return result
+
+        return wrapper
+    return decorator
@@ -0,0 +1,336 @@
+"""
+Compact Encoding for Station Outputs in Redis
+
+Station outputs are large JSON documents; the per-episode outputs of
+Stations 21-27 repeat the full script text several times. StateStore
+(app/state_store.py) writes them through this codec, which serializes with
+orjson (or msgpack) and compresses with zstd, optionally using a dictionary
+trained on the existing output/ corpus.
+
+Every encoded value starts with a short header naming its format, so the
+reader never needs to know how a value was written:
+
+    \\x00SC <version> <format: j|m> <compression: -|z> [<zstd dictionary id, 4 bytes>]
+
+Anything without the header is read as plain JSON, so values written before
+the codec existed (or by tools that write JSON directly) keep loading.
+`RedisClient.get()` decodes encoded values back to JSON text, so code that
+reads station keys directly still sees JSON. The files stations write to
+output/ stay pretty-printed JSON: they are the readable deliverables, and
+the corpus the dictionary is trained on.
+
+    STATE_CODEC=json            json (orjson when installed) or msgpack
+    STATE_COMPRESSION=zstd      zstd or none
+    STATE_COMPRESSION_LEVEL=3
+    STATE_COMPRESSION_MIN_BYTES=512
+    STATE_ZSTD_DICTIONARY=      path of a dictionary from `train-dict`
+
+A codec whose package is missing falls back to JSON / no compression with a
+warning. Readers need zstandard (and msgpack) for values written with them.
+
+    python -m app.codec train-dict                 # train on output/ into .cache/
+    python -m app.codec stats                      # sizes of output/ under each codec
+"""
+
+import argparse
+import json
+import logging
+import os
+import struct
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional, Tuple, Union
+
+from app.config import settings
+
+logger = logging.getLogger(__name__)
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import msgpack
+except ImportError:
+    msgpack = None
+
+try:
+    import zstandard
+except ImportError:
+    zstandard = None
+
+MAGIC = b"\x00SC"
+VERSION = 1
+FORMAT_JSON = b"j"
+FORMAT_MSGPACK = b"m"
+COMPRESSION_NONE = b"-"
+COMPRESSION_ZSTD = b"z"
+_HEADER_SIZE = len(MAGIC) + 3
+DEFAULT_DICTIONARY_PATH = ".cache/state_codec.dict"
+
+
+class CodecError(ValueError):
+    """An encoded value that this process cannot decode"""
+
+
+def is_encoded(raw: Union[bytes, str, None]) -> bool:
+    """True for values written by this codec (as opposed to plain JSON)"""
+    return isinstance(raw, (bytes, bytearray, memoryview)) and bytes(raw[:len(MAGIC)]) == MAGIC
+
+
+# Serializers
+
+def _dumps_json(data: Any) -> bytes:
+    if orjson is not None:
+        try:
+            return orjson.dumps(data, option=orjson.OPT_NON_STR_KEYS)
+        except TypeError:
+            pass  # Types orjson refuses (e.g. huge ints); the stdlib handles them
+    return json.dumps(data, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+
+
+def _loads_json(payload: bytes) -> Any:
+    if orjson is not None:
+        return orjson.loads(payload)
+    return json.loads(payload)
+
+
+_warned = set()
+
+
+def _warn_once(what: str, package: str):
+    if what not in _warned:
+        _warned.add(what)
+        logger.warning(f"{what} needs the {package} package (pip install {package}); "
+                       "falling back to JSON / no compression")
+
+
+def _format() -> bytes:
+    name = settings.state_codec.strip().lower()
+    if name == "msgpack":
+        if msgpack is not None:
+            return FORMAT_MSGPACK
+        _warn_once("STATE_CODEC=msgpack", "msgpack")
+    elif name not in ("json", "orjson"):
+        raise ValueError(f"Unknown STATE_CODEC {settings.state_codec!r} (use json or msgpack)")
+    return FORMAT_JSON
+
+
+def _serialize(data: Any, fmt: bytes) -> bytes:
+    if fmt == FORMAT_MSGPACK:
+        return msgpack.packb(data, use_bin_type=True)
+    return _dumps_json(data)
+
+
+def _deserialize(payload: bytes, fmt: bytes) -> Any:
+    if fmt == FORMAT_MSGPACK:
+        if msgpack is None:
+            raise CodecError("Value was written with msgpack; pip install msgpack to read it")
+        return msgpack.unpackb(payload, raw=False, strict_map_key=False)
+    if fmt == FORMAT_JSON:
+        return _loads_json(payload)
+    raise CodecError(f"Unknown codec format {fmt!r}")
+
+
+# Compression
+
+_dictionaries: Dict[str, Any] = {}
+_compressors: Dict[Tuple[int, int], Any] = {}
+_decompressors: Dict[int, Any] = {}
+
+
+def _dictionary() -> Optional[Any]:
+    """The configured zstd dictionary (None without one)"""
+    path = settings.state_zstd_dictionary
+    if not path or zstandard is None:
+        return None
+    if path not in _dictionaries:
+        try:
+            _dictionaries[path] = zstandard.ZstdCompressionDict(Path(path).read_bytes())
+        except OSError as e:
+            logger.warning(f"Could not load zstd dictionary {path}: {e}; compressing without it")
+            _dictionaries[path] = None
+    return _dictionaries[path]
+
+
+def _compressor():
+    dictionary = _dictionary()
+    dict_id = dictionary.dict_id() if dictionary is not None else 0
+    level = settings.state_compression_level
+    key = (level, dict_id)
+    if key not in _compressors:
+        _compressors[key] = zstandard.ZstdCompressor(level=level, dict_data=dictionary)
+    return _compressors[key], dict_id
+
+
+def _decompressor(dict_id: int):
+    if dict_id not in _decompressors:
+        dictionary = None
+        if dict_id:
+            dictionary = _dictionary()
+            if dictionary is None or dictionary.dict_id() != dict_id:
+                raise CodecError(f"Value was compressed with zstd dictionary {dict_id}; "
+                                 "point STATE_ZSTD_DICTIONARY at that dictionary to read it")
+        _decompressors[dict_id] = zstandard.ZstdDecompressor(dict_data=dictionary)
+    return _decompressors[dict_id]
+
+
+def _compression() -> bytes:
+    name = settings.state_compression.strip().lower()
+    if name in ("", "none"):
+        return COMPRESSION_NONE
+    if name != "zstd":
+        raise ValueError(f"Unknown STATE_COMPRESSION {settings.state_compression!r} (use zstd or none)")
+    if zstandard is None:
+        _warn_once("STATE_COMPRESSION=zstd", "zstandard")
+        return COMPRESSION_NONE
+    return COMPRESSION_ZSTD
+
+
+# Public API
+
+def encode(data: Any) -> bytes:
+    """Serialize (and compress) a value for storage, header included"""
+    fmt = _format()
+    payload = _serialize(data, fmt)
+    compression = _compression()
+    if compression == COMPRESSION_ZSTD and len(payload) >= settings.state_compression_min_bytes:
+        compressor, dict_id = _compressor()
+        header = MAGIC + bytes([VERSION]) + fmt + COMPRESSION_ZSTD + struct.pack(">I", dict_id)
+        return header + compressor.compress(payload)
+    if fmt == FORMAT_JSON:
+        # Small or uncompressed JSON is stored as is: readable by any client
+        return payload
+    return MAGIC + bytes([VERSION]) + fmt + COMPRESSION_NONE + payload
+
+
+def _unwrap(raw: bytes) -> Tuple[bytes, bytes]:
+    """(format, serialized payload) of an encoded value"""
+    if len(raw) < _HEADER_SIZE:
+        raise CodecError("Truncated codec header")
+    version = raw[len(MAGIC)]
+    if version != VERSION:
+        raise CodecError(f"Unsupported codec version {version}")
+    fmt = raw[len(MAGIC) + 1:len(MAGIC) + 2]
+    compression = raw[len(MAGIC) + 2:_HEADER_SIZE]
+    body = raw[_HEADER_SIZE:]
+    if compression == COMPRESSION_NONE:
+        return fmt, body
+    if compression != COMPRESSION_ZSTD:
+        raise CodecError(f"Unknown codec compression {compression!r}")
+    if zstandard is None:
+        raise CodecError("Value was compressed with zstd; pip install zstandard to read it")
+    (dict_id,) = struct.unpack(">I", body[:4])
+    try:
+        return fmt, _decompressor(dict_id).decompress(body[4:])
+    except zstandard.ZstdError as e:
+        raise CodecError(f"Corrupt zstd payload: {e}") from e
+
+
+def decode(raw: Union[bytes, str, None]) -> Any:
+    """Value stored by encode() or as plain JSON (None stays None)"""
+    if raw is None:
+        return None
+    if isinstance(raw, str):
+        return json.loads(raw)
+    raw = bytes(raw)
+    if not is_encoded(raw):
+        return _loads_json(raw)
+    fmt, payload = _unwrap(raw)
+    return _deserialize(payload, fmt)
+
+
+def decode_text(raw: Union[bytes, str, None]) -> Optional[str]:
+    """Stored value as text: encoded values come back as JSON text"""
+    if raw is None or isinstance(raw, str):
+        return raw
+    raw = bytes(raw)
+    if not is_encoded(raw):
+        return raw.decode("utf-8")
+    fmt, payload = _unwrap(raw)
+    if fmt == FORMAT_JSON:
+        return payload.decode("utf-8")
+    return json.dumps(_deserialize(payload, fmt), ensure_ascii=False)
+
+
+# Dictionary training and corpus statistics
+
+def _corpus(output_dir: str) -> Iterator[Tuple[Path, Any]]:
+    for path in sorted(Path(output_dir).rglob("*.json")):
+        try:
+            yield path, json.loads(path.read_text(encoding="utf-8"))
+        except (OSError, ValueError) as e:
+            logger.debug(f"Skipping {path}: {e}")
+
+
+def _samples(data: Any) -> List[bytes]:
+    """A document plus its top-level values, serialized as they would be stored"""
+    fmt = _format()
+    samples = [_serialize(data, fmt)]
+    if isinstance(data, dict):
+        samples.extend(_serialize(value, fmt) for value in data.values()
+                       if isinstance(value, (dict, list)))
+    return samples
+
+
+def train_dictionary(output_dir: str, dictionary_path: str, size: int = 112640) -> Dict[str, int]:
+    """Train a zstd dictionary on the JSON files under output_dir"""
+    if zstandard is None:
+        raise SystemExit("Training a dictionary needs the zstandard package (pip install zstandard)")
+    samples = [sample for _, data in _corpus(output_dir) for sample in _samples(data)]
+    if len(samples) < 8:
+        raise SystemExit(f"Only {len(samples)} sample(s) under {output_dir}/; run some stations first")
+    dictionary = zstandard.train_dictionary(size, samples, level=settings.state_compression_level)
+    target = Path(dictionary_path)
+    target.parent.mkdir(parents=True, exist_ok=True)
+    target.write_bytes(dictionary.as_bytes())
+    return {"samples": len(samples), "bytes": sum(map(len, samples)),
+            "dict_id": dictionary.dict_id(), "dict_bytes": len(dictionary.as_bytes())}
+
+
+def corpus_stats(output_dir: str) -> Dict[str, int]:
+    """Bytes of the output/ JSON files as written, as compact JSON, and encoded"""
+    stats = {"files": 0, "pretty": 0, "compact": 0, "encoded": 0}
+    for path, data in _corpus(output_dir):
+        stats["files"] += 1
+        stats["pretty"] += path.stat().st_size
+        stats["compact"] += len(json.dumps(data).encode("utf-8"))
+        stats["encoded"] += len(encode(data))
+    return stats
+
+
+def main():
+    """Command line entry point"""
+    parser = argparse.ArgumentParser(description="Station output codec tools")
+    sub = parser.add_subparsers(dest="command", required=True)
+    train_parser = sub.add_parser("train-dict", help="Train a zstd dictionary on the output/ corpus")
+    train_parser.add_argument("--output-dir", default=settings.output_dir)
+    train_parser.add_argument("--out", default=settings.state_zstd_dictionary or DEFAULT_DICTIONARY_PATH,
+                              help=f"Dictionary file (default: {DEFAULT_DICTIONARY_PATH})")
+    train_parser.add_argument("--size", type=int, default=112640, help="Dictionary size in bytes")
+    stats_parser = sub.add_parser("stats", help="Compare output/ sizes under the configured codec")
+    stats_parser.add_argument("--output-dir", default=settings.output_dir)
+    args = parser.parse_args()
+
+    if args.command == "train-dict":
+        result = train_dictionary(args.output_dir, args.out, args.size)
+        print(f"📚 Trained dictionary {result['dict_id']} ({result['dict_bytes']:,} bytes) on "
+              f"{result['samples']} samples ({result['bytes']:,} bytes) -> {args.out}")
+        if os.path.abspath(args.out) != os.path.abspath(settings.state_zstd_dictionary or ""):
+            print(f"   Set STATE_ZSTD_DICTIONARY={args.out} to use it")
+    else:
+        stats = corpus_stats(args.output_dir)
+        if not stats["files"]:
+            print(f"No JSON files under {args.output_dir}/")
+            return
+        print(f"📦 {stats['files']} files under {args.output_dir}/ "
+              f"(codec {settings.state_codec}, compression {settings.state_compression})")
+        print(f"   pretty JSON:  {stats['pretty']:>12,} bytes")
+        print(f"   compact JSON: {stats['compact']:>12,} bytes")
+        print(f"   encoded:      {stats['encoded']:>12,} bytes "
+              f"({stats['pretty'] / max(1, stats['encoded']):.1f}x smaller than the files)")
+
+
+if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO)
+    main()
@@ -0,0 +1,133 @@
+"""
+Cross-Process LLM Concurrency Budget
+
+The per-model limiters in app/llm_rate_limiter.py only see one process. When
+several pipelines run at once (app/batch_runner.py starts one process per
+session) their combined traffic can still exceed what the OpenRouter account
+allows, so LLM_GLOBAL_CONCURRENCY caps the requests in flight across every
+process that shares the Redis server.
+
+The budget is a Redis sorted set of leases: each in-flight request adds a
+member scored with its expiry time, and a slot is free while fewer than the
+limit unexpired members remain. Leases are renewed while the request runs
+and expire on their own if a worker dies mid-call, so a crashed process
+never strands the budget.
+
+With LLM_GLOBAL_CONCURRENCY=0 (the default) or no reachable Redis, calls go
+straight through and only the per-process limits apply.
+"""
+
+import asyncio
+import logging
+import random
+import time
+import uuid
+from contextlib import asynccontextmanager
+from typing import AsyncIterator, Optional
+
+import redis.asyncio as redis
+
+from app.config import settings
+from app.redis_pool import get_redis
+
+logger = logging.getLogger(__name__)
+
+BUDGET_KEY = "llm:global_budget"
+
+# Drop expired leases, then take a slot if one is free (atomic on the server)
+_ACQUIRE_SCRIPT = """
+redis.call('ZREMRANGEBYSCORE', KEYS[1], '-inf', ARGV[1])
+if redis.call('ZCARD', KEYS[1]) < tonumber(ARGV[2]) then
+    redis.call('ZADD', KEYS[1], ARGV[3], ARGV[4])
+    return 1
+end
+return 0
+"""
+
+
+class GlobalConcurrencyBudget:
+    """Redis-backed semaphore shared by every process using the same key"""
+
+    def __init__(self, limit: int, lease_seconds: float = 60.0, key: str = BUDGET_KEY):
+        self.limit = limit
+        self.lease_seconds = lease_seconds
+        self.key = key
+        self.wait_seconds = 0.0
+        self._disabled = limit <= 0
+
+    def _client(self) -> redis.Redis:
+        return get_redis()  # Shared pool, one per event loop
+
+    async def acquire(self) -> Optional[str]:
+        """Wait for a free slot; returns the lease token (None when the budget is off)"""
+        if self._disabled:
+            return None
+        token = uuid.uuid4().hex
+        started = time.monotonic()
+        delay = 0.05
+        while True:
+            now = time.time()
+            try:
+                acquired = await self._client().eval(
+                    _ACQUIRE_SCRIPT, 1, self.key, now, self.limit, now + self.lease_seconds, token
+                )
+            except Exception as e:
+                logger.warning(f"LLM concurrency budget unavailable, continuing without it: {e}")
+                self._disabled = True
+                return None
+            if int(acquired):
+                self.wait_seconds += time.monotonic() - started
+                return token
+            await asyncio.sleep(delay * random.uniform(0.5, 1.5))
+            delay = min(delay * 2, 1.0)
+
+    async def release(self, token: Optional[str]):
+        """Give a slot back"""
+        if token is None:
+            return
+        try:
+            await self._client().zrem(self.key, token)
+        except Exception as e:
+            logger.warning(f"Could not release LLM budget lease (it will expire): {e}")
+
+    async def _renew(self, token: str):
+        """Keep a long-running request's lease alive"""
+        while True:
+            await asyncio.sleep(self.lease_seconds / 3)
+            try:
+                await self._client().zadd(self.key, {token: time.time() + self.lease_seconds}, xx=True)
+            except Exception as e:
+                logger.warning(f"Could not renew LLM budget lease: {e}")
+
+    @asynccontextmanager
+    async def slot(self) -> AsyncIterator["GlobalConcurrencyBudget"]:
+        """Hold one budget slot for the duration of the block"""
+        token = await self.acquire()
+        renewer = asyncio.create_task(self._renew(token)) if token else None
+        try:
+            yield self
+        finally:
+            if renewer:
+                renewer.cancel()
+            await self.release(token)
+
+    async def in_flight(self) -> int:
+        """Unexpired leases across all processes"""
+        if self._disabled:
+            return 0
+        return await self._client().zcount(self.key, time.time(), "+inf")
+
+
+# Global budget instance (lazy initialization)
+llm_budget = None
+
+
+def get_llm_budget() -> GlobalConcurrencyBudget:
+    """Get the process-wide handle on the shared LLM budget"""
+    global llm_budget
+    if llm_budget is None:
+        llm_budget = GlobalConcurrencyBudget(
+            settings.llm_global_concurrency,
+            lease_seconds=settings.llm_global_lease_seconds
+        )
+    return llm_budget
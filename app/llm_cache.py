@@ -0,0 +1,308 @@
+"""
+Content-Addressed LLM Response Cache
+
+Responses are keyed on a SHA-256 of (model id, full messages, temperature,
+max_tokens), so re-running a station after a crash replays every prompt it
+already paid for instead of calling OpenRouter again.
+
+Tiers:
+- Disk (SQLite): always on when caching is enabled; LRU eviction by last
+  access, TTL expiry and entry/byte size caps
+- Redis (optional): shared across machines/sessions, TTL only; hits are
+  promoted to the local disk tier
+
+Opting out:
+- Per call: generate(..., use_cache=False) / process_message(..., use_cache=False)
+- Per station: `llm_cache: false` in configs/station_N.yml (applies to every
+  call made inside the station's usage scope)
+- Regenerate flows: `with refresh_llm_cache():` skips reads but stores the
+  fresh response so later reruns see the regenerated output
+
+Rejected responses: a caller that throws away a response (bad JSON, failed
+validation) calls `await reject_llm_response()` before retrying. The entry
+is evicted, so the retry asks the model again and a rerun never replays the
+bad answer.
+"""
+
+import asyncio
+import hashlib
+import json
+import logging
+import sqlite3
+import threading
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from pathlib import Path
+from typing import Dict, Any, Optional, List
+
+from app.config import settings
+
+logger = logging.getLogger(__name__)
+
+# Set inside refresh_llm_cache() blocks
+_refresh_cache: ContextVar[bool] = ContextVar("llm_cache_refresh", default=False)
+
+# Cache key of the response the last call in this context returned
+_last_response_key: ContextVar[Optional[str]] = ContextVar("llm_last_response_key", default=None)
+
+
+@contextmanager
+def refresh_llm_cache():
+    """Bypass cache reads (but still write) for calls made inside the block"""
+    token = _refresh_cache.set(True)
+    try:
+        yield
+    finally:
+        _refresh_cache.reset(token)
+
+
+def is_cache_refresh() -> bool:
+    """Whether the current context asked for fresh responses"""
+    return _refresh_cache.get()
+
+
+def note_response_key(key: Optional[str]):
+    """Remember which cache entry the current call returned (None: not cached)"""
+    _last_response_key.set(key)
+
+
+async def reject_llm_response():
+    """Evict the cached response the last call in this context returned
+
+    Call it when the response is unusable, before retrying the same prompt.
+    """
+    key = _last_response_key.get()
+    _last_response_key.set(None)
+    cache = get_llm_cache()
+    if key is not None and cache is not None:
+        await cache.delete(key)
+
+
+def make_cache_key(model_id: str, messages: List[Dict[str, Any]],
+                   temperature: float, max_tokens: int) -> str:
+    """Hash the request fields that determine the response"""
+    canonical = json.dumps(
+        {
+            "model": model_id,
+            "messages": messages,
+            "temperature": temperature,
+            "max_tokens": max_tokens
+        },
+        sort_keys=True,
+        ensure_ascii=False,
+        separators=(",", ":")
+    )
+    return hashlib.sha256(canonical.encode("utf-8")).hexdigest()
+
+
+class DiskCacheTier:
+    """SQLite-backed cache with LRU/TTL eviction and size caps"""
+
+    def __init__(self, path: str, max_entries: int, max_bytes: int, ttl_seconds: int):
+        self.path = Path(path)
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.ttl_seconds = ttl_seconds
+        self._lock = threading.Lock()
+        self._conn: Optional[sqlite3.Connection] = None
+
+    def _connection(self) -> sqlite3.Connection:
+        if self._conn is None:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            self._conn = sqlite3.connect(str(self.path), check_same_thread=False)
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS llm_cache ("
+                " key TEXT PRIMARY KEY,"
+                " value TEXT NOT NULL,"
+                " size INTEGER NOT NULL,"
+                " created_at REAL NOT NULL,"
+                " last_access REAL NOT NULL)"
+            )
+            self._conn.execute(
+                "CREATE INDEX IF NOT EXISTS idx_llm_cache_access ON llm_cache(last_access)"
+            )
+            self._conn.commit()
+        return self._conn
+
+    def get(self, key: str) -> Optional[str]:
+        with self._lock:
+            conn = self._connection()
+            row = conn.execute(
+                "SELECT value, created_at FROM llm_cache WHERE key = ?", (key,)
+            ).fetchone()
+            if row is None:
+                return None
+
+            value, created_at = row
+            now = time.time()
+            if self.ttl_seconds and now - created_at > self.ttl_seconds:
+                conn.execute("DELETE FROM llm_cache WHERE key = ?", (key,))
+                conn.commit()
+                return None
+
+            conn.execute("UPDATE llm_cache SET last_access = ? WHERE key = ?", (now, key))
+            conn.commit()
+            return value
+
+    def put(self, key: str, value: str):
+        with self._lock:
+            conn = self._connection()
+            now = time.time()
+            conn.execute(
+                "INSERT OR REPLACE INTO llm_cache (key, value, size, created_at, last_access)"
+                " VALUES (?, ?, ?, ?, ?)",
+                (key, value, len(value.encode("utf-8")), now, now)
+            )
+            self._evict(conn, now)
+            conn.commit()
+
+    def _evict(self, conn: sqlite3.Connection, now: float):
+        """Drop expired entries, then least-recently-used ones over the caps"""
+        if self.ttl_seconds:
+            conn.execute("DELETE FROM llm_cache WHERE created_at < ?", (now - self.ttl_seconds,))
+
+        count, total_bytes = conn.execute(
+            "SELECT COUNT(*), COALESCE(SUM(size), 0) FROM llm_cache"
+        ).fetchone()
+
+        while count > self.max_entries or total_bytes > self.max_bytes:
+            # Evict in batches of ~10% to avoid re-checking after every row
+            batch = max(1, count // 10)
+            rows = conn.execute(
+                "SELECT key, size FROM llm_cache ORDER BY last_access ASC LIMIT ?", (batch,)
+            ).fetchall()
+            if not rows:
+                break
+            conn.executemany("DELETE FROM llm_cache WHERE key = ?", [(k,) for k, _ in rows])
+            count -= len(rows)
+            total_bytes -= sum(size for _, size in rows)
+
+    def delete(self, key: str):
+        with self._lock:
+            conn = self._connection()
+            conn.execute("DELETE FROM llm_cache WHERE key = ?", (key,))
+            conn.commit()
+
+    def clear(self):
+        with self._lock:
+            conn = self._connection()
+            conn.execute("DELETE FROM llm_cache")
+            conn.commit()
+
+
+class RedisCacheTier:
+    """Optional shared cache tier in Redis (TTL eviction only)"""
+
+    KEY_PREFIX = "llm_cache:"
+
+    def __init__(self, ttl_seconds: int):
+        self.ttl_seconds = ttl_seconds
+        self._client = None
+        self._disabled = False
+
+    async def _get_client(self):
+        if self._disabled:
+            return None
+        if self._client is None:
+            try:
+                from app.redis_client import RedisClient
+                client = RedisClient()
+                await client.connect()
+                self._client = client
+            except Exception as e:
+                logger.warning(f"LLM cache Redis tier unavailable, using disk only: {e}")
+                self._disabled = True
+                return None
+        return self._client
+
+    async def get(self, key: str) -> Optional[str]:
+        client = await self._get_client()
+        if client is None:
+            return None
+        try:
+            return await client.get(self.KEY_PREFIX + key)
+        except Exception as e:
+            logger.warning(f"LLM cache Redis read failed: {e}")
+            return None
+
+    async def put(self, key: str, value: str):
+        client = await self._get_client()
+        if client is None:
+            return
+        try:
+            await client.set(self.KEY_PREFIX + key, value, expire=self.ttl_seconds or None)
+        except Exception as e:
+            logger.warning(f"LLM cache Redis write failed: {e}")
+
+    async def delete(self, key: str):
+        client = await self._get_client()
+        if client is None:
+            return
+        try:
+            await client.delete(self.KEY_PREFIX + key)
+        except Exception as e:
+            logger.warning(f"LLM cache Redis delete failed: {e}")
+
+
+class LLMResponseCache:
+    """Two-tier response cache used by OpenRouterAgent"""
+
+    def __init__(self):
+        self.disk = DiskCacheTier(
+            settings.llm_cache_path,
+            max_entries=settings.llm_cache_max_entries,
+            max_bytes=settings.llm_cache_max_bytes,
+            ttl_seconds=settings.llm_cache_ttl_seconds
+        )
+        self.redis = RedisCacheTier(settings.llm_cache_ttl_seconds) if settings.llm_cache_redis else None
+        self.hits = 0
+        self.misses = 0
+
+    async def get(self, key: str) -> Optional[Dict[str, Any]]:
+        """Look up a cached response body"""
+        value = await asyncio.to_thread(self.disk.get, key)
+
+        if value is None and self.redis is not None:
+            value = await self.redis.get(key)
+            if value is not None:
+                # Promote shared hits to the local tier
+                await asyncio.to_thread(self.disk.put, key, value)
+
+        if value is None:
+            self.misses += 1
+            return None
+
+        self.hits += 1
+        return json.loads(value)
+
+    async def put(self, key: str, result: Dict[str, Any]):
+        """Store a response body in every tier"""
+        value = json.dumps(result, ensure_ascii=False)
+        await asyncio.to_thread(self.disk.put, key, value)
+        if self.redis is not None:
+            await self.redis.put(key, value)
+
+    async def delete(self, key: str):
+        """Remove a response from every tier"""
+        await asyncio.to_thread(self.disk.delete, key)
+        if self.redis is not None:
+            await self.redis.delete(key)
+
+    def get_stats(self) -> Dict[str, int]:
+        return {"hits": self.hits, "misses": self.misses}
+
+
+# Global cache instance (lazy initialization)
+llm_cache = None
+
+
+def get_llm_cache() -> Optional[LLMResponseCache]:
+    """Get the global response cache, or None when caching is disabled"""
+    global llm_cache
+    if not settings.llm_cache_enabled:
+        return None
+    if llm_cache is None:
+        llm_cache = LLMResponseCache()
+    return llm_cache
@@ -0,0 +1,127 @@
+"""
+LLM Cassette Record/Replay
+
+Records every OpenRouter request/response pair to a gzip-compressed JSON
+Lines "cassette" and replays them deterministically later, so full station
+runs can be benchmarked and regression-tested without the paid API.
+
+Modes (LLM_CASSETTE_MODE):
+- "record": calls go to OpenRouter as usual and each exchange is appended
+  to the cassette
+- "replay": calls are answered from the cassette; a request that was never
+  recorded raises CassetteMissError
+- "" (default): disabled
+
+While a cassette is active the LLM response cache is bypassed, so every
+call is recorded (not just cache misses) and replayed responses never
+reach the real cache.
+
+Each line holds the request key (see app.llm_cache.make_cache_key), the
+request body, the response body and the observed latency. Identical
+requests recorded several times are replayed in recording order.
+
+The cassettes are also served over HTTP by tools/openrouter_stub_server.py.
+"""
+
+import gzip
+import json
+import threading
+from collections import defaultdict
+from pathlib import Path
+from typing import Dict, Any, List, Optional
+
+from app.config import settings
+from app.llm_cache import make_cache_key
+
+
+class CassetteMissError(Exception):
+    """Raised in replay mode when a request is not on the cassette"""
+
+
+def request_key(data: Dict[str, Any]) -> str:
+    """Cassette key for a chat completion request body"""
+    return make_cache_key(data["model"], data["messages"],
+                          data.get("temperature"), data.get("max_tokens"))
+
+
+def load_cassette(path: str) -> Dict[str, List[Dict[str, Any]]]:
+    """Read a cassette file into {request key: [entries in recording order]}"""
+    entries: Dict[str, List[Dict[str, Any]]] = defaultdict(list)
+    cassette_path = Path(path)
+    if not cassette_path.exists():
+        return entries
+
+    with gzip.open(cassette_path, "rt", encoding="utf-8") as f:
+        for line in f:
+            line = line.strip()
+            if line:
+                entry = json.loads(line)
+                entries[entry["key"]].append(entry)
+    return entries
+
+
+class LLMCassette:
+    """Recorder/player bound to a single cassette file"""
+
+    def __init__(self, path: str, mode: str):
+        if mode not in ("record", "replay"):
+            raise ValueError(f"Unknown cassette mode: {mode!r} (expected 'record' or 'replay')")
+        self.path = Path(path)
+        self.mode = mode
+        self._lock = threading.Lock()
+        self._entries: Dict[str, List[Dict[str, Any]]] = {}
+        self._play_counts: Dict[str, int] = defaultdict(int)
+
+        if mode == "replay":
+            self._entries = load_cassette(str(self.path))
+        else:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+
+    @property
+    def recording(self) -> bool:
+        return self.mode == "record"
+
+    @property
+    def replaying(self) -> bool:
+        return self.mode == "replay"
+
+    def play(self, data: Dict[str, Any]) -> Dict[str, Any]:
+        """Return the recorded response for a request"""
+        key = request_key(data)
+        recorded = self._entries.get(key)
+        if not recorded:
+            raise CassetteMissError(
+                f"No recorded response for model {data['model']} (key {key[:12]}) in {self.path}"
+            )
+        with self._lock:
+            index = min(self._play_counts[key], len(recorded) - 1)
+            self._play_counts[key] += 1
+        return recorded[index]["response"]
+
+    def record(self, data: Dict[str, Any], response: Dict[str, Any], latency: float):
+        """Append one request/response exchange to the cassette"""
+        entry = {
+            "key": request_key(data),
+            "request": {k: data[k] for k in ("model", "messages", "temperature", "max_tokens") if k in data},
+            "response": response,
+            "latency": round(latency, 3)
+        }
+        line = json.dumps(entry, ensure_ascii=False) + "\n"
+        with self._lock:
+            # Each append is its own gzip member; gzip readers concatenate them
+            with gzip.open(self.path, "at", encoding="utf-8") as f:
+                f.write(line)
+
+
+# Global cassette instance (lazy initialization)
+llm_cassette = None
+
+
+def get_llm_cassette() -> Optional[LLMCassette]:
+    """Get the configured cassette, or None when record/replay is off"""
+    global llm_cassette
+    if not settings.llm_cassette_mode:
+        return None
+    if llm_cassette is None:
+        llm_cassette = LLMCassette(settings.llm_cassette_path, settings.llm_cassette_mode)
+    return llm_cassette
@@ -0,0 +1,115 @@
+"""
+Per-Model Circuit Breakers
+
+Each resolved model id has a breaker shared by every call in the process:
+- closed: calls flow normally; consecutive failures (errors, or calls slower
+  than LLM_BREAKER_SLOW_CALL_SECONDS) are counted
+- open: after LLM_BREAKER_FAILURE_THRESHOLD consecutive failures the model
+  is skipped and calls go straight to the next model in the failover chain
+- half-open: after LLM_BREAKER_OPEN_SECONDS one probe call is let through;
+  success closes the breaker, failure re-opens it
+
+Failover chains are declared per station as `fallback_models` in
+configs/station_N.yml (LLM_FALLBACK_MODELS is the default chain).
+"""
+
+import time
+import logging
+from typing import Dict, Any
+
+from app.config import settings
+
+logger = logging.getLogger(__name__)
+
+CLOSED = "closed"
+OPEN = "open"
+HALF_OPEN = "half_open"
+
+
+class CircuitOpenError(Exception):
+    """Raised when every model in a failover chain has an open breaker"""
+
+
+class CircuitBreaker:
+    """Failure tracker for a single model"""
+
+    def __init__(self, model_id: str, failure_threshold: int = 5,
+                 open_seconds: float = 30.0, slow_call_seconds: float = 0.0):
+        self.model_id = model_id
+        self.failure_threshold = failure_threshold
+        self.open_seconds = open_seconds
+        self.slow_call_seconds = slow_call_seconds
+
+        self.state = CLOSED
+        self.consecutive_failures = 0
+        self.opened_at = 0.0
+        self._probe_in_flight = False
+
+    def allow_request(self) -> bool:
+        """Whether a call to this model may go out now"""
+        if self.state == CLOSED:
+            return True
+        if self.state == OPEN and time.monotonic() - self.opened_at >= self.open_seconds:
+            self.state = HALF_OPEN
+            self._probe_in_flight = False
+        if self.state == HALF_OPEN and not self._probe_in_flight:
+            self._probe_in_flight = True
+            return True
+        return False
+
+    def record_success(self, duration: float = 0.0):
+        """A call returned; slow calls still count towards opening"""
+        if self.slow_call_seconds and duration > self.slow_call_seconds:
+            self.record_failure(reason=f"slow call ({duration:.1f}s)")
+            return
+        if self.state != CLOSED:
+            logger.info(f"Circuit closed for {self.model_id}")
+        self.state = CLOSED
+        self.consecutive_failures = 0
+        self._probe_in_flight = False
+
+    def release_probe(self):
+        """End a call that neither succeeded nor counts as a model failure"""
+        self._probe_in_flight = False
+
+    def record_failure(self, reason: str = "error"):
+        self.consecutive_failures += 1
+        self._probe_in_flight = False
+        if self.state == HALF_OPEN or self.consecutive_failures >= self.failure_threshold:
+            if self.state != OPEN:
+                logger.warning(
+                    f"Circuit opened for {self.model_id} after {self.consecutive_failures} "
+                    f"consecutive failure(s), last: {reason}"
+                )
+            self.state = OPEN
+            self.opened_at = time.monotonic()
+
+    def get_stats(self) -> Dict[str, Any]:
+        return {
+            "model": self.model_id,
+            "state": self.state,
+            "consecutive_failures": self.consecutive_failures,
+        }
+
+
+# Process-wide registry keyed by resolved model id
+_breakers: Dict[str, CircuitBreaker] = {}
+
+
+def get_circuit_breaker(model_id: str) -> CircuitBreaker:
+    """Get the shared breaker for a model, creating it if needed"""
+    breaker = _breakers.get(model_id)
+    if breaker is None:
+        breaker = CircuitBreaker(
+            model_id,
+            failure_threshold=settings.llm_breaker_failure_threshold,
+            open_seconds=settings.llm_breaker_open_seconds,
+            slow_call_seconds=settings.llm_breaker_slow_call_seconds
+        )
+        _breakers[model_id] = breaker
+    return breaker
+
+
+def get_all_breaker_stats() -> Dict[str, Dict[str, Any]]:
+    """Stats for every model seen so far"""
+    return {model_id: breaker.get_stats() for model_id, breaker in _breakers.items()}
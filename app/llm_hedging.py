@@ -0,0 +1,199 @@
+"""
+Hedged LLM Requests
+
+Cuts tail latency on slow completions: when a call has not returned by a
+percentile of that model's recent latency, a second request is fired
+(optionally to an alternate model) and whichever finishes first wins; the
+other is cancelled.
+
+Hedging is opt-in:
+- globally with LLM_HEDGE_ENABLED=true (plus LLM_HEDGE_MODEL for an alternate)
+- per block with `with hedge_requests(alternate_model="gpt-4o"):`
+
+Latencies are kept per model and per max_tokens size class (up to 1024,
+2048, 4096, ... tokens), so a 16k-token draft is not hedged at the p95 of
+short 1k-token calls. No hedge is sent until a model has
+LLM_HEDGE_MIN_SAMPLES recorded latencies in the request's size class, and
+streaming calls are never hedged.
+
+Latency is measured from the moment a request holds its rate limiter and
+budget slots, both for the samples and for the hedge timer, so time spent
+queued behind a throttled limiter never triggers a hedge. A primary that
+loses to its hedge is recorded with its elapsed time (a lower bound of its
+latency), so the slow calls that caused hedges stay in the percentile.
+
+The extra cost is bounded: once hedges reach LLM_HEDGE_MAX_FRACTION of the
+calls made under a hedge policy, slow calls wait without a backup.
+"""
+
+import asyncio
+import logging
+from collections import defaultdict, deque
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass
+from typing import Dict, Optional, Callable, Awaitable, Any, Tuple
+
+from app.config import settings
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class HedgePolicy:
+    """When and where to send the backup request"""
+    percentile: float = 95.0
+    min_samples: int = 10
+    alternate_model: Optional[str] = None
+    max_fraction: float = 0.1  # Most hedges per call
+
+
+def size_class(max_tokens: Optional[int]) -> int:
+    """Latency bucket for a request: max_tokens rounded up to a power of two (min 1024)"""
+    if not max_tokens:
+        return 0
+    size = 1024
+    while size < max_tokens:
+        size *= 2
+    return size
+
+
+class LatencyTracker:
+    """Rolling latency samples of successful calls per model and size class"""
+
+    def __init__(self, window: int = 200):
+        self._samples: Dict[Tuple[str, int], deque] = defaultdict(lambda: deque(maxlen=window))
+        self.calls = 0  # Calls made under a hedge policy
+        self.hedges_sent = 0
+        self.hedge_wins = 0
+
+    def record(self, model_id: str, seconds: float, max_tokens: Optional[int] = None):
+        self._samples[(model_id, size_class(max_tokens))].append(seconds)
+
+    def percentile(self, model_id: str, percentile: float,
+                   max_tokens: Optional[int] = None) -> Optional[float]:
+        samples = self._samples.get((model_id, size_class(max_tokens)))
+        if not samples:
+            return None
+        ordered = sorted(samples)
+        index = min(len(ordered) - 1, int(round(percentile / 100.0 * (len(ordered) - 1))))
+        return ordered[index]
+
+    def hedge_delay(self, model_id: str, policy: HedgePolicy,
+                    max_tokens: Optional[int] = None) -> Optional[float]:
+        """Seconds to wait before hedging, or None when history is too short"""
+        if len(self._samples.get((model_id, size_class(max_tokens)), ())) < policy.min_samples:
+            return None
+        return self.percentile(model_id, policy.percentile, max_tokens)
+
+    def hedge_budget_left(self, policy: HedgePolicy) -> bool:
+        """Whether another hedge keeps hedges within policy.max_fraction of calls"""
+        return self.hedges_sent < policy.max_fraction * self.calls
+
+    def get_stats(self) -> Dict[str, Any]:
+        labels = {(m, size): f"{m} (max_tokens <= {size})" if size else m for m, size in self._samples}
+        return {
+            "calls": self.calls,
+            "hedges_sent": self.hedges_sent,
+            "hedge_wins": self.hedge_wins,
+            "p50": {label: self.percentile(m, 50, size) for (m, size), label in labels.items()},
+            "p95": {label: self.percentile(m, 95, size) for (m, size), label in labels.items()},
+        }
+
+
+# Process-wide latency history
+latency_tracker = LatencyTracker()
+
+# Set inside hedge_requests() blocks
+_hedge_policy: ContextVar[Optional[HedgePolicy]] = ContextVar("llm_hedge_policy", default=None)
+
+
+@contextmanager
+def hedge_requests(alternate_model: Optional[str] = None,
+                   percentile: Optional[float] = None,
+                   min_samples: Optional[int] = None,
+                   max_fraction: Optional[float] = None):
+    """Enable hedging for calls made inside the block"""
+    token = _hedge_policy.set(HedgePolicy(
+        percentile=percentile if percentile is not None else settings.llm_hedge_percentile,
+        min_samples=min_samples if min_samples is not None else settings.llm_hedge_min_samples,
+        alternate_model=alternate_model or settings.llm_hedge_model or None,
+        max_fraction=max_fraction if max_fraction is not None else settings.llm_hedge_max_fraction
+    ))
+    try:
+        yield
+    finally:
+        _hedge_policy.reset(token)
+
+
+def get_hedge_policy() -> Optional[HedgePolicy]:
+    """The hedge policy for the current context, or None when hedging is off"""
+    policy = _hedge_policy.get()
+    if policy is None and settings.llm_hedge_enabled:
+        policy = HedgePolicy(
+            percentile=settings.llm_hedge_percentile,
+            min_samples=settings.llm_hedge_min_samples,
+            alternate_model=settings.llm_hedge_model or None,
+            max_fraction=settings.llm_hedge_max_fraction
+        )
+    return policy
+
+
+async def hedged_call(model_id: str,
+                      fetch: Callable[[str, Callable[[], None]], Awaitable[Any]],
+                      policy: HedgePolicy,
+                      alternate_model_id: Optional[str] = None,
+                      max_tokens: Optional[int] = None) -> Any:
+    """Run fetch(model_id), hedging with fetch(alternate) if it runs long
+
+    fetch(model_id, on_started) calls on_started() once the request holds
+    its limiter slots; the hedge delay (the policy percentile of earlier
+    calls to the model with a similar max_tokens) counts from there.
+    Returns the first successful result; raises the last error only if
+    every request fails. The losing request is cancelled.
+    """
+    latency_tracker.calls += 1
+    delay = latency_tracker.hedge_delay(model_id, policy, max_tokens)
+    started = asyncio.Event()
+    primary = asyncio.ensure_future(fetch(model_id, started.set))
+    if delay is None:
+        return await primary
+
+    hedge = None
+    waiter = asyncio.ensure_future(started.wait())
+    try:
+        # Queue time in the limiter is not latency: start the clock at the slot
+        await asyncio.wait({primary, waiter}, return_when=asyncio.FIRST_COMPLETED)
+        if primary.done():
+            return primary.result()
+
+        loop = asyncio.get_running_loop()
+        slot_at = loop.time()
+        done, _ = await asyncio.wait({primary}, timeout=delay)
+        if done:
+            return primary.result()
+        if not latency_tracker.hedge_budget_left(policy):
+            return await primary
+
+        hedge_model_id = alternate_model_id or model_id
+        latency_tracker.hedges_sent += 1
+        logger.info(f"Hedging {model_id} after {delay:.1f}s with {hedge_model_id}")
+        hedge = asyncio.ensure_future(fetch(hedge_model_id, lambda: None))
+
+        pending = {primary, hedge}
+        last_error: Optional[BaseException] = None
+        while pending:
+            done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+            for task in done:
+                if task.exception() is None:
+                    if task is hedge:
+                        latency_tracker.hedge_wins += 1
+                        # The primary is cancelled; keep its (lower-bound) latency
+                        latency_tracker.record(model_id, loop.time() - slot_at, max_tokens)
+                    return task.result()
+                last_error = task.exception()
+        raise last_error
+    finally:
+        for task in (primary, hedge, waiter):
+            if task is not None and not task.done():
+                task.cancel()
@@ -0,0 +1,194 @@
+"""
+Adaptive Rate Limiter for LLM Traffic
+
+One limiter per resolved model id, shared by every OpenRouterAgent call in
+the process. Each limiter combines:
+- a token bucket that paces request starts (requests/second + burst)
+- a max-in-flight cap on concurrent requests
+- AIMD adaptation: the rate grows additively on success and is cut
+  multiplicatively on 429 responses
+- rate-limit headers (Retry-After, X-RateLimit-Remaining/Reset) that pause
+  the whole model until the provider's window resets
+
+Callers retry immediately after a 429; the limiter holds them back until
+the model can take traffic again, so coroutines no longer back off on
+their own independent schedules.
+"""
+
+import asyncio
+import time
+import logging
+from contextlib import asynccontextmanager
+from typing import Dict, Optional, Mapping, AsyncIterator
+
+from app.config import settings
+
+logger = logging.getLogger(__name__)
+
+
+class ModelRateLimiter:
+    """Token bucket + concurrency governor for a single model"""
+
+    def __init__(self, model_id: str,
+                 rate: float = 2.0,
+                 burst: int = 5,
+                 max_in_flight: int = 8,
+                 min_rate: float = 0.1,
+                 max_rate: float = 20.0,
+                 increase_step: float = 0.1,
+                 decrease_factor: float = 0.5):
+        self.model_id = model_id
+        self.rate = rate
+        self.burst = burst
+        self.max_in_flight = max_in_flight
+        self.min_rate = min_rate
+        self.max_rate = max_rate
+        self.increase_step = increase_step
+        self.decrease_factor = decrease_factor
+
+        self.in_flight = 0
+        self.rate_limited_count = 0
+        self._tokens = float(burst)
+        self._last_refill = time.monotonic()
+        self._blocked_until = 0.0
+        self._cond: Optional[asyncio.Condition] = None
+        self._cond_loop: Optional[asyncio.AbstractEventLoop] = None
+
+    def _condition(self) -> asyncio.Condition:
+        """Get the wake-up condition for the running event loop"""
+        loop = asyncio.get_running_loop()
+        if self._cond is None or self._cond_loop is not loop:
+            self._cond = asyncio.Condition()
+            self._cond_loop = loop
+            self.in_flight = 0
+        return self._cond
+
+    def _refill(self, now: float):
+        elapsed = now - self._last_refill
+        self._tokens = min(float(self.burst), self._tokens + elapsed * self.rate)
+        self._last_refill = now
+
+    async def acquire(self):
+        """Wait until a request may start, then claim a slot"""
+        cond = self._condition()
+        async with cond:
+            while True:
+                now = time.monotonic()
+                self._refill(now)
+
+                if now < self._blocked_until:
+                    wait: Optional[float] = self._blocked_until - now
+                elif self.in_flight >= self.max_in_flight:
+                    wait = None  # Woken by release()
+                elif self._tokens >= 1.0:
+                    self._tokens -= 1.0
+                    self.in_flight += 1
+                    return
+                else:
+                    wait = (1.0 - self._tokens) / self.rate
+
+                try:
+                    await asyncio.wait_for(cond.wait(), timeout=wait)
+                except asyncio.TimeoutError:
+                    pass
+
+    async def release(self):
+        """Free a slot claimed by acquire()"""
+        cond = self._condition()
+        async with cond:
+            self.in_flight = max(0, self.in_flight - 1)
+            cond.notify_all()
+
+    @asynccontextmanager
+    async def slot(self) -> AsyncIterator["ModelRateLimiter"]:
+        """Hold a request slot for the duration of the block"""
+        await self.acquire()
+        try:
+            yield self
+        finally:
+            await self.release()
+
+    def on_success(self, headers: Optional[Mapping[str, str]] = None):
+        """Additive increase after a successful call"""
+        self.rate = min(self.max_rate, self.rate + self.increase_step)
+        if headers:
+            self._apply_headers(headers)
+
+    def on_rate_limited(self, headers: Optional[Mapping[str, str]] = None):
+        """Multiplicative decrease and pause after a 429"""
+        self.rate_limited_count += 1
+        self.rate = max(self.min_rate, self.rate * self.decrease_factor)
+        self._tokens = 0.0
+
+        pause = 1.0 / self.rate
+        if headers:
+            pause = max(pause, self._apply_headers(headers))
+        self._blocked_until = max(self._blocked_until, time.monotonic() + pause)
+
+        logger.warning(
+            f"Rate limited on {self.model_id}: rate now {self.rate:.2f} req/s, "
+            f"pausing {pause:.1f}s"
+        )
+
+    def _apply_headers(self, headers: Mapping[str, str]) -> float:
+        """Honour Retry-After / X-RateLimit-* headers, returning the pause in seconds"""
+        pause = 0.0
+
+        retry_after = headers.get("retry-after")
+        if retry_after:
+            try:
+                pause = max(pause, float(retry_after))
+            except ValueError:
+                pass
+
+        remaining = headers.get("x-ratelimit-remaining")
+        reset = headers.get("x-ratelimit-reset")
+        if remaining is not None and reset:
+            try:
+                if int(float(remaining)) <= 0:
+                    reset_at = float(reset)
+                    # OpenRouter reports the reset as epoch milliseconds
+                    if reset_at > 1e12:
+                        reset_at /= 1000.0
+                    pause = max(pause, reset_at - time.time())
+            except ValueError:
+                pass
+
+        if pause > 0:
+            self._blocked_until = max(self._blocked_until, time.monotonic() + pause)
+        return pause
+
+    def get_stats(self) -> Dict[str, float]:
+        """Current limiter state for logging"""
+        return {
+            "model": self.model_id,
+            "rate": round(self.rate, 3),
+            "in_flight": self.in_flight,
+            "max_in_flight": self.max_in_flight,
+            "rate_limited_count": self.rate_limited_count,
+        }
+
+
+# Process-wide registry keyed by resolved model id
+_limiters: Dict[str, ModelRateLimiter] = {}
+
+
+def get_rate_limiter(model_id: str) -> ModelRateLimiter:
+    """Get the shared limiter for a model, creating it if needed"""
+    limiter = _limiters.get(model_id)
+    if limiter is None:
+        limiter = ModelRateLimiter(
+            model_id,
+            rate=settings.llm_rate_limit_rps,
+            burst=settings.llm_rate_limit_burst,
+            max_in_flight=settings.llm_max_in_flight,
+            min_rate=settings.llm_rate_limit_min_rps,
+            max_rate=settings.llm_rate_limit_max_rps
+        )
+        _limiters[model_id] = limiter
+    return limiter
+
+
+def get_all_limiter_stats() -> Dict[str, Dict[str, float]]:
+    """Stats for every model seen so far"""
+    return {model_id: limiter.get_stats() for model_id, limiter in _limiters.items()}
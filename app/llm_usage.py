@@ -0,0 +1,383 @@
+"""
+LLM Token and Cost Accounting
+
+Every OpenRouter response carries a `usage` block (prompt/completion tokens
+and, with usage accounting enabled, the provider-reported cost). The ledger
+accumulates it per call, station, episode, model and session, persists the
+totals next to the session checkpoint (output/{session_id}/usage_{session_id}.json)
+and enforces soft (warn) and hard (raise) budgets.
+
+Attribution comes from the current usage scope:
+
+    with usage_scope(session_id="session_...", station="21", episode=3):
+        await agent.generate(...)
+
+Station entry points and per-episode methods are decorated with
+@track_usage so scopes nest automatically.
+"""
+
+import asyncio
+import inspect
+import json
+import logging
+import os
+import tempfile
+import threading
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass, asdict
+from datetime import datetime
+from functools import wraps
+from pathlib import Path
+from typing import Dict, Any, Optional, Tuple, Callable
+
+from app.config import settings
+
+logger = logging.getLogger(__name__)
+
+# Fallback USD prices per million tokens (prompt, completion), used only when
+# the response does not report a cost. ":free" models are always zero.
+MODEL_PRICING: Dict[str, Tuple[float, float]] = {
+    "openai/gpt-4o-2024-08-06": (2.50, 10.00),
+    "anthropic/claude-3-haiku": (0.25, 1.25),
+    "anthropic/claude-3.5-sonnet": (3.00, 15.00),
+    "z-ai/glm-4.5": (0.60, 2.20),
+}
+
+
+class BudgetExceededError(Exception):
+    """Raised before a call when a hard budget has been used up"""
+
+
+@dataclass
+class UsageTotals:
+    """Accumulated usage for one accounting bucket"""
+    calls: int = 0
+    prompt_tokens: int = 0
+    completion_tokens: int = 0
+    cost: float = 0.0
+
+    @property
+    def total_tokens(self) -> int:
+        return self.prompt_tokens + self.completion_tokens
+
+    def add(self, prompt_tokens: int, completion_tokens: int, cost: float):
+        self.calls += 1
+        self.prompt_tokens += prompt_tokens
+        self.completion_tokens += completion_tokens
+        self.cost += cost
+
+    def to_dict(self) -> Dict[str, Any]:
+        data = asdict(self)
+        data["total_tokens"] = self.total_tokens
+        data["cost"] = round(self.cost, 6)
+        return data
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "UsageTotals":
+        return cls(
+            calls=data.get("calls", 0),
+            prompt_tokens=data.get("prompt_tokens", 0),
+            completion_tokens=data.get("completion_tokens", 0),
+            cost=data.get("cost", 0.0)
+        )
+
+
+@dataclass
+class Budget:
+    """Soft limits log a warning once; hard limits block further calls"""
+    soft_cost: Optional[float] = None
+    hard_cost: Optional[float] = None
+    soft_tokens: Optional[int] = None
+    hard_tokens: Optional[int] = None
+
+
+@dataclass
+class UsageScope:
+    """Who a call is billed to"""
+    session_id: Optional[str] = None
+    station: Optional[str] = None
+    episode: Optional[int] = None
+
+
+_usage_scope: ContextVar[UsageScope] = ContextVar("llm_usage_scope", default=UsageScope())
+
+
+@contextmanager
+def usage_scope(session_id: Optional[str] = None, station: Optional[str] = None,
+                episode: Optional[int] = None):
+    """Attribute calls made inside the block; unset fields inherit the outer scope"""
+    outer = _usage_scope.get()
+    token = _usage_scope.set(UsageScope(
+        session_id=session_id if session_id is not None else outer.session_id,
+        station=station if station is not None else outer.station,
+        episode=episode if episode is not None else outer.episode
+    ))
+    try:
+        yield
+    finally:
+        _usage_scope.reset(token)
+
+
+def set_usage_session(session_id: str):
+    """Set the session for the current scope (for stations that create the session id)"""
+    current = _usage_scope.get()
+    _usage_scope.set(UsageScope(session_id=session_id, station=current.station, episode=current.episode))
+
+
+def get_usage_scope() -> UsageScope:
+    return _usage_scope.get()
+
+
+def track_usage(station: Optional[str] = None, episode_arg: Optional[str] = None):
+    """Decorator that runs an async station method inside a usage scope
+
+    The session id is read from a `session_id` argument or `self.session_id`;
+    episode_arg names the parameter holding the episode number.
+    """
+    def decorator(func: Callable):
+        signature = inspect.signature(func)
+
+        @wraps(func)
+        async def wrapper(self, *args, **kwargs):
+            bound = signature.bind_partial(self, *args, **kwargs)
+            session_id = bound.arguments.get("session_id") or getattr(self, "session_id", None)
+            episode = bound.arguments.get(episode_arg) if episode_arg else None
+            with usage_scope(session_id=session_id, station=station, episode=episode):
+                return await func(self, *args, **kwargs)
+
+        return wrapper
+    return decorator
+
+
+def estimate_cost(model_id: str, prompt_tokens: int, completion_tokens: int) -> float:
+    """USD cost from the fallback price table"""
+    if model_id.endswith(":free"):
+        return 0.0
+    prompt_price, completion_price = MODEL_PRICING.get(model_id, (0.0, 0.0))
+    return (prompt_tokens * prompt_price + completion_tokens * completion_price) / 1_000_000
+
+
+class UsageLedger:
+    """Process-wide usage totals with budget enforcement"""
+
+    def __init__(self, output_dir: str = "output"):
+        self.output_dir = Path(output_dir)
+        self._lock = threading.Lock()
+        self._save_locks: Dict[str, threading.Lock] = {}
+        self._versions: Dict[str, int] = {}  # Bumped by every record()
+        self._saved_versions: Dict[str, int] = {}
+        self._sessions: Dict[str, UsageTotals] = {}
+        self._stations: Dict[Tuple[str, str], UsageTotals] = {}
+        self._episodes: Dict[Tuple[str, str, int], UsageTotals] = {}
+        self._models: Dict[Tuple[str, str], UsageTotals] = {}
+        self._loaded_sessions: set = set()
+        self._soft_warned: set = set()
+
+        self.session_budget = Budget(
+            soft_cost=settings.llm_session_budget_soft_usd or None,
+            hard_cost=settings.llm_session_budget_hard_usd or None
+        )
+        self.station_budget = Budget(
+            soft_cost=settings.llm_station_budget_soft_usd or None,
+            hard_cost=settings.llm_station_budget_hard_usd or None
+        )
+        self.episode_budget = Budget()
+        self.station_budget_overrides: Dict[str, Budget] = {}
+
+    # ------------------------------------------------------------------
+    # Budgets
+    # ------------------------------------------------------------------
+
+    def set_budget(self, level: str, budget: Budget, station: Optional[str] = None):
+        """Set the budget for every session/station/episode, or one station"""
+        if level == "session":
+            self.session_budget = budget
+        elif level == "station" and station is not None:
+            self.station_budget_overrides[station] = budget
+        elif level == "station":
+            self.station_budget = budget
+        elif level == "episode":
+            self.episode_budget = budget
+        else:
+            raise ValueError(f"Unknown budget level: {level!r}")
+
+    def _buckets_for(self, scope: UsageScope):
+        """(label, totals, budget) for each bucket a call in this scope is billed to"""
+        session_id = scope.session_id or "unscoped"
+        buckets = [(f"session {session_id}", self._sessions.setdefault(session_id, UsageTotals()),
+                    self.session_budget)]
+        if scope.station is not None:
+            budget = self.station_budget_overrides.get(scope.station, self.station_budget)
+            buckets.append((f"station {scope.station}",
+                            self._stations.setdefault((session_id, scope.station), UsageTotals()),
+                            budget))
+            if scope.episode is not None:
+                buckets.append((f"station {scope.station} episode {scope.episode}",
+                                self._episodes.setdefault((session_id, scope.station, scope.episode),
+                                                          UsageTotals()),
+                                self.episode_budget))
+        return buckets
+
+    def check_budget(self, scope: Optional[UsageScope] = None):
+        """Raise BudgetExceededError if any hard budget for the scope is spent"""
+        scope = scope or get_usage_scope()
+        self._load_session(scope.session_id)
+        with self._lock:
+            for label, totals, budget in self._buckets_for(scope):
+                if budget.hard_cost is not None and totals.cost >= budget.hard_cost:
+                    raise BudgetExceededError(
+                        f"Hard budget reached for {label}: ${totals.cost:.4f} of ${budget.hard_cost:.4f}"
+                    )
+                if budget.hard_tokens is not None and totals.total_tokens >= budget.hard_tokens:
+                    raise BudgetExceededError(
+                        f"Hard token budget reached for {label}: "
+                        f"{totals.total_tokens:,} of {budget.hard_tokens:,}"
+                    )
+
+    # ------------------------------------------------------------------
+    # Recording
+    # ------------------------------------------------------------------
+
+    def record(self, model_id: str, usage: Dict[str, Any],
+               scope: Optional[UsageScope] = None) -> float:
+        """Add one response's usage block; returns the cost charged"""
+        scope = scope or get_usage_scope()
+        self._load_session(scope.session_id)
+
+        prompt_tokens = int(usage.get("prompt_tokens") or 0)
+        completion_tokens = int(usage.get("completion_tokens") or 0)
+        cost = usage.get("cost")
+        cost = float(cost) if cost is not None else estimate_cost(model_id, prompt_tokens, completion_tokens)
+
+        with self._lock:
+            for label, totals, budget in self._buckets_for(scope):
+                totals.add(prompt_tokens, completion_tokens, cost)
+                self._warn_soft(label, totals, budget)
+            session_id = scope.session_id or "unscoped"
+            self._models.setdefault((session_id, model_id), UsageTotals()).add(
+                prompt_tokens, completion_tokens, cost
+            )
+            self._versions[session_id] = self._versions.get(session_id, 0) + 1
+        return cost
+
+    def _warn_soft(self, label: str, totals: UsageTotals, budget: Budget):
+        if label in self._soft_warned:
+            return
+        over_cost = budget.soft_cost is not None and totals.cost >= budget.soft_cost
+        over_tokens = budget.soft_tokens is not None and totals.total_tokens >= budget.soft_tokens
+        if over_cost or over_tokens:
+            self._soft_warned.add(label)
+            logger.warning(
+                f"Soft budget exceeded for {label}: ${totals.cost:.4f}, {totals.total_tokens:,} tokens"
+            )
+
+    # ------------------------------------------------------------------
+    # Reporting and persistence
+    # ------------------------------------------------------------------
+
+    def get_session_report(self, session_id: str) -> Dict[str, Any]:
+        """Totals for one session broken down by station, episode and model"""
+        with self._lock:
+            stations: Dict[str, Any] = {}
+            for (sid, station), totals in self._stations.items():
+                if sid == session_id:
+                    stations[station] = dict(totals.to_dict(), episodes={})
+            for (sid, station, episode), totals in self._episodes.items():
+                if sid == session_id and station in stations:
+                    stations[station]["episodes"][str(episode)] = totals.to_dict()
+            models = {model: totals.to_dict()
+                      for (sid, model), totals in self._models.items() if sid == session_id}
+            return {
+                "session_id": session_id,
+                "updated_at": datetime.now().isoformat(),
+                "totals": self._sessions.get(session_id, UsageTotals()).to_dict(),
+                "stations": stations,
+                "models": models
+            }
+
+    def _usage_path(self, session_id: str) -> Path:
+        return self.output_dir / session_id / f"usage_{session_id}.json"
+
+    def save(self, session_id: Optional[str]):
+        """Write the session's totals next to its checkpoint
+
+        Saves of one session are serialized; a save that finds a newer
+        report already on disk skips the write, so a burst of concurrent
+        calls produces a handful of writes rather than one each.
+        """
+        if not session_id:
+            return
+        with self._lock:
+            save_lock = self._save_locks.setdefault(session_id, threading.Lock())
+        with save_lock:
+            with self._lock:
+                version = self._versions.get(session_id, 0)
+                if version and self._saved_versions.get(session_id) == version:
+                    return
+            path = self._usage_path(session_id)
+            path.parent.mkdir(parents=True, exist_ok=True)
+            report = self.get_session_report(session_id)
+            # Unique temp file so no other writer can rename it from under us
+            with tempfile.NamedTemporaryFile("w", encoding="utf-8", dir=path.parent,
+                                             prefix=f"{path.name}.", suffix=".tmp",
+                                             delete=False) as f:
+                tmp_path = f.name
+                try:
+                    json.dump(report, f, indent=2)
+                except BaseException:
+                    f.close()
+                    os.unlink(tmp_path)
+                    raise
+            os.replace(tmp_path, path)
+            with self._lock:
+                self._saved_versions[session_id] = version
+
+    def _load_session(self, session_id: Optional[str]):
+        """Resume totals persisted by an earlier run of the same session"""
+        if not session_id or session_id in self._loaded_sessions:
+            return
+        with self._lock:
+            if session_id in self._loaded_sessions:
+                return
+            self._loaded_sessions.add(session_id)
+            path = self._usage_path(session_id)
+            if not path.exists():
+                return
+            try:
+                with open(path, "r", encoding="utf-8") as f:
+                    report = json.load(f)
+            except (OSError, json.JSONDecodeError) as e:
+                logger.warning(f"Could not load usage for {session_id}: {e}")
+                return
+
+            self._sessions[session_id] = UsageTotals.from_dict(report.get("totals", {}))
+            for station, data in report.get("stations", {}).items():
+                self._stations[(session_id, station)] = UsageTotals.from_dict(data)
+                for episode, ep_data in data.get("episodes", {}).items():
+                    self._episodes[(session_id, station, int(episode))] = UsageTotals.from_dict(ep_data)
+            for model, data in report.get("models", {}).items():
+                self._models[(session_id, model)] = UsageTotals.from_dict(data)
+
+    async def record_and_save(self, model_id: str, usage: Dict[str, Any]) -> float:
+        """Record a response and persist the session totals off the event loop"""
+        scope = get_usage_scope()
+        cost = self.record(model_id, usage, scope)
+        try:
+            await asyncio.to_thread(self.save, scope.session_id)
+        except Exception as e:
+            # The call is already paid for and recorded in memory; the next save catches up
+            logger.warning(f"Could not save usage for {scope.session_id}: {e}")
+        return cost
+
+
+# Global ledger instance (lazy initialization)
+usage_ledger = None
+
+
+def get_usage_ledger() -> UsageLedger:
+    """Get the global usage ledger, creating it if needed"""
+    global usage_ledger
+    if usage_ledger is None:
+        usage_ledger = UsageLedger(settings.output_dir)
+    return usage_ledger
@@ -1,14 +1,113 @@
 import httpx
 import json
+import time
 import asyncio
-from typing import Dict, Any, List
+from collections import deque
+from dataclasses import dataclass, asdict
+from typing import Dict, Any, List, Optional, Callable, AsyncIterator
 from app.config import settings
+from app.llm_rate_limiter import get_rate_limiter
+from app.llm_budget import get_llm_budget
+from app.llm_cache import get_llm_cache, make_cache_key, is_cache_refresh, note_response_key
+from app.llm_cassette import get_llm_cassette
+from app.llm_hedging import get_hedge_policy, hedged_call, latency_tracker
+from app.llm_usage import get_usage_ledger, get_usage_scope, BudgetExceededError
+from app.llm_circuit_breaker import get_circuit_breaker, CircuitOpenError
+
+
+# Process-wide pooled HTTP client shared by every OpenRouterAgent
+_http_client: Optional[httpx.AsyncClient] = None
+_http_client_loop: Optional[asyncio.AbstractEventLoop] = None
+
+# Requests currently on the wire, keyed by request hash (single-flight)
+_inflight_requests: Dict[str, asyncio.Future] = {}
+
+# Shortest repeated prefill a continuation may have trimmed off its start
+MIN_CONTINUATION_OVERLAP = 24
+
+
+def _build_http_client() -> httpx.AsyncClient:
+    """Create the pooled keep-alive client, using HTTP/2 when h2 is installed"""
+    limits = httpx.Limits(
+        max_connections=settings.openrouter_max_connections,
+        max_keepalive_connections=settings.openrouter_max_keepalive_connections,
+        keepalive_expiry=settings.openrouter_keepalive_expiry
+    )
+    timeout = httpx.Timeout(settings.openrouter_timeout)
+    if settings.openrouter_http2:
+        try:
+            return httpx.AsyncClient(http2=True, limits=limits, timeout=timeout)
+        except ImportError:
+            # h2 package not installed - fall back to HTTP/1.1 keep-alive
+            pass
+    return httpx.AsyncClient(limits=limits, timeout=timeout)
+
+
+def get_http_client() -> httpx.AsyncClient:
+    """Get the shared HTTP client, creating it if needed
+
+    Connections are bound to the event loop that opened them, so a new
+    client is built when called from a different loop (e.g. a second
+    asyncio.run() in the same process).
+    """
+    global _http_client, _http_client_loop
+    loop = asyncio.get_running_loop()
+    if _http_client is None or _http_client.is_closed or _http_client_loop is not loop:
+        _http_client = _build_http_client()
+        _http_client_loop = loop
+    return _http_client
+
+
+async def startup_openrouter():
+    """Open the shared HTTP connection pool ahead of the first request"""
+    get_http_client()
+
+
+async def shutdown_openrouter():
+    """Close the shared HTTP connection pool"""
+    global _http_client, _http_client_loop
+    if _http_client is not None and not _http_client.is_closed:
+        await _http_client.aclose()
+    _http_client = None
+    _http_client_loop = None
+
+
+@dataclass
+class CallMetrics:
+    """Latency and throughput figures for a single chat completion call"""
+    model: str
+    streamed: bool
+    duration: float
+    time_to_first_token: Optional[float]
+    completion_tokens: int
+    tokens_per_second: float
+
+    def to_dict(self) -> Dict[str, Any]:
+        return asdict(self)
+
+
+class StreamProgress:
+    """on_delta callback that prints a progress line every few thousand characters"""
+
+    def __init__(self, label: str = "Streaming", every_chars: int = 2000):
+        self.label = label
+        self.every_chars = every_chars
+        self.chars = 0
+        self._next_report = every_chars
+        self._started = time.perf_counter()
+
+    def __call__(self, delta: str):
+        self.chars += len(delta)
+        if self.chars >= self._next_report:
+            elapsed = time.perf_counter() - self._started
+            print(f"   ✍️  {self.label}: {self.chars:,} chars received ({elapsed:.1f}s)")
+            self._next_report += self.every_chars
 
 
 class OpenRouterAgent:
     def __init__(self):
         self.api_key = settings.openrouter_api_key
-        self.base_url = "https://openrouter.ai/api/v1"
+        self.base_url = settings.openrouter_base_url.rstrip("/")
         # Make embeddings optional to avoid dependency issues
         self.embeddings = None
         # Disabled embeddings to avoid PyTorch/NumPy compatibility issues
@@ -31,23 +130,29 @@ class OpenRouterAgent:
             "claude-3-haiku": "anthropic/claude-3-haiku",
             "glm-4.5": "z-ai/glm-4.5"
         }
+
+        # Per-call latency metrics (most recent calls only)
+        self.call_metrics: deque = deque(maxlen=500)
     
-    async def process_message(self, user_input: str, model_name: str = "qwen-72b", max_tokens: int = 3000) -> str:
-        """Process a user message using OpenRouter with rate limiting and retry logic"""
+    async def process_message(self, user_input: str, model_name: str = "qwen-72b", max_tokens: int = 3000,
+                              stream: bool = False, on_delta: Optional[Callable[[str], None]] = None,
+                              use_cache: bool = True) -> str:
+        """Process a user message using OpenRouter with rate limiting and retry logic
+
+        With stream=True the response is read as server-sent events and each
+        content delta is passed to on_delta as it arrives; the return value is
+        the same final string as the non-streaming call.
+        """
         max_retries = 3
-        base_delay = 2.0  # Base delay in seconds
-        
+        base_delay = 2.0  # Backoff for errors other than 429 (those wait in the rate limiter)
+        note_response_key(None)
+
         # Check if API key is set
         if not self.api_key:
             raise Exception("OpenRouter API key is not set. Please set OPENROUTER_API_KEY environment variable.")
         
         for attempt in range(max_retries):
             try:
-                # Add delay between requests to avoid rate limiting
-                if attempt > 0:
-                    delay = base_delay * (2 ** attempt)  # Exponential backoff
-                    await asyncio.sleep(delay)
-                
                 # Get the actual model ID
                 model_id = self.available_models.get(model_name, self.available_models["qwen-72b"])
                 
@@ -68,44 +173,431 @@ class OpenRouterAgent:
                         {"role": "user", "content": user_input}
                     ],
                     "temperature": 0.7,
-                    "max_tokens": max_tokens
+                    "max_tokens": max_tokens,
+                    "usage": {"include": True}  # Ask OpenRouter to report cost
                 }
                 
-                async with httpx.AsyncClient() as client:
-                    response = await client.post(
-                        f"{self.base_url}/chat/completions",
-                        headers=headers,
-                        json=data,
-                        timeout=60.0
-                    )
-                    
-                    # Handle rate limiting specifically
-                    if response.status_code == 429:
-                        if attempt < max_retries - 1:
-                            continue  # Retry with exponential backoff
-                        else:
-                            raise Exception(f"Rate limited after {max_retries} attempts")
-                    
-                    response.raise_for_status()
-                    result = response.json()
-                    if "choices" in result and result["choices"]:
-                        return result["choices"][0]["message"]["content"]
-                    else:
-                        raise Exception("No choices in API response")
+                # Rate limiting (429) surfaces as HTTPStatusError below
+                result = await self._chat_completion(headers, data, stream=stream, on_delta=on_delta,
+                                                     use_cache=use_cache)
+                if "choices" in result and result["choices"]:
+                    return result["choices"][0]["message"]["content"]
+                else:
+                    raise Exception("No choices in API response")
                 
+            except BudgetExceededError:
+                raise
             except httpx.HTTPStatusError as e:
                 if e.response.status_code == 429 and attempt < max_retries - 1:
-                    continue  # Retry on rate limit
+                    continue  # Retry on rate limit (paced by the rate limiter)
+                elif e.response.status_code >= 500 and attempt < max_retries - 1:
+                    await asyncio.sleep(base_delay * (2 ** attempt))
+                    continue
                 else:
                     raise Exception(f"OpenRouter API error: {str(e)}")
             except Exception as e:
                 if attempt < max_retries - 1:
-                    continue  # Retry on other errors
+                    # Retry on other errors (connection errors, 5xx) after a backoff
+                    await asyncio.sleep(base_delay * (2 ** attempt))
+                    continue
                 else:
                     raise Exception(f"OpenRouter API error: {str(e)}")
         
         raise Exception(f"OpenRouter API failed after {max_retries} attempts")
     
+    async def _post_chat_completion(self, headers: Dict[str, str], data: Dict[str, Any]) -> httpx.Response:
+        """POST a chat completion request over the shared connection pool"""
+        client = get_http_client()
+        return await client.post(
+            f"{self.base_url}/chat/completions",
+            headers=headers,
+            json=data,
+            timeout=settings.openrouter_timeout
+        )
+
+    async def _chat_completion(self, headers: Dict[str, str], data: Dict[str, Any],
+                               stream: bool = False,
+                               on_delta: Optional[Callable[[str], None]] = None,
+                               use_cache: bool = True) -> Dict[str, Any]:
+        """Run one chat completion and return the response body
+
+        Responses are served from / stored in the content-addressed LLM cache
+        unless use_cache is False or a cassette is recording or replaying
+        (every call must reach the cassette), and byte-identical requests already in
+        flight are collapsed into a single HTTP call (single-flight).
+        Streaming responses are reassembled into the same shape as a regular
+        response so callers read choices[0].message.content either way.
+        """
+        request_key = make_cache_key(data["model"], data["messages"],
+                                     data.get("temperature"), data.get("max_tokens"))
+        note_response_key(None)
+        use_cache = use_cache and self._station_uses_cache() and get_llm_cassette() is None
+        # Callers asking for fresh output want their own generation
+        shareable = use_cache and not is_cache_refresh()
+
+        cache = get_llm_cache() if use_cache else None
+        if cache is not None and shareable:
+            cached = await cache.get(request_key)
+            if cached is not None:
+                if stream and on_delta:
+                    on_delta(cached["choices"][0]["message"]["content"])
+                note_response_key(request_key)
+                return cached
+
+        if not shareable:
+            result = await self._complete(headers, data, stream, on_delta)
+        else:
+            result = await self._single_flight(request_key, headers, data, stream, on_delta)
+
+        # Only cache complete responses
+        if cache is not None and result.get("choices") and result["choices"][0]["message"].get("content"):
+            await cache.put(request_key, result)
+            note_response_key(request_key)
+        return result
+
+    @staticmethod
+    def _station_uses_cache() -> bool:
+        """False inside the usage scope of a station configured with `llm_cache: false`"""
+        # Imported here: app.agents imports the stations, which import this module
+        from app.agents.config_loader import station_uses_llm_cache
+
+        station = get_usage_scope().station
+        return station_uses_llm_cache(station) if station else True
+
+    async def _single_flight(self, request_key: str, headers: Dict[str, str], data: Dict[str, Any],
+                             stream: bool, on_delta: Optional[Callable[[str], None]]) -> Dict[str, Any]:
+        """Share one in-flight request between every caller with the same key
+
+        The first caller (leader) sends the request; later callers wait for
+        its result or error. If the leader is cancelled, a waiter takes over.
+        """
+        loop = asyncio.get_running_loop()
+        while True:
+            inflight = _inflight_requests.get(request_key)
+            if inflight is None or inflight.get_loop() is not loop:
+                break
+            try:
+                result = await asyncio.shield(inflight)
+            except asyncio.CancelledError:
+                if inflight.cancelled():
+                    continue  # Leader was cancelled, not us - try again
+                raise
+            if stream and on_delta:
+                on_delta(result["choices"][0]["message"]["content"])
+            return result
+
+        future = loop.create_future()
+        _inflight_requests[request_key] = future
+        try:
+            result = await self._complete(headers, data, stream, on_delta)
+            future.set_result(result)
+            return result
+        except asyncio.CancelledError:
+            future.cancel()
+            raise
+        except BaseException as e:
+            future.set_exception(e)
+            future.exception()  # Mark retrieved when nobody else was waiting
+            raise
+        finally:
+            if _inflight_requests.get(request_key) is future:
+                del _inflight_requests[request_key]
+
+    async def _complete(self, headers: Dict[str, str], data: Dict[str, Any],
+                        stream: bool, on_delta: Optional[Callable[[str], None]]) -> Dict[str, Any]:
+        """Complete a request, continuing it if the output was cut at max_tokens
+
+        A response with finish_reason == "length" is resumed by sending the
+        partial output back as an assistant prefill, and the pieces are
+        stitched into one response (up to LLM_MAX_CONTINUATIONS extra calls).
+        """
+        result = await self._complete_uncached(headers, data, stream, on_delta)
+
+        continuations = 0
+        while (continuations < settings.llm_max_continuations
+               and result.get("choices")
+               and result["choices"][0].get("finish_reason") == "length"):
+            partial = result["choices"][0]["message"].get("content") or ""
+            if not partial:
+                break
+            continuations += 1
+            print(f"✂️  Output hit max_tokens ({len(partial):,} chars), "
+                  f"requesting continuation {continuations}/{settings.llm_max_continuations}...")
+
+            continuation_data = dict(
+                data,
+                messages=data["messages"] + [{"role": "assistant", "content": partial}]
+            )
+            more = await self._complete_uncached(headers, continuation_data, stream, on_delta)
+            result = self._stitch_continuation(result, more, continuations)
+
+        return result
+
+    @staticmethod
+    def _stitch_continuation(result: Dict[str, Any], more: Dict[str, Any],
+                             continuations: int) -> Dict[str, Any]:
+        """Append a continuation response to a truncated one"""
+        head = result["choices"][0]["message"].get("content") or ""
+        tail = (more.get("choices") or [{}])[0].get("message", {}).get("content") or ""
+
+        # Some models repeat the last few words of the prefill; drop the overlap.
+        # Shorter matches are too likely to be coincidence ('"', '}', ', ')
+        # and trimming them would corrupt the JSON.
+        max_overlap = min(len(head), len(tail), 200)
+        for size in range(max_overlap, MIN_CONTINUATION_OVERLAP - 1, -1):
+            if head.endswith(tail[:size]):
+                tail = tail[size:]
+                break
+
+        usage = dict(result.get("usage") or {})
+        for key, value in (more.get("usage") or {}).items():
+            if isinstance(value, (int, float)) and isinstance(usage.get(key, 0), (int, float)):
+                usage[key] = usage.get(key, 0) + value
+
+        stitched = dict(result)
+        stitched["choices"] = [{
+            "message": {"role": "assistant", "content": head + tail},
+            "finish_reason": (more.get("choices") or [{}])[0].get("finish_reason")
+        }]
+        stitched["usage"] = usage
+        stitched["continuations"] = continuations
+        return stitched
+
+    async def _complete_uncached(self, headers: Dict[str, str], data: Dict[str, Any],
+                                 stream: bool, on_delta: Optional[Callable[[str], None]]) -> Dict[str, Any]:
+        """Answer from the replay cassette, or fetch (and record) over HTTP"""
+        cassette = get_llm_cassette()
+        if cassette is not None and cassette.replaying:
+            result = cassette.play(data)
+            if stream and on_delta:
+                on_delta(result["choices"][0]["message"]["content"])
+            return result
+
+        ledger = get_usage_ledger()
+        ledger.check_budget()
+
+        started = time.perf_counter()
+        result = await self._fetch_with_failover(headers, data, stream, on_delta)
+        if cassette is not None:
+            await asyncio.to_thread(cassette.record, data, result, time.perf_counter() - started)
+
+        await ledger.record_and_save(result.get("model") or data["model"], result.get("usage") or {})
+        return result
+
+    def _failover_chain(self, model_id: str) -> List[str]:
+        """The requested model followed by the calling station's fallback models"""
+        # Imported here: app.agents imports the stations, which import this module
+        from app.agents.config_loader import get_fallback_models
+
+        station = get_usage_scope().station
+        fallbacks = get_fallback_models(station) if station else None
+        if fallbacks is None:
+            fallbacks = [m.strip() for m in settings.llm_fallback_models.split(",") if m.strip()]
+
+        chain = [model_id]
+        for name in fallbacks:
+            resolved = self.available_models.get(name, name)
+            if not settings.llm_allow_paid_fallback and not resolved.endswith(":free"):
+                continue  # Spending on a different model is opt-in
+            if resolved not in chain:
+                chain.append(resolved)
+        return chain
+
+    async def _fetch_with_failover(self, headers: Dict[str, str], data: Dict[str, Any],
+                                   stream: bool, on_delta: Optional[Callable[[str], None]]) -> Dict[str, Any]:
+        """Try each model in the failover chain, skipping models whose circuit is open"""
+        chain = self._failover_chain(data["model"])
+        last_error: Optional[Exception] = None
+
+        for model_id in chain:
+            breaker = get_circuit_breaker(model_id)
+            if not breaker.allow_request():
+                continue
+            if model_id != data["model"]:
+                print(f"⚠️  Failing over from {data['model']} to {model_id}...")
+
+            started = time.perf_counter()
+            try:
+                result = await self._fetch_once(headers, dict(data, model=model_id), stream, on_delta)
+            except httpx.HTTPStatusError as e:
+                status = e.response.status_code
+                if status in (402, 404, 408):
+                    # Out of credits, model gone or a request timeout: another
+                    # model may still answer, but this one isn't unhealthy
+                    breaker.release_probe()
+                    last_error = e
+                    continue
+                if 400 <= status < 500:
+                    # Rate limits belong to the limiter and other client errors
+                    # would fail on any model, so neither trips the breaker
+                    breaker.release_probe()
+                    raise
+                breaker.record_failure(f"HTTP {status}")
+                last_error = e
+                continue
+            except Exception as e:
+                breaker.record_failure(type(e).__name__)
+                last_error = e
+                continue
+
+            # Streams are long by design, so only non-streamed calls can be "slow"
+            breaker.record_success(0.0 if stream else time.perf_counter() - started)
+            return result
+
+        if last_error is not None:
+            raise last_error
+        raise CircuitOpenError(f"Circuit open for every model in failover chain: {', '.join(chain)}")
+
+    async def _fetch_once(self, headers: Dict[str, str], data: Dict[str, Any],
+                          stream: bool, on_delta: Optional[Callable[[str], None]]) -> Dict[str, Any]:
+        """Fetch from one model, hedging slow non-streamed calls when enabled"""
+        policy = get_hedge_policy()
+        if policy is not None and not stream:
+            # Streams are never hedged: two interleaved delta feeds can't be merged
+            alternate = policy.alternate_model
+            alternate_id = self.available_models.get(alternate, alternate) if alternate else None
+            return await hedged_call(
+                data["model"],
+                lambda model_id, on_started: self._fetch_chat_completion(
+                    headers, dict(data, model=model_id), on_started=on_started
+                ),
+                policy,
+                alternate_id,
+                max_tokens=data.get("max_tokens")
+            )
+        return await self._fetch_chat_completion(headers, data, stream=stream, on_delta=on_delta)
+
+    async def _fetch_chat_completion(self, headers: Dict[str, str], data: Dict[str, Any],
+                                     stream: bool = False,
+                                     on_delta: Optional[Callable[[str], None]] = None,
+                                     on_started: Optional[Callable[[], None]] = None) -> Dict[str, Any]:
+        """Send one chat completion to OpenRouter through the rate limiter
+
+        on_started is called once the request holds its rate limiter and
+        budget slots, where its latency starts to count.
+        """
+        if stream:
+            result: Dict[str, Any] = {}
+            async for delta in self._iter_chat_stream(headers, data, result):
+                if on_delta:
+                    on_delta(delta)
+            return result
+
+        limiter = get_rate_limiter(data["model"])
+        async with limiter.slot(), get_llm_budget().slot():
+            started = time.perf_counter()
+            if on_started:
+                on_started()
+            response = await self._post_chat_completion(headers, data)
+            if response.status_code == 429:
+                limiter.on_rate_limited(response.headers)
+            response.raise_for_status()
+            limiter.on_success(response.headers)
+            result = response.json()
+        usage = result.get("usage") or {}
+        self._record_metrics(data["model"], started, None, usage.get("completion_tokens", 0), streamed=False,
+                             max_tokens=data.get("max_tokens"))
+        return result
+
+    async def _iter_chat_stream(self, headers: Dict[str, str], data: Dict[str, Any],
+                                result: Dict[str, Any]) -> AsyncIterator[str]:
+        """Yield content deltas from an SSE chat completion
+
+        The read timeout applies between chunks, so long generations that keep
+        producing tokens are not cut off by the overall request timeout.
+        On completion `result` is filled with a regular response body.
+        """
+        client = get_http_client()
+        limiter = get_rate_limiter(data["model"])
+        payload = dict(data, stream=True)
+        first_token_at = None
+        parts: List[str] = []
+        finish_reason = None
+        usage: Dict[str, Any] = {}
+        chunk_count = 0
+
+        async with limiter.slot(), get_llm_budget().slot():
+            started = time.perf_counter()
+            async with client.stream(
+                "POST",
+                f"{self.base_url}/chat/completions",
+                headers=headers,
+                json=payload,
+                timeout=settings.openrouter_timeout
+            ) as response:
+                if response.status_code == 429:
+                    limiter.on_rate_limited(response.headers)
+                if response.status_code >= 400:
+                    await response.aread()
+                    response.raise_for_status()
+                limiter.on_success(response.headers)
+
+                async for line in response.aiter_lines():
+                    # SSE comments (": OPENROUTER PROCESSING") and blank keep-alives
+                    if not line or not line.startswith("data:"):
+                        continue
+                    payload_str = line[len("data:"):].strip()
+                    if payload_str == "[DONE]":
+                        break
+
+                    chunk = json.loads(payload_str)
+                    if "error" in chunk:
+                        raise Exception(f"Stream error: {chunk['error']}")
+                    if chunk.get("usage"):
+                        usage = chunk["usage"]
+
+                    for choice in chunk.get("choices", []):
+                        delta = (choice.get("delta") or {}).get("content")
+                        if choice.get("finish_reason"):
+                            finish_reason = choice["finish_reason"]
+                        if delta:
+                            if first_token_at is None:
+                                first_token_at = time.perf_counter()
+                            chunk_count += 1
+                            parts.append(delta)
+                            yield delta
+
+        content = "".join(parts)
+        completion_tokens = usage.get("completion_tokens", chunk_count)
+        self._record_metrics(data["model"], started, first_token_at, completion_tokens, streamed=True)
+
+        result.update({
+            "model": data["model"],
+            "choices": [{
+                "message": {"role": "assistant", "content": content},
+                "finish_reason": finish_reason
+            }],
+            "usage": usage
+        })
+
+    def _record_metrics(self, model_id: str, started: float, first_token_at: Optional[float],
+                        completion_tokens: int, streamed: bool,
+                        max_tokens: Optional[int] = None) -> CallMetrics:
+        """Store latency metrics for one call"""
+        finished = time.perf_counter()
+        duration = finished - started
+        ttft = (first_token_at - started) if first_token_at is not None else None
+        # Generation rate excludes queueing/prompt processing when TTFT is known
+        generation_time = (finished - first_token_at) if first_token_at is not None else duration
+        tokens_per_second = completion_tokens / generation_time if generation_time > 0 else 0.0
+
+        metrics = CallMetrics(
+            model=model_id,
+            streamed=streamed,
+            duration=duration,
+            time_to_first_token=ttft,
+            completion_tokens=completion_tokens or 0,
+            tokens_per_second=tokens_per_second
+        )
+        self.call_metrics.append(metrics)
+        if not streamed:
+            latency_tracker.record(model_id, duration, max_tokens)
+        return metrics
+
+    def get_call_metrics(self) -> List[Dict[str, Any]]:
+        """Get recorded per-call latency metrics"""
+        return [m.to_dict() for m in self.call_metrics]
+
     def _get_system_message(self, model_name: str) -> str:
         """Get appropriate system message for each model"""
         system_messages = {
@@ -119,54 +611,71 @@ class OpenRouterAgent:
         }
         return system_messages.get(model_name, "You are a helpful AI assistant. Return ONLY valid JSON as requested.")
     
+    def _build_generate_request(self, prompt: str, model: str, max_tokens: int,
+                                temperature: float) -> tuple:
+        """Build headers and body for a single-prompt generate call"""
+        # Use the full model ID if provided, otherwise map from friendly names
+        if "/" not in model:
+            model_id = self.available_models.get(model, model)
+        else:
+            model_id = model
+
+        headers = {
+            "Authorization": f"Bearer {self.api_key}",
+            "Content-Type": "application/json",
+            "HTTP-Referer": "https://github.com/your-repo",  # Optional
+            "X-Title": "Audiobook Production System"  # Optional
+        }
+
+        data = {
+            "model": model_id,
+            "messages": [{"role": "user", "content": prompt}],
+            "temperature": temperature,
+            "max_tokens": max_tokens,
+            "usage": {"include": True}  # Ask OpenRouter to report cost
+        }
+        return headers, data
+
+    async def stream(self, prompt: str, model: str = "qwen-72b",
+                     max_tokens: int = 3000, temperature: float = 0.7) -> AsyncIterator[str]:
+        """Stream content deltas for a prompt as they arrive
+
+        Joining the yielded deltas gives the same string generate() returns.
+        No retries are attempted once deltas have been yielded.
+        """
+        headers, data = self._build_generate_request(prompt, model, max_tokens, temperature)
+        result: Dict[str, Any] = {}
+        async for delta in self._iter_chat_stream(headers, data, result):
+            yield delta
+
     async def generate(self, prompt: str, model: str = "qwen-72b", 
-                      max_tokens: int = 3000, temperature: float = 0.7) -> str:
-        """Generate response using specified model (for Station agents) with rate limiting"""
-        import asyncio
-        
+                      max_tokens: int = 3000, temperature: float = 0.7,
+                      stream: bool = False, on_delta: Optional[Callable[[str], None]] = None,
+                      use_cache: bool = True) -> str:
+        """Generate response using specified model (for Station agents) with rate limiting
+
+        With stream=True the response is read as server-sent events and each
+        content delta is passed to on_delta as it arrives.
+        """
         max_retries = 5
-        base_delay = 2  # Start with 2 seconds
-        
+        note_response_key(None)
+
         for attempt in range(max_retries):
             try:
-                # Use the full model ID if provided, otherwise map from friendly names
-                if "/" not in model:
-                    model_id = self.available_models.get(model, model)
-                else:
-                    model_id = model
-                
-                headers = {
-                    "Authorization": f"Bearer {self.api_key}",
-                    "Content-Type": "application/json",
-                    "HTTP-Referer": "https://github.com/your-repo",  # Optional
-                    "X-Title": "Audiobook Production System"  # Optional
-                }
-                
-                data = {
-                    "model": model_id,
-                    "messages": [{"role": "user", "content": prompt}],
-                    "temperature": temperature,
-                    "max_tokens": max_tokens
-                }
-                
-                async with httpx.AsyncClient() as client:
-                    response = await client.post(
-                        f"{self.base_url}/chat/completions",
-                        headers=headers,
-                        json=data,
-                        timeout=60.0
-                    )
-                    response.raise_for_status()
-                    result = response.json()
-                    return result["choices"][0]["message"]["content"]
+                headers, data = self._build_generate_request(prompt, model, max_tokens, temperature)
+
+                result = await self._chat_completion(headers, data, stream=stream, on_delta=on_delta,
+                                                     use_cache=use_cache)
+                return result["choices"][0]["message"]["content"]
                 
+            except BudgetExceededError:
+                raise
             except httpx.HTTPStatusError as e:
                 if e.response.status_code == 429:
-                    # Rate limit hit - exponential backoff
+                    # Rate limit hit - the shared limiter has already slowed this
+                    # model down and holds the retry until it may proceed
                     if attempt < max_retries - 1:
-                        delay = base_delay * (2 ** attempt)  # Exponential backoff: 2, 4, 8, 16, 32 seconds
-                        print(f"⚠️  Rate limit hit. Waiting {delay}s before retry {attempt + 1}/{max_retries}...")
-                        await asyncio.sleep(delay)
+                        print(f"⚠️  Rate limit hit. Retry {attempt + 1}/{max_retries} queued behind rate limiter...")
                         continue
                     else:
                         raise Exception(f"OpenRouter rate limit exceeded after {max_retries} retries. Please wait before continuing.")
@@ -174,28 +683,9 @@ class OpenRouterAgent:
                     # Other HTTP error
                     raise Exception(f"OpenRouter API error: {str(e)}")
             except Exception as e:
-                error_msg = str(e)
-                if "402 Payment Required" in error_msg:
-                    # Try with a free model as fallback
-                    print("⚠️ Payment required for selected model, switching to free model...")
-                    free_model_id = "qwen/qwen-2.5-72b-instruct:free"
-                    data["model"] = free_model_id
-                    
-                    try:
-                        async with httpx.AsyncClient() as client:
-                            response = await client.post(
-                                f"{self.base_url}/chat/completions",
-                                headers=headers,
-                                json=data,
-                                timeout=60.0
-                            )
-                            response.raise_for_status()
-                            result = response.json()
-                            return result["choices"][0]["message"]["content"]
-                    except Exception as fallback_error:
-                        raise Exception(f"OpenRouter API error (free model also failed): {str(fallback_error)}")
-                else:
-                    raise Exception(f"OpenRouter API error: {str(e)}")
+                # Payment/outage failover already happened inside the request
+                # via the station's failover chain and circuit breakers
+                raise Exception(f"OpenRouter API error: {str(e)}")
     
     def get_available_models(self) -> Dict[str, str]:
         """Get list of available models"""
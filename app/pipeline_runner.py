@@ -0,0 +1,617 @@
+"""
+Headless Pipeline Runner
+
+Builds the station dependency graph from the `dependencies` field of every
+configs/station_N.yml and runs the stations of one session in dependency
+order. Stations whose dependencies are all complete run concurrently (for
+example the 16-20 check family, which only reads upstream data), up to
+PIPELINE_MAX_CONCURRENCY at a time, so a full run takes roughly the length
+of the critical path instead of the sum of every station.
+
+Stations that prompt on the console (seed input, genre choice, reviews)
+are run on their own so prompts never interleave with other stations'
+output; stations with a skip_review option auto-accept when stdin is not a
+terminal, as their standalone entry points do. The script stations (21-27)
+run in batch mode, processing every episode concurrently.
+
+Progress is written after every state change to
+output/auto_<timestamp>/checkpoint_auto_<timestamp>.json and a summary to
+automation_summary_auto_<timestamp>.json, in the same format as earlier
+automation runs. With --resume, completed stations are skipped and the
+stations that rerun skip the tasks and episodes they had already finished
+(see app/checkpoint_store.py).
+
+With --distributed, every station without console prompts is queued as a
+job on a Redis Stream and run by station workers, possibly on other
+machines (see app/station_queue.py); the runner still decides what runs
+when and records checkpoints and fingerprints.
+
+Stations are skipped when their YAML config and the outputs of the stations
+they read are unchanged since their last successful run (see
+app/station_fingerprints.py); --force reruns them anyway and --plan lists
+what a run would execute.
+
+Usage:
+    python -m app.pipeline_runner --session-id session_20251024_101737
+    python -m app.pipeline_runner --session-id session_... --stations 16-20 --max-concurrency 5
+    python -m app.pipeline_runner --resume output/auto_.../checkpoint_auto_....json
+    python -m app.pipeline_runner --session-id session_... --plan
+    python -m app.pipeline_runner --session-id session_... --distributed
+"""
+
+import argparse
+import asyncio
+import importlib
+import inspect
+import json
+import logging
+import sys
+import time
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, Any, List, Optional, Iterable
+
+from app.config import settings
+from app.agents.config_loader import load_station_config
+from app.checkpoint_store import get_checkpoint_store, resume_units
+from app.station_fingerprints import (
+    FingerprintManifest, compute_fingerprint, config_digest, downstream_of, output_digest
+)
+from app.llm_usage import usage_scope
+from app.openrouter_agent import startup_openrouter, shutdown_openrouter
+from app.redis_pool import close_redis
+from app.redis_client import RedisClient
+from app.review_queue import reviews_use_console
+from app.station_queue import JOBS_STREAM, StationJob, StationJobQueue
+
+logger = logging.getLogger(__name__)
+
+# Station id -> (module in app.agents, class name, display name)
+STATION_REGISTRY: Dict[str, tuple] = {
+    "1": ("station_01_seed_processor", "Station01SeedProcessor", "Seed Processor"),
+    "2": ("station_02_project_dna_builder", "Station02ProjectDNABuilder", "Project DNA Builder"),
+    "3": ("station_03_age_genre_optimizer", "Station03AgeGenreOptimizer", "Age/Genre Optimizer"),
+    "4": ("station_04_reference_mining", "Station04ReferenceMining", "Reference Mining"),
+    "4.5": ("station_045_narrator_strategy_designer", "Station045NarratorStrategyDesigner",
+            "Narrator Strategy Designer"),
+    "5": ("station_05_season_architect", "Station05SeasonArchitect", "Season Architect"),
+    "6": ("station_06_master_style_guide_builder", "Station06MasterStyleGuideBuilder",
+          "Master Style Guide Builder"),
+    "7": ("station_07_character_architect", "Station07CharacterArchitect", "Character Architect"),
+    "8": ("station_08_world_builder", "Station08WorldBuilder", "World Builder"),
+    "9": ("station_09_world_building_system", "Station09WorldBuildingSystem", "World Building System"),
+    "10": ("station_10_narrative_reveal_strategy", "Station10NarrativeRevealStrategy",
+           "Narrative Reveal Strategy"),
+    "11": ("station_11_runtime_planner", "Station11RuntimePlanner", "Runtime Planner"),
+    "12": ("station_12_hook_cliffhanger_designer", "Station12HookCliffhangerDesigner",
+           "Hook & Cliffhanger Designer"),
+    "13": ("station_13_multi_world_timeline_manager", "Station13MultiWorldTimelineManager",
+           "Multi-World Timeline Manager"),
+    "14": ("station_14_simple_episode_blueprint", "Station14SimpleEpisodeBlueprint",
+           "Simple Episode Blueprint"),
+    "15": ("station_15_detailed_episode_outlining", "Station15DetailedEpisodeOutlining",
+           "Detailed Episode Outlining"),
+    "16": ("station_16_canon_check", "Station16CanonCheck", "Canon Check"),
+    "17": ("station_17_dialect_planning", "Station17DialectPlanning", "Dialect Planning"),
+    "18": ("station_18_evergreen_check", "Station18EvergreenCheck", "Evergreen Check"),
+    "19": ("station_19_procedure_check", "Station19ProcedureCheck", "Procedure Check"),
+    "20": ("station_20_geography_transit", "Station20GeographyTransit", "Geography & Transit"),
+    "21": ("station_21_first_draft", "Station21FirstDraft", "First Draft"),
+    "22": ("station_22_momentum_check", "Station22MomentumCheck", "Momentum Check"),
+    "23": ("station_23_twist_integration", "Station23TwistIntegration", "Twist Integration"),
+    "24": ("station_24_dialogue_polish", "Station24DialoguePolish", "Dialogue Polish"),
+    "25": ("station_25_audio_optimization", "Station25AudioOptimization", "Audio Optimization"),
+    "26": ("station_26_final_script_lock", "Station26FinalScriptLock", "Final Script Lock"),
+    "27": ("station_27_master_script_assembly", "Station27MasterScriptAssembly",
+           "Master Script Assembly"),
+    "28": ("station_28_emotional_truth_validator", "Station28EmotionalTruthValidator",
+           "Emotional Truth Validator"),
+    "29": ("station_29_heroic_journey_auditor", "Station29HeroicJourneyAuditor",
+           "Heroic Journey Auditor"),
+    "30": ("station_30_structure_integrity_checker", "Station30StructureIntegrityChecker",
+           "Structure Integrity Checker"),
+    "31": ("station_31_dialogue_naturalness_pass", "Station31DialogueNaturalnessPass",
+           "Dialogue Naturalness Pass"),
+    "32": ("station_32_audio_clarity_audit", "Station32AudioClarityAudit", "Audio Clarity Audit"),
+}
+
+# Stations that read from the console during a run; never run alongside others
+INTERACTIVE_STATIONS = {"1", "3", "4", "9", "10", "21", "22", "23", "24", "25", "26", "27", "30", "31", "32"}
+
+# Script stations run in batch mode (every episode concurrently)
+BATCH_STATIONS = {"21", "22", "23", "24", "25", "26", "27"}
+
+# Stations whose prompts are only reviews; with reviews skipped they need no
+# console at all. Station 1 needs none when given a seed preset.
+REVIEW_STATIONS = BATCH_STATIONS | {"3", "4", "9", "10", "30", "31", "32"}
+
+# Stations whose runner-mode prompts all go through app/review_queue.py, so
+# with REVIEW_MODE=redis or file they run alongside other stations
+QUEUED_REVIEW_STATIONS = BATCH_STATIONS | {"9", "10", "30"}
+
+
+def station_sort_key(station_id: str) -> float:
+    return float(station_id)
+
+
+def station_number(station_id: str):
+    """Checkpoint representation of a station id (1, 2, ..., 4.5, ...)"""
+    value = float(station_id)
+    return int(value) if value.is_integer() else value
+
+
+def _normalize_station_id(value: Any) -> str:
+    text = str(value).strip()
+    if text in ("45", "045"):
+        return "4.5"
+    return str(station_number(text))
+
+
+def expand_station_spec(spec: Any) -> List[str]:
+    """Expand '16-20', '4.5', 7 or '1,2,5-8' into registered station ids"""
+    station_ids: List[str] = []
+    for part in str(spec).split(","):
+        part = part.strip()
+        if not part:
+            continue
+        if "-" in part:
+            low, high = (float(_normalize_station_id(p)) for p in part.split("-", 1))
+            station_ids.extend(
+                sid for sid in sorted(STATION_REGISTRY, key=station_sort_key)
+                if low <= float(sid) <= high
+            )
+        else:
+            station_ids.append(_normalize_station_id(part))
+    return station_ids
+
+
+def parse_dependencies(raw: Any) -> List[str]:
+    """Normalize a config `dependencies` field into station ids
+
+    Accepts the shapes used across the station YAMLs: `{none: true}`, a list
+    of station numbers, or a list of `{station: N, name: ...}` entries where
+    N may be a range such as "1-9".
+    """
+    if not raw or isinstance(raw, dict):
+        return []
+    station_ids: List[str] = []
+    for entry in raw:
+        spec = entry.get("station") if isinstance(entry, dict) else entry
+        if spec is None:
+            continue
+        for sid in expand_station_spec(spec):
+            if sid not in station_ids:
+                station_ids.append(sid)
+    return station_ids
+
+
+def load_dependencies(station_id: str) -> List[str]:
+    """Dependencies declared in a station's YAML config"""
+    config = load_station_config(0, station_suffix=station_id.replace(".", ""))
+    return [sid for sid in parse_dependencies(config.dependencies) if sid != station_id]
+
+
+def build_station_graph(station_ids: Optional[Iterable[str]] = None) -> Dict[str, List[str]]:
+    """Station id -> dependency ids for every registered (or the given) station
+
+    Raises:
+        ValueError: If a dependency is unknown or the graph has a cycle
+    """
+    graph = {sid: load_dependencies(sid) for sid in (station_ids or STATION_REGISTRY)}
+    for sid, deps in graph.items():
+        unknown = [dep for dep in deps if dep not in STATION_REGISTRY]
+        if unknown:
+            raise ValueError(f"Station {sid} depends on unknown station(s): {', '.join(unknown)}")
+
+    # Kahn's algorithm over the stations in the graph, only to detect cycles
+    remaining = {sid: {dep for dep in deps if dep in graph} for sid, deps in graph.items()}
+    while remaining:
+        ready = [sid for sid, deps in remaining.items() if not deps]
+        if not ready:
+            raise ValueError(f"Dependency cycle between stations: {', '.join(sorted(remaining, key=station_sort_key))}")
+        for sid in ready:
+            del remaining[sid]
+        for deps in remaining.values():
+            deps.difference_update(ready)
+    return graph
+
+
+async def run_station(station_id: str, session_id: str, skip_review: bool = True,
+                      station_kwargs: Optional[Dict[str, Any]] = None):
+    """Instantiate and run a single station for a session"""
+    module_name, class_name, _ = STATION_REGISTRY[station_id]
+    module = importlib.import_module(f"app.agents.{module_name}")
+    station_class = getattr(module, class_name)
+
+    init_params = inspect.signature(station_class.__init__).parameters
+    kwargs = {}
+    if "session_id" in init_params:
+        kwargs["session_id"] = session_id
+    if "skip_review" in init_params:
+        kwargs["skip_review"] = skip_review
+    if "batch_mode" in init_params:
+        kwargs["batch_mode"] = True
+    kwargs.update({
+        name: value for name, value in (station_kwargs or {}).items()
+        if name in init_params
+    })
+    station = station_class(**kwargs)
+
+    await station.initialize()
+    try:
+        entry = station.run if hasattr(station, "run") else station.process
+        if "session_id" in inspect.signature(entry).parameters:
+            await entry(session_id=session_id)
+        else:
+            await entry()
+    finally:
+        for value in vars(station).values():
+            if isinstance(value, RedisClient):
+                await value.disconnect()
+
+
+class PipelineRunner:
+    """Runs one session's stations concurrently in dependency order"""
+
+    def __init__(self, session_id: str, stations: Optional[List[str]] = None,
+                 max_concurrency: Optional[int] = None, skip_review: Optional[bool] = None,
+                 checkpoint: Optional[Dict[str, Any]] = None, force: bool = False,
+                 station_kwargs: Optional[Dict[str, Dict[str, Any]]] = None,
+                 run_id: Optional[str] = None, distributed: bool = False):
+        self.session_id = session_id
+        self.max_concurrency = max(1, max_concurrency or settings.pipeline_max_concurrency)
+        self.skip_review = (not sys.stdin.isatty()) if skip_review is None else skip_review
+
+        # Build the full graph so dependencies outside the selection are known
+        self.graph = build_station_graph()
+        selected = stations or list(STATION_REGISTRY)
+        self.stations = sorted(dict.fromkeys(selected), key=station_sort_key)
+
+        # Extra constructor arguments per station, e.g. {"1": {"seed": {...}}}
+        self.station_kwargs = station_kwargs or {}
+
+        self.run_id = run_id or f"auto_{datetime.now().strftime('%Y%m%d_%H%M%S')}"
+        self.start_time = datetime.now().isoformat()
+        self.station_details: Dict[str, Dict[str, Any]] = {}
+        self.current_station = None
+        # Resumed runs also skip finished units inside the stations that rerun
+        self.resume_units = checkpoint is not None
+        # Stations whose inputs and config are unchanged are skipped unless forced
+        self.incremental = not force
+        self.fingerprints = FingerprintManifest(session_id)
+        self.redis: Optional[RedisClient] = None
+        # Stations without console prompts run on station workers (app/station_worker.py)
+        self.distributed = distributed
+        self.job_queue: Optional[StationJobQueue] = None
+
+        previous = (checkpoint or {}).get("station_details", {})
+        if checkpoint:
+            self.run_id = checkpoint.get("run_id", self.run_id)
+            self.start_time = checkpoint.get("start_time", self.start_time)
+
+        for sid in self.stations:
+            name = STATION_REGISTRY[sid][2]
+            status = previous.get(sid, {}).get("status", "pending")
+            self.station_details[sid] = {
+                "name": name,
+                "status": "completed" if status == "completed" else "pending",
+                "dependencies": [station_number(dep) for dep in self.graph[sid]],
+            }
+            for field in ("started_at", "finished_at", "duration_seconds"):
+                if status == "completed" and field in previous.get(sid, {}):
+                    self.station_details[sid][field] = previous[sid][field]
+
+        self.output_dir = Path(settings.output_dir) / self.run_id
+        self.output_dir.mkdir(parents=True, exist_ok=True)
+
+    @property
+    def checkpoint_path(self) -> Path:
+        return self.output_dir / f"checkpoint_{self.run_id}.json"
+
+    def _ids_with_status(self, *statuses: str) -> List[str]:
+        return [sid for sid in self.stations if self.station_details[sid]["status"] in statuses]
+
+    def _dependencies_met(self, station_id: str) -> bool:
+        # Dependencies outside this run are assumed to have completed earlier
+        return all(
+            self.station_details[dep]["status"] == "completed"
+            for dep in self.graph[station_id] if dep in self.station_details
+        )
+
+    def _interactive(self, station_id: str) -> bool:
+        if station_id in REVIEW_STATIONS and self.skip_review:
+            return False
+        if station_id in QUEUED_REVIEW_STATIONS and not reviews_use_console():
+            return False
+        if station_id == "1" and self.station_kwargs.get("1", {}).get("seed") is not None:
+            return False
+        return station_id in INTERACTIVE_STATIONS
+
+    def _blocked(self, station_id: str) -> bool:
+        return any(
+            self.station_details[dep]["status"] in ("failed", "skipped")
+            for dep in self.graph[station_id] if dep in self.station_details
+        )
+
+    async def _fingerprint(self, station_id: str):
+        """Current (fingerprint, config digest, upstream output digests) of a station"""
+        config_hash = config_digest(station_id)
+        inputs = {dep: await output_digest(self.redis, self.session_id, dep) for dep in self.graph[station_id]}
+        return compute_fingerprint(config_hash, inputs), config_hash, inputs
+
+    async def _up_to_date(self, station_id: str) -> bool:
+        """Whether the station's last recorded run still matches its config, inputs and outputs"""
+        record = self.fingerprints.get(station_id)
+        if not record or record.get("invalidated_by"):
+            return False
+        fingerprint, _, _ = await self._fingerprint(station_id)
+        if fingerprint != record.get("fingerprint"):
+            return False
+        return await output_digest(self.redis, self.session_id, station_id) == record.get("output_digest")
+
+    async def stale_stations(self) -> List[str]:
+        """Stations that would rerun: changed ones plus everything downstream of them"""
+        changed = [sid for sid in self.stations if not await self._up_to_date(sid)]
+        stale = set(changed) | downstream_of(self.graph, changed)
+        return [sid for sid in self.stations if sid in stale]
+
+    def save_checkpoint(self):
+        checkpoint = {
+            "run_id": self.run_id,
+            "session_id": self.session_id,
+            "start_time": self.start_time,
+            "current_station": self.current_station,
+            "running_stations": [station_number(sid) for sid in self._ids_with_status("running")],
+            "completed_stations": [station_number(sid) for sid in self._ids_with_status("completed")],
+            "failed_stations": [station_number(sid) for sid in self._ids_with_status("failed")],
+            "station_details": self.station_details,
+        }
+        with open(self.checkpoint_path, "w", encoding="utf-8") as f:
+            json.dump(checkpoint, f, indent=2)
+
+    def save_summary(self, wall_seconds: float) -> Dict[str, Any]:
+        completed = self._ids_with_status("completed")
+        station_seconds = sum(d.get("duration_seconds", 0.0) for d in self.station_details.values())
+        summary = {
+            "run_id": self.run_id,
+            "session_id": self.session_id,
+            "start_time": self.start_time,
+            "end_time": datetime.now().isoformat(),
+            "total_stations": len(self.stations),
+            "completed_stations": [station_number(sid) for sid in completed],
+            "failed_stations": [station_number(sid) for sid in self._ids_with_status("failed")],
+            "skipped_stations": [station_number(sid) for sid in self._ids_with_status("skipped")],
+            "success_rate": round(len(completed) / len(self.stations) * 100, 1) if self.stations else 0.0,
+            "wall_clock_seconds": round(wall_seconds, 2),
+            "sum_of_station_seconds": round(station_seconds, 2),
+            "max_concurrency": self.max_concurrency,
+            "station_details": self.station_details,
+        }
+        summary_path = self.output_dir / f"automation_summary_{self.run_id}.json"
+        with open(summary_path, "w", encoding="utf-8") as f:
+            json.dump(summary, f, indent=2)
+        return summary
+
+    async def _run_station(self, station_id: str):
+        """Run a single station here, or on a station worker with --distributed"""
+        station_kwargs = self.station_kwargs.get(station_id, {})
+        if not self.job_queue or self._interactive(station_id):
+            await run_station(station_id, self.session_id, self.skip_review, station_kwargs)
+            return
+
+        job = StationJob(self.session_id, station_id, skip_review=True, station_kwargs=station_kwargs,
+                         resume=self.resume_units)
+        await self.job_queue.enqueue(job)
+        print(f"📮 Station {station_id}: queued as job {job.job_id}")
+        reply = await self.job_queue.wait_result(job.job_id)
+        self.station_details[station_id].update(worker=reply.get("consumer"), attempts=reply.get("attempts"))
+        if reply.get("status") != "completed":
+            raise RuntimeError(f"Station job failed on {reply.get('consumer')} after "
+                               f"{reply.get('attempts')} attempt(s): {reply.get('error')}")
+
+    async def _execute(self, station_id: str):
+        details = self.station_details[station_id]
+        details["status"] = "running"
+        details["started_at"] = datetime.now().isoformat()
+        details.pop("error", None)
+        self.current_station = station_number(station_id)
+        self.save_checkpoint()
+        print(f"▶️  Station {station_id}: {details['name']} started")
+
+        started = time.monotonic()
+        try:
+            fingerprint = config_hash = inputs = None
+            if self.redis:
+                fingerprint, config_hash, inputs = await self._fingerprint(station_id)
+                record = self.fingerprints.get(station_id)
+                if not record or record.get("fingerprint") != fingerprint:
+                    # Its output is about to change: everything downstream is stale
+                    self.fingerprints.invalidate(downstream_of(self.graph, [station_id]), changed=station_id)
+                    if record and self.resume_units:
+                        # Units from a run with other inputs or config can't be reused
+                        get_checkpoint_store().clear(self.session_id, station_id)
+
+            with usage_scope(session_id=self.session_id), resume_units(self.resume_units):
+                await self._run_station(station_id)
+
+            if fingerprint:
+                outputs = await output_digest(self.redis, self.session_id, station_id)
+                self.fingerprints.record(station_id, fingerprint, config_hash, inputs, outputs)
+            details["status"] = "completed"
+            print(f"✅ Station {station_id}: {details['name']} completed ({time.monotonic() - started:.1f}s)")
+        except (Exception, SystemExit) as e:
+            details["status"] = "failed"
+            details["error"] = str(e)
+            logger.error(f"Station {station_id} failed: {e}", exc_info=True)
+            print(f"❌ Station {station_id}: {details['name']} failed: {e}")
+        finally:
+            details["finished_at"] = datetime.now().isoformat()
+            details["duration_seconds"] = round(time.monotonic() - started, 2)
+            details["completed_units"] = get_checkpoint_store().completed_units(self.session_id, station_id)
+            self.save_checkpoint()
+
+    async def _connect_redis(self):
+        """Connection used for fingerprints; without Redis every station simply runs"""
+        self.redis = RedisClient()
+        try:
+            await self.redis.initialize()
+        except Exception as e:
+            logger.warning(f"Redis unavailable, fingerprint checks disabled: {e}")
+            self.redis = None
+
+    async def plan(self) -> List[str]:
+        """Print and return the stations a run would execute"""
+        await self._connect_redis()
+        if not self.redis:
+            return list(self.stations)
+        try:
+            stale = await self.stale_stations()
+        finally:
+            await self.redis.disconnect()
+        print(f"Stale ({len(stale)}/{len(self.stations)}): {', '.join(stale) or 'none'}")
+        for sid in stale:
+            reason = (self.fingerprints.get(sid) or {}).get("invalidated_by")
+            print(f"   • Station {sid}: {self.station_details[sid]['name']}"
+                  + (f" (upstream station {reason} changed)" if reason else ""))
+        return stale
+
+    async def run(self) -> Dict[str, Any]:
+        """Run every pending station; returns the run summary"""
+        print("=" * 70)
+        print(f"🚀 PIPELINE RUN {self.run_id}")
+        print("=" * 70)
+        print(f"Session: {self.session_id}")
+        print(f"Stations: {', '.join(self.stations)} (max {self.max_concurrency} at once)")
+        print()
+
+        await startup_openrouter()
+        await self._connect_redis()
+        if self.distributed:
+            self.job_queue = StationJobQueue()
+            await self.job_queue.connect()
+            await self.job_queue.ensure_group()
+            print(f"📡 Distributed: stations are queued on {JOBS_STREAM} for station workers")
+        wall_start = time.monotonic()
+        running: Dict[str, asyncio.Task] = {}
+        self.save_checkpoint()
+
+        try:
+            while True:
+                for sid in self._ids_with_status("pending"):
+                    if self._blocked(sid):
+                        self.station_details[sid]["status"] = "skipped"
+                        print(f"⏭️  Station {sid}: skipped (upstream station failed)")
+
+                ready = [sid for sid in self._ids_with_status("pending") if self._dependencies_met(sid)]
+
+                if self.incremental and self.redis:
+                    up_to_date = [sid for sid in ready if await self._up_to_date(sid)]
+                    for sid in up_to_date:
+                        self.station_details[sid].update(status="completed", up_to_date=True)
+                        print(f"⏭️  Station {sid}: up to date (config and inputs unchanged)")
+                    if up_to_date:
+                        self.save_checkpoint()
+                        continue
+                exclusive_running = any(self._interactive(sid) for sid in running)
+
+                for sid in ready:
+                    if exclusive_running or len(running) >= self.max_concurrency:
+                        break
+                    if self._interactive(sid):
+                        if running:
+                            continue
+                        exclusive_running = True
+                    running[sid] = asyncio.create_task(self._execute(sid))
+
+                if not running:
+                    break
+
+                done, _ = await asyncio.wait(running.values(), return_when=asyncio.FIRST_COMPLETED)
+                for sid in [sid for sid, task in running.items() if task in done]:
+                    del running[sid]
+        finally:
+            for task in running.values():
+                task.cancel()
+            if self.redis:
+                await self.redis.disconnect()
+            if self.job_queue:
+                await self.job_queue.disconnect()
+            await shutdown_openrouter()
+            await close_redis()
+
+        self.current_station = None
+        self.save_checkpoint()
+        summary = self.save_summary(time.monotonic() - wall_start)
+
+        print()
+        print("=" * 70)
+        print("📊 PIPELINE SUMMARY")
+        print("=" * 70)
+        print(f"Completed: {len(summary['completed_stations'])}/{summary['total_stations']}")
+        up_to_date = [sid for sid, d in self.station_details.items() if d.get("up_to_date")]
+        if up_to_date:
+            print(f"Up to date (not rerun): {', '.join(up_to_date)}")
+        if summary["failed_stations"]:
+            print(f"Failed: {', '.join(map(str, summary['failed_stations']))}")
+        if summary["skipped_stations"]:
+            print(f"Skipped: {', '.join(map(str, summary['skipped_stations']))}")
+        print(f"Wall clock: {summary['wall_clock_seconds']:.1f}s "
+              f"(stations took {summary['sum_of_station_seconds']:.1f}s in total)")
+        print(f"Checkpoint: {self.checkpoint_path}")
+        return summary
+
+
+async def main():
+    """Run the pipeline headless from the command line"""
+    parser = argparse.ArgumentParser(description="Run pipeline stations in dependency order")
+    parser.add_argument("--session-id", help="Session ID to run the stations for")
+    parser.add_argument("--stations", help="Stations to run, e.g. '16-20' or '2,3,4.5' (default: all)")
+    parser.add_argument("--max-concurrency", type=int, default=None,
+                        help=f"Stations run at once (default: {settings.pipeline_max_concurrency})")
+    parser.add_argument("--skip-review", action="store_true", default=None,
+                        help="Auto-accept review prompts (default when stdin is not a terminal)")
+    parser.add_argument("--resume", help="Checkpoint file of an earlier run; completed stations are skipped")
+    parser.add_argument("--force", action="store_true",
+                        help="Rerun stations even when their config and inputs are unchanged")
+    parser.add_argument("--plan", action="store_true",
+                        help="List the stations whose config or inputs changed (and their downstream) and exit")
+    parser.add_argument("--distributed", action="store_true",
+                        help="Queue stations for station workers (python -m app.station_worker) instead of running them here")
+    args = parser.parse_args()
+
+    checkpoint = None
+    if args.resume:
+        with open(args.resume, "r", encoding="utf-8") as f:
+            checkpoint = json.load(f)
+
+    session_id = args.session_id or (checkpoint or {}).get("session_id")
+    if not session_id:
+        parser.error("--session-id is required (or --resume with a checkpoint)")
+
+    stations = expand_station_spec(args.stations) if args.stations else None
+    if stations is None and checkpoint:
+        stations = list(checkpoint.get("station_details", {})) or None
+    unknown = [sid for sid in stations or [] if sid not in STATION_REGISTRY]
+    if unknown:
+        parser.error(f"Unknown station(s): {', '.join(unknown)}")
+
+    runner = PipelineRunner(
+        session_id,
+        stations=stations,
+        max_concurrency=args.max_concurrency,
+        skip_review=args.skip_review,
+        checkpoint=checkpoint,
+        force=args.force,
+        distributed=args.distributed
+    )
+    if args.plan:
+        await runner.plan()
+        return
+    summary = await runner.run()
+    if summary["failed_stations"]:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO)
+    asyncio.run(main())
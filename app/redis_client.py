@@ -1,6 +1,7 @@
 import redis.asyncio as redis
-from app.config import settings
-from typing import Optional
+from app import codec
+from app.redis_pool import client_cache, get_redis, start_client_cache
+from typing import Optional, Dict, List, Sequence
 
 
 class RedisClient:
@@ -12,32 +13,57 @@ class RedisClient:
         await self.connect()
     
     async def connect(self):
-        """Connect to Redis"""
-        self.redis = redis.from_url(settings.redis_url)
+        """Connect to Redis (through the process-wide pool, see app/redis_pool.py)"""
+        self.redis = get_redis()
         await self.redis.ping()
+        await start_client_cache()
     
     async def disconnect(self):
-        """Disconnect from Redis"""
-        if self.redis:
-            await self.redis.close()
+        """Nothing to close: the pool is shared by the whole process (see close_redis())"""
     
     async def get(self, key: str):
-        """Get value from Redis"""
-        if self.redis:
-            result = await self.redis.get(key)
-            return result.decode('utf-8') if result else None
-        return None
+        """Get value from Redis (values written by app/codec.py come back as JSON text)"""
+        result = (await self.mget_raw([key]))[0]
+        return codec.decode_text(result) if result else None
     
+    async def mget(self, keys: Sequence[str]) -> List[Optional[str]]:
+        """Get several values in one round trip (None for missing keys)"""
+        return [codec.decode_text(result) if result else None for result in await self.mget_raw(keys)]
+
+    async def mget_raw(self, keys: Sequence[str]) -> List[Optional[bytes]]:
+        """Get several values as stored, without decoding (for codec.decode)"""
+        if not (self.redis and keys):
+            return [None] * len(keys)
+        cache = client_cache()
+        if cache is None:
+            return await self.redis.mget(list(keys))
+        cached = [key for key in keys if cache.cacheable(key)]
+        values = dict(zip(cached, await cache.mget(cached, self.redis.mget))) if cached else {}
+        direct = [key for key in keys if key not in values]
+        if direct:
+            values.update(zip(direct, await self.redis.mget(direct)))
+        return [values[key] for key in keys]
+
+    def forget(self, *keys: str):
+        """Drop keys this process has just written from the client-side cache"""
+        cache = client_cache()
+        if cache is not None:
+            cache.invalidate(keys)
+
     async def set(self, key: str, value: str, expire: Optional[int] = None):
         """Set value in Redis"""
         if self.redis:
-            return await self.redis.set(key, value, ex=expire)
+            result = await self.redis.set(key, value, ex=expire)
+            self.forget(key)
+            return result
         return False
     
     async def delete(self, key: str):
         """Delete key from Redis"""
         if self.redis:
-            return await self.redis.delete(key)
+            result = await self.redis.delete(key)
+            self.forget(key)
+            return result
         return False
     
     async def exists(self, key: str):
@@ -46,6 +72,65 @@ class RedisClient:
             return await self.redis.exists(key)
         return False
     
+    async def type(self, key: str) -> Optional[str]:
+        """Get the Redis type of a key ('string', 'hash', ... or 'none')"""
+        if self.redis:
+            result = await self.redis.type(key)
+            return result.decode('utf-8') if isinstance(result, bytes) else result
+        return None
+
+    async def hset(self, key: str, field: str, value: str, expire: Optional[int] = None):
+        """Set one field of a hash in Redis"""
+        if self.redis:
+            async with self.redis.pipeline(transaction=False) as pipe:
+                pipe.hset(key, field, value)
+                if expire:
+                    pipe.expire(key, expire)
+                results = await pipe.execute()
+            return results[0]
+        return False
+
+    async def hgetall(self, key: str) -> Dict[str, str]:
+        """Get all fields of a hash from Redis"""
+        if self.redis:
+            result = await self.redis.hgetall(key)
+            return {
+                (k.decode('utf-8') if isinstance(k, bytes) else k): (v.decode('utf-8') if isinstance(v, bytes) else v)
+                for k, v in result.items()
+            }
+        return {}
+
+    async def zadd(self, key: str, mapping: Dict[str, float], expire: Optional[int] = None):
+        """Add members to a sorted set in Redis"""
+        if self.redis:
+            async with self.redis.pipeline(transaction=False) as pipe:
+                pipe.zadd(key, mapping)
+                if expire:
+                    pipe.expire(key, expire)
+                results = await pipe.execute()
+            return results[0]
+        return False
+
+    async def zrange(self, key: str, start: int = 0, end: int = -1) -> List[str]:
+        """Get members of a sorted set in score order"""
+        if self.redis:
+            members = await self.redis.zrange(key, start, end)
+            return [m.decode('utf-8') if isinstance(m, bytes) else m for m in members]
+        return []
+
+    async def ttl(self, key: str) -> int:
+        """Seconds until the key expires (-1 without expiry, -2 if missing)"""
+        if self.redis:
+            return await self.redis.ttl(key)
+        return -2
+
+    async def scan_keys(self, pattern: str, count: int = 1000) -> List[str]:
+        """Get keys matching pattern with SCAN (does not block the server like KEYS)"""
+        if self.redis:
+            return [key.decode('utf-8') if isinstance(key, bytes) else key
+                    async for key in self.redis.scan_iter(match=pattern, count=count)]
+        return []
+
     async def keys(self, pattern: str):
         """Get keys matching pattern from Redis"""
         if self.redis:
@@ -0,0 +1,260 @@
+"""
+Shared Redis Connection Pool
+
+Stations, the runner, the review queue, the job queue and the Redis tools all
+talk to Redis through one connection pool per process (per event loop), made
+by `get_redis()`. A station's `RedisClient()` no longer opens connections of
+its own, so ten stations running side by side share at most
+REDIS_MAX_CONNECTIONS connections. When they are all busy, callers wait up to
+REDIS_POOL_TIMEOUT seconds for a free one instead of failing. A connection
+left idle for REDIS_HEALTH_CHECK_INTERVAL seconds is PINGed before reuse, so
+a dropped socket is replaced before a command hits it.
+
+Client-side cache (REDIS_CLIENT_CACHE=true)
+-------------------------------------------
+Upstream outputs (Stations 1, 2, 5, 7, 8 ...) are read by many stations and
+rarely change. With the cache on, values under REDIS_CLIENT_CACHE_PREFIXES
+read through `RedisClient.get()` / `mget()` are kept in process memory, up to
+REDIS_CLIENT_CACHE_MAX_BYTES. Only the first read of a key goes to Redis.
+
+The server says when a cached value goes stale. A tracking connection turns
+on `CLIENT TRACKING ... BCAST PREFIX ...`, and the server then reports every
+write under those prefixes, from any client, on the `__redis__:invalidate`
+channel of a listener connection. Those keys are evicted on arrival. Writes
+through RedisClient in this process evict their key at once. If the listener
+loses its connection, the whole cache is dropped and rebuilt on reconnect.
+"""
+
+import asyncio
+import logging
+from collections import OrderedDict
+from typing import Any, Awaitable, Callable, Dict, Iterable, List, Optional, Sequence
+
+import redis.asyncio as redis
+
+from app.config import settings
+
+logger = logging.getLogger(__name__)
+
+INVALIDATE_CHANNEL = "__redis__:invalidate"
+
+_client: Optional[redis.Redis] = None
+_client_loop: Optional[asyncio.AbstractEventLoop] = None
+_cache: Optional["ClientSideCache"] = None
+
+
+def get_redis() -> redis.Redis:
+    """The process-wide Redis client (one pool per event loop)"""
+    global _client, _client_loop, _cache
+    loop = asyncio.get_running_loop()
+    if _client is None or _client_loop is not loop:
+        pool = redis.BlockingConnectionPool.from_url(
+            settings.redis_url,
+            max_connections=settings.redis_max_connections,
+            timeout=settings.redis_pool_timeout,
+            health_check_interval=settings.redis_health_check_interval,
+            socket_keepalive=True,
+        )
+        _client = redis.Redis(connection_pool=pool)
+        _client_loop = loop
+        _cache = None  # Belonged to the previous loop
+    return _client
+
+
+async def close_redis():
+    """Close the shared pool (and the client-side cache); the next get_redis() reopens it"""
+    global _client, _client_loop, _cache
+    cache, client = _cache, _client
+    _client = _client_loop = _cache = None
+    if cache is not None:
+        await cache.close()
+    if client is not None:
+        await client.aclose()
+        await client.connection_pool.disconnect()
+
+
+def client_cache() -> Optional["ClientSideCache"]:
+    """The running client-side cache of this loop's pool, if any"""
+    if _cache is not None and _cache.active and _client_loop is asyncio.get_running_loop():
+        return _cache
+    return None
+
+
+async def start_client_cache() -> Optional["ClientSideCache"]:
+    """Start the client-side cache once per pool when REDIS_CLIENT_CACHE is on"""
+    global _cache
+    if not settings.redis_client_cache:
+        return None
+    client = get_redis()
+    if _cache is None:
+        prefixes = [p.strip() for p in settings.redis_client_cache_prefixes.split(",") if p.strip()]
+        _cache = ClientSideCache(client, prefixes, settings.redis_client_cache_max_bytes)
+    if not _cache.active:
+        await _cache.start()
+    return _cache if _cache.active else None
+
+
+class ClientSideCache:
+    """In-process copy of hot keys, invalidated by the server (CLIENT TRACKING, BCAST mode)"""
+
+    RETRY_SECONDS = 30.0
+
+    def __init__(self, client: redis.Redis, prefixes: Sequence[str], max_bytes: int):
+        self.client = client
+        self.prefixes = tuple(prefixes)
+        self.max_bytes = max_bytes
+        self._values: "OrderedDict[str, bytes]" = OrderedDict()
+        self._bytes = 0
+        self._fetching: Dict[str, int] = {}
+        self._stale: set = set()  # Invalidated while a read of them was in flight
+        self._listener = None
+        self._tracker = None
+        self._task: Optional[asyncio.Task] = None
+        self._retry_at = 0.0
+        self.hits = 0
+        self.misses = 0
+        self.invalidations = 0
+
+    @property
+    def active(self) -> bool:
+        return self._task is not None and not self._task.done()
+
+    def cacheable(self, key: str) -> bool:
+        return key.startswith(self.prefixes)
+
+    async def _connection(self):
+        pool = self.client.connection_pool
+        # No health-check PINGs: the listener is in subscribe mode
+        connection = pool.connection_class(**dict(pool.connection_kwargs, health_check_interval=0))
+        await connection.connect()
+        return connection
+
+    async def start(self):
+        loop = asyncio.get_running_loop()
+        if loop.time() < self._retry_at:
+            return
+        try:
+            self._listener = await self._connection()
+            await self._listener.send_command("CLIENT", "ID")
+            listener_id = await self._listener.read_response()
+            await self._listener.send_command("SUBSCRIBE", INVALIDATE_CHANNEL)
+            await self._listener.read_response()
+
+            self._tracker = await self._connection()
+            args = ["CLIENT", "TRACKING", "ON", "REDIRECT", listener_id, "BCAST"]
+            for prefix in self.prefixes:
+                args += ["PREFIX", prefix]
+            await self._tracker.send_command(*args)
+            await self._tracker.read_response()
+        except Exception as e:
+            self._retry_at = loop.time() + self.RETRY_SECONDS
+            await self._disconnect()
+            logger.warning(f"Redis client-side cache unavailable, reading through: {e}")
+            return
+        self._task = asyncio.create_task(self._listen(), name="redis-client-cache")
+        logger.info(f"Redis client-side cache on for {', '.join(self.prefixes)} "
+                    f"(up to {self.max_bytes // (1024 * 1024)} MB)")
+
+    async def _listen(self):
+        """Apply invalidation messages until the connection drops"""
+        interval = settings.redis_health_check_interval or 30
+        try:
+            while True:
+                message = await self._listener.read_response(timeout=interval)
+                if message is None:
+                    # Quiet for a while: make sure both connections are still there
+                    await self._tracker.send_command("PING")
+                    await self._tracker.read_response()
+                    await self._listener.send_command("PING")
+                    continue
+                kind = message[0].decode() if isinstance(message[0], bytes) else message[0]
+                if kind == "message":
+                    keys = message[2]
+                    # None means the server flushed its tracking table (FLUSHALL, ...)
+                    self.invalidate(None if keys is None else
+                                    [k.decode("utf-8") if isinstance(k, bytes) else k for k in keys])
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            logger.warning(f"Redis client-side cache lost its invalidation connection, dropped: {e}")
+        finally:
+            self.invalidate(None)
+            await self._disconnect()
+
+    def invalidate(self, keys: Optional[Iterable[str]]):
+        """Evict keys (all of them for None)"""
+        if keys is None:
+            self._values.clear()
+            self._bytes = 0
+            self._stale.update(self._fetching)
+            return
+        for key in keys:
+            value = self._values.pop(key, None)
+            if value is not None:
+                self._bytes -= len(value)
+                self.invalidations += 1
+            if key in self._fetching:
+                self._stale.add(key)
+
+    def _store(self, key: str, value: bytes):
+        if len(value) > self.max_bytes // 4:
+            return  # One huge value would push everything else out
+        old = self._values.pop(key, None)
+        if old is not None:
+            self._bytes -= len(old)
+        self._values[key] = value
+        self._bytes += len(value)
+        while self._bytes > self.max_bytes:
+            _, evicted = self._values.popitem(last=False)
+            self._bytes -= len(evicted)
+
+    async def mget(self, keys: Sequence[str],
+                   fetch: Callable[[List[str]], Awaitable[List[Optional[bytes]]]]) -> List[Optional[bytes]]:
+        """Values for keys: cached ones from memory, the rest with one fetch()"""
+        found: Dict[str, Optional[bytes]] = {}
+        missing = []
+        for key in keys:
+            if key in self._values:
+                self._values.move_to_end(key)
+                found[key] = self._values[key]
+                self.hits += 1
+            elif key not in found:
+                missing.append(key)
+                found[key] = None
+        if missing:
+            self.misses += len(missing)
+            for key in missing:
+                self._fetching[key] = self._fetching.get(key, 0) + 1
+            try:
+                values = await fetch(missing)
+            finally:
+                for key in missing:
+                    self._fetching[key] -= 1
+            for key, value in zip(missing, values):
+                found[key] = value
+                if value is not None and key not in self._stale and self.active:
+                    self._store(key, value)
+            for key in missing:
+                if not self._fetching[key]:
+                    del self._fetching[key]
+                    self._stale.discard(key)
+        return [found[key] for key in keys]
+
+    async def _disconnect(self):
+        for connection in (self._tracker, self._listener):
+            if connection is not None:
+                try:
+                    await connection.disconnect()
+                except Exception:
+                    pass
+        self._tracker = self._listener = None
+
+    async def close(self):
+        if self._task is not None:
+            self._task.cancel()
+            await asyncio.gather(self._task, return_exceptions=True)
+            self._task = None
+        await self._disconnect()
+        if self.hits or self.misses:
+            logger.info(f"Redis client-side cache: {self.hits} hit(s), {self.misses} miss(es), "
+                        f"{self.invalidations} invalidation(s)")
@@ -0,0 +1,386 @@
+"""
+Human Review Queue
+
+Review points in the stations (approve a draft, lock a script, accept
+flagged issues) used to call input() inside coroutines, which froze every
+in-flight LLM call and background task until the reviewer answered. They now
+go through request_review(), which never blocks the event loop:
+
+    choice = await request_review(
+        self.session_id, "21", f"Episode {episode_number}", "FIRST DRAFT REVIEW",
+        summary=[f"{total_words} words"],
+        options={"": "Approve and save (recommended)", "R": "Regenerate entire draft"},
+        views={"V": ("View complete script", lambda: self.display_full_script(draft_data))}
+    )
+
+REVIEW_MODE selects where the request goes:
+- console (default): prompted on this terminal from a worker thread; prompts
+  from concurrent episodes are asked one at a time
+- redis: published to Redis (review:pending) for a reviewer anywhere
+- file: written to output/reviews/pending/ as JSON; a decision is a JSON
+  file in output/reviews/decisions/ (or use the CLI below)
+
+With redis or file, stations keep drafting other episodes and the runner
+keeps other stations going while reviews wait. Reviewers answer with:
+
+    python -m app.review_queue                  # walk through pending reviews
+    python -m app.review_queue list
+    python -m app.review_queue answer <review_id> R
+
+`views` are extra choices that show more detail (the full script, a change
+report) without deciding; queued requests carry their text. Any choice that
+is not one of the options counts as the default (the first option),
+matching the old prompts, and REVIEW_TIMEOUT_SECONDS (0 = wait forever)
+applies the default when nobody answers in time.
+"""
+
+import argparse
+import asyncio
+import contextlib
+import io
+import json
+import logging
+import sys
+import time
+import uuid
+from dataclasses import asdict, dataclass, field
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+import redis.asyncio as redis
+
+from app.config import settings
+from app.redis_pool import get_redis
+
+logger = logging.getLogger(__name__)
+
+REVIEW_MODES = ("console", "redis", "file")
+PENDING_KEY = "review:pending"
+REQUEST_KEY = "review:request:{review_id}"
+DECISION_KEY = "review:decision:{review_id}"
+REVIEW_TTL_SECONDS = 7 * 86400
+
+
+@dataclass
+class ReviewRequest:
+    """A decision a station is waiting for"""
+    session_id: str
+    station: str
+    subject: str
+    title: str
+    summary: List[str]
+    options: Dict[str, str]
+    views: Dict[str, Dict[str, str]] = field(default_factory=dict)  # key -> {"label", "text"}
+    review_id: str = field(default_factory=lambda: uuid.uuid4().hex[:12])
+    created_at: str = field(default_factory=lambda: datetime.now().isoformat())
+
+    @property
+    def default(self) -> str:
+        return next(iter(self.options))
+
+    def resolve(self, choice: Optional[str]) -> str:
+        """Map a reviewer's answer onto an option key"""
+        choice = (choice or "").strip().upper()
+        return choice if choice in self.options else self.default
+
+    def print_request(self):
+        print("=" * 70)
+        print(f"⭐ {self.title}")
+        print("=" * 70)
+        print()
+        for line in self.summary:
+            print(line)
+        if self.summary:
+            print()
+        print("OPTIONS:")
+        for key, label in list(self.options.items()) + [(k, v["label"]) for k, v in self.views.items()]:
+            print(f"  {('[' + (key or 'Enter') + ']'):<8} - {label}")
+        print()
+
+
+class RedisReviewQueue:
+    """Reviews published to Redis; decisions pushed onto a per-review list"""
+
+    def _client(self) -> redis.Redis:
+        return get_redis()  # Shared pool, one per event loop
+
+    async def publish(self, request: ReviewRequest):
+        client = self._client()
+        async with client.pipeline(transaction=True) as pipe:
+            pipe.set(REQUEST_KEY.format(review_id=request.review_id), json.dumps(asdict(request)),
+                     ex=REVIEW_TTL_SECONDS)
+            pipe.zadd(PENDING_KEY, {request.review_id: time.time()})
+            await pipe.execute()
+
+    async def wait(self, review_id: str, timeout: float) -> Optional[str]:
+        """The reviewer's choice, or None on timeout"""
+        client = self._client()
+        deadline = time.monotonic() + timeout if timeout > 0 else None
+        try:
+            while deadline is None or time.monotonic() < deadline:
+                reply = await client.blpop([DECISION_KEY.format(review_id=review_id)], timeout=5)
+                if reply:
+                    value = reply[1].decode("utf-8") if isinstance(reply[1], bytes) else reply[1]
+                    return json.loads(value).get("choice", "")
+            return None
+        finally:
+            await client.zrem(PENDING_KEY, review_id)
+            await client.delete(REQUEST_KEY.format(review_id=review_id))
+
+    async def pending(self) -> List[ReviewRequest]:
+        client = self._client()
+        requests = []
+        for review_id in await client.zrange(PENDING_KEY, 0, -1):
+            review_id = review_id.decode("utf-8") if isinstance(review_id, bytes) else review_id
+            raw = await client.get(REQUEST_KEY.format(review_id=review_id))
+            if raw is None:
+                await client.zrem(PENDING_KEY, review_id)
+                continue
+            requests.append(ReviewRequest(**json.loads(raw)))
+        return requests
+
+    async def decide(self, review_id: str, choice: str, reviewer: str = ""):
+        key = DECISION_KEY.format(review_id=review_id)
+        client = self._client()
+        async with client.pipeline(transaction=True) as pipe:
+            pipe.rpush(key, json.dumps({"choice": choice, "reviewer": reviewer,
+                                        "decided_at": datetime.now().isoformat()}))
+            pipe.expire(key, REVIEW_TTL_SECONDS)
+            await pipe.execute()
+
+
+class FileReviewInbox:
+    """Reviews as JSON files; a decision is a file with the same name in decisions/"""
+
+    def __init__(self, root: Optional[Path] = None):
+        self.root = Path(root or Path(settings.output_dir) / "reviews")
+        for folder in ("pending", "decisions", "done"):
+            (self.root / folder).mkdir(parents=True, exist_ok=True)
+
+    def _path(self, folder: str, review_id: str) -> Path:
+        return self.root / folder / f"{review_id}.json"
+
+    @staticmethod
+    def _write(path: Path, data: Dict[str, Any]):
+        tmp_path = path.with_suffix(".json.tmp")
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(data, f, indent=2, ensure_ascii=False)
+        tmp_path.replace(path)
+
+    async def publish(self, request: ReviewRequest):
+        await asyncio.to_thread(self._write, self._path("pending", request.review_id), asdict(request))
+
+    async def wait(self, review_id: str, timeout: float) -> Optional[str]:
+        decision_path = self._path("decisions", review_id)
+        deadline = time.monotonic() + timeout if timeout > 0 else None
+        decision = None
+        while deadline is None or time.monotonic() < deadline:
+            if decision_path.exists():
+                try:
+                    with open(decision_path, "r", encoding="utf-8") as f:
+                        decision = json.load(f)
+                    break
+                except (OSError, json.JSONDecodeError):
+                    pass  # Still being written
+            await asyncio.sleep(settings.review_poll_seconds)
+
+        pending_path = self._path("pending", review_id)
+        if pending_path.exists():
+            with open(pending_path, "r", encoding="utf-8") as f:
+                record = json.load(f)
+            record["decision"] = decision
+            self._write(self._path("done", review_id), record)
+            pending_path.unlink()
+        decision_path.unlink(missing_ok=True)
+        return None if decision is None else decision.get("choice", "")
+
+    async def pending(self) -> List[ReviewRequest]:
+        requests = []
+        for path in sorted(self.root.joinpath("pending").glob("*.json"), key=lambda p: p.stat().st_mtime):
+            with open(path, "r", encoding="utf-8") as f:
+                requests.append(ReviewRequest(**json.load(f)))
+        return requests
+
+    async def decide(self, review_id: str, choice: str, reviewer: str = ""):
+        self._write(self._path("decisions", review_id), {
+            "choice": choice, "reviewer": reviewer, "decided_at": datetime.now().isoformat()
+        })
+
+
+# Global queue instance (lazy initialization)
+review_queue = None
+
+
+def get_review_queue():
+    """The configured review queue, or None when reviews are asked on the console"""
+    global review_queue
+    mode = settings.review_mode.lower()
+    if mode not in REVIEW_MODES:
+        raise ValueError(f"REVIEW_MODE must be one of {', '.join(REVIEW_MODES)}, got {settings.review_mode!r}")
+    if mode == "console":
+        return None
+    if review_queue is None:
+        review_queue = RedisReviewQueue() if mode == "redis" else FileReviewInbox()
+    return review_queue
+
+
+def reviews_use_console() -> bool:
+    return settings.review_mode.lower() == "console"
+
+
+# Serializes console prompts per event loop so concurrent episodes don't interleave
+_console_locks: Dict[asyncio.AbstractEventLoop, asyncio.Lock] = {}
+
+
+def _console_lock() -> asyncio.Lock:
+    loop = asyncio.get_running_loop()
+    if loop not in _console_locks:
+        _console_locks.clear()
+        _console_locks[loop] = asyncio.Lock()
+    return _console_locks[loop]
+
+
+async def _ask_console(request: ReviewRequest, views: Dict[str, Tuple[str, Callable[[], None]]]) -> str:
+    async with _console_lock():
+        while True:
+            request.print_request()
+            choice = (await asyncio.to_thread(input, "Your choice: ")).strip().upper()
+            if choice in views:
+                views[choice][1]()
+                await asyncio.to_thread(input, "\nPress Enter to return to review menu...")
+                continue
+            return request.resolve(choice)
+
+
+def _render(show: Callable[[], None]) -> str:
+    """Capture what a display method prints, for reviewers elsewhere"""
+    buffer = io.StringIO()
+    with contextlib.redirect_stdout(buffer):
+        show()
+    return buffer.getvalue()
+
+
+async def request_review(session_id: str, station: str, subject: str, title: str,
+                         summary: List[str], options: Dict[str, str],
+                         views: Optional[Dict[str, Tuple[str, Callable[[], None]]]] = None) -> str:
+    """
+    Ask a reviewer to decide, without blocking the event loop
+
+    Args:
+        session_id: Session under review
+        station: Station id, e.g. "21"
+        subject: What is reviewed, e.g. "Episode 3"
+        title: Heading shown to the reviewer
+        summary: Lines describing the result
+        options: Choice key -> label; the first is the default ("" for Enter)
+        views: Choice key -> (label, method that prints the detail)
+
+    Returns:
+        The chosen option key (upper-case)
+    """
+    views = {key.upper(): view for key, view in (views or {}).items()}
+    request = ReviewRequest(
+        session_id=session_id, station=station, subject=subject, title=title,
+        summary=summary, options={key.upper(): label for key, label in options.items()}
+    )
+
+    queue = get_review_queue()
+    if queue is None:
+        request.views = {key: {"label": label, "text": ""} for key, (label, _) in views.items()}
+        return await _ask_console(request, views)
+
+    request.views = {key: {"label": label, "text": _render(show)} for key, (label, show) in views.items()}
+    await queue.publish(request)
+    request.print_request()
+    print(f"📨 Review {request.review_id} queued ({settings.review_mode}); "
+          f"answer with: python -m app.review_queue answer {request.review_id} <choice>")
+
+    started = time.monotonic()
+    choice = await queue.wait(request.review_id, settings.review_timeout_seconds)
+    if choice is None:
+        logger.warning(f"Review {request.review_id} ({subject}) timed out, using the default")
+        print(f"⏱️  No decision on review {request.review_id}, using the default")
+    resolved = request.resolve(choice)
+    print(f"📬 Review {request.review_id} ({subject}): {resolved or 'Enter'} "
+          f"after {time.monotonic() - started:.0f}s")
+    return resolved
+
+
+def _print_request(request: ReviewRequest, show_views: bool = False):
+    print(f"\n[{request.review_id}] Session {request.session_id} · Station {request.station} · "
+          f"{request.subject} · {request.created_at}")
+    request.print_request()
+    if show_views:
+        for key, view in request.views.items():
+            print(f"--- [{key}] {view['label']} ---")
+            print(view["text"])
+
+
+async def _cli(args: argparse.Namespace):
+    queue = get_review_queue()
+    if queue is None:
+        print("REVIEW_MODE is console: reviews are asked in the station's own terminal")
+        return
+
+    if args.command == "answer":
+        await queue.decide(args.review_id, args.choice.upper(), reviewer=args.reviewer)
+        print(f"✅ Decision sent for review {args.review_id}")
+        return
+
+    requests = [r for r in await queue.pending() if not args.session or r.session_id == args.session]
+    if args.command == "list":
+        if not requests:
+            print("No pending reviews")
+        for request in requests:
+            print(f"{request.review_id}  {request.session_id}  Station {request.station}  "
+                  f"{request.subject}  {request.title}")
+        return
+    if args.command == "show":
+        for request in requests:
+            if request.review_id == args.review_id:
+                _print_request(request, show_views=True)
+                return
+        print(f"❌ No pending review {args.review_id}")
+        return
+
+    # Walk through the pending reviews one by one
+    if not requests:
+        print("No pending reviews")
+    for request in requests:
+        _print_request(request)
+        while True:
+            choice = input("Your choice (or 'skip'): ").strip().upper()
+            if choice in request.views:
+                print(request.views[choice]["text"])
+                continue
+            break
+        if choice == "SKIP":
+            continue
+        await queue.decide(request.review_id, choice, reviewer=args.reviewer)
+        print(f"✅ Decision sent: {request.resolve(choice) or 'Enter'}")
+
+
+def main():
+    """Answer queued reviews from the command line"""
+    parser = argparse.ArgumentParser(description="Answer pipeline reviews queued in Redis or the file inbox")
+    parser.add_argument("--session", help="Only reviews for this session")
+    parser.add_argument("--reviewer", default="", help="Name recorded with the decision")
+    commands = parser.add_subparsers(dest="command")
+    commands.add_parser("list", help="List pending reviews")
+    show = commands.add_parser("show", help="Show a review with its full detail")
+    show.add_argument("review_id")
+    answer = commands.add_parser("answer", help="Send a decision")
+    answer.add_argument("review_id")
+    answer.add_argument("choice", nargs="?", default="", help="Option key (empty = the default)")
+    args = parser.parse_args()
+
+    try:
+        asyncio.run(_cli(args))
+    except KeyboardInterrupt:
+        print("\n👋 Bye")
+        sys.exit(130)
+
+
+if __name__ == "__main__":
+    main()
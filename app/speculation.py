@@ -0,0 +1,106 @@
+"""
+Speculative Work During Human Reviews
+
+A reviewer takes minutes per decision while the LLM sits idle. Stations use
+that time to start, in the background, the work that will most likely be
+needed once the reviewer answers: Station 21 drafts the next episode and runs
+Station 22's analyses of the draft under review.
+
+Speculation rides on the LLM cache and single-flight (see
+app/openrouter_agent.py): a speculative call stores its response in the
+cache, and a real call with the same request either reads it from there or
+joins the call still in flight. Results a station keeps for itself (such as
+the next draft) are taken with `SpeculativeTasks.result()`.
+
+When the reviewer asks for a regeneration, the speculation built on the
+rejected output is discarded. Tasks still running are cancelled, and a real
+caller already waiting on the same request takes it over. A finished
+response stays cached but is only reused for the exact same prompt, so it
+never leaks into the regenerated output.
+
+It is off by default; SPECULATIVE_EXECUTION=true turns it on. The Station 22
+analyses are only prefetched while the LLM cache is enabled, since that is
+where Station 22 picks them up.
+"""
+
+import asyncio
+import logging
+from typing import Any, Awaitable, Callable, Dict, Optional
+
+from app.config import settings
+
+logger = logging.getLogger(__name__)
+
+
+class SpeculativeTasks:
+    """Named background tasks whose results may or may not be used"""
+
+    def __init__(self, label: str):
+        self.label = label
+        self._tasks: Dict[str, asyncio.Task] = {}
+        self.started = 0
+        self.used = 0
+        self.discarded = 0
+
+    @property
+    def enabled(self) -> bool:
+        return settings.speculative_execution
+
+    def start(self, name: str, factory: Callable[[], Awaitable[Any]]) -> Optional[asyncio.Task]:
+        """Start factory() in the background unless it is already running"""
+        if not self.enabled:
+            return None
+        task = self._tasks.get(name)
+        if task is not None and not task.cancelled():
+            return task
+        task = asyncio.create_task(factory(), name=f"speculative:{self.label}:{name}")
+        task.add_done_callback(lambda t, name=name: self._log_outcome(name, t))
+        self._tasks[name] = task
+        self.started += 1
+        logger.info(f"{self.label}: speculating on {name}")
+        return task
+
+    def _log_outcome(self, name: str, task: asyncio.Task):
+        if task.cancelled():
+            return
+        error = task.exception()  # Also marks it retrieved when nobody awaits it
+        if error is not None:
+            logger.info(f"{self.label}: speculative {name} failed, it will run normally: {error}")
+
+    async def result(self, name: str) -> Optional[Any]:
+        """Wait for a speculative result and take it; None if there is none or it failed"""
+        task = self._tasks.pop(name, None)
+        if task is None:
+            return None
+        try:
+            value = await asyncio.shield(task)
+        except asyncio.CancelledError:
+            if task.cancelled():
+                return None
+            raise
+        except Exception:
+            return None
+        self.used += 1
+        return value
+
+    def discard(self, *names: str):
+        """Drop speculative work (e.g. after the reviewer rejected its input)"""
+        for name in names:
+            task = self._tasks.pop(name, None)
+            if task is None:
+                continue
+            if not task.done():
+                task.cancel()
+            self.discarded += 1
+            logger.info(f"{self.label}: discarded speculative {name}")
+
+    async def close(self):
+        """Cancel whatever is still running (the station is done)"""
+        running = {name: task for name, task in self._tasks.items() if not task.done()}
+        self.discard(*running)
+        self._tasks.clear()
+        if running:
+            await asyncio.gather(*running.values(), return_exceptions=True)
+        if self.started:
+            logger.info(f"{self.label}: {self.started} speculative task(s), "
+                        f"{self.used} result(s) taken, {self.discarded} discarded")
@@ -0,0 +1,346 @@
+"""
+Session State Store (one key schema for station outputs)
+
+Every station output lives under one canonical Redis key:
+
+    audiobook:{session_id}:station_{NN}                  whole-station output
+    audiobook:{session_id}:station_{NN}:episode_{EE}     per-episode output
+
+NN is the zero-padded station number ("01" ... "32", "045" for Station 4.5)
+and EE the zero-padded episode number. Values are written through
+app/codec.py (compressed JSON or msgpack with a self-describing header);
+plain JSON values load as well.
+
+Episode outputs are indexed as they are written, so nothing has to scan the
+keyspace (KEYS) to find them:
+
+    audiobook:{session_id}:station_{NN}:episodes   sorted set of episode numbers
+    audiobook:{session_id}:episode_stations        sorted set of stations with episodes
+
+Sessions written before the indexes existed are indexed on first use with a
+one-off SCAN (or up front with `python -m app.state_store reindex`). The SCAN
+sets `audiobook:{session_id}:episodes_indexed`, so it runs at most once per
+session even when the session has no episodes at all.
+
+Older stations wrote under other spellings, which this module still reads:
+
+    session:{session_id}:station:{NN}:{category}   (e.g. :output, :bible)
+    station_{N}:{session_id}
+    audiobook:{session_id}:station_{N}             (unpadded, e.g. station_7)
+
+`StateStore.load_stations()` fetches a station's whole dependency set with a
+single MGET. The canonical keys and every legacy spelling go in one request,
+and a canonical value wins over a legacy one. Existing sessions can be moved
+to the canonical keys with:
+
+    python -m app.state_store migrate                      # every session
+    python -m app.state_store migrate --session-id ID --dry-run
+    python -m app.state_store migrate --delete-legacy      # drop old keys once copied
+    python -m app.state_store reindex --session-id ID
+"""
+
+import argparse
+import asyncio
+import logging
+import re
+from typing import Any, Dict, Iterable, List, Mapping, Optional, Tuple, Union
+
+from app import codec
+from app.redis_client import RedisClient
+
+logger = logging.getLogger(__name__)
+
+StationRef = Union[int, float, str]
+
+# Category suffixes of the old session:{sid}:station:{NN}:{category} keys
+LEGACY_CATEGORIES = (
+    "output", "bible", "style_guide", "character_bible", "world_bible",
+    "detailed_episode_outlines", "geography_transit_results",
+)
+
+_LEGACY_KEY_PATTERNS = [
+    re.compile(r"^session:(?P<session>[^:]+):station:(?P<station>\d+):(?P<category>[a-z_]+)$"),
+    re.compile(r"^station_(?P<station>\d+):(?P<session>[^:]+)$"),
+    re.compile(r"^audiobook:(?P<session>[^:]+):station_(?P<station>\d|45)$"),
+]
+
+
+def station_code(station: StationRef) -> str:
+    """Canonical spelling of a station number (1 -> '01', '4.5' / 45 -> '045')"""
+    text = str(station).strip()
+    if text in ("4.5", "45", "045"):
+        return "045"
+    return f"{int(text):02d}"
+
+
+def station_key(session_id: str, station: StationRef, episode: Optional[int] = None) -> str:
+    """Canonical Redis key of a station's output (or one episode of it)"""
+    key = f"audiobook:{session_id}:station_{station_code(station)}"
+    if episode is not None:
+        key += f":episode_{int(episode):02d}"
+    return key
+
+
+def episode_index_key(session_id: str, station: StationRef) -> str:
+    """Sorted set of the episode numbers a station has stored"""
+    return f"{station_key(session_id, station)}:episodes"
+
+
+def episode_stations_key(session_id: str) -> str:
+    """Sorted set of the stations that have stored episodes"""
+    return f"audiobook:{session_id}:episode_stations"
+
+
+def episodes_indexed_key(session_id: str) -> str:
+    """Marker set once a session's episode indexes have been rebuilt by SCAN"""
+    return f"audiobook:{session_id}:episodes_indexed"
+
+
+def _station_score(code: str) -> float:
+    return 4.5 if code == "045" else float(int(code))
+
+
+def legacy_station_keys(session_id: str, station: StationRef) -> List[str]:
+    """Older spellings of a station's output key, in lookup order"""
+    code = station_code(station)
+    short = "45" if code == "045" else str(int(code))
+    keys = [f"session:{session_id}:station:{code}:{category}" for category in LEGACY_CATEGORIES]
+    keys.append(f"station_{short}:{session_id}")
+    if short != code:
+        keys += [f"station_{code}:{session_id}", f"audiobook:{session_id}:station_{short}"]
+    return keys
+
+
+def parse_legacy_key(key: str) -> Optional[Tuple[str, str]]:
+    """(session_id, station code) of a legacy output key, or None"""
+    for pattern in _LEGACY_KEY_PATTERNS:
+        match = pattern.match(key)
+        if match:
+            if match.groupdict().get("category", "output") not in LEGACY_CATEGORIES:
+                return None
+            return match.group("session"), station_code(match.group("station"))
+    return None
+
+
+def _decode(raw: Optional[bytes], key: str) -> Optional[Any]:
+    if raw is None:
+        return None
+    try:
+        return codec.decode(raw)
+    except (ValueError, codec.CodecError) as e:
+        logger.warning(f"Ignoring unreadable value at {key}: {e}")
+        return None
+
+
+class StateStore:
+    """Reads and writes station outputs under the canonical key schema"""
+
+    def __init__(self, redis_client: RedisClient):
+        self.redis_client = redis_client
+
+    async def load_stations(self, session_id: str,
+                            stations: Union[Iterable[StationRef], Mapping[Any, StationRef]]) -> Dict[Any, Any]:
+        """Load several stations' outputs in one round trip
+
+        `stations` is a list of station numbers, or a mapping of the names the
+        caller wants back to station numbers. Stations with no stored output
+        are left out of the result.
+        """
+        names = dict(stations) if isinstance(stations, Mapping) else {s: s for s in stations}
+        candidates = {
+            name: [station_key(session_id, station)] + legacy_station_keys(session_id, station)
+            for name, station in names.items()
+        }
+        keys = [key for keys in candidates.values() for key in keys]
+        values = dict(zip(keys, await self.redis_client.mget_raw(keys)))
+
+        loaded = {}
+        for name, keys in candidates.items():
+            for key in keys:
+                data = _decode(values[key], key)
+                if data is not None:
+                    if key != keys[0]:
+                        logger.info(f"Station {station_code(names[name])} read from legacy key {key} "
+                                    "(run `python -m app.state_store migrate`)")
+                    loaded[name] = data
+                    break
+        return loaded
+
+    async def load_station(self, session_id: str, station: StationRef) -> Optional[Any]:
+        """Load one station's output (None if it has none)"""
+        return (await self.load_stations(session_id, [station])).get(station)
+
+    async def load_episodes(self, session_id: str, station: StationRef,
+                            episodes: Iterable[int]) -> Dict[int, Any]:
+        """Load a station's per-episode outputs in one round trip"""
+        episodes = list(episodes)
+        keys = [station_key(session_id, station, episode) for episode in episodes]
+        values = await self.redis_client.mget_raw(keys)
+        loaded = {}
+        for episode, key, raw in zip(episodes, keys, values):
+            data = _decode(raw, key)
+            if data is not None:
+                loaded[episode] = data
+        return loaded
+
+    async def episode_numbers(self, session_id: str, station: StationRef) -> List[int]:
+        """Episode numbers a station has stored, in order"""
+        members = await self.redis_client.zrange(episode_index_key(session_id, station))
+        if not members:
+            # Written before the index existed (or nothing yet)
+            members = (await self._index_once(session_id)).get(station_code(station), [])
+        return sorted(int(m) for m in members)
+
+    async def episode_stations(self, session_id: str) -> List[str]:
+        """Codes of the stations with stored episodes, in station order"""
+        codes = await self.redis_client.zrange(episode_stations_key(session_id))
+        if not codes:
+            codes = sorted((await self._index_once(session_id)), key=_station_score)
+        return codes
+
+    async def _index_once(self, session_id: str) -> Dict[str, List[int]]:
+        """Rebuild a session's episode indexes unless that has been done already"""
+        if await self.redis_client.exists(episodes_indexed_key(session_id)):
+            return {}
+        return await self.reindex(session_id)
+
+    async def load_all_episodes(self, session_id: str, station: StationRef) -> Dict[int, Any]:
+        """Every stored episode of a station: index lookup plus one MGET"""
+        return await self.load_episodes(session_id, station, await self.episode_numbers(session_id, station))
+
+    async def reindex(self, session_id: str, station: Optional[StationRef] = None) -> Dict[str, List[int]]:
+        """Rebuild the episode indexes from the keys themselves (SCAN, not KEYS)"""
+        code = station_code(station) if station is not None else "*"
+        found: Dict[str, List[int]] = {}
+        for key in await self.redis_client.scan_keys(f"audiobook:{session_id}:station_{code}:episode_*"):
+            match = re.match(r"^audiobook:[^:]+:station_(\d+):episode_(\d+)$", key)
+            if match:
+                found.setdefault(match.group(1), []).append(int(match.group(2)))
+        for found_code, episodes in found.items():
+            await self.redis_client.zadd(episode_index_key(session_id, found_code),
+                                         {str(e): e for e in episodes})
+            await self.redis_client.zadd(episode_stations_key(session_id),
+                                         {found_code: _station_score(found_code)})
+        if station is None:
+            await self.redis_client.set(episodes_indexed_key(session_id), "1")
+        if found:
+            logger.info(f"Indexed episodes for {session_id}: "
+                        + ", ".join(f"station {c} ({len(e)})" for c, e in sorted(found.items())))
+        return found
+
+    async def save_station(self, session_id: str, station: StationRef, data: Any,
+                           episode: Optional[int] = None, expire: Optional[int] = None) -> str:
+        """Store a station's output (or one episode of it); returns the key
+
+        Episodes are added to the session's episode indexes in the same
+        transaction.
+        """
+        key = station_key(session_id, station, episode)
+        value = codec.encode(data)
+        redis = self.redis_client.redis
+        if episode is None or redis is None:
+            await self.redis_client.set(key, value, expire=expire)
+            return key
+
+        code = station_code(station)
+        index_key = episode_index_key(session_id, code)
+        stations_key = episode_stations_key(session_id)
+        async with redis.pipeline(transaction=True) as pipe:
+            pipe.set(key, value, ex=expire)
+            pipe.zadd(index_key, {str(int(episode)): int(episode)})
+            pipe.zadd(stations_key, {code: _station_score(code)})
+            if expire:
+                # The index lives as long as its newest episode
+                pipe.expire(index_key, expire)
+                pipe.expire(stations_key, expire)
+            await pipe.execute()
+        self.redis_client.forget(key)
+        return key
+
+
+async def migrate(session_id: Optional[str] = None, dry_run: bool = False,
+                  delete_legacy: bool = False) -> Dict[str, int]:
+    """Copy legacy output keys to their canonical keys (TTL preserved)
+
+    An existing canonical key is never overwritten. With delete_legacy, a
+    legacy key is removed once its canonical key holds a value.
+    """
+    client = RedisClient()
+    await client.connect()
+    counts = {"legacy": 0, "copied": 0, "kept": 0, "deleted": 0}
+    try:
+        session = session_id or "*"
+        patterns = [f"session:{session}:station:*", f"station_*:{session}",
+                    f"audiobook:{session}:station_?", f"audiobook:{session}:station_45"]
+        legacy: Dict[str, List[str]] = {}
+        for pattern in patterns:
+            for key in await client.scan_keys(pattern):
+                parsed = parse_legacy_key(key)
+                if parsed:
+                    legacy.setdefault(station_key(*parsed), []).append(key)
+
+        canonical_keys = sorted(legacy)
+        existing = await client.mget(canonical_keys)
+        for canonical, current in zip(canonical_keys, existing):
+            old_keys = sorted(legacy[canonical])
+            counts["legacy"] += len(old_keys)
+            if current is not None:
+                counts["kept"] += 1
+                print(f"  = {canonical} already set ({len(old_keys)} legacy key(s))")
+            else:
+                source = next(key for key in legacy_station_keys(*_session_and_station(canonical))
+                              if key in old_keys)
+                print(f"  + {source} -> {canonical}")
+                if not dry_run:
+                    value = await client.get(source)
+                    ttl = await client.ttl(source)
+                    await client.set(canonical, value, expire=ttl if ttl > 0 else None)
+                counts["copied"] += 1
+            if delete_legacy and not dry_run:
+                for key in old_keys:
+                    await client.delete(key)
+                counts["deleted"] += len(old_keys)
+    finally:
+        await client.disconnect()
+    return counts
+
+
+def _session_and_station(canonical: str) -> Tuple[str, str]:
+    _, session, station = canonical.split(":", 2)
+    return session, station[len("station_"):]
+
+
+async def main():
+    """Command line entry point"""
+    parser = argparse.ArgumentParser(description="Session state store tools")
+    sub = parser.add_subparsers(dest="command", required=True)
+    migrate_parser = sub.add_parser("migrate", help="Move legacy station keys to the canonical schema")
+    migrate_parser.add_argument("--session-id", help="Only this session (default: all)")
+    migrate_parser.add_argument("--dry-run", action="store_true", help="Show what would be copied")
+    migrate_parser.add_argument("--delete-legacy", action="store_true",
+                                help="Delete legacy keys once the canonical key is set")
+    reindex_parser = sub.add_parser("reindex", help="Rebuild the episode indexes of a session")
+    reindex_parser.add_argument("--session-id", required=True)
+    args = parser.parse_args()
+
+    if args.command == "reindex":
+        client = RedisClient()
+        await client.connect()
+        try:
+            found = await StateStore(client).reindex(args.session_id)
+        finally:
+            await client.disconnect()
+        print(f"✅ Indexed {sum(len(e) for e in found.values())} episode(s) "
+              f"across {len(found)} station(s) for {args.session_id}")
+        return
+
+    print("🔁 Migrating station outputs to audiobook:{session_id}:station_NN"
+          + (" (dry run)" if args.dry_run else ""))
+    counts = await migrate(args.session_id, dry_run=args.dry_run, delete_legacy=args.delete_legacy)
+    print(f"✅ {counts['legacy']} legacy key(s): {counts['copied']} copied, "
+          f"{counts['kept']} canonical already present, {counts['deleted']} deleted")
+
+
+if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO)
+    asyncio.run(main())
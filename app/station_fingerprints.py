@@ -0,0 +1,157 @@
+"""
+Station Fingerprints (incremental recomputation)
+
+A station's fingerprint hashes everything its output depends on:
+- its YAML config (prompts, model, limits) in app/agents/configs/
+- the current outputs of the stations it depends on, as a digest of the
+  values under each upstream station's Redis keys
+
+After a station completes, the pipeline runner records its fingerprint and a
+digest of its own outputs in output/{session_id}/fingerprints_{session_id}.json.
+On later runs a station whose fingerprint is unchanged, and whose outputs are
+still the recorded ones, is skipped. When a station's fingerprint changes,
+exactly its downstream stations are marked invalidated, so editing one
+prompt in station_24.yml reruns 24 and the stations that read its output,
+and nothing else.
+"""
+
+import hashlib
+import json
+import logging
+import threading
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional, Set
+
+from app.config import settings
+from app.redis_client import RedisClient
+
+logger = logging.getLogger(__name__)
+
+CONFIG_DIR = Path(__file__).parent / "agents" / "configs"
+
+
+def _station_codes(station_id: str) -> Set[str]:
+    """Spellings of a station number used in Redis keys ('9' -> '9', '09'; '4.5' -> '45', '045')"""
+    if station_id == "4.5":
+        return {"45", "045"}
+    return {station_id, f"{int(station_id):02d}"}
+
+
+def station_key_patterns(session_id: str, station_id: str) -> List[str]:
+    """Redis key patterns a station writes its outputs under"""
+    patterns = []
+    for code in sorted(_station_codes(station_id)):
+        patterns += [
+            f"audiobook:{session_id}:station_{code}",
+            f"audiobook:{session_id}:station_{code}:*",
+            f"session:{session_id}:station:{code}:*",
+            f"station_{code}:{session_id}",
+        ]
+    return patterns
+
+
+def config_digest(station_id: str) -> str:
+    """Hash of the station's YAML config file"""
+    path = CONFIG_DIR / f"station_{station_id.replace('.', '')}.yml"
+    return hashlib.sha256(path.read_bytes()).hexdigest()
+
+
+async def output_digest(redis: RedisClient, session_id: str, station_id: str) -> Optional[str]:
+    """Hash of every value a station has stored for the session, or None if it has none"""
+    keys: Set[str] = set()
+    for pattern in station_key_patterns(session_id, station_id):
+        if "*" in pattern:
+            keys.update(await redis.scan_keys(pattern))
+        elif await redis.exists(pattern):
+            keys.add(pattern)
+    if not keys:
+        return None
+
+    digest = hashlib.sha256()
+    for key in sorted(keys):
+        key_type = await redis.type(key)
+        if key_type == "hash":
+            value = json.dumps(await redis.hgetall(key), sort_keys=True)
+        elif key_type == "zset":
+            # Episode index (see app/state_store.py)
+            value = json.dumps(await redis.zrange(key))
+        else:
+            value = await redis.get(key) or ""
+        digest.update(key.encode("utf-8") + b"\0" + value.encode("utf-8") + b"\0")
+    return digest.hexdigest()
+
+
+def compute_fingerprint(config_hash: str, inputs: Dict[str, Optional[str]]) -> str:
+    """Combine a station's config hash with its upstream output digests"""
+    payload = json.dumps({"config": config_hash, "inputs": inputs}, sort_keys=True)
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+def downstream_of(graph: Dict[str, List[str]], station_ids: Iterable[str]) -> Set[str]:
+    """Every station that depends, directly or transitively, on the given stations"""
+    dependents: Dict[str, Set[str]] = {}
+    for sid, deps in graph.items():
+        for dep in deps:
+            dependents.setdefault(dep, set()).add(sid)
+    found: Set[str] = set()
+    frontier = list(station_ids)
+    while frontier:
+        for sid in dependents.get(frontier.pop(), ()):
+            if sid not in found:
+                found.add(sid)
+                frontier.append(sid)
+    return found
+
+
+class FingerprintManifest:
+    """Recorded fingerprints for one session"""
+
+    def __init__(self, session_id: str, output_dir: Optional[str] = None):
+        self.session_id = session_id
+        self.path = Path(output_dir or settings.output_dir) / session_id / f"fingerprints_{session_id}.json"
+        self._lock = threading.Lock()
+        self.stations: Dict[str, Dict[str, Any]] = {}
+        if self.path.exists():
+            try:
+                with open(self.path, "r", encoding="utf-8") as f:
+                    self.stations = json.load(f).get("stations", {})
+            except (OSError, json.JSONDecodeError) as e:
+                logger.warning(f"Could not load fingerprints for {session_id}: {e}")
+
+    def get(self, station_id: str) -> Optional[Dict[str, Any]]:
+        return self.stations.get(station_id)
+
+    def record(self, station_id: str, fingerprint: str, config_hash: str,
+               inputs: Dict[str, Optional[str]], outputs: Optional[str]):
+        """Record a successful run"""
+        with self._lock:
+            self.stations[station_id] = {
+                "fingerprint": fingerprint,
+                "config_digest": config_hash,
+                "inputs": inputs,
+                "output_digest": outputs,
+                "recorded_at": datetime.now().isoformat(),
+            }
+        self.save()
+
+    def invalidate(self, station_ids: Iterable[str], changed: str):
+        """Mark recorded stations stale because an upstream station changed"""
+        with self._lock:
+            for sid in station_ids:
+                if sid in self.stations:
+                    self.stations[sid]["invalidated_by"] = changed
+        self.save()
+
+    def save(self):
+        with self._lock:
+            payload = json.dumps({
+                "session_id": self.session_id,
+                "updated_at": datetime.now().isoformat(),
+                "stations": self.stations,
+            }, indent=2)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = self.path.with_suffix(".json.tmp")
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            f.write(payload)
+        tmp_path.replace(self.path)
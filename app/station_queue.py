@@ -0,0 +1,227 @@
+"""
+Distributed Station Jobs (Redis Streams)
+
+Stations can run as jobs on worker processes spread over several machines,
+with Redis as the work queue. The pipeline runner, started with
+--distributed, adds one job per station to the `pipeline:jobs` stream and
+waits for its reply; workers (`python -m app.station_worker`) read jobs
+through the `station-workers` consumer group, run the station exactly as the
+runner would, and reply when it finishes. A station writes its outputs to
+the same session keys (audiobook:{session_id}:station_NN, ...) wherever it
+runs, so downstream stations find them as usual.
+
+Delivery guarantees:
+- a job stays pending in the group until the worker acknowledges it
+- while a station runs, its worker re-claims the job every third of the
+  visibility timeout so other workers leave it alone
+- a job whose worker crashed (no re-claim for STATION_JOB_VISIBILITY_SECONDS)
+  is claimed by another worker and run again; finished units inside the
+  station are skipped (see app/checkpoint_store.py)
+- a failed station is retried up to STATION_JOB_MAX_ATTEMPTS times in all,
+  after which the job moves to `pipeline:jobs:dead` and the runner is told
+  it failed; a job that keeps crashing its worker counts each crash as an
+  attempt and is dead-lettered the same way
+- the runner gives up on a job with no reply after STATION_JOB_TIMEOUT_SECONDS
+"""
+
+import asyncio
+import json
+import logging
+import time
+import uuid
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import Any, Dict, List, Optional
+
+import redis.asyncio as redis
+from redis.exceptions import ResponseError
+
+from app.config import settings
+from app.redis_pool import get_redis
+
+logger = logging.getLogger(__name__)
+
+JOBS_STREAM = "pipeline:jobs"
+DEAD_STREAM = "pipeline:jobs:dead"
+WORKER_GROUP = "station-workers"
+REPLY_KEY = "pipeline:job_reply:{job_id}"
+REPLY_TTL_SECONDS = 86400
+
+
+def _text(value: Any) -> str:
+    return value.decode("utf-8") if isinstance(value, bytes) else str(value)
+
+
+@dataclass
+class StationJob:
+    """One station run for one session"""
+    session_id: str
+    station_id: str
+    skip_review: bool = True
+    station_kwargs: Dict[str, Any] = field(default_factory=dict)
+    resume: bool = False  # Skip units finished by an earlier run (--resume)
+    job_id: str = field(default_factory=lambda: uuid.uuid4().hex)
+    attempts: int = 0  # Failed runs before this delivery
+    message_id: Optional[str] = None
+    enqueued_at: str = field(default_factory=lambda: datetime.now().isoformat())
+
+    def to_fields(self) -> Dict[str, str]:
+        return {
+            "job_id": self.job_id,
+            "session_id": self.session_id,
+            "station": self.station_id,
+            "skip_review": "1" if self.skip_review else "0",
+            "station_kwargs": json.dumps(self.station_kwargs),
+            "resume": "1" if self.resume else "0",
+            "attempts": str(self.attempts),
+            "enqueued_at": self.enqueued_at,
+        }
+
+    @classmethod
+    def from_message(cls, message_id: Any, fields: Dict[Any, Any]) -> "StationJob":
+        data = {_text(k): _text(v) for k, v in fields.items()}
+        return cls(
+            session_id=data["session_id"],
+            station_id=data["station"],
+            skip_review=data.get("skip_review", "1") == "1",
+            station_kwargs=json.loads(data.get("station_kwargs") or "{}"),
+            resume=data.get("resume", "0") == "1",
+            job_id=data["job_id"],
+            attempts=int(data.get("attempts", 0)),
+            message_id=_text(message_id),
+            enqueued_at=data.get("enqueued_at", ""),
+        )
+
+
+class StationJobQueue:
+    """Producer and consumer side of the station job stream"""
+
+    def __init__(self, visibility_seconds: Optional[float] = None,
+                 max_attempts: Optional[int] = None):
+        self.visibility_seconds = visibility_seconds or settings.station_job_visibility_seconds
+        self.max_attempts = max(1, max_attempts or settings.station_job_max_attempts)
+        self.redis: Optional[redis.Redis] = None
+
+    async def connect(self):
+        self.redis = get_redis()
+        await self.redis.ping()
+
+    async def disconnect(self):
+        """Nothing to close: the pool is shared by the whole process (see close_redis())"""
+
+    async def ensure_group(self):
+        """Create the stream and consumer group if they don't exist yet"""
+        try:
+            await self.redis.xgroup_create(JOBS_STREAM, WORKER_GROUP, id="0", mkstream=True)
+        except ResponseError as e:
+            if "BUSYGROUP" not in str(e):
+                raise
+
+    # Producer side
+
+    async def enqueue(self, job: StationJob) -> str:
+        """Add a job to the stream; returns its job id"""
+        await self.redis.xadd(JOBS_STREAM, job.to_fields())
+        return job.job_id
+
+    async def wait_result(self, job_id: str, poll_seconds: int = 5,
+                          timeout: Optional[float] = None) -> Dict[str, Any]:
+        """Block until a worker replies for the job (0 = wait forever)"""
+        key = REPLY_KEY.format(job_id=job_id)
+        timeout = settings.station_job_timeout_seconds if timeout is None else timeout
+        deadline = time.monotonic() + timeout if timeout > 0 else None
+        while deadline is None or time.monotonic() < deadline:
+            reply = await self.redis.blpop([key], timeout=poll_seconds)
+            if reply:
+                return json.loads(_text(reply[1]))
+        raise TimeoutError(f"No reply for station job {job_id} after {timeout:.0f}s")
+
+    # Consumer side
+
+    async def read(self, consumer: str, count: int = 1, block_ms: int = 5000) -> List[StationJob]:
+        """New jobs for this consumer"""
+        response = await self.redis.xreadgroup(WORKER_GROUP, consumer, {JOBS_STREAM: ">"},
+                                               count=count, block=block_ms)
+        jobs = []
+        for _, messages in response or []:
+            jobs.extend(StationJob.from_message(mid, fields) for mid, fields in messages)
+        return jobs
+
+    async def reclaim(self, consumer: str, count: int = 1) -> List[StationJob]:
+        """Jobs whose worker stopped renewing them within the visibility timeout"""
+        response = await self.redis.xautoclaim(
+            JOBS_STREAM, WORKER_GROUP, consumer,
+            min_idle_time=int(self.visibility_seconds * 1000), start_id="0-0", count=count
+        )
+        jobs = []
+        for mid, fields in response[1]:
+            if not fields:
+                # Trimmed from the stream; nothing left to run
+                await self.redis.xack(JOBS_STREAM, WORKER_GROUP, mid)
+                continue
+            job = StationJob.from_message(mid, fields)
+            # The crashed delivery counts as a failed attempt
+            pending = await self.redis.xpending_range(JOBS_STREAM, WORKER_GROUP, min=mid, max=mid, count=1)
+            if pending:
+                job.attempts += max(0, int(pending[0]["times_delivered"]) - 1)
+            if job.attempts >= self.max_attempts:
+                error = f"Worker stopped responding on each of {job.attempts} attempt(s)"
+                logger.error(f"Station {job.station_id} job {job.job_id} for {job.session_id}: {error}, dead-lettered")
+                await self._dead_letter(job, consumer, error, attempts=job.attempts)
+                continue
+            logger.warning(f"Reclaimed station {job.station_id} job {job.job_id} for {job.session_id} "
+                           f"(attempt {job.attempts + 1})")
+            jobs.append(job)
+        return jobs
+
+    async def keep_alive(self, job: StationJob, consumer: str):
+        """Renew the job's claim until cancelled"""
+        while True:
+            await asyncio.sleep(self.visibility_seconds / 3)
+            try:
+                await self.redis.xclaim(JOBS_STREAM, WORKER_GROUP, consumer, min_idle_time=0,
+                                        message_ids=[job.message_id], justid=True)
+            except Exception as e:
+                logger.warning(f"Could not renew job {job.job_id}: {e}")
+
+    async def _reply(self, job: StationJob, status: str, consumer: str, error: Optional[str] = None,
+                     attempts: Optional[int] = None):
+        key = REPLY_KEY.format(job_id=job.job_id)
+        payload = json.dumps({
+            "job_id": job.job_id,
+            "session_id": job.session_id,
+            "station": job.station_id,
+            "status": status,
+            "attempts": job.attempts + 1 if attempts is None else attempts,
+            "consumer": consumer,
+            "error": error,
+            "finished_at": datetime.now().isoformat(),
+        })
+        async with self.redis.pipeline(transaction=True) as pipe:
+            pipe.rpush(key, payload)
+            pipe.expire(key, REPLY_TTL_SECONDS)
+            pipe.xack(JOBS_STREAM, WORKER_GROUP, job.message_id)
+            await pipe.execute()
+
+    async def complete(self, job: StationJob, consumer: str):
+        """Acknowledge a finished job and tell the runner"""
+        await self._reply(job, "completed", consumer)
+
+    async def fail(self, job: StationJob, consumer: str, error: str) -> bool:
+        """Retry a failed job, or dead-letter it once out of attempts; True if retried"""
+        if job.attempts + 1 < self.max_attempts:
+            retry = StationJob(job.session_id, job.station_id, job.skip_review, job.station_kwargs,
+                               resume=job.resume, job_id=job.job_id, attempts=job.attempts + 1, enqueued_at=job.enqueued_at)
+            async with self.redis.pipeline(transaction=True) as pipe:
+                pipe.xadd(JOBS_STREAM, retry.to_fields())
+                pipe.xack(JOBS_STREAM, WORKER_GROUP, job.message_id)
+                await pipe.execute()
+            return True
+        await self._dead_letter(job, consumer, error)
+        return False
+
+    async def _dead_letter(self, job: StationJob, consumer: str, error: str,
+                           attempts: Optional[int] = None):
+        """Move the job to the dead stream and tell the runner it failed"""
+        await self.redis.xadd(DEAD_STREAM, dict(job.to_fields(), error=error[:2000], consumer=consumer))
+        await self._reply(job, "failed", consumer, error, attempts=attempts)
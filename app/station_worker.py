@@ -0,0 +1,131 @@
+"""
+Station Worker
+
+Pulls station jobs from the Redis Stream fed by
+`python -m app.pipeline_runner --distributed` and runs them (see
+app/station_queue.py). Start as many workers as you like, on any machine
+that can reach the same Redis server and has the same .env:
+
+    python -m app.station_worker
+    python -m app.station_worker --concurrency 4 --name render-box-2
+
+Each worker first takes over jobs abandoned by crashed workers, then reads
+new ones. Reviews are always auto-accepted, since nobody is at a worker's
+console. A retried station resumes from the units it had already finished.
+Stop a worker with Ctrl+C; stations in progress are left pending and picked
+up by another worker once their visibility timeout passes.
+"""
+
+import argparse
+import asyncio
+import logging
+import os
+import socket
+import time
+import traceback
+from typing import Optional, Set
+
+from app.checkpoint_store import resume_units
+from app.config import settings
+from app.llm_usage import usage_scope
+from app.openrouter_agent import startup_openrouter, shutdown_openrouter
+from app.redis_pool import close_redis
+from app.pipeline_runner import STATION_REGISTRY, run_station
+from app.station_queue import StationJob, StationJobQueue
+
+logger = logging.getLogger(__name__)
+
+
+class StationWorker:
+    """Runs station jobs from the queue, several at a time"""
+
+    def __init__(self, name: Optional[str] = None, concurrency: Optional[int] = None):
+        self.name = name or f"{socket.gethostname()}-{os.getpid()}"
+        self.concurrency = max(1, concurrency or settings.station_worker_concurrency)
+        self.queue = StationJobQueue()
+        self.completed = 0
+        self.failed = 0
+
+    async def _handle(self, job: StationJob):
+        """Run one job, renewing its claim until it finishes"""
+        print(f"▶️  Station {job.station_id} for {job.session_id} (job {job.job_id}, attempt {job.attempts + 1})")
+        keep_alive = asyncio.create_task(self.queue.keep_alive(job, self.name))
+        started = time.monotonic()
+        try:
+            if job.station_id not in STATION_REGISTRY:
+                raise ValueError(f"Unknown station: {job.station_id}")
+            with usage_scope(session_id=job.session_id), resume_units(job.resume or job.attempts > 0):
+                await run_station(job.station_id, job.session_id, job.skip_review, job.station_kwargs)
+        except asyncio.CancelledError:
+            raise
+        except (Exception, SystemExit) as e:
+            error = str(e) or type(e).__name__
+            logger.error(f"Station {job.station_id} job {job.job_id} failed: {error}\n{traceback.format_exc()}")
+            retried = await self.queue.fail(job, self.name, error)
+            self.failed += 0 if retried else 1
+            print(f"❌ Station {job.station_id} for {job.session_id} failed: {error}"
+                  + (" (queued for retry)" if retried else " (out of attempts)"))
+        else:
+            await self.queue.complete(job, self.name)
+            self.completed += 1
+            print(f"✅ Station {job.station_id} for {job.session_id} completed "
+                  f"({time.monotonic() - started:.1f}s)")
+        finally:
+            keep_alive.cancel()
+
+    async def run(self, max_jobs: Optional[int] = None):
+        """Process jobs until interrupted (or until max_jobs have been taken)"""
+        await self.queue.connect()
+        await self.queue.ensure_group()
+        await startup_openrouter()
+        print(f"👷 Station worker {self.name}: up to {self.concurrency} station(s) at once")
+
+        running: Set[asyncio.Task] = set()
+        taken = 0
+        try:
+            while max_jobs is None or taken < max_jobs:
+                running = {task for task in running if not task.done()}
+                free = self.concurrency - len(running)
+                if max_jobs is not None:
+                    free = min(free, max_jobs - taken)
+                if free <= 0:
+                    await asyncio.wait(running, return_when=asyncio.FIRST_COMPLETED)
+                    continue
+
+                jobs = await self.queue.reclaim(self.name, count=free)
+                if not jobs:
+                    jobs = await self.queue.read(self.name, count=free)
+                for job in jobs:
+                    running.add(asyncio.create_task(self._handle(job)))
+                taken += len(jobs)
+
+            if running:
+                await asyncio.wait(running)
+        finally:
+            for task in running:
+                task.cancel()
+            await shutdown_openrouter()
+            await self.queue.disconnect()
+            await close_redis()
+            print(f"👷 Station worker {self.name} stopped: {self.completed} completed, {self.failed} failed")
+
+
+async def main():
+    """Run a station worker from the command line"""
+    parser = argparse.ArgumentParser(description="Run pipeline stations queued by the distributed runner")
+    parser.add_argument("--name", help="Consumer name in the worker group (default: host-pid)")
+    parser.add_argument("--concurrency", type=int, default=None,
+                        help=f"Stations run at once (default: {settings.station_worker_concurrency})")
+    parser.add_argument("--max-jobs", type=int, default=None, help="Exit after taking this many jobs")
+    args = parser.parse_args()
+
+    worker = StationWorker(name=args.name, concurrency=args.concurrency)
+    await worker.run(max_jobs=args.max_jobs)
+
+
+if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO)
+    try:
+        asyncio.run(main())
+    except KeyboardInterrupt:
+        print("\n👋 Worker interrupted")
@@ -11,35 +11,68 @@ File types handled:
 - JSON files: Stored as JSON strings
 - CSV files: Stored as JSON array of objects
 - TXT files: Stored as text
+
+Bulk mode (--bulk) is for loading whole output/ trees, e.g. rehydrating an
+archive into a fresh Redis. Files are parsed on a thread pool (or a process
+pool with --processes) while earlier batches are written, one MSET per
+--batch-size files. The session/station indexes are collected in the same
+pass and written at the end. The run reports files/s and bytes/s.
+
+    python push_to_redis.py --bulk
+    python push_to_redis.py --bulk --output-dir archive/output --batch-size 1000 --processes --workers 8
 """
 
+import argparse
 import asyncio
 import json
 import csv
 import os
+import time
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
 from pathlib import Path
-from typing import Dict, List, Any
+from typing import Dict, List, Any, Optional, Tuple
 import redis.asyncio as redis
-from app.config import settings
+from app.redis_pool import close_redis, get_redis
+
+SUPPORTED_TYPES = {".json": "JSON", ".csv": "CSV", ".txt": "TXT"}
+
+
+def read_output_file(file_path: str) -> Tuple[str, int]:
+    """Value to store for an output file and its size in bytes
+
+    Module-level so a process pool can run it.
+    """
+    path = Path(file_path)
+    file_type = path.suffix.lower()
+    with open(path, 'r', encoding='utf-8') as f:
+        if file_type == ".json":
+            value = json.dumps(json.load(f))
+        elif file_type == ".csv":
+            value = json.dumps([dict(row) for row in csv.DictReader(f)])
+        else:
+            value = f.read()
+    return value, len(value.encode('utf-8'))
 
 
 class OutputToRedis:
-    def __init__(self):
+    def __init__(self, output_dir: str = "output"):
         self.redis_client: redis.Redis = None
-        self.output_dir = Path("output")
+        self.output_dir = Path(output_dir)
         self.sessions: set = set()
         self.stations: set = set()
+        # Stations pushed per session, recorded as files are written
+        self.session_stations: Dict[str, set] = {}
 
     async def connect(self):
         """Connect to Redis"""
-        self.redis_client = redis.from_url(settings.redis_url)
+        self.redis_client = get_redis()
         await self.redis_client.ping()
         print("✓ Connected to Redis")
 
     async def disconnect(self):
         """Disconnect from Redis"""
         if self.redis_client:
-            await self.redis_client.close()
+            await close_redis()
             print("✓ Disconnected from Redis")
 
     def extract_session_id(self, filename: str) -> str:
@@ -56,46 +89,26 @@ class OutputToRedis:
         # Format: station_04, station_045, etc.
         return station_dir.replace("station_", "")
 
-    def csv_to_dict_list(self, csv_path: Path) -> List[Dict]:
-        """Convert CSV file to list of dictionaries"""
-        result = []
-        with open(csv_path, 'r', encoding='utf-8') as f:
-            reader = csv.DictReader(f)
-            for row in reader:
-                result.append(dict(row))
-        return result
+    def file_key(self, file_path: Path, station_number: str, session_id: str) -> str:
+        """Redis key of an output file (category taken from the filename)"""
+        category = file_path.stem.replace(f"{session_id}_", "")
+        return f"session:{session_id}:station:{station_number}:{category}"
 
     async def push_file(self, file_path: Path, station_number: str, session_id: str):
         """Push a single file to Redis"""
         file_type = file_path.suffix.lower()
-        file_name = file_path.stem
+        redis_key = self.file_key(file_path, station_number, session_id)
 
-        # Determine the file category from filename
-        category = file_name.replace(f"{session_id}_", "")
-
-        # Create Redis key
-        redis_key = f"session:{session_id}:station:{station_number}:{category}"
+        if file_type not in SUPPORTED_TYPES:
+            print(f"  ⚠ Skipped unsupported file type: {file_path}")
+            return
 
         try:
-            if file_type == ".json":
-                with open(file_path, 'r', encoding='utf-8') as f:
-                    data = json.load(f)
-                await self.redis_client.set(redis_key, json.dumps(data))
-                print(f"  → Pushed JSON: {redis_key}")
-
-            elif file_type == ".csv":
-                data = self.csv_to_dict_list(file_path)
-                await self.redis_client.set(redis_key, json.dumps(data))
-                print(f"  → Pushed CSV: {redis_key}")
-
-            elif file_type == ".txt":
-                with open(file_path, 'r', encoding='utf-8') as f:
-                    data = f.read()
-                await self.redis_client.set(redis_key, data)
-                print(f"  → Pushed TXT: {redis_key}")
-
-            else:
-                print(f"  ⚠ Skipped unsupported file type: {file_path}")
+            # Parsed off the event loop
+            value, _ = await asyncio.to_thread(read_output_file, str(file_path))
+            await self.redis_client.set(redis_key, value)
+            print(f"  → Pushed {SUPPORTED_TYPES[file_type]}: {redis_key}")
+            self.session_stations.setdefault(session_id, set()).add(station_number)
 
         except Exception as e:
             print(f"  ✗ Error pushing {file_path}: {e}")
@@ -108,7 +121,7 @@ class OutputToRedis:
         print(f"\nProcessing Station {station_number}...")
 
         # Get all files in the station directory
-        files = list(station_path.glob("*"))
+        files = sorted(station_path.glob("*"))
 
         for file_path in files:
             if file_path.is_file() and not file_path.name.startswith('.'):
@@ -118,44 +131,123 @@ class OutputToRedis:
 
     async def push_metadata(self):
         """Push metadata about sessions and stations"""
-        # Store list of all sessions
-        await self.redis_client.set("sessions:list", json.dumps(list(self.sessions)))
-        print(f"\n✓ Stored {len(self.sessions)} session(s)")
+        # Session-station mapping from what was pushed (no keyspace scan);
+        # without --clear, stations pushed by earlier runs are kept
+        sessions = sorted(self.sessions)
+        index_keys = [f"session:{session_id}:stations" for session_id in sessions]
+        existing = await self.redis_client.mget(index_keys) if index_keys else []
+
+        metadata = {
+            "sessions:list": json.dumps(list(self.sessions)),
+            "stations:list": json.dumps(sorted(list(self.stations))),
+        }
+        for session_id, index_key, current in zip(sessions, index_keys, existing):
+            session_stations = set(json.loads(current)) if current else set()
+            session_stations |= self.session_stations.get(session_id, set())
+            metadata[index_key] = json.dumps(sorted(session_stations))
+        await self.redis_client.mset(metadata)
 
-        # Store list of all stations
-        await self.redis_client.set("stations:list", json.dumps(sorted(list(self.stations))))
+        print(f"\n✓ Stored {len(self.sessions)} session(s)")
         print(f"✓ Stored {len(self.stations)} station(s)")
+        for session_id, index_key in zip(sessions, index_keys):
+            print(f"  → {session_id} has data for stations: {json.loads(metadata[index_key])}")
+
+    def collect_files(self, station_dirs: List[Path]) -> List[Tuple[Path, str, str]]:
+        """(file, station number, session id) of every file to push, indexes recorded on the way"""
+        files = []
+        for station_path in sorted(station_dirs):
+            station_number = self.extract_station_number(station_path.name)
+            self.stations.add(station_number)
+            for file_path in sorted(station_path.glob("*")):
+                if file_path.is_file() and not file_path.name.startswith('.'):
+                    session_id = self.extract_session_id(file_path.name)
+                    self.sessions.add(session_id)
+                    if file_path.suffix.lower() in SUPPORTED_TYPES:
+                        files.append((file_path, station_number, session_id))
+                    else:
+                        print(f"  ⚠ Skipped unsupported file type: {file_path}")
+        return files
+
+    async def bulk_push(self, station_dirs: List[Path], batch_size: int = 500,
+                        workers: Optional[int] = None, processes: bool = False) -> Dict[str, float]:
+        """Parse files on a worker pool and write them in MSET batches
+
+        Parsing of the next batch overlaps the write of the previous one.
+        """
+        files = self.collect_files(station_dirs)
+        cpus = os.cpu_count() or 1
+        workers = workers or (cpus if processes else min(32, cpus + 4))
+        executor: Executor = (ProcessPoolExecutor(max_workers=workers) if processes
+                              else ThreadPoolExecutor(max_workers=workers))
+        loop = asyncio.get_running_loop()
+        stats = {"files": 0, "bytes": 0, "errors": 0, "batches": 0}
+        started = time.monotonic()
+        print(f"\nBulk loading {len(files)} file(s) in batches of {batch_size} "
+              f"({workers} parser {'processes' if processes else 'threads'})")
+
+        async def write(mapping: Dict[str, str], batch_files: int, batch_bytes: int):
+            await self.redis_client.mset(mapping)
+            stats["batches"] += 1
+            stats["files"] += batch_files
+            stats["bytes"] += batch_bytes
+            elapsed = max(time.monotonic() - started, 1e-6)
+            print(f"  → {stats['files']}/{len(files)} files, {stats['bytes'] / 1e6:.1f} MB "
+                  f"({stats['files'] / elapsed:.0f} files/s)")
+
+        writing: Optional[asyncio.Task] = None
+        try:
+            for start in range(0, len(files), batch_size):
+                batch = files[start:start + batch_size]
+                results = await asyncio.gather(
+                    *(loop.run_in_executor(executor, read_output_file, str(path)) for path, _, _ in batch),
+                    return_exceptions=True
+                )
+                mapping: Dict[str, str] = {}
+                batch_files = batch_bytes = 0
+                for (path, station_number, session_id), result in zip(batch, results):
+                    if isinstance(result, Exception):
+                        stats["errors"] += 1
+                        print(f"  ✗ Error pushing {path}: {result}")
+                        continue
+                    value, size = result
+                    mapping[self.file_key(path, station_number, session_id)] = value
+                    batch_files += 1
+                    batch_bytes += size
+                    self.session_stations.setdefault(session_id, set()).add(station_number)
+                if writing:
+                    await writing
+                writing = asyncio.create_task(write(mapping, batch_files, batch_bytes)) if mapping else None
+            if writing:
+                await writing
+        finally:
+            if writing and not writing.done():
+                writing.cancel()
+            executor.shutdown(wait=False, cancel_futures=True)
 
-        # Store session-station mapping
-        for session_id in self.sessions:
-            session_stations = []
-            for station_number in self.stations:
-                # Check if this session has data for this station
-                pattern = f"session:{session_id}:station:{station_number}:*"
-                keys = await self.redis_client.keys(pattern)
-                if keys:
-                    session_stations.append(station_number)
-
-            await self.redis_client.set(
-                f"session:{session_id}:stations",
-                json.dumps(sorted(session_stations))
-            )
-            print(f"  → {session_id} has data for stations: {sorted(session_stations)}")
+        stats["seconds"] = time.monotonic() - started
+        elapsed = max(stats["seconds"], 1e-6)
+        print(f"✓ Bulk loaded {stats['files']} file(s), {stats['bytes'] / 1e6:.1f} MB in {elapsed:.2f}s: "
+              f"{stats['files'] / elapsed:.0f} files/s, {stats['bytes'] / 1e6 / elapsed:.1f} MB/s"
+              + (f" ({stats['errors']} error(s))" if stats["errors"] else ""))
+        return stats
 
     async def clear_existing_data(self):
         """Clear existing session data from Redis"""
         print("\nClearing existing session data...")
-        keys = await self.redis_client.keys("session:*")
-        keys.extend(await self.redis_client.keys("sessions:*"))
-        keys.extend(await self.redis_client.keys("stations:*"))
+        # SCAN rather than KEYS, so Redis keeps serving other clients meanwhile
+        keys = []
+        for pattern in ("session:*", "sessions:*", "stations:*"):
+            keys.extend([key async for key in self.redis_client.scan_iter(match=pattern, count=1000)])
 
         if keys:
-            await self.redis_client.delete(*keys)
+            for start in range(0, len(keys), 1000):
+                await self.redis_client.delete(*keys[start:start + 1000])
             print(f"✓ Cleared {len(keys)} existing keys")
         else:
             print("✓ No existing data to clear")
 
-    async def run(self, clear_first: bool = True):
+    async def run(self, clear_first: bool = True, bulk: bool = False, batch_size: int = 500,
+                  workers: Optional[int] = None, processes: bool = False):
         """Main execution method"""
         try:
             await self.connect()
@@ -173,13 +265,16 @@ class OutputToRedis:
                           if d.is_dir() and d.name.startswith("station_")]
 
             if not station_dirs:
-                print("✗ No station directories found in output/")
+                print(f"✗ No station directories found in {self.output_dir}/")
                 return
 
             print(f"\nFound {len(station_dirs)} station(s) to process")
 
-            for station_path in sorted(station_dirs):
-                await self.push_station(station_path)
+            if bulk:
+                await self.bulk_push(station_dirs, batch_size=batch_size, workers=workers, processes=processes)
+            else:
+                for station_path in sorted(station_dirs):
+                    await self.push_station(station_path)
 
             # Push metadata
             await self.push_metadata()
@@ -196,14 +291,20 @@ class OutputToRedis:
 
 async def main():
     """Entry point"""
-    import sys
-
-    clear_first = True
-    if len(sys.argv) > 1 and sys.argv[1] == "--no-clear":
-        clear_first = False
-
-    pusher = OutputToRedis()
-    await pusher.run(clear_first=clear_first)
+    parser = argparse.ArgumentParser(description="Push output/ station files to Redis")
+    parser.add_argument("--no-clear", action="store_true", help="Keep existing session data")
+    parser.add_argument("--output-dir", default="output", help="Tree to load (default: output)")
+    parser.add_argument("--bulk", action="store_true",
+                        help="Parse on a worker pool and write in pipelined MSET batches")
+    parser.add_argument("--batch-size", type=int, default=500, help="Files per MSET in bulk mode")
+    parser.add_argument("--workers", type=int, default=None, help="Parser threads/processes in bulk mode")
+    parser.add_argument("--processes", action="store_true",
+                        help="Parse on a process pool instead of threads (large JSON/CSV trees)")
+    args = parser.parse_args()
+
+    pusher = OutputToRedis(output_dir=args.output_dir)
+    await pusher.run(clear_first=not args.no_clear, bulk=args.bulk, batch_size=max(1, args.batch_size),
+                     workers=args.workers, processes=args.processes)
 
 
 if __name__ == "__main__":
@@ -12,7 +12,7 @@ import asyncio
 import json
 from typing import List, Dict, Optional
 import redis.asyncio as redis
-from app.config import settings
+from app.redis_pool import close_redis, get_redis
 
 
 class RedisQuery:
@@ -21,13 +21,13 @@ class RedisQuery:
 
     async def connect(self):
         """Connect to Redis"""
-        self.redis_client = redis.from_url(settings.redis_url)
+        self.redis_client = get_redis()
         await self.redis_client.ping()
 
     async def disconnect(self):
         """Disconnect from Redis"""
         if self.redis_client:
-            await self.redis_client.close()
+            await close_redis()
 
     async def get_sessions(self) -> List[str]:
         """Get list of all sessions"""
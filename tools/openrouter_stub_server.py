@@ -0,0 +1,246 @@
+#!/usr/bin/env python3
+"""
+OpenRouter Stand-In Server
+
+A small local HTTP server that speaks the OpenRouter /chat/completions
+shape (regular JSON and SSE streaming) and answers from recorded LLM
+cassettes (see app/llm_cassette.py). Use it to profile or regression-test
+full station runs offline at realistic latencies.
+
+Usage:
+    python tools/openrouter_stub_server.py --cassette cassettes/run1.jsonl.gz
+    python tools/openrouter_stub_server.py --cassette run1.jsonl.gz --recorded-latency \\
+        --rate-limit-rate 0.05 --error-rate 0.02
+
+Then point the pipeline at it:
+    OPENROUTER_BASE_URL=http://127.0.0.1:8787/api/v1 python -m app.agents.station_01_seed_processor
+
+Requests that are not on any cassette get a synthetic response (or a 404
+with --strict).
+"""
+
+import argparse
+import json
+import random
+import sys
+import threading
+import time
+import uuid
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from typing import Dict, Any, List, Optional
+
+# Add parent directory to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from app.llm_cassette import load_cassette, request_key
+
+
+class StubState:
+    """Cassette contents, replay counters and fault-injection settings"""
+
+    def __init__(self, args: argparse.Namespace):
+        self.args = args
+        self.entries: Dict[str, List[Dict[str, Any]]] = {}
+        for path in args.cassette:
+            for key, recorded in load_cassette(path).items():
+                self.entries.setdefault(key, []).extend(recorded)
+        self.play_counts: Dict[str, int] = {}
+        self.lock = threading.Lock()
+        self.rng = random.Random(args.seed)
+        self.stats = {"requests": 0, "hits": 0, "misses": 0, "errors": 0, "rate_limited": 0}
+
+    def lookup(self, body: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+        """Next recorded entry for a request, in recording order"""
+        key = request_key(body)
+        recorded = self.entries.get(key)
+        if not recorded:
+            return None
+        with self.lock:
+            index = min(self.play_counts.get(key, 0), len(recorded) - 1)
+            self.play_counts[key] = self.play_counts.get(key, 0) + 1
+        return recorded[index]
+
+    def roll(self, rate: float) -> bool:
+        with self.lock:
+            return rate > 0 and self.rng.random() < rate
+
+    def latency_for(self, entry: Optional[Dict[str, Any]]) -> float:
+        """Seconds to wait before answering"""
+        if entry is not None and self.args.recorded_latency:
+            base = entry.get("latency", 0.0) * self.args.latency_scale
+        else:
+            base = self.args.latency_ms / 1000.0
+        with self.lock:
+            jitter = self.rng.uniform(0, self.args.jitter_ms / 1000.0) if self.args.jitter_ms else 0.0
+        return base + jitter
+
+    def count(self, stat: str):
+        with self.lock:
+            self.stats[stat] += 1
+
+
+def synthetic_response(body: Dict[str, Any]) -> Dict[str, Any]:
+    """Placeholder completion for requests that were never recorded"""
+    prompt = body["messages"][-1]["content"] if body.get("messages") else ""
+    content = json.dumps({"stub": True, "prompt_chars": len(prompt)})
+    return {
+        "id": f"gen-stub-{uuid.uuid4().hex[:12]}",
+        "model": body.get("model"),
+        "choices": [{
+            "message": {"role": "assistant", "content": content},
+            "finish_reason": "stop"
+        }],
+        "usage": {
+            "prompt_tokens": len(prompt) // 4,
+            "completion_tokens": len(content) // 4,
+            "total_tokens": (len(prompt) + len(content)) // 4
+        }
+    }
+
+
+class StubHandler(BaseHTTPRequestHandler):
+    state: StubState = None
+
+    def log_message(self, format, *args):
+        if not self.state.args.quiet:
+            super().log_message(format, *args)
+
+    def _send_json(self, status: int, payload: Dict[str, Any], headers: Optional[Dict[str, str]] = None):
+        data = json.dumps(payload).encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(data)))
+        for name, value in (headers or {}).items():
+            self.send_header(name, value)
+        self.end_headers()
+        self.wfile.write(data)
+
+    def do_GET(self):
+        if self.path.rstrip("/") in ("/stats", "/api/v1/stats"):
+            self._send_json(200, self.state.stats)
+        else:
+            self._send_json(404, {"error": {"message": "Not found", "code": 404}})
+
+    def do_POST(self):
+        if not self.path.rstrip("/").endswith("/chat/completions"):
+            self._send_json(404, {"error": {"message": "Not found", "code": 404}})
+            return
+
+        length = int(self.headers.get("Content-Length", 0))
+        body = json.loads(self.rfile.read(length) or b"{}")
+        state = self.state
+        state.count("requests")
+
+        # Fault injection happens before any latency so storms are cheap to simulate
+        if state.roll(state.args.rate_limit_rate):
+            state.count("rate_limited")
+            self._send_json(
+                429,
+                {"error": {"message": "Rate limit exceeded (stub)", "code": 429}},
+                {"Retry-After": str(state.args.retry_after)}
+            )
+            return
+        if state.roll(state.args.error_rate):
+            state.count("errors")
+            self._send_json(500, {"error": {"message": "Injected server error (stub)", "code": 500}})
+            return
+
+        entry = state.lookup(body)
+        if entry is None:
+            state.count("misses")
+            if state.args.strict:
+                self._send_json(404, {"error": {"message": "Request not on cassette", "code": 404}})
+                return
+            response = synthetic_response(body)
+        else:
+            state.count("hits")
+            response = entry["response"]
+
+        latency = state.latency_for(entry)
+        if body.get("stream"):
+            self._stream(response, latency)
+        else:
+            time.sleep(latency)
+            self._send_json(200, response)
+
+    def _stream(self, response: Dict[str, Any], latency: float):
+        """Send a response as SSE chunks spread over the latency budget"""
+        content = response["choices"][0]["message"]["content"] or ""
+        finish_reason = response["choices"][0].get("finish_reason", "stop")
+        pieces = [content[i:i + 16] for i in range(0, len(content), 16)] or [""]
+
+        ttft = latency * self.state.args.ttft_fraction
+        per_piece = (latency - ttft) / len(pieces) if pieces else 0.0
+
+        self.send_response(200)
+        self.send_header("Content-Type", "text/event-stream")
+        self.send_header("Cache-Control", "no-cache")
+        self.end_headers()
+
+        self.wfile.write(b": OPENROUTER PROCESSING\n\n")
+        self.wfile.flush()
+        time.sleep(ttft)
+
+        for index, piece in enumerate(pieces):
+            last = index == len(pieces) - 1
+            chunk = {
+                "model": response.get("model"),
+                "choices": [{
+                    "delta": {"content": piece},
+                    "finish_reason": finish_reason if last else None
+                }]
+            }
+            if last and response.get("usage"):
+                chunk["usage"] = response["usage"]
+            self.wfile.write(f"data: {json.dumps(chunk)}\n\n".encode("utf-8"))
+            self.wfile.flush()
+            if per_piece:
+                time.sleep(per_piece)
+
+        self.wfile.write(b"data: [DONE]\n\n")
+        self.wfile.flush()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Local OpenRouter stand-in serving LLM cassettes")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8787)
+    parser.add_argument("--cassette", action="append", default=[], help="Cassette file (repeatable)")
+    parser.add_argument("--strict", action="store_true", help="404 on requests not on a cassette")
+    parser.add_argument("--latency-ms", type=float, default=0.0, help="Fixed response latency")
+    parser.add_argument("--jitter-ms", type=float, default=0.0, help="Random extra latency (uniform)")
+    parser.add_argument("--recorded-latency", action="store_true",
+                        help="Replay the latency observed when the cassette was recorded")
+    parser.add_argument("--latency-scale", type=float, default=1.0,
+                        help="Multiplier for recorded latencies")
+    parser.add_argument("--ttft-fraction", type=float, default=0.2,
+                        help="Share of latency spent before the first streamed token")
+    parser.add_argument("--error-rate", type=float, default=0.0, help="Probability of a 500 response")
+    parser.add_argument("--rate-limit-rate", type=float, default=0.0, help="Probability of a 429 response")
+    parser.add_argument("--retry-after", type=int, default=1, help="Retry-After seconds sent with 429s")
+    parser.add_argument("--seed", type=int, default=None, help="Random seed for fault injection")
+    parser.add_argument("--quiet", action="store_true", help="Suppress per-request logging")
+    args = parser.parse_args()
+
+    StubHandler.state = StubState(args)
+    recorded = sum(len(v) for v in StubHandler.state.entries.values())
+    server = ThreadingHTTPServer((args.host, args.port), StubHandler)
+
+    print("=" * 60)
+    print("OpenRouter Stand-In Server")
+    print("=" * 60)
+    print(f"Serving {recorded} recorded exchange(s) from {len(args.cassette)} cassette(s)")
+    print(f"Base URL: http://{args.host}:{args.port}/api/v1")
+    print(f"Stats:    http://{args.host}:{args.port}/stats")
+
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        print("\n✓ Stopped")
+    finally:
+        server.server_close()
+
+
+if __name__ == "__main__":
+    main()
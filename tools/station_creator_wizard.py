@@ -21,7 +21,7 @@ from datetime import datetime
 # Add parent directory to path for imports
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
-from app.openrouter_agent import OpenRouterAgent
+from app.openrouter_agent import get_openrouter_agent
 from app.redis_client import RedisClient
 
 
@@ -29,7 +29,7 @@ class StationCreatorWizard:
     """Interactive wizard for creating custom stations with approval loops"""
 
     def __init__(self):
-        self.openrouter = OpenRouterAgent()
+        self.openrouter = get_openrouter_agent()
         self.redis = None
         self.session_data = {
             "station_number": None,
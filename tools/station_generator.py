@@ -55,7 +55,7 @@ from datetime import datetime
 from typing import Dict, List, Optional, Any
 from dataclasses import dataclass, asdict
 
-from app.openrouter_agent import OpenRouterAgent
+from app.openrouter_agent import get_openrouter_agent
 from app.redis_client import RedisClient
 from app.agents.config_loader import load_station_config
 
@@ -81,7 +81,7 @@ class Station{self.station_num:02d}{self.class_name}:
     """
 
     def __init__(self):
-        self.openrouter = OpenRouterAgent()
+        self.openrouter = get_openrouter_agent()
         self.redis = RedisClient()
         self.station_id = "station_{self.station_num:02d}"
 